@@ -25,11 +25,39 @@ tox-tests: check-python-venv
 	@export USE_MYSQL=False; \
 	tox -v -e allianceauth-latest; \
 
+# Benchmarks
+.PHONY: benchmark
+benchmark: check-python-venv check-myauth-path
+	@echo "Running benchmarks …"
+	@LEDGER_BENCHMARK=1 python $(myauth_path)/manage.py \
+		test \
+		$(package).tests.benchmarks.test_benchmarks \
+		--keepdb
+
+# Load test
+.PHONY: loadtest
+loadtest: check-python-venv check-myauth-path
+	@echo "Running the update sweep load test against a fake ESI …"
+	@LEDGER_LOADTEST=1 python $(myauth_path)/manage.py \
+		test \
+		$(package).tests.benchmarks.test_load \
+		--keepdb
+
+# Import time
+.PHONY: importtime
+importtime: check-python-venv check-myauth-path
+	@echo "Measuring the import time of the app startup …"
+	@cd $(myauth_path) && DJANGO_SETTINGS_MODULE=myauth.settings.local \
+		python $(CURDIR)/$(package)/tests/benchmarks/importtime.py
+
 # Help message
 .PHONY: help
 help::
 	@echo "  $(TEXT_UNDERLINE)Tests:$(TEXT_UNDERLINE_END)"
+	@echo "    benchmark                   Run the benchmarks on a synthetic dataset"
 	@echo "    build-test                  Build the package"
 	@echo "    coverage                    Run tests and create a coverage report"
+	@echo "    importtime                  Measure the import time of the app startup"
+	@echo "    loadtest                    Run the update sweep load test against a fake ESI"
 	@echo "    tox-tests                   Run tests with tox"
 	@echo ""
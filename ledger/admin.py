@@ -99,6 +99,8 @@ class CorporationAuditAdmin(admin.ModelAdmin):
 
     list_select_related = ("eve_corporation",)
 
+    list_filter = ("total_update_status", "active")
+
     ordering = ["eve_corporation__corporation_name"]
 
     search_fields = [
@@ -246,6 +248,8 @@ class CharacterAuditAdmin(admin.ModelAdmin):
 
     list_select_related = ("eve_character",)
 
+    list_filter = ("total_update_status", "active")
+
     ordering = ["eve_character__character_name"]
 
     search_fields = ["eve_character__character_name"]
@@ -10,17 +10,27 @@ from allianceauth.services.hooks import get_extension_logger
 
 # AA Ledger
 from ledger import __title__
-from ledger.api import admin, alliance, character, corporation, planetary
+from ledger.api import admin, alliance, character, corporation, planetary, summary
+from ledger.api.renderers import LedgerJSONRenderer
+from ledger.app_settings import LEDGER_API_ASYNC
+from ledger.helpers.profiler import profile_api_request
 from ledger.providers import AppLogger
 
 logger = AppLogger(get_extension_logger(__name__), __title__)
 
 
+# Lookup strings of the Ninja operation views, excluded from `main_character_required`
+API_VIEWS = [
+    "ninja.operation.PathView.get_view.<locals>.sync_view_wrapper",
+    "ninja.operation.PathView.get_view.<locals>.async_view_wrapper",
+]
+
 api = NinjaAPI(
     title="Geuthur API",
     version="0.5.0",
     urls_namespace="ledger:api",
     auth=django_auth,
+    renderer=LedgerJSONRenderer(),
     openapi_url=settings.DEBUG and "/openapi.json" or "",
 )
 
@@ -29,18 +39,33 @@ def setup(ninja_api):
     admin.AdminApiEndpoints(ninja_api)
 
     # Character Endpoints
-    character.CharacterApiEndpoints(ninja_api)
+    if LEDGER_API_ASYNC:
+        character.CharacterAsyncApiEndpoints(ninja_api)
+    else:
+        character.CharacterApiEndpoints(ninja_api)
     character.CharacterDetailsApiEndpoints(ninja_api)
     planetary.PlanetaryApiEndpoints(ninja_api)
 
     # Corporation Endpoints
-    corporation.CorporationApiEndpoints(ninja_api)
+    if LEDGER_API_ASYNC:
+        corporation.CorporationAsyncApiEndpoints(ninja_api)
+    else:
+        corporation.CorporationApiEndpoints(ninja_api)
     corporation.CorporationDetailsApiEndpoints(ninja_api)
 
     # Alliance Endpoints
-    alliance.AllianceApiEndpoints(ninja_api)
+    if LEDGER_API_ASYNC:
+        alliance.AllianceAsyncApiEndpoints(ninja_api)
+    else:
+        alliance.AllianceApiEndpoints(ninja_api)
     alliance.AllianceDetailsApiEndpoints(ninja_api)
 
+    # Summary Endpoints
+    summary.LedgerSummaryApiEndpoints(ninja_api)
+
+    # Opt-in profiling of all endpoints
+    ninja_api.add_decorator(profile_api_request, mode="view")
+
 
 # Initialize API endpoints
 setup(api)
@@ -5,6 +5,7 @@ from typing import Any
 from ninja import NinjaAPI
 
 # Django
+from django.db.models import Exists, OuterRef
 from django.utils.translation import gettext_lazy as _
 
 # Alliance Auth
@@ -20,7 +21,7 @@ from ledger.api.helpers.core import (
     get_characterowner_or_none,
     get_corporationowner_or_none,
 )
-from ledger.models.characteraudit import CharacterOwner
+from ledger.models.characteraudit import CharacterOwner, CharacterUpdateStatus
 from ledger.models.corporationaudit import CorporationOwner
 from ledger.providers import AppLogger
 
@@ -187,10 +188,15 @@ class AdminApiEndpoints:
 
             status_msg = None
             status_issues = None
-            issues = []
-            for char in characters:
-                if char.ledger_update_status.filter(is_success=False).exists():
-                    issues.append(char.eve_character.character_name)
+            issues = list(
+                characters.filter(
+                    Exists(
+                        CharacterUpdateStatus.objects.filter(
+                            owner=OuterRef("pk"), is_success=False
+                        )
+                    )
+                ).values_list("eve_character__character_name", flat=True)
+            )
 
             if issues:
                 status_msg = _("Please re-register characters with issues")
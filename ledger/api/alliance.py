@@ -1,13 +1,17 @@
 # Standard Library
+import asyncio
 from decimal import Decimal
+from typing import Literal
 
 # Third Party
-from ninja import NinjaAPI, Schema
+from asgiref.sync import sync_to_async
+from ninja import NinjaAPI, Query, Schema
 
 # Django
 from django.contrib.humanize.templatetags.humanize import intcomma
 from django.core.handlers.wsgi import WSGIRequest
-from django.db.models import Q, QuerySet
+from django.db.models import F, Q, QuerySet
+from django.http import HttpRequest
 from django.utils import timezone
 from django.utils.translation import gettext as _
 
@@ -18,6 +22,8 @@ from allianceauth.services.hooks import get_extension_logger
 # AA Ledger
 from ledger import __title__
 from ledger.api.helpers.core import (
+    aget_alliance_or_none,
+    alist,
     get_alliance_or_none,
 )
 from ledger.api.helpers.icons import (
@@ -38,6 +44,7 @@ from ledger.api.schema import (
 )
 from ledger.helpers.eveonline import get_alliance_logo_url, get_corporation_logo_url
 from ledger.helpers.ledger_data import get_footer_text_class
+from ledger.helpers.profiler import profile_phase
 from ledger.helpers.ref_type import RefTypeManager
 from ledger.models import AllianceBillboardEntry, AllianceLedgerEntry
 from ledger.models.corporationaudit import (
@@ -48,6 +55,16 @@ from ledger.providers import AppLogger
 
 logger = AppLogger(get_extension_logger(__name__), __title__)
 
+# Aggregated fields of the alliance ledger entries
+ALLIANCE_LEDGER_FIELDS = [
+    "name",
+    "bounty",
+    "ess",
+    "costs",
+    "miscellaneous",
+    "final_data",
+]
+
 
 class LedgerAllianceSchema(Schema):
     corporation: EntitySchema
@@ -83,12 +100,18 @@ class AllianceApiEndpoints:
             response={200: AllianceLedgerResponse, 403: dict, 404: dict},
             tags=self.tags,
         )
-        def get_alliance_ledger(request: WSGIRequest, alliance_id: int, year: int):
+        def get_alliance_ledger(
+            request: WSGIRequest,
+            alliance_id: int,
+            year: int,
+            response_format: Literal["html", "data"] = Query("html", alias="format"),
+        ):
             """Get the ledger for an alliance for a specific year. Admin Endpoint."""
             return self._ledger_api_response(
                 request=request,
                 alliance_id=alliance_id,
                 year=year,
+                data_only=response_format == "data",
             )
 
         @api.get(
@@ -97,7 +120,11 @@ class AllianceApiEndpoints:
             tags=self.tags,
         )
         def get_alliance_ledger(
-            request: WSGIRequest, alliance_id: int, year: int, month: int
+            request: WSGIRequest,
+            alliance_id: int,
+            year: int,
+            month: int,
+            response_format: Literal["html", "data"] = Query("html", alias="format"),
         ):
             """Get the ledger for an alliance for a specific year and month. Admin Endpoint."""
             return self._ledger_api_response(
@@ -105,6 +132,7 @@ class AllianceApiEndpoints:
                 alliance_id=alliance_id,
                 year=year,
                 month=month,
+                data_only=response_format == "data",
             )
 
         @api.get(
@@ -118,6 +146,7 @@ class AllianceApiEndpoints:
             year: int,
             month: int,
             day: int,
+            response_format: Literal["html", "data"] = Query("html", alias="format"),
         ):
             """Get the ledger for an alliance for a specific year, month, and day. Admin Endpoint."""
             return self._ledger_api_response(
@@ -126,6 +155,7 @@ class AllianceApiEndpoints:
                 year=year,
                 month=month,
                 day=day,
+                data_only=response_format == "data",
             )
 
     # pylint: disable=duplicate-code
@@ -146,6 +176,10 @@ class AllianceApiEndpoints:
         Returns:
             str: The generated footer HTML.
         """
+        # Skip Footer in Data-Only Mode
+        if request_info.data_only:
+            return request_info
+
         total_bounty = sum(entity.ledger.bounty for entity in corporations)
         total_ess = sum(entity.ledger.ess for entity in corporations)
         total_costs = sum(entity.ledger.costs for entity in corporations)
@@ -178,189 +212,193 @@ class AllianceApiEndpoints:
         request_info.footer_html = footer_html
         return request_info
 
-    def generate_corporation_data(
+    def _get_journals(
         self,
-        owner: EveAllianceInfo,
+        corporations: list[CorporationOwner],
         request_info: AllianceLedgerRequestInfo,
-    ):
+    ) -> tuple[
+        QuerySet[CorporationWalletJournalEntry], QuerySet[CorporationWalletJournalEntry]
+    ]:
         """
-        Generate the corporation ledger data for the alliance.
-
-        This Helper function generates the corporation ledger data for all corporation of the Alliance
-        based on the provided request information.
+        Get the wallet journals of all corporations of the alliance.
 
         Args:
-            owner (EveAllianceInfo): The alliance owner object.
+            corporations (list[CorporationOwner]): The corporations of the alliance.
             request_info (AllianceLedgerRequestInfo): The request information object.
         Returns:
-            list[LedgerAllianceSchema]: The generated alliance ledger data.
-
+            tuple[QuerySet, QuerySet]: The alliance journal without transfers between
+            the corporations and the journal without the internal transfers of each corporation.
         """
-        corporations = CorporationOwner.objects.filter(
-            eve_corporation__alliance__alliance_id=owner.alliance_id
+        corporation_ids = [corp.eve_corporation.corporation_id for corp in corporations]
+        wallet_journal = CorporationWalletJournalEntry.objects.filter(
+            division__corporation__in=corporations,
+            **request_info.to_date_query(),
+        ).exclude(
+            # Exclude Zero Amount Entries
+            amount=Decimal("0.00")
         )
 
-        # Get Wallet Journal Entries
-        corporations_journal = (
-            CorporationWalletJournalEntry.objects.filter(
-                division__corporation__in=corporations,
-                **request_info.to_date_query(),
-            )
-            # Exclude Zero Amount Entries
-            .exclude(amount=Decimal("0.00"))
-            # Exclude Internal Transfers
-            .exclude(
-                Q(
-                    first_party_id__in=[
-                        corp.eve_corporation.corporation_id for corp in corporations
-                    ]
-                )
-                & Q(
-                    second_party_id__in=[
-                        corp.eve_corporation.corporation_id for corp in corporations
-                    ]
-                )
-            )
+        # Exclude Transfers between the Corporations
+        alliance_journal = wallet_journal.exclude(
+            Q(first_party_id__in=corporation_ids)
+            & Q(second_party_id__in=corporation_ids)
         )
 
-        # Check for Existing Billboard Entry
-        billboard = AllianceBillboardEntry.objects.filter(
-            owner=owner,
-            year=request_info.year,
-            month=request_info.month,
-            day=request_info.day,
-        ).first()
+        # Exclude Internal Transfers of each Corporation
+        corporations_journal = wallet_journal.exclude(
+            first_party_id=F("division__corporation__eve_corporation__corporation_id"),
+            second_party_id=F("division__corporation__eve_corporation__corporation_id"),
+        )
+        return alliance_journal, corporations_journal
 
+    def _build_corporation_data(
+        self,
+        owner: EveAllianceInfo,
+        corporations: list[CorporationOwner],
+        wallet_amounts: dict[int, dict],
+        ledger_entries: dict[int, AllianceLedgerEntry],
+        request_info: AllianceLedgerRequestInfo,
+    ) -> tuple[list[LedgerAllianceSchema], list[AllianceLedgerEntry]]:
+        """
+        Build the ledger data of the corporations from their aggregated amounts.
+
+        Final ledger entries are used as they are, all other corporations get their
+        ledger entry updated with the aggregated amounts.
+
+        Args:
+            owner (EveAllianceInfo): The alliance owner object.
+            corporations (list[CorporationOwner]): The corporations of the alliance.
+            wallet_amounts (dict[int, dict]): The aggregated wallet amounts per corporation.
+            ledger_entries (dict[int, AllianceLedgerEntry]): The stored ledger entries per corporation ID.
+            request_info (AllianceLedgerRequestInfo): The request information object.
+        Returns:
+            tuple[list[LedgerAllianceSchema], list[AllianceLedgerEntry]]: The ledger data and the ledger entries to save.
+        """
         alliance_ledger_list: list[LedgerAllianceSchema] = []
+        changed_entries: list[AllianceLedgerEntry] = []
         for corporation in corporations:
-            wallet_journal = (
-                CorporationWalletJournalEntry.objects.filter(
-                    division__corporation=corporation,
-                    **request_info.to_date_query(),
-                )
-                # Exclude Zero Amount Entries
-                .exclude(amount=Decimal("0.00"))
-                # Exclude Internal Transfers
-                .exclude(
-                    first_party_id=corporation.eve_corporation.corporation_id,
-                    second_party_id=corporation.eve_corporation.corporation_id,
-                )
-            )
-
-            if not wallet_journal.exists():
+            corporation_id = corporation.eve_corporation.corporation_id
+            if corporation.pk not in wallet_amounts:
                 continue
 
-            # Check for Existing Ledger Entry
-            ledger_data = AllianceLedgerEntry.objects.filter(
-                owner=owner,
-                corporation_id=corporation.eve_corporation.corporation_id,
-                year=request_info.year,
-                month=request_info.month,
-                day=request_info.day,
-            ).first()
-
-            # If Ledger Entry Exists, Use it. Otherwise, Aggregate Data and Create/Update Ledger Entry.
+            # If Ledger Entry Exists, Use it. Otherwise, Use the Aggregated Data and Create/Update Ledger Entry.
+            ledger_data = ledger_entries.get(corporation_id)
             if ledger_data is not None and ledger_data.is_final:
-                response_ledger = LedgerAllianceSchema(
+                amounts = {
+                    "bounty": ledger_data.bounty,
+                    "ess": ledger_data.ess,
+                    "miscellaneous": ledger_data.miscellaneous,
+                    "costs": ledger_data.costs,
+                }
+            else:
+                logger.debug(
+                    "Aggregating data for corporation %s (%s)",
+                    corporation.eve_corporation.corporation_name,
+                    corporation_id,
+                )
+                amounts = wallet_amounts[corporation.pk]
+
+                # Update or Create Ledger Entry to Store Aggregated Data
+                if ledger_data is None:
+                    ledger_data = AllianceLedgerEntry(
+                        owner=owner,
+                        corporation_id=corporation_id,
+                        year=request_info.year,
+                        month=request_info.month,
+                        day=request_info.day,
+                    )
+                ledger_data.name = owner.alliance_name
+                ledger_data.bounty = amounts["bounty"]
+                ledger_data.ess = amounts["ess"]
+                ledger_data.costs = amounts["costs"]
+                ledger_data.miscellaneous = amounts["miscellaneous"]
+                ledger_data.final_data = request_info.is_final_data
+                changed_entries.append(ledger_data)
+
+            # Add to Corporation Ledger List
+            alliance_ledger_list.append(
+                LedgerAllianceSchema(
                     corporation=EntitySchema(
-                        entity_id=corporation.eve_corporation.corporation_id,
+                        entity_id=corporation_id,
                         entity_name=corporation.eve_corporation.corporation_name,
-                        icon=get_corporation_logo_url(
-                            corporation_id=corporation.eve_corporation.corporation_id,
-                            corporation_name=corporation.eve_corporation.corporation_name,
-                            as_html=True,
-                        ),
-                    ),
-                    ledger=LedgerSchema(
-                        bounty=ledger_data.bounty,
-                        ess=ledger_data.ess,
-                        miscellaneous=ledger_data.miscellaneous,
-                        costs=ledger_data.costs,
-                        total=sum(
-                            [
-                                ledger_data.bounty,
-                                ledger_data.ess,
-                                ledger_data.costs,
-                                ledger_data.miscellaneous,
-                            ]
+                        icon=(
+                            None
+                            if request_info.data_only
+                            else get_corporation_logo_url(
+                                corporation_id=corporation_id,
+                                corporation_name=corporation.eve_corporation.corporation_name,
+                                as_html=True,
+                            )
                         ),
                     ),
+                    ledger=LedgerSchema(total=sum(amounts.values()), **amounts),
                     update_status=UpdateStatusSchema(
                         status=corporation.get_status,
                     ),
                     actions=get_alliance_details_info_button(
-                        entity_id=corporation.eve_corporation.corporation_id,
+                        entity_id=corporation_id,
                         request_info=request_info,
                     ),
                 )
-                alliance_ledger_list.append(response_ledger)
-                continue
-
-            logger.debug(
-                "Aggregating data for corporation %s (%s)",
-                corporation.eve_corporation.corporation_name,
-                corporation.eve_corporation.corporation_id,
             )
+        return alliance_ledger_list, changed_entries
 
-            # Aggregate Data
-            bounty = wallet_journal.aggregate_bounty()
-            ess = wallet_journal.aggregate_ess()
-            miscellaneous = wallet_journal.aggregate_miscellaneous()
-            costs = wallet_journal.aggregate_costs()
+    @profile_phase("aggregation")
+    def generate_corporation_data(
+        self,
+        owner: EveAllianceInfo,
+        request_info: AllianceLedgerRequestInfo,
+    ):
+        """
+        Generate the corporation ledger data for the alliance.
 
-            # Update or Create Ledger Entry to Store Aggregated Data
-            AllianceLedgerEntry.objects.update_or_create(
-                owner=owner,
-                corporation_id=corporation.eve_corporation.corporation_id,
-                year=request_info.year,
-                month=request_info.month,
-                day=request_info.day,
-                defaults={
-                    "name": owner.alliance_name,
-                    "bounty": bounty,
-                    "ess": ess,
-                    "costs": costs,
-                    "miscellaneous": miscellaneous,
-                    "final_data": request_info.is_final_data,
-                },
-            )
+        This Helper function generates the corporation ledger data for all corporation of the Alliance
+        based on the provided request information. The amounts of all corporations are aggregated
+        with grouped queries, so the query count does not grow with the corporations.
 
-            total = sum(
-                [
-                    bounty,
-                    ess,
-                    miscellaneous,
-                    costs,
-                ]
-            )
+        Args:
+            owner (EveAllianceInfo): The alliance owner object.
+            request_info (AllianceLedgerRequestInfo): The request information object.
+        Returns:
+            list[LedgerAllianceSchema]: The generated alliance ledger data.
 
-            response_ledger = LedgerAllianceSchema(
-                corporation=EntitySchema(
-                    entity_id=corporation.eve_corporation.corporation_id,
-                    entity_name=corporation.eve_corporation.corporation_name,
-                    icon=get_corporation_logo_url(
-                        corporation_id=corporation.eve_corporation.corporation_id,
-                        corporation_name=corporation.eve_corporation.corporation_name,
-                        as_html=True,
-                    ),
-                ),
-                ledger=LedgerSchema(
-                    bounty=bounty,
-                    ess=ess,
-                    miscellaneous=miscellaneous,
-                    costs=costs,
-                    total=total,
-                ),
-                update_status=UpdateStatusSchema(
-                    status=corporation.get_status,
-                ),
-                actions=get_alliance_details_info_button(
-                    entity_id=corporation.eve_corporation.corporation_id,
-                    request_info=request_info,
-                ),
-            )
-            # Add to Corporation Ledger List
-            alliance_ledger_list.append(response_ledger)
+        """
+        corporations = list(
+            CorporationOwner.objects.filter(
+                eve_corporation__alliance__alliance_id=owner.alliance_id
+            ).select_related("eve_corporation")
+        )
+
+        # Get Wallet Journal Entries
+        alliance_journal, corporations_journal = self._get_journals(
+            corporations, request_info
+        )
+
+        # Check for Existing Billboard Entry
+        billboard = AllianceBillboardEntry.objects.filter(
+            owner=owner,
+            year=request_info.year,
+            month=request_info.month,
+            day=request_info.day,
+        ).first()
+
+        alliance_ledger_list, changed_entries = self._build_corporation_data(
+            owner=owner,
+            corporations=corporations,
+            wallet_amounts=corporations_journal.aggregate_by_field(
+                "division__corporation_id"
+            ),
+            ledger_entries={
+                entry.corporation_id: entry
+                for entry in AllianceLedgerEntry.objects.filter(
+                    owner=owner
+                ).filter_request_period(request_info)
+            },
+            request_info=request_info,
+        )
+        AllianceLedgerEntry.objects.bulk_update_or_create(
+            changed_entries, fields=ALLIANCE_LEDGER_FIELDS
+        )
 
         # If No Billboard Data Exists or Existing Billboard Data is Not Final, Update or Create Billboard Entry for Owner
         if billboard is None or not billboard.is_final:
@@ -372,12 +410,13 @@ class AllianceApiEndpoints:
             AllianceBillboardEntry.objects.update_or_create_billboard_entry(
                 owner=owner,
                 request_info=request_info,
-                wallet_journal=corporations_journal,
+                wallet_journal=alliance_journal,
                 ledger_list=alliance_ledger_list,
             )
         return alliance_ledger_list
 
     # pylint: disable=too-many-locals
+    @profile_phase("billboard")
     def generate_billboard_data(
         self,
         owner: EveAllianceInfo,
@@ -403,14 +442,19 @@ class AllianceApiEndpoints:
             day=request_info.day,
         ).first()
 
+        return self._create_billboard(billboard)
+
+    def _create_billboard(
+        self, billboard: AllianceBillboardEntry | None
+    ) -> BillboardSchema:
+        """Create the billboard schema of a billboard entry."""
         # If Billboard Data Still Doesn't Exist, Return Empty Billboard Schema
         if billboard is None:
             return BillboardSchema()
 
-        response_billboard = BillboardSchema(
+        return BillboardSchema(
             xy_chart=billboard.xy_billboard, chord_chart=billboard.chord_billboard
         )
-        return response_billboard
 
     # pylint: disable=duplicate-code
     def _ledger_api_response(
@@ -420,6 +464,7 @@ class AllianceApiEndpoints:
         year: int,
         month: int = None,
         day: int = None,
+        data_only: bool = False,
     ) -> AllianceLedgerResponse | tuple[int, dict]:
         """
         Helper function to generate ledger response for various date parameters.
@@ -433,6 +478,7 @@ class AllianceApiEndpoints:
             year (int): The year for the ledger data.
             month (int, optional): The month for the ledger data. Defaults to None.
             day (int, optional): The day for the ledger data. Defaults to None.
+            data_only (bool, optional): Whether to skip the pre-rendered HTML fragments. Defaults to False.
 
         Returns:
             AllianceLedgerResponse | tuple[int, dict]: The ledger response or error tuple.
@@ -453,6 +499,7 @@ class AllianceApiEndpoints:
             year=year,
             month=month,
             day=day,
+            data_only=data_only,
         )
 
         # Generate Corporation Ledger Data
@@ -467,6 +514,21 @@ class AllianceApiEndpoints:
             request_info=request_info,
         )
 
+        return self._create_ledger_response(
+            owner=owner,
+            request_info=request_info,
+            corporation_ledger_list=corporation_ledger_list,
+            billboard=billboard,
+        )
+
+    def _create_ledger_response(
+        self,
+        owner: EveAllianceInfo,
+        request_info: AllianceLedgerRequestInfo,
+        corporation_ledger_list: list[LedgerAllianceSchema],
+        billboard: BillboardSchema,
+    ) -> AllianceLedgerResponse:
+        """Create the ledger response of an alliance."""
         # Update Request Info with Available Data
         self._create_datatable_footer(
             corporations=corporation_ledger_list, request_info=request_info
@@ -476,10 +538,14 @@ class AllianceApiEndpoints:
             owner=OwnerSchema(
                 character_id=owner.alliance_id,
                 character_name=owner.alliance_name,
-                icon=get_alliance_logo_url(
-                    alliance_id=owner.alliance_id,
-                    alliance_name=owner.alliance_name,
-                    as_html=True,
+                icon=(
+                    None
+                    if request_info.data_only
+                    else get_alliance_logo_url(
+                        alliance_id=owner.alliance_id,
+                        alliance_name=owner.alliance_name,
+                        as_html=True,
+                    )
                 ),
             ),
             information=request_info,
@@ -494,6 +560,171 @@ class AllianceApiEndpoints:
         return response_ledger
 
 
+class AllianceAsyncApiEndpoints(AllianceApiEndpoints):
+    """
+    Async variant of the Alliance Ledger endpoints for ASGI deployments.
+
+    The independent queries of a request run concurrently with the async ORM,
+    so slow ledger requests don't tie up a worker thread each.
+    """
+
+    # pylint: disable=super-init-not-called, function-redefined
+    # flake8: noqa: F811
+    def __init__(self, api: NinjaAPI):
+        @api.get(
+            "alliance/{alliance_id}/date/{year}/",
+            response={200: AllianceLedgerResponse, 403: dict, 404: dict},
+            tags=self.tags,
+        )
+        async def get_alliance_ledger(
+            request: HttpRequest,
+            alliance_id: int,
+            year: int,
+            response_format: Literal["html", "data"] = Query("html", alias="format"),
+        ):
+            """Get the ledger for an alliance for a specific year. Admin Endpoint."""
+            return await self._aledger_api_response(
+                request=request,
+                alliance_id=alliance_id,
+                year=year,
+                data_only=response_format == "data",
+            )
+
+        @api.get(
+            "alliance/{alliance_id}/date/{year}/{month}/",
+            response={200: AllianceLedgerResponse, 403: dict, 404: dict},
+            tags=self.tags,
+        )
+        async def get_alliance_ledger(
+            request: HttpRequest,
+            alliance_id: int,
+            year: int,
+            month: int,
+            response_format: Literal["html", "data"] = Query("html", alias="format"),
+        ):
+            """Get the ledger for an alliance for a specific year and month. Admin Endpoint."""
+            return await self._aledger_api_response(
+                request=request,
+                alliance_id=alliance_id,
+                year=year,
+                month=month,
+                data_only=response_format == "data",
+            )
+
+        @api.get(
+            "alliance/{alliance_id}/date/{year}/{month}/{day}/",
+            response={200: AllianceLedgerResponse, 403: dict, 404: dict},
+            tags=self.tags,
+        )
+        async def get_alliance_ledger(
+            request: HttpRequest,
+            alliance_id: int,
+            year: int,
+            month: int,
+            day: int,
+            response_format: Literal["html", "data"] = Query("html", alias="format"),
+        ):
+            """Get the ledger for an alliance for a specific year, month, and day. Admin Endpoint."""
+            return await self._aledger_api_response(
+                request=request,
+                alliance_id=alliance_id,
+                year=year,
+                month=month,
+                day=day,
+                data_only=response_format == "data",
+            )
+
+    # pylint: disable=too-many-positional-arguments
+    async def _aledger_api_response(
+        self,
+        request,
+        alliance_id: int,
+        year: int,
+        month: int = None,
+        day: int = None,
+        data_only: bool = False,
+    ) -> AllianceLedgerResponse | tuple[int, dict]:
+        """Async variant of `_ledger_api_response`."""
+        perms, owner = await aget_alliance_or_none(
+            request=request, alliance_id=alliance_id
+        )
+
+        if owner is None:
+            return 404, {"error": _("Alliance not found in Ledger.")}
+
+        if perms is False:
+            return 403, {
+                "error": _("You do not have permission to view this alliance.")
+            }
+
+        # Build Request Info
+        request_info = AllianceLedgerRequestInfo(
+            owner_id=owner.alliance_id,
+            year=year,
+            month=month,
+            day=day,
+            data_only=data_only,
+        )
+
+        # The update status is loaded with the corporations
+        corporations = await alist(
+            CorporationOwner.objects.filter(
+                eve_corporation__alliance__alliance_id=owner.alliance_id
+            ).select_related("eve_corporation")
+        )
+        alliance_journal, corporations_journal = self._get_journals(
+            corporations, request_info
+        )
+
+        # The aggregation, the stored ledger entries and the billboard entry are independent
+        wallet_amounts, ledger_entries, billboard = await asyncio.gather(
+            corporations_journal.aaggregate_by_field("division__corporation_id"),
+            alist(
+                AllianceLedgerEntry.objects.filter(owner=owner).filter_request_period(
+                    request_info
+                )
+            ),
+            AllianceBillboardEntry.objects.filter(
+                owner=owner,
+                year=request_info.year,
+                month=request_info.month,
+                day=request_info.day,
+            ).afirst(),
+        )
+
+        corporation_ledger_list, changed_entries = self._build_corporation_data(
+            owner=owner,
+            corporations=corporations,
+            wallet_amounts=wallet_amounts,
+            ledger_entries={entry.corporation_id: entry for entry in ledger_entries},
+            request_info=request_info,
+        )
+        await AllianceLedgerEntry.objects.abulk_update_or_create(
+            changed_entries, fields=ALLIANCE_LEDGER_FIELDS
+        )
+
+        # If No Billboard Data Exists or Existing Billboard Data is Not Final, Update or Create Billboard Entry for Owner
+        if billboard is None or not billboard.is_final:
+            billboard = (
+                await sync_to_async(
+                    AllianceBillboardEntry.objects.update_or_create_billboard_entry
+                )(
+                    owner=owner,
+                    request_info=request_info,
+                    wallet_journal=alliance_journal,
+                    ledger_list=corporation_ledger_list,
+                )
+                or billboard
+            )
+
+        return self._create_ledger_response(
+            owner=owner,
+            request_info=request_info,
+            corporation_ledger_list=corporation_ledger_list,
+            billboard=self._create_billboard(billboard),
+        )
+
+
 class AllianceDetailsApiEndpoints:
     tags = ["Alliance Details"]
 
@@ -579,6 +810,7 @@ class AllianceDetailsApiEndpoints:
         return footer_html
 
     # pylint: disable=too-many-locals
+    @profile_phase("aggregation")
     def _create_ledger_details(
         self,
         journal: QuerySet[CorporationWalletJournalEntry],
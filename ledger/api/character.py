@@ -1,13 +1,17 @@
 # Standard Library
+import asyncio
 from decimal import Decimal
+from typing import Literal
 
 # Third Party
-from ninja import NinjaAPI, Schema
+from asgiref.sync import sync_to_async
+from ninja import NinjaAPI, Query, Schema
 
 # Django
 from django.contrib.humanize.templatetags.humanize import intcomma
 from django.core.handlers.wsgi import WSGIRequest
 from django.db.models import Q, QuerySet
+from django.http import HttpRequest
 from django.utils import timezone
 from django.utils.translation import gettext as _
 
@@ -17,6 +21,8 @@ from allianceauth.services.hooks import get_extension_logger
 # AA Ledger
 from ledger import __title__
 from ledger.api.helpers.core import (
+    aget_characterowner_or_none,
+    alist,
     get_characterowner_or_none,
 )
 from ledger.api.helpers.icons import (
@@ -34,7 +40,8 @@ from ledger.api.schema import (
     OwnerSchema,
     UpdateStatusSchema,
 )
-from ledger.helpers.ledger_data import get_footer_text_class
+from ledger.helpers.ledger_data import get_empty_amounts, get_footer_text_class
+from ledger.helpers.profiler import profile_phase
 from ledger.helpers.ref_type import RefTypeManager
 from ledger.models.characteraudit import (
     CharacterMiningLedger,
@@ -46,6 +53,17 @@ from ledger.providers import AppLogger
 
 logger = AppLogger(get_extension_logger(__name__), __title__)
 
+# Aggregated fields of the character ledger entries
+CHARACTER_LEDGER_FIELDS = [
+    "name",
+    "bounty",
+    "ess",
+    "mining",
+    "costs",
+    "miscellaneous",
+    "final_data",
+]
+
 
 class LedgerCharacterSchema(Schema):
     character: OwnerSchema
@@ -81,12 +99,18 @@ class CharacterApiEndpoints:
             response={200: CharacterLedgerResponse, 403: dict, 404: dict},
             tags=self.tags,
         )
-        def get_character_ledger(request: WSGIRequest, character_id: int, year: int):
+        def get_character_ledger(
+            request: WSGIRequest,
+            character_id: int,
+            year: int,
+            response_format: Literal["html", "data"] = Query("html", alias="format"),
+        ):
             """Get the ledger for a character for a specific year. Admin Endpoint."""
             return self._ledger_api_response(
                 request=request,
                 character_id=character_id,
                 year=year,
+                data_only=response_format == "data",
             )
 
         @api.get(
@@ -95,7 +119,11 @@ class CharacterApiEndpoints:
             tags=self.tags,
         )
         def get_character_ledger(
-            request: WSGIRequest, character_id: int, year: int, month: int
+            request: WSGIRequest,
+            character_id: int,
+            year: int,
+            month: int,
+            response_format: Literal["html", "data"] = Query("html", alias="format"),
         ):
             """Get the ledger for a character for a specific year. Admin Endpoint."""
             return self._ledger_api_response(
@@ -103,6 +131,7 @@ class CharacterApiEndpoints:
                 character_id=character_id,
                 year=year,
                 month=month,
+                data_only=response_format == "data",
             )
 
         @api.get(
@@ -116,6 +145,7 @@ class CharacterApiEndpoints:
             year: int,
             month: int,
             day: int,
+            response_format: Literal["html", "data"] = Query("html", alias="format"),
         ):
             """Get the ledger for a character for a specific year. Admin Endpoint."""
             return self._ledger_api_response(
@@ -124,6 +154,7 @@ class CharacterApiEndpoints:
                 year=year,
                 month=month,
                 day=day,
+                data_only=response_format == "data",
             )
 
     def _create_datatable_footer(
@@ -143,6 +174,10 @@ class CharacterApiEndpoints:
         Returns:
             str: The generated footer HTML.
         """
+        # Skip Footer in Data-Only Mode
+        if request_info.data_only:
+            return request_info
+
         total_bounty = sum(char.ledger.bounty for char in characters)
         total_ess = sum(char.ledger.ess for char in characters)
         total_mining = sum(char.ledger.mining for char in characters)
@@ -184,28 +219,18 @@ class CharacterApiEndpoints:
         request_info.footer_html = footer_html
         return request_info
 
-    # pylint: disable=too-many-locals
-    def generate_character_data(
+    def _get_journals(
         self, owner: CharacterOwner, request_info: OwnerLedgerRequestInfo
-    ) -> list[CharacterLedgerResponse]:
+    ) -> tuple[QuerySet[CharacterWalletJournalEntry], QuerySet[CharacterMiningLedger]]:
         """
-        Generate the ledger data for all alts of a character owner.
-
-        This Helper function generates the ledger data for all alts of a character owner
-        based on the provided date query.
+        Get the wallet and mining journals of all alts of a character owner.
 
         Args:
             owner (CharacterOwner): The character owner object.
-            request_info (LedgerRequestInfo): The request information containing date and section details.
+            request_info (OwnerLedgerRequestInfo): The request information containing date and section details.
         Returns:
-            list[LedgerCharacterSchema]: A list of ledger responses for each character.
+            tuple[QuerySet, QuerySet]: The wallet journal and the mining journal.
         """
-        # Get All Alts for this Owner
-        characters = CharacterOwner.objects.filter(
-            eve_character__character_id__in=owner.alt_ids
-        )
-
-        # Get Wallet and Mining Journal Entries
         wallet_journal = (
             CharacterWalletJournalEntry.objects.filter(
                 character__eve_character__character_id__in=owner.alt_ids,
@@ -224,131 +249,162 @@ class CharacterApiEndpoints:
             character__eve_character__character_id__in=owner.alt_ids,
             **request_info.to_date_query(),
         ).order_by("-date")
+        return wallet_journal, mining_journal
 
-        # Create Ledger Response for each Character
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def _build_character_data(
+        self,
+        characters: list[CharacterOwner],
+        wallet_amounts: dict[int, dict],
+        mining_amounts: dict[int, Decimal],
+        ledger_entries: dict[int, CharacterLedgerEntry],
+        owner_status: str,
+        request_info: OwnerLedgerRequestInfo,
+    ) -> tuple[list[LedgerCharacterSchema], list[CharacterLedgerEntry]]:
+        """
+        Build the ledger data of the alts from their aggregated amounts.
+
+        Final ledger entries are used as they are, all other alts get their
+        ledger entry updated with the aggregated amounts.
+
+        Args:
+            characters (list[CharacterOwner]): The alts of the character owner.
+            wallet_amounts (dict[int, dict]): The aggregated wallet amounts per alt.
+            mining_amounts (dict[int, Decimal]): The aggregated mining amounts per alt.
+            ledger_entries (dict[int, CharacterLedgerEntry]): The stored ledger entries per alt.
+            owner_status (str): The update status of the character owner.
+            request_info (OwnerLedgerRequestInfo): The request information containing date and section details.
+        Returns:
+            tuple[list[LedgerCharacterSchema], list[CharacterLedgerEntry]]: The ledger data and the ledger entries to save.
+        """
         character_ledger_list: list[LedgerCharacterSchema] = []
+        changed_entries: list[CharacterLedgerEntry] = []
         for character in characters:
-            # Get Journal Data
-            character_journal = wallet_journal.filter(
-                character=character,
-            )
-            # Get Mining Journal Data
-            character_mining_journal = mining_journal.filter(
-                character=character,
-            )
-
             # Skip if No Data for Character
-            if not character_journal.exists() and not character_mining_journal.exists():
+            if (
+                character.pk not in wallet_amounts
+                and character.pk not in mining_amounts
+            ):
                 continue
 
-            # Check for Existing Ledger Entry
-            ledger_data = character.ledger_character.filter(
-                year=request_info.year,
-                month=request_info.month,
-                day=request_info.day,
-            ).first()
-
-            # If Ledger Entry Exists, Use it. Otherwise, Aggregate Data and Create/Update Ledger Entry.
+            # If Ledger Entry Exists, Use it. Otherwise, Use the Aggregated Data and Create/Update Ledger Entry.
+            ledger_data = ledger_entries.get(character.pk)
             if ledger_data is not None and ledger_data.is_final:
-                character_ledger_list.append(
-                    LedgerCharacterSchema(
-                        character=OwnerSchema(
-                            character_id=character.eve_character.character_id,
-                            character_name=character.eve_character.character_name,
-                            icon=character.get_portrait(size=32, as_html=True),
-                        ),
-                        ledger=CharacterLedgerSchema(
-                            bounty=ledger_data.bounty,
-                            ess=ledger_data.ess,
-                            mining=ledger_data.mining,
-                            costs=ledger_data.costs,
-                            miscellaneous=ledger_data.miscellaneous,
-                            total=sum(
-                                [
-                                    ledger_data.bounty,
-                                    ledger_data.ess,
-                                    ledger_data.mining,
-                                    ledger_data.costs,
-                                    ledger_data.miscellaneous,
-                                ]
-                            ),
-                        ),
-                        update_status=UpdateStatusSchema(
-                            status=owner.get_status,
-                        ),
-                        actions=get_character_details_info_button(
-                            character_id=character.eve_character.character_id,
-                            request_info=request_info,
-                            section="single",
-                        ),
+                ledger = CharacterLedgerSchema(
+                    bounty=ledger_data.bounty,
+                    ess=ledger_data.ess,
+                    mining=ledger_data.mining,
+                    costs=ledger_data.costs,
+                    miscellaneous=ledger_data.miscellaneous,
+                    total=sum(
+                        [
+                            ledger_data.bounty,
+                            ledger_data.ess,
+                            ledger_data.mining,
+                            ledger_data.costs,
+                            ledger_data.miscellaneous,
+                        ]
+                    ),
+                )
+            else:
+                logger.debug(
+                    "Aggregating data for character %s (%s)",
+                    character.eve_character.character_name,
+                    character.eve_character.character_id,
+                )
+                amounts = wallet_amounts.get(character.pk, get_empty_amounts())
+                mining = mining_amounts.get(character.pk, Decimal("0.00"))
+
+                # Update or Create Ledger Entry to Store Aggregated Data
+                if ledger_data is None:
+                    ledger_data = CharacterLedgerEntry(
+                        owner=character,
+                        year=request_info.year,
+                        month=request_info.month,
+                        day=request_info.day,
                     )
+                ledger_data.name = character.eve_character.character_name
+                ledger_data.bounty = amounts["bounty"]
+                ledger_data.ess = amounts["ess"]
+                ledger_data.mining = mining
+                ledger_data.costs = amounts["costs"]
+                ledger_data.miscellaneous = amounts["miscellaneous"]
+                ledger_data.final_data = request_info.is_final_data
+                changed_entries.append(ledger_data)
+
+                ledger = CharacterLedgerSchema(
+                    mining=mining,
+                    total=sum(amounts.values()),
+                    **amounts,
                 )
-                continue
 
-            logger.debug(
-                "Aggregating data for character %s (%s)",
-                character.eve_character.character_name,
-                character.eve_character.character_id,
-            )
-            # Aggregate Data
-            character_bounty = character_journal.aggregate_bounty()
-            character_ess = character_journal.aggregate_ess()
-            character_mining = character_mining_journal.aggregate_mining()
-            character_costs = character_journal.aggregate_costs()
-            character_miscellaneous = character_journal.aggregate_miscellaneous()
-
-            # Update or Create Ledger Entry to Store Aggregated Data
-            CharacterLedgerEntry.objects.update_or_create(
-                owner=character,
-                year=request_info.year,
-                month=request_info.month,
-                day=request_info.day,
-                defaults={
-                    "name": character.eve_character.character_name,
-                    "bounty": character_bounty,
-                    "ess": character_ess,
-                    "mining": character_mining,
-                    "costs": character_costs,
-                    "miscellaneous": character_miscellaneous,
-                    "final_data": request_info.is_final_data,
-                },
+            # Add Character Ledger to List
+            character_ledger_list.append(
+                LedgerCharacterSchema(
+                    character=OwnerSchema(
+                        character_id=character.eve_character.character_id,
+                        character_name=character.eve_character.character_name,
+                        icon=(
+                            None
+                            if request_info.data_only
+                            else character.get_portrait(size=32, as_html=True)
+                        ),
+                    ),
+                    ledger=ledger,
+                    update_status=UpdateStatusSchema(
+                        status=owner_status,
+                    ),
+                    actions=get_character_details_info_button(
+                        character_id=character.eve_character.character_id,
+                        request_info=request_info,
+                        section="single",
+                    ),
+                )
             )
+        return character_ledger_list, changed_entries
 
-            total = sum(
-                [
-                    character_bounty,
-                    character_ess,
-                    character_miscellaneous,
-                    character_costs,
-                ]
-            )
+    @profile_phase("aggregation")
+    def generate_character_data(
+        self, owner: CharacterOwner, request_info: OwnerLedgerRequestInfo
+    ) -> list[LedgerCharacterSchema]:
+        """
+        Generate the ledger data for all alts of a character owner.
 
-            response_ledger = LedgerCharacterSchema(
-                character=OwnerSchema(
-                    character_id=character.eve_character.character_id,
-                    character_name=character.eve_character.character_name,
-                    icon=character.get_portrait(size=32, as_html=True),
-                ),
-                ledger=CharacterLedgerSchema(
-                    bounty=character_bounty,
-                    ess=character_ess,
-                    mining=character_mining,
-                    costs=character_costs,
-                    miscellaneous=character_miscellaneous,
-                    total=total,
-                ),
-                update_status=UpdateStatusSchema(
-                    status=owner.get_status,
-                ),
-                actions=get_character_details_info_button(
-                    character_id=character.eve_character.character_id,
-                    request_info=request_info,
-                    section="single",
-                ),
-            )
+        This Helper function generates the ledger data for all alts of a character owner
+        based on the provided date query. The amounts of all alts are aggregated
+        with grouped queries, so the query count does not grow with the alts.
 
-            # Add Character Ledger to List
-            character_ledger_list.append(response_ledger)
+        Args:
+            owner (CharacterOwner): The character owner object.
+            request_info (LedgerRequestInfo): The request information containing date and section details.
+        Returns:
+            list[LedgerCharacterSchema]: A list of ledger responses for each character.
+        """
+        # Get All Alts for this Owner
+        characters = CharacterOwner.objects.filter(
+            eve_character__character_id__in=owner.alt_ids
+        ).select_related("eve_character")
+
+        # Get Wallet and Mining Journal Entries
+        wallet_journal, mining_journal = self._get_journals(owner, request_info)
+
+        character_ledger_list, changed_entries = self._build_character_data(
+            characters=list(characters),
+            wallet_amounts=wallet_journal.aggregate_by_field("character_id"),
+            mining_amounts=mining_journal.aggregate_mining_by_field("character_id"),
+            ledger_entries={
+                entry.owner_id: entry
+                for entry in CharacterLedgerEntry.objects.filter(
+                    owner__in=characters
+                ).filter_request_period(request_info)
+            },
+            # Resolve the update status once for all alt rows
+            owner_status=owner.get_status,
+            request_info=request_info,
+        )
+        CharacterLedgerEntry.objects.bulk_update_or_create(
+            changed_entries, fields=CHARACTER_LEDGER_FIELDS
+        )
 
         # Check for Existing Billboard Entry
         billboard_data = owner.ledger_character_billboard.filter(
@@ -374,6 +430,7 @@ class CharacterApiEndpoints:
         return character_ledger_list
 
     # pylint: disable=too-many-locals
+    @profile_phase("billboard")
     def generate_billboard_data(
         self,
         owner: CharacterOwner,
@@ -394,13 +451,16 @@ class CharacterApiEndpoints:
             month=request_info.month,
             day=request_info.day,
         ).first()
+        return self._create_billboard(billboard)
 
-        response_billboard = BillboardSchema(
+    def _create_billboard(
+        self, billboard: CharacterBillboardEntry | None
+    ) -> BillboardSchema:
+        """Create the billboard schema of a billboard entry."""
+        return BillboardSchema(
             xy_chart=billboard.xy_billboard if billboard else None,
             chord_chart=billboard.chord_billboard if billboard else None,
         )
-        # Billboard Data Generation Logic Here
-        return response_billboard
 
     # pylint: disable=too-many-positional-arguments
     def _ledger_api_response(
@@ -410,6 +470,7 @@ class CharacterApiEndpoints:
         year: int,
         month: int = None,
         day: int = None,
+        data_only: bool = False,
     ) -> CharacterLedgerResponse | tuple[int, dict]:
         """
         Helper function to generate ledger response for various date parameters.
@@ -423,7 +484,7 @@ class CharacterApiEndpoints:
             year (int): The year for the ledger data.
             month (int, optional): The month for the ledger data. Defaults to None.
             day (int, optional): The day for the ledger data. Defaults to None.
-            section (str): The section type ('single' or 'summary').
+            data_only (bool, optional): Whether to skip the pre-rendered HTML fragments. Defaults to False.
 
         Returns:
             CharacterLedgerResponse | tuple[int, dict]: The ledger response or error tuple.
@@ -447,6 +508,7 @@ class CharacterApiEndpoints:
             year=year,
             month=month,
             day=day,
+            data_only=data_only,
         )
 
         # Generate Character Ledger Data
@@ -461,6 +523,21 @@ class CharacterApiEndpoints:
             request_info=request_info,
         )
 
+        return self._create_ledger_response(
+            owner=owner,
+            request_info=request_info,
+            character_ledger_list=character_ledger_list,
+            billboard=billboard,
+        )
+
+    def _create_ledger_response(
+        self,
+        owner: CharacterOwner,
+        request_info: OwnerLedgerRequestInfo,
+        character_ledger_list: list[LedgerCharacterSchema],
+        billboard: BillboardSchema,
+    ) -> CharacterLedgerResponse:
+        """Create the ledger response of a character owner."""
         # Update Request Info with Available Data
         self._create_datatable_footer(
             characters=character_ledger_list, request_info=request_info
@@ -470,7 +547,9 @@ class CharacterApiEndpoints:
             owner=OwnerSchema(
                 character_id=owner.eve_character.character_id,
                 character_name=owner.eve_character.character_name,
-                icon=owner.get_portrait(as_html=True),
+                icon=(
+                    None if request_info.data_only else owner.get_portrait(as_html=True)
+                ),
             ),
             information=request_info,
             characters=character_ledger_list,
@@ -484,6 +563,183 @@ class CharacterApiEndpoints:
         return response_ledger
 
 
+class CharacterAsyncApiEndpoints(CharacterApiEndpoints):
+    """
+    Async variant of the Character Ledger endpoints for ASGI deployments.
+
+    The independent queries of a request run concurrently with the async ORM,
+    so slow ledger requests don't tie up a worker thread each.
+    """
+
+    # pylint: disable=super-init-not-called, function-redefined
+    # flake8: noqa: F811
+    def __init__(self, api: NinjaAPI):
+        @api.get(
+            "character/{character_id}/date/{year}/",
+            response={200: CharacterLedgerResponse, 403: dict, 404: dict},
+            tags=self.tags,
+        )
+        async def get_character_ledger(
+            request: HttpRequest,
+            character_id: int,
+            year: int,
+            response_format: Literal["html", "data"] = Query("html", alias="format"),
+        ):
+            """Get the ledger for a character for a specific year. Admin Endpoint."""
+            return await self._aledger_api_response(
+                request=request,
+                character_id=character_id,
+                year=year,
+                data_only=response_format == "data",
+            )
+
+        @api.get(
+            "character/{character_id}/date/{year}/{month}/",
+            response={200: CharacterLedgerResponse, 403: dict, 404: dict},
+            tags=self.tags,
+        )
+        async def get_character_ledger(
+            request: HttpRequest,
+            character_id: int,
+            year: int,
+            month: int,
+            response_format: Literal["html", "data"] = Query("html", alias="format"),
+        ):
+            """Get the ledger for a character for a specific year. Admin Endpoint."""
+            return await self._aledger_api_response(
+                request=request,
+                character_id=character_id,
+                year=year,
+                month=month,
+                data_only=response_format == "data",
+            )
+
+        @api.get(
+            "character/{character_id}/date/{year}/{month}/{day}/",
+            response={200: CharacterLedgerResponse, 403: dict, 404: dict},
+            tags=self.tags,
+        )
+        async def get_character_ledger(
+            request: HttpRequest,
+            character_id: int,
+            year: int,
+            month: int,
+            day: int,
+            response_format: Literal["html", "data"] = Query("html", alias="format"),
+        ):
+            """Get the ledger for a character for a specific year. Admin Endpoint."""
+            return await self._aledger_api_response(
+                request=request,
+                character_id=character_id,
+                year=year,
+                month=month,
+                day=day,
+                data_only=response_format == "data",
+            )
+
+    async def agenerate_character_data(
+        self, owner: CharacterOwner, request_info: OwnerLedgerRequestInfo
+    ) -> list[LedgerCharacterSchema]:
+        """Async variant of `generate_character_data` without the billboard update."""
+        alts = CharacterOwner.objects.filter(
+            eve_character__character_id__in=owner.alt_ids
+        ).select_related("eve_character")
+        wallet_journal, mining_journal = self._get_journals(owner, request_info)
+
+        # The alts, their amounts and their stored ledger entries are independent
+        characters, wallet_amounts, mining_amounts, ledger_entries = (
+            await asyncio.gather(
+                alist(alts),
+                wallet_journal.aaggregate_by_field("character_id"),
+                mining_journal.aaggregate_mining_by_field("character_id"),
+                alist(
+                    CharacterLedgerEntry.objects.filter(
+                        owner__in=alts
+                    ).filter_request_period(request_info)
+                ),
+            )
+        )
+
+        character_ledger_list, changed_entries = self._build_character_data(
+            characters=characters,
+            wallet_amounts=wallet_amounts,
+            mining_amounts=mining_amounts,
+            ledger_entries={entry.owner_id: entry for entry in ledger_entries},
+            owner_status=owner.get_status,
+            request_info=request_info,
+        )
+        await CharacterLedgerEntry.objects.abulk_update_or_create(
+            changed_entries, fields=CHARACTER_LEDGER_FIELDS
+        )
+        return character_ledger_list
+
+    # pylint: disable=too-many-positional-arguments
+    async def _aledger_api_response(
+        self,
+        request,
+        character_id: int,
+        year: int,
+        month: int = None,
+        day: int = None,
+        data_only: bool = False,
+    ) -> CharacterLedgerResponse | tuple[int, dict]:
+        """Async variant of `_ledger_api_response`."""
+        perms, owner = await aget_characterowner_or_none(
+            request=request, character_id=character_id
+        )
+
+        if owner is None:
+            return 404, {"error": _("Character not found in Ledger.")}
+
+        if perms is False:
+            return 403, {
+                "error": _("You do not have permission to view this character.")
+            }
+
+        # Build Request Info
+        request_info = OwnerLedgerRequestInfo(
+            owner_id=owner.eve_character.character_id,
+            year=year,
+            month=month,
+            day=day,
+            data_only=data_only,
+        )
+
+        # The update status is loaded with the owner, the aggregation and the
+        # stored billboard entry are independent
+        character_ledger_list, billboard = await asyncio.gather(
+            self.agenerate_character_data(owner=owner, request_info=request_info),
+            owner.ledger_character_billboard.filter(
+                year=request_info.year,
+                month=request_info.month,
+                day=request_info.day,
+            ).afirst(),
+        )
+
+        # If No Billboard Data Exists or Existing Billboard Data is Not Final, Update or Create Billboard Entry for Owner
+        if billboard is None or not billboard.is_final:
+            wallet_journal, mining_journal = self._get_journals(owner, request_info)
+            billboard = (
+                await sync_to_async(
+                    CharacterBillboardEntry.objects.update_or_create_billboard_entry
+                )(
+                    owner=owner,
+                    request_info=request_info,
+                    wallet_journal=wallet_journal,
+                    mining_journal=mining_journal,
+                    ledger_list=character_ledger_list,
+                )
+                or billboard
+            )
+
+        return self._create_ledger_response(
+            owner=owner,
+            request_info=request_info,
+            character_ledger_list=character_ledger_list,
+            billboard=self._create_billboard(billboard),
+        )
+
+
 class CharacterDetailsApiEndpoints:
     tags = ["Character Details"]
 
@@ -554,6 +810,7 @@ class CharacterDetailsApiEndpoints:
         return footer_html
 
     # pylint: disable=too-many-locals
+    @profile_phase("aggregation")
     def _create_ledger_details(
         self,
         journal: QuerySet[CharacterWalletJournalEntry],
@@ -1,24 +1,30 @@
 # Standard Library
+import asyncio
 from collections import defaultdict
 from decimal import Decimal
+from typing import Literal
 
 # Third Party
-from ninja import NinjaAPI, Schema
+from asgiref.sync import sync_to_async
+from ninja import NinjaAPI, Query, Schema
 
 # Django
 from django.contrib.humanize.templatetags.humanize import intcomma
 from django.core.handlers.wsgi import WSGIRequest
 from django.db.models import Q, QuerySet
+from django.http import HttpRequest
 from django.utils import timezone
 from django.utils.translation import gettext as _
 
 # Alliance Auth
-from allianceauth.authentication.models import UserProfile
+from allianceauth.authentication.models import CharacterOwnership
 from allianceauth.services.hooks import get_extension_logger
 
 # AA Ledger
 from ledger import __title__
 from ledger.api.helpers.core import (
+    aget_corporationowner_or_none,
+    alist,
     get_corporationowner_or_none,
 )
 from ledger.api.helpers.icons import (
@@ -40,17 +46,28 @@ from ledger.api.schema import (
 from ledger.constants import NPC_ENTITIES
 from ledger.helpers.eveonline import get_character_portrait_url
 from ledger.helpers.ledger_data import get_footer_text_class
+from ledger.helpers.profiler import profile_phase
 from ledger.helpers.ref_type import RefTypeManager
 from ledger.models.corporationaudit import (
     CorporationOwner,
     CorporationWalletJournalEntry,
 )
 from ledger.models.general import EveEntity
-from ledger.models.ledger import CorporationBillboardEntry
+from ledger.models.ledger import CorporationBillboardEntry, CorporationLedgerEntry
 from ledger.providers import AppLogger
 
 logger = AppLogger(get_extension_logger(__name__), __title__)
 
+# Aggregated fields of the corporation ledger entries
+CORPORATION_LEDGER_FIELDS = [
+    "name",
+    "bounty",
+    "ess",
+    "costs",
+    "miscellaneous",
+    "final_data",
+]
+
 
 class LedgerEntitySchema(Schema):
     entity: EntitySchema
@@ -87,7 +104,11 @@ class CorporationApiEndpoints:
             tags=self.tags,
         )
         def get_corporation_ledger(
-            request: WSGIRequest, corporation_id: int, division_id: int, year: int
+            request: WSGIRequest,
+            corporation_id: int,
+            division_id: int,
+            year: int,
+            response_format: Literal["html", "data"] = Query("html", alias="format"),
         ):
             """Get the ledger for a character for a specific year. Admin Endpoint."""
             return self._ledger_api_response(
@@ -95,6 +116,7 @@ class CorporationApiEndpoints:
                 corporation_id=corporation_id,
                 division_id=division_id,
                 year=year,
+                data_only=response_format == "data",
             )
 
         @api.get(
@@ -108,6 +130,7 @@ class CorporationApiEndpoints:
             division_id: int,
             year: int,
             month: int,
+            response_format: Literal["html", "data"] = Query("html", alias="format"),
         ):
             """Get the ledger for a character for a specific year. Admin Endpoint."""
             return self._ledger_api_response(
@@ -116,6 +139,7 @@ class CorporationApiEndpoints:
                 division_id=division_id,
                 year=year,
                 month=month,
+                data_only=response_format == "data",
             )
 
         @api.get(
@@ -130,6 +154,7 @@ class CorporationApiEndpoints:
             year: int,
             month: int,
             day: int,
+            response_format: Literal["html", "data"] = Query("html", alias="format"),
         ):
             """Get the ledger for a character for a specific year. Admin Endpoint."""
             return self._ledger_api_response(
@@ -139,6 +164,7 @@ class CorporationApiEndpoints:
                 year=year,
                 month=month,
                 day=day,
+                data_only=response_format == "data",
             )
 
         @api.get(
@@ -147,13 +173,17 @@ class CorporationApiEndpoints:
             tags=self.tags,
         )
         def get_corporation_ledger(
-            request: WSGIRequest, corporation_id: int, year: int
+            request: WSGIRequest,
+            corporation_id: int,
+            year: int,
+            response_format: Literal["html", "data"] = Query("html", alias="format"),
         ):
             """Get the ledger for a character for a specific year. Admin Endpoint."""
             return self._ledger_api_response(
                 request=request,
                 corporation_id=corporation_id,
                 year=year,
+                data_only=response_format == "data",
             )
 
         @api.get(
@@ -162,7 +192,11 @@ class CorporationApiEndpoints:
             tags=self.tags,
         )
         def get_corporation_ledger(
-            request: WSGIRequest, corporation_id: int, year: int, month: int
+            request: WSGIRequest,
+            corporation_id: int,
+            year: int,
+            month: int,
+            response_format: Literal["html", "data"] = Query("html", alias="format"),
         ):
             """Get the ledger for a character for a specific year. Admin Endpoint."""
             return self._ledger_api_response(
@@ -170,6 +204,7 @@ class CorporationApiEndpoints:
                 corporation_id=corporation_id,
                 year=year,
                 month=month,
+                data_only=response_format == "data",
             )
 
         @api.get(
@@ -183,6 +218,7 @@ class CorporationApiEndpoints:
             year: int,
             month: int,
             day: int,
+            response_format: Literal["html", "data"] = Query("html", alias="format"),
         ):
             """Get the ledger for a character for a specific year. Admin Endpoint."""
             return self._ledger_api_response(
@@ -191,6 +227,7 @@ class CorporationApiEndpoints:
                 year=year,
                 month=month,
                 day=day,
+                data_only=response_format == "data",
             )
 
     # pylint: disable=duplicate-code
@@ -211,6 +248,10 @@ class CorporationApiEndpoints:
         Returns:
             str: The generated footer HTML.
         """
+        # Skip Footer in Data-Only Mode
+        if request_info.data_only:
+            return request_info
+
         total_bounty = sum(entity.ledger.bounty for entity in entities)
         total_ess = sum(entity.ledger.ess for entity in entities)
         total_costs = sum(entity.ledger.costs for entity in entities)
@@ -271,6 +312,8 @@ class CorporationApiEndpoints:
         entity: EntitySchema,
         request_info: CorporationLedgerRequestInfo,
         entries_by_entity: dict[int, list[dict]],
+        ledger_entries: dict[int, CorporationLedgerEntry],
+        changed_entries: list[CorporationLedgerEntry],
         processed_entry_ids: set[int] | None = None,
     ) -> LedgerEntitySchema | None:
         """
@@ -284,6 +327,8 @@ class CorporationApiEndpoints:
             entity (EntitySchema): The entity schema for which to process entries.
             request_info (CorporationLedgerRequestInfo): The request information object.
             entries_by_entity (dict[int, list[dict]]): The mapping of entity IDs to their ledger entries.
+            ledger_entries (dict[int, CorporationLedgerEntry]): The stored ledger entries per entity ID.
+            changed_entries (list[CorporationLedgerEntry]): The list to append the ledger entries to save to.
             processed_entry_ids (set[int]|None): The set of already processed ledger entry IDs to avoid double-counting.
         Returns:
             list[EntitySchema]: A list of entity schemas for each processed entity.
@@ -319,12 +364,7 @@ class CorporationApiEndpoints:
         entry_ids = list(unique.keys())
         entry_list = list(unique.values())
 
-        ledger_data = owner.ledger_corporation.filter(
-            entity_id=entity.entity_id,
-            year=request_info.year,
-            month=request_info.month,
-            day=request_info.day,
-        ).first()
+        ledger_data = ledger_entries.get(entity.entity_id)
 
         # If Ledger Entry Exists, Use it. Otherwise, Aggregate Data and Create/Update Ledger Entry.
         if ledger_data is not None and ledger_data.is_final:
@@ -350,21 +390,22 @@ class CorporationApiEndpoints:
                 entry_list, RefTypeManager.ledger_ref_types(), sign="positive"
             )
 
-            owner.ledger_corporation.update_or_create(
-                entity_id=entity.entity_id,
-                year=request_info.year,
-                month=request_info.month,
-                day=request_info.day,
-                defaults={
-                    "name": entity.entity_name,
-                    "owner": owner,
-                    "bounty": entity_bounty,
-                    "ess": entity_ess,
-                    "costs": entity_costs,
-                    "miscellaneous": entity_miscellaneous,
-                    "final_data": request_info.is_final_data,
-                },
-            )
+            # Update or Create Ledger Entry to Store Aggregated Data
+            if ledger_data is None:
+                ledger_data = CorporationLedgerEntry(
+                    owner=owner,
+                    entity_id=entity.entity_id,
+                    year=request_info.year,
+                    month=request_info.month,
+                    day=request_info.day,
+                )
+            ledger_data.name = entity.entity_name
+            ledger_data.bounty = entity_bounty
+            ledger_data.ess = entity_ess
+            ledger_data.costs = entity_costs
+            ledger_data.miscellaneous = entity_miscellaneous
+            ledger_data.final_data = request_info.is_final_data
+            changed_entries.append(ledger_data)
 
         total = sum(
             [
@@ -392,6 +433,21 @@ class CorporationApiEndpoints:
         processed_entry_ids.update(entry_ids)
         return response_entity
 
+    def get_member_ownerships(self, entity_ids: set[int]) -> QuerySet:
+        """Get the ownerships of the auth member entities ordered by account."""
+        # Map the party characters to their accounts in a single query
+        return (
+            CharacterOwnership.objects.filter(
+                character__character_id__in=entity_ids,
+                user__profile__main_character__isnull=False,
+            )
+            .select_related("character", "user__profile__main_character")
+            .order_by(
+                "user__profile__main_character__character_name",
+                "character__character_name",
+            )
+        )
+
     # pylint: disable=too-many-positional-arguments
     def process_member_ledger_data(
         self,
@@ -399,8 +455,11 @@ class CorporationApiEndpoints:
         entity_ids: set[int],
         request_info: CorporationLedgerRequestInfo,
         entries_by_entity: dict[int, list[dict]],
+        ledger_entries: dict[int, CorporationLedgerEntry],
+        changed_entries: list[CorporationLedgerEntry],
         processed_entry_ids: set[int],
         entity_ledger_list: list[LedgerEntitySchema],
+        ownerships: list[CharacterOwnership] | None = None,
     ) -> list[EntitySchema]:
         """
         Process the ledger data for auth member entities.
@@ -413,33 +472,25 @@ class CorporationApiEndpoints:
             entity_ids (set[int]): The set of entity IDs to process.
             request_info (CorporationLedgerRequestInfo): The request information object.
             entries_by_entity (dict[int, list[dict]]): The mapping of entity IDs to their ledger entries.
+            ledger_entries (dict[int, CorporationLedgerEntry]): The stored ledger entries per entity ID.
+            changed_entries (list[CorporationLedgerEntry]): The list to append the ledger entries to save to.
             processed_entry_ids (set[int]): The set of already processed ledger entry IDs.
             entity_ledger_list (list[LedgerEntitySchema]): The list to append processed ledger data to.
+            ownerships (list[CharacterOwnership], optional): The prefetched ownerships of the entity IDs. Defaults to None.
         Returns:
             list[int]: A list of processed entity IDs.
         """
+        if ownerships is None:
+            ownerships = self.get_member_ownerships(entity_ids)
 
-        accounts = UserProfile.objects.filter(
-            main_character__isnull=False,
-        ).order_by(
-            "user__profile__main_character__character_name",
-        )
+        alts_by_account: dict[int, list[CharacterOwnership]] = defaultdict(list)
+        for ownership in ownerships:
+            alts_by_account[ownership.user_id].append(ownership)
 
         auth_entity_ids = []
-        for account in accounts:
-            alts = account.user.character_ownerships.all()
-            existings_alts = alts.filter(
-                character__character_id__in=entity_ids.intersection(
-                    alts.values_list("character__character_id", flat=True)
-                )
-            )
-            alt_ids = list(
-                existings_alts.values_list("character__character_id", flat=True)
-            )
-
-            # Skip if no characters in Corporation
-            if not alt_ids:
-                continue
+        for existings_alts in alts_by_account.values():
+            account = existings_alts[0].user.profile
+            alt_ids = [alt.character.character_id for alt in existings_alts]
 
             response_ledger = self._process_entity_entries(
                 owner=owner,
@@ -447,16 +498,26 @@ class CorporationApiEndpoints:
                     entity_id=account.main_character.character_id,
                     entity_name=account.main_character.character_name,
                     alt_ids=alt_ids,
-                    icon=get_character_portrait_url(
-                        character_id=account.main_character.character_id,
-                        character_name=account.main_character.character_name,
-                        size=32,
-                        as_html=True,
+                    icon=(
+                        None
+                        if request_info.data_only
+                        else get_character_portrait_url(
+                            character_id=account.main_character.character_id,
+                            character_name=account.main_character.character_name,
+                            size=32,
+                            as_html=True,
+                        )
+                    ),
+                    popover=(
+                        None
+                        if request_info.data_only
+                        else get_corporation_ledger_popover_button(alts=existings_alts)
                     ),
-                    popover=get_corporation_ledger_popover_button(alts=existings_alts),
                 ),
                 request_info=request_info,
                 entries_by_entity=entries_by_entity,
+                ledger_entries=ledger_entries,
+                changed_entries=changed_entries,
                 processed_entry_ids=processed_entry_ids,
             )
             auth_entity_ids.extend(alt_ids)
@@ -473,6 +534,8 @@ class CorporationApiEndpoints:
         entities: list[EveEntity],
         request_info: CorporationLedgerRequestInfo,
         entries_by_entity: dict[int, list[dict]],
+        ledger_entries: dict[int, CorporationLedgerEntry],
+        changed_entries: list[CorporationLedgerEntry],
         processed_entry_ids: set[int],
         entity_ledger_list: list[LedgerEntitySchema],
     ) -> list[LedgerEntitySchema]:
@@ -487,6 +550,8 @@ class CorporationApiEndpoints:
             entities (list[EveEntity]): The list of entities to process.
             request_info (CorporationLedgerRequestInfo): The request information object.
             entries_by_entity (dict[int, list[dict]]): The mapping of entity IDs to their ledger entries.
+            ledger_entries (dict[int, CorporationLedgerEntry]): The stored ledger entries per entity ID.
+            changed_entries (list[CorporationLedgerEntry]): The list to append the ledger entries to save to.
             processed_entry_ids (set[int]): The set of already processed ledger entry IDs.
             entity_ledger_list (list[LedgerEntitySchema]): The list to append processed ledger data to.
         Returns:
@@ -498,10 +563,16 @@ class CorporationApiEndpoints:
                 entity=EntitySchema(
                     entity_id=entity.eve_id,
                     entity_name=entity.name,
-                    icon=entity.get_portrait(size=32, as_html=True),
+                    icon=(
+                        None
+                        if request_info.data_only
+                        else entity.get_portrait(size=32, as_html=True)
+                    ),
                 ),
                 request_info=request_info,
                 entries_by_entity=entries_by_entity,
+                ledger_entries=ledger_entries,
+                changed_entries=changed_entries,
                 processed_entry_ids=processed_entry_ids,
             )
             if response_ledger is None:
@@ -511,24 +582,11 @@ class CorporationApiEndpoints:
 
         return entity_ledger_list
 
-    # pylint: disable=too-many-locals
-    def generate_entity_data(
+    def _get_journal(
         self, owner: CorporationOwner, request_info: CorporationLedgerRequestInfo
-    ) -> list[CorporationLedgerResponse]:
-        """
-        Generate the ledger data for a corporation owner.
-
-        This Helper function generates the ledger data for a entity
-        based on the provided date query.
-
-        Args:
-            owner (CorporationOwner): The corporation owner object.
-            request_info (CorporationLedgerRequestInfo): The request information object.
-        Returns:
-            list[CorporationLedgerResponse]: A list of ledger responses for each entity.
-        """
-        # Get Corporation Wallet Journal Entries
-        corp_journal = (
+    ) -> QuerySet[CorporationWalletJournalEntry]:
+        """Get the wallet journal of the corporation owner for the requested period."""
+        return (
             CorporationWalletJournalEntry.objects.filter(
                 division__corporation=owner,
                 **request_info.to_date_query(),
@@ -543,7 +601,9 @@ class CorporationApiEndpoints:
             ).order_by("-date")
         )
 
-        corp_journal_values = corp_journal.values(
+    def _get_journal_values(self, corp_journal: QuerySet) -> QuerySet:
+        """Get the values of the wallet journal rows used for the aggregation."""
+        return corp_journal.values(
             "entry_id",
             "amount",
             "ref_type",
@@ -552,6 +612,41 @@ class CorporationApiEndpoints:
             "date",
         )
 
+    def _group_by_entity(self, rows) -> dict[int, list[dict]]:
+        """Group the wallet journal rows by their first and second party."""
+        entries_by_entity: dict[int, list[dict]] = defaultdict(list)
+        for row in rows:
+            a = row.get("first_party_id")
+            b = row.get("second_party_id")
+            if a:
+                entries_by_entity[a].append(row)
+
+            # Only append second party if different from first to avoid double-counting
+            if b and b != a:
+                entries_by_entity[b].append(row)
+        return entries_by_entity
+
+    # pylint: disable=too-many-locals
+    @profile_phase("aggregation")
+    def generate_entity_data(
+        self, owner: CorporationOwner, request_info: CorporationLedgerRequestInfo
+    ) -> list[CorporationLedgerResponse]:
+        """
+        Generate the ledger data for a corporation owner.
+
+        This Helper function generates the ledger data for a entity
+        based on the provided date query.
+
+        Args:
+            owner (CorporationOwner): The corporation owner object.
+            request_info (CorporationLedgerRequestInfo): The request information object.
+        Returns:
+            list[CorporationLedgerResponse]: A list of ledger responses for each entity.
+        """
+        # Get Corporation Wallet Journal Entries
+        corp_journal = self._get_journal(owner, request_info)
+        corp_journal_values = self._get_journal_values(corp_journal)
+
         # Check for Existing Billboard Entry
         billboard = owner.ledger_corporation_billboard.filter(
             year=request_info.year,
@@ -563,22 +658,15 @@ class CorporationApiEndpoints:
         if not corp_journal.exists():
             return []
 
-        entity_ids = set()
         entity_ledger_list: list[LedgerEntitySchema] = []
         processed_entry_ids: set[int] = set()
-        entries_by_entity: dict[int, list[dict]] = defaultdict(list)
-
-        for row in corp_journal_values:
-            a = row.get("first_party_id")
-            b = row.get("second_party_id")
-            if a:
-                entries_by_entity[a].append(row)
-                entity_ids.add(a)
-
-            # Only append second party if different from first to avoid double-counting
-            if b and b != a:
-                entries_by_entity[b].append(row)
-                entity_ids.add(b)
+        changed_entries: list[CorporationLedgerEntry] = []
+        ledger_entries = {
+            entry.entity_id: entry
+            for entry in owner.ledger_corporation.filter_request_period(request_info)
+        }
+        entries_by_entity = self._group_by_entity(corp_journal_values)
+        entity_ids = set(entries_by_entity)
 
         # Process Auth Entities (Members) First
         auth_entity_ids = self.process_member_ledger_data(
@@ -586,6 +674,8 @@ class CorporationApiEndpoints:
             entity_ids=entity_ids,
             request_info=request_info,
             entries_by_entity=entries_by_entity,
+            ledger_entries=ledger_entries,
+            changed_entries=changed_entries,
             processed_entry_ids=processed_entry_ids,
             entity_ledger_list=entity_ledger_list,
         )
@@ -612,6 +702,8 @@ class CorporationApiEndpoints:
             entities=list(entities),
             request_info=request_info,
             entries_by_entity=entries_by_entity,
+            ledger_entries=ledger_entries,
+            changed_entries=changed_entries,
             processed_entry_ids=processed_entry_ids,
             entity_ledger_list=entity_ledger_list,
         )
@@ -622,10 +714,16 @@ class CorporationApiEndpoints:
             entities=list(npc_entities),
             request_info=request_info,
             entries_by_entity=entries_by_entity,
+            ledger_entries=ledger_entries,
+            changed_entries=changed_entries,
             processed_entry_ids=processed_entry_ids,
             entity_ledger_list=entity_ledger_list,
         )
 
+        CorporationLedgerEntry.objects.bulk_update_or_create(
+            changed_entries, fields=CORPORATION_LEDGER_FIELDS
+        )
+
         # If No Billboard Data Exists or Existing Billboard Data is Not Final, Update or Create Billboard Entry for Owner
         if billboard is None or not billboard.is_final:
             logger.debug(
@@ -641,6 +739,7 @@ class CorporationApiEndpoints:
             )
         return entity_ledger_list
 
+    @profile_phase("billboard")
     def generate_billboard_data(
         self,
         owner: CorporationOwner,
@@ -665,14 +764,19 @@ class CorporationApiEndpoints:
             day=request_info.day,
         ).first()
 
+        return self._create_billboard(billboard)
+
+    def _create_billboard(
+        self, billboard: CorporationBillboardEntry | None
+    ) -> BillboardSchema:
+        """Create the billboard schema of a billboard entry."""
         # If Billboard Data Still Doesn't Exist, Return Empty Billboard Schema
         if billboard is None:
             return BillboardSchema()
 
-        response_billboard = BillboardSchema(
+        return BillboardSchema(
             xy_chart=billboard.xy_billboard, chord_chart=billboard.chord_billboard
         )
-        return response_billboard
 
     # pylint: disable=too-many-positional-arguments, duplicate-code
     def _ledger_api_response(
@@ -683,6 +787,7 @@ class CorporationApiEndpoints:
         division_id: int = None,
         month: int = None,
         day: int = None,
+        data_only: bool = False,
     ) -> CorporationLedgerResponse | tuple[int, dict]:
         """
         Helper function to generate ledger response for various date parameters.
@@ -697,6 +802,7 @@ class CorporationApiEndpoints:
             division_id (int, optional): The division ID for the ledger data. Defaults to None.
             month (int, optional): The month for the ledger data. Defaults to None.
             day (int, optional): The day for the ledger data. Defaults to None.
+            data_only (bool, optional): Whether to skip the pre-rendered HTML fragments. Defaults to False.
         Returns:
             CorporationLedgerResponse | tuple[int, dict]: The ledger response or error tuple.
         """
@@ -720,6 +826,7 @@ class CorporationApiEndpoints:
             year=year,
             month=month,
             day=day,
+            data_only=data_only,
         )
 
         # Generate Entity Ledger Data
@@ -734,6 +841,21 @@ class CorporationApiEndpoints:
             request_info=request_info,
         )
 
+        return self._create_ledger_response(
+            owner=owner,
+            request_info=request_info,
+            entity_ledger_list=entity_ledger_list,
+            billboard=billboard,
+        )
+
+    def _create_ledger_response(
+        self,
+        owner: CorporationOwner,
+        request_info: CorporationLedgerRequestInfo,
+        entity_ledger_list: list[LedgerEntitySchema],
+        billboard: BillboardSchema,
+    ) -> CorporationLedgerResponse:
+        """Create the ledger response of a corporation owner."""
         # Update Request Info with Available Data
         self._create_datatable_footer(
             entities=entity_ledger_list, request_info=request_info
@@ -743,7 +865,9 @@ class CorporationApiEndpoints:
             owner=OwnerSchema(
                 character_id=owner.eve_corporation.corporation_id,
                 character_name=owner.eve_corporation.corporation_name,
-                icon=owner.get_portrait(as_html=True),
+                icon=(
+                    None if request_info.data_only else owner.get_portrait(as_html=True)
+                ),
             ),
             information=request_info,
             entities=entity_ledger_list,
@@ -757,6 +881,290 @@ class CorporationApiEndpoints:
         return response_ledger
 
 
+class CorporationAsyncApiEndpoints(CorporationApiEndpoints):
+    """
+    Async variant of the Corporation Ledger endpoints for ASGI deployments.
+
+    The independent queries of a request run concurrently with the async ORM,
+    so slow ledger requests don't tie up a worker thread each.
+    """
+
+    # pylint: disable=super-init-not-called, function-redefined
+    # flake8: noqa: F811
+    def __init__(self, api: NinjaAPI):
+        @api.get(
+            "corporation/{corporation_id}/division/{division_id}/date/{year}/",
+            response={200: CorporationLedgerResponse, 403: dict, 404: dict},
+            tags=self.tags,
+        )
+        async def get_corporation_ledger(
+            request: HttpRequest,
+            corporation_id: int,
+            division_id: int,
+            year: int,
+            response_format: Literal["html", "data"] = Query("html", alias="format"),
+        ):
+            """Get the ledger for a character for a specific year. Admin Endpoint."""
+            return await self._aledger_api_response(
+                request=request,
+                corporation_id=corporation_id,
+                division_id=division_id,
+                year=year,
+                data_only=response_format == "data",
+            )
+
+        @api.get(
+            "corporation/{corporation_id}/division/{division_id}/date/{year}/{month}/",
+            response={200: CorporationLedgerResponse, 403: dict, 404: dict},
+            tags=self.tags,
+        )
+        async def get_corporation_ledger(
+            request: HttpRequest,
+            corporation_id: int,
+            division_id: int,
+            year: int,
+            month: int,
+            response_format: Literal["html", "data"] = Query("html", alias="format"),
+        ):
+            """Get the ledger for a character for a specific year. Admin Endpoint."""
+            return await self._aledger_api_response(
+                request=request,
+                corporation_id=corporation_id,
+                division_id=division_id,
+                year=year,
+                month=month,
+                data_only=response_format == "data",
+            )
+
+        @api.get(
+            "corporation/{corporation_id}/division/{division_id}/date/{year}/{month}/{day}/",
+            response={200: CorporationLedgerResponse, 403: dict, 404: dict},
+            tags=self.tags,
+        )
+        async def get_corporation_ledger(
+            request: HttpRequest,
+            corporation_id: int,
+            division_id: int,
+            year: int,
+            month: int,
+            day: int,
+            response_format: Literal["html", "data"] = Query("html", alias="format"),
+        ):
+            """Get the ledger for a character for a specific year. Admin Endpoint."""
+            return await self._aledger_api_response(
+                request=request,
+                corporation_id=corporation_id,
+                division_id=division_id,
+                year=year,
+                month=month,
+                day=day,
+                data_only=response_format == "data",
+            )
+
+        @api.get(
+            "corporation/{corporation_id}/date/{year}/",
+            response={200: CorporationLedgerResponse, 403: dict, 404: dict},
+            tags=self.tags,
+        )
+        async def get_corporation_ledger(
+            request: HttpRequest,
+            corporation_id: int,
+            year: int,
+            response_format: Literal["html", "data"] = Query("html", alias="format"),
+        ):
+            """Get the ledger for a character for a specific year. Admin Endpoint."""
+            return await self._aledger_api_response(
+                request=request,
+                corporation_id=corporation_id,
+                year=year,
+                data_only=response_format == "data",
+            )
+
+        @api.get(
+            "corporation/{corporation_id}/date/{year}/{month}/",
+            response={200: CorporationLedgerResponse, 403: dict, 404: dict},
+            tags=self.tags,
+        )
+        async def get_corporation_ledger(
+            request: HttpRequest,
+            corporation_id: int,
+            year: int,
+            month: int,
+            response_format: Literal["html", "data"] = Query("html", alias="format"),
+        ):
+            """Get the ledger for a character for a specific year. Admin Endpoint."""
+            return await self._aledger_api_response(
+                request=request,
+                corporation_id=corporation_id,
+                year=year,
+                month=month,
+                data_only=response_format == "data",
+            )
+
+        @api.get(
+            "corporation/{corporation_id}/date/{year}/{month}/{day}/",
+            response={200: CorporationLedgerResponse, 403: dict, 404: dict},
+            tags=self.tags,
+        )
+        async def get_corporation_ledger(
+            request: HttpRequest,
+            corporation_id: int,
+            year: int,
+            month: int,
+            day: int,
+            response_format: Literal["html", "data"] = Query("html", alias="format"),
+        ):
+            """Get the ledger for a character for a specific year. Admin Endpoint."""
+            return await self._aledger_api_response(
+                request=request,
+                corporation_id=corporation_id,
+                year=year,
+                month=month,
+                day=day,
+                data_only=response_format == "data",
+            )
+
+    async def agenerate_entity_data(
+        self, owner: CorporationOwner, request_info: CorporationLedgerRequestInfo
+    ) -> list[LedgerEntitySchema]:
+        """Async variant of `generate_entity_data` without the billboard update."""
+        corp_journal = self._get_journal(owner, request_info)
+
+        # The journal rows and the stored ledger entries are independent
+        rows, ledger_entries = await asyncio.gather(
+            alist(self._get_journal_values(corp_journal)),
+            alist(owner.ledger_corporation.filter_request_period(request_info)),
+        )
+
+        # Skip Corporation if no Ledger Entries
+        if not rows:
+            return []
+
+        entries_by_entity = self._group_by_entity(rows)
+        entity_ids = set(entries_by_entity)
+
+        # The members, the other entities and the NPC entities are independent
+        ownerships, entities, npc_entities = await asyncio.gather(
+            alist(self.get_member_ownerships(entity_ids)),
+            alist(
+                EveEntity.objects.filter(eve_id__in=entity_ids)
+                # Exclude NPC Entities
+                .exclude(eve_id__in=NPC_ENTITIES)
+                # Exclude Corporation Itself
+                .exclude(eve_id=owner.eve_corporation.corporation_id).order_by("name")
+            ),
+            alist(EveEntity.objects.filter(eve_id__in=NPC_ENTITIES).order_by("name")),
+        )
+
+        entity_ledger_list: list[LedgerEntitySchema] = []
+        processed_entry_ids: set[int] = set()
+        changed_entries: list[CorporationLedgerEntry] = []
+        ledger_entries = {entry.entity_id: entry for entry in ledger_entries}
+
+        # Process Auth Entities (Members) First
+        auth_entity_ids = set(
+            self.process_member_ledger_data(
+                owner=owner,
+                entity_ids=entity_ids,
+                request_info=request_info,
+                entries_by_entity=entries_by_entity,
+                ledger_entries=ledger_entries,
+                changed_entries=changed_entries,
+                processed_entry_ids=processed_entry_ids,
+                entity_ledger_list=entity_ledger_list,
+                ownerships=ownerships,
+            )
+        )
+
+        # Process Remaining Entities, then NPC Entities Last
+        for entity_list in (
+            [entity for entity in entities if entity.eve_id not in auth_entity_ids],
+            npc_entities,
+        ):
+            self._process_ledger_data(
+                owner=owner,
+                entities=entity_list,
+                request_info=request_info,
+                entries_by_entity=entries_by_entity,
+                ledger_entries=ledger_entries,
+                changed_entries=changed_entries,
+                processed_entry_ids=processed_entry_ids,
+                entity_ledger_list=entity_ledger_list,
+            )
+
+        await CorporationLedgerEntry.objects.abulk_update_or_create(
+            changed_entries, fields=CORPORATION_LEDGER_FIELDS
+        )
+        return entity_ledger_list
+
+    # pylint: disable=too-many-positional-arguments
+    async def _aledger_api_response(
+        self,
+        request,
+        corporation_id: int,
+        year: int,
+        division_id: int = None,
+        month: int = None,
+        day: int = None,
+        data_only: bool = False,
+    ) -> CorporationLedgerResponse | tuple[int, dict]:
+        """Async variant of `_ledger_api_response`."""
+        perms, owner = await aget_corporationowner_or_none(
+            request=request, corporation_id=corporation_id
+        )
+
+        if owner is None:
+            return 404, {"error": _("Corporation not found in Ledger.")}
+
+        if perms is False:
+            return 403, {
+                "error": _("You do not have permission to view this corporation.")
+            }
+
+        # Build Request Info
+        request_info = CorporationLedgerRequestInfo(
+            owner=owner,
+            owner_id=owner.eve_corporation.corporation_id,
+            division_id=division_id,
+            year=year,
+            month=month,
+            day=day,
+            data_only=data_only,
+        )
+
+        # The update status is loaded with the owner, the aggregation and the
+        # stored billboard entry are independent
+        entity_ledger_list, billboard = await asyncio.gather(
+            self.agenerate_entity_data(owner=owner, request_info=request_info),
+            owner.ledger_corporation_billboard.filter(
+                year=request_info.year,
+                month=request_info.month,
+                day=request_info.day,
+            ).afirst(),
+        )
+
+        # If No Billboard Data Exists or Existing Billboard Data is Not Final, Update or Create Billboard Entry for Owner
+        if entity_ledger_list and (billboard is None or not billboard.is_final):
+            billboard = (
+                await sync_to_async(
+                    CorporationBillboardEntry.objects.update_or_create_billboard_entry
+                )(
+                    owner=owner,
+                    request_info=request_info,
+                    wallet_journal=self._get_journal(owner, request_info),
+                    ledger_list=entity_ledger_list,
+                )
+                or billboard
+            )
+
+        return self._create_ledger_response(
+            owner=owner,
+            request_info=request_info,
+            entity_ledger_list=entity_ledger_list,
+            billboard=self._create_billboard(billboard),
+        )
+
+
 class CorporationDetailsApiEndpoints:
     tags = ["Corporation Details"]
 
@@ -916,6 +1324,7 @@ class CorporationDetailsApiEndpoints:
         return footer_html
 
     # pylint: disable=too-many-locals
+    @profile_phase("aggregation")
     def _create_ledger_details(
         self,
         journal: QuerySet[CorporationWalletJournalEntry],
@@ -1016,16 +1425,16 @@ class CorporationDetailsApiEndpoints:
     ) -> list[int] | None:
         """
         Check if the entity_id belongs to a auth account of the corporation.
+
+        Returns all character IDs of the account or None if the entity is not a member.
         """
-        for member in owner.auth_accounts:
-            alt_ids = list(
-                member.user.character_ownerships.all().values_list(
-                    "character__character_id", flat=True
-                )
-            )
-            if entity_id in alt_ids:
-                return alt_ids
-        return None
+        alt_ids = list(
+            CharacterOwnership.objects.filter(
+                user__character_ownerships__character__character_id=entity_id,
+                user__profile__main_character__isnull=False,
+            ).values_list("character__character_id", flat=True)
+        )
+        return alt_ids or None
 
     def create_entity_details(
         self,
@@ -1,3 +1,9 @@
+# Standard Library
+import asyncio
+
+# Third Party
+from asgiref.sync import sync_to_async
+
 # Django
 from django.core.exceptions import ObjectDoesNotExist
 from django.db.models import QuerySet
@@ -8,11 +14,14 @@ from allianceauth.services.hooks import get_extension_logger
 
 # AA Ledger
 from ledger import __title__, models
+from ledger.helpers.permissions import PermissionResolver
+from ledger.helpers.profiler import profile_phase
 from ledger.providers import AppLogger
 
 logger = AppLogger(get_extension_logger(__name__), __title__)
 
 
+@profile_phase("permission")
 def get_characterowner_or_none(
     request, character_id
 ) -> tuple[bool, models.CharacterOwner | None]:
@@ -29,12 +38,49 @@ def get_characterowner_or_none(
         return None, None
 
     # check access
-    visible = models.CharacterOwner.objects.visible_eve_characters(request.user)
-    if owner.eve_character not in visible:
+    resolver = PermissionResolver.for_request(request)
+    if not resolver.can_view_character(character_id=owner.eve_character.character_id):
         perms = False
     return perms, owner
 
 
+async def alist(queryset: QuerySet) -> list:
+    """Evaluate a queryset with the async ORM."""
+    return [obj async for obj in queryset]
+
+
+async def aget_or_none(queryset: QuerySet, **kwargs):
+    """Get an object with the async ORM or None if it does not exist."""
+    try:
+        return await queryset.aget(**kwargs)
+    except ObjectDoesNotExist:
+        return None
+
+
+async def aget_characterowner_or_none(
+    request, character_id
+) -> tuple[bool, models.CharacterOwner | None]:
+    """Get Character and check permissions, async variant of `get_characterowner_or_none`."""
+    resolver = PermissionResolver.for_request(request)
+    owner, visible_ids = await asyncio.gather(
+        aget_or_none(
+            # Load the account of the owner for the alt IDs
+            models.CharacterOwner.objects.select_related(
+                "eve_character__character_ownership__user"
+            ),
+            eve_character__character_id=character_id,
+        ),
+        sync_to_async(resolver.visible_character_ids)(),
+    )
+    if owner is None:
+        return False, None
+
+    # check access
+    perms = visible_ids is None or owner.eve_character.character_id in visible_ids
+    return perms, owner
+
+
+@profile_phase("permission")
 def get_corporationowner_or_none(
     request, corporation_id
 ) -> tuple[bool | None, models.CorporationOwner | None]:
@@ -49,12 +95,37 @@ def get_corporationowner_or_none(
         return None, None
 
     # Check access
-    visible = models.CorporationOwner.objects.visible_to(request.user)
-    if main_corp not in visible:
+    resolver = PermissionResolver.for_request(request)
+    if not resolver.can_view_corporation(
+        corporation_id=main_corp.eve_corporation.corporation_id
+    ):
         perms = False
     return perms, main_corp
 
 
+async def aget_corporationowner_or_none(
+    request, corporation_id
+) -> tuple[bool | None, models.CorporationOwner | None]:
+    """Return Corporation and check permissions, async variant of `get_corporationowner_or_none`."""
+    resolver = PermissionResolver.for_request(request)
+    main_corp, visible_ids = await asyncio.gather(
+        aget_or_none(
+            models.CorporationOwner.objects.select_related("eve_corporation"),
+            eve_corporation__corporation_id=corporation_id,
+        ),
+        sync_to_async(resolver.visible_corporation_ids)(),
+    )
+    if main_corp is None:
+        return None, None
+
+    # Check access
+    perms = (
+        visible_ids is None or main_corp.eve_corporation.corporation_id in visible_ids
+    )
+    return perms, main_corp
+
+
+@profile_phase("permission")
 def get_manage_corporation(
     request, corporation_id
 ) -> tuple[bool | None, models.CorporationOwner | None]:
@@ -69,12 +140,15 @@ def get_manage_corporation(
         return None, None
 
     # Check access
-    visible = models.CorporationOwner.objects.manage_to(request.user)
-    if main_corp not in visible:
+    resolver = PermissionResolver.for_request(request)
+    if not resolver.can_manage_corporation(
+        corporation_id=main_corp.eve_corporation.corporation_id
+    ):
         perms = False
     return perms, main_corp
 
 
+@profile_phase("permission")
 def get_alliance_or_none(
     request, alliance_id
 ) -> tuple[bool | None, EveAllianceInfo | None]:
@@ -85,21 +159,43 @@ def get_alliance_or_none(
         eve_corporation__alliance__alliance_id=alliance_id
     )
 
-    if not corporations.exists():
+    corporation_ids = list(
+        corporations.values_list("eve_corporation__corporation_id", flat=True)
+    )
+    if not corporation_ids:
         return None, None
 
-    # Check access
-    visible = models.CorporationOwner.objects.visible_to(request.user)
-
-    # Check if there is an intersection between main_corp and visible
-    common_corps = corporations.intersection(visible)
-    if not common_corps.exists():
+    # Check if there is an intersection between the corporations and visible
+    resolver = PermissionResolver.for_request(request)
+    if not resolver.can_view_any_corporation(corporation_ids=corporation_ids):
         perms = False
 
     ally = EveAllianceInfo.objects.get(alliance_id=alliance_id)
     return perms, ally
 
 
+async def aget_alliance_or_none(
+    request, alliance_id
+) -> tuple[bool | None, EveAllianceInfo | None]:
+    """Get Alliance and check permissions, async variant of `get_alliance_or_none`."""
+    resolver = PermissionResolver.for_request(request)
+    corporation_ids, ally, visible_ids = await asyncio.gather(
+        alist(
+            models.CorporationOwner.objects.filter(
+                eve_corporation__alliance__alliance_id=alliance_id
+            ).values_list("eve_corporation__corporation_id", flat=True)
+        ),
+        aget_or_none(EveAllianceInfo.objects.all(), alliance_id=alliance_id),
+        sync_to_async(resolver.visible_corporation_ids)(),
+    )
+    if not corporation_ids or ally is None:
+        return None, None
+
+    # Check if there is an intersection between the corporations and visible
+    perms = visible_ids is None or not visible_ids.isdisjoint(corporation_ids)
+    return perms, ally
+
+
 def get_all_corporations_from_alliance(
     request, alliance_id
 ) -> tuple[bool | None, list[models.CorporationOwner] | None]:
@@ -110,15 +206,15 @@ def get_all_corporations_from_alliance(
         eve_corporation__alliance__alliance_id=alliance_id
     )
 
-    if not corporations.exists():
+    corporation_ids = list(
+        corporations.values_list("eve_corporation__corporation_id", flat=True)
+    )
+    if not corporation_ids:
         return None, None
 
-    # Check access
-    visible = models.CorporationOwner.objects.visible_to(request.user)
-
-    # Check if there is an intersection between main_corp and visible
-    common_corps = corporations.intersection(visible)
-    if not common_corps.exists():
+    # Check if there is an intersection between the corporations and visible
+    resolver = PermissionResolver.for_request(request)
+    if not resolver.can_view_any_corporation(corporation_ids=corporation_ids):
         perms = False
     return perms, corporations
 
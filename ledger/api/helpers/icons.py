@@ -1,5 +1,4 @@
 # Django
-from django.db import models
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
 
@@ -158,6 +157,9 @@ def get_character_details_info_button(
     Returns:
         String: HTML string containing the info button.
     """
+    # No HTML in Data-Only Mode
+    if request_info.data_only:
+        return ""
 
     kwargs = {"character_id": character_id, "section": section}
     if request_info.year is not None:
@@ -224,7 +226,7 @@ def get_ref_type_details_popover_button(
 
 
 def get_corporation_ledger_popover_button(
-    alts: models.QuerySet[CharacterOwnership],
+    alts: list[CharacterOwnership],
 ) -> str:
     """
     Generate a Corporation Ledger Popover button for the Corporation Ledger View.
@@ -232,7 +234,7 @@ def get_corporation_ledger_popover_button(
     When hover, it triggers a popover to display information about all Alt characters from the Account.
 
     Args:
-        alts (models.QuerySet[CharacterOwnership]): The queryset of alt characters to be viewed.
+        alts (list[CharacterOwnership]): The alt characters to be viewed.
     Returns:
         String: HTML string containing the popover button.
     """
@@ -285,6 +287,9 @@ def get_corporation_details_info_button(
     Returns:
         String: HTML string containing the info button.
     """
+    # No HTML in Data-Only Mode
+    if request_info.data_only:
+        return ""
 
     kwargs = {
         "corporation_id": request_info.owner_id,
@@ -337,6 +342,9 @@ def get_alliance_details_info_button(
     Returns:
         String: HTML string containing the info button.
     """
+    # No HTML in Data-Only Mode
+    if request_info.data_only:
+        return ""
 
     kwargs = {
         "alliance_id": request_info.owner_id,
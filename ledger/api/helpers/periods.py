@@ -0,0 +1,94 @@
+# Standard Library
+from datetime import date, datetime, timedelta
+
+# Django
+from django.utils import timezone
+
+# AA Ledger
+from ledger.helpers.ledger_data import PERIOD_GRANULARITIES, get_period_key
+
+MAX_SUMMARY_PERIODS = 366
+
+
+def get_next_period_key(
+    key: tuple[int, int | None, int | None], granularity: str
+) -> tuple[int, int | None, int | None]:
+    """Get the key of the period following the given period.
+
+    Args:
+        key (tuple): The (year, month, day) period key.
+        granularity (str): The granularity of the period ('year', 'month' or 'day').
+    Returns:
+        tuple[int, int | None, int | None]: The next period key.
+    """
+    year, month, day = key
+    if granularity == "year":
+        return (year + 1, None, None)
+    if granularity == "month":
+        return (year + month // 12, month % 12 + 1, None)
+    next_day = date(year, month, day) + timedelta(days=1)
+    return (next_day.year, next_day.month, next_day.day)
+
+
+def get_period_start(key: tuple[int, int | None, int | None]) -> datetime:
+    """Get the aware start datetime of a period key.
+
+    Args:
+        key (tuple): The (year, month, day) period key.
+    Returns:
+        datetime: The start of the period in the current timezone.
+    """
+    year, month, day = key
+    return timezone.make_aware(datetime(year, month or 1, day or 1))
+
+
+def get_ledger_periods(
+    start: date, end: date | None, granularity: str
+) -> list[tuple[int, int | None, int | None]]:
+    """Expand a date range to the list of period keys it covers.
+
+    Args:
+        start (date): The first date of the range.
+        end (date | None): The last date of the range. Defaults to start if None.
+        granularity (str): The granularity of the periods ('year', 'month' or 'day').
+    Returns:
+        list[tuple[int, int | None, int | None]]: The ordered period keys.
+    Raises:
+        ValueError: If the granularity or range is invalid or covers too many periods.
+    """
+    if granularity not in PERIOD_GRANULARITIES:
+        raise ValueError(f"Invalid granularity '{granularity}'.")
+
+    end = end or start
+    if end < start:
+        raise ValueError("The end date must not be before the start date.")
+
+    key = get_period_key(start, granularity)
+    last_key = get_period_key(end, granularity)
+
+    periods = []
+    while key <= last_key:
+        periods.append(key)
+        if len(periods) > MAX_SUMMARY_PERIODS:
+            raise ValueError(
+                f"A summary can not contain more than {MAX_SUMMARY_PERIODS} periods."
+            )
+        key = get_next_period_key(key, granularity)
+    return periods
+
+
+def get_periods_date_query(
+    periods: list[tuple[int, int | None, int | None]], granularity: str
+) -> dict:
+    """Get the date range query covering all given periods.
+
+    Args:
+        periods (list[tuple]): The ordered period keys.
+        granularity (str): The granularity of the periods ('year', 'month' or 'day').
+    Returns:
+        dict: The date range filter for the journal querysets.
+    """
+    return {
+        "date__gte": get_period_start(periods[0]),
+        "date__lt": get_period_start(get_next_period_key(periods[-1], granularity)),
+    }
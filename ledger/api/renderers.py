@@ -0,0 +1,27 @@
+# Standard Library
+from typing import Any
+
+# Third Party
+from ninja.renderers import BaseRenderer
+from ninja.responses import NinjaJSONEncoder
+
+# Django
+from django.http import HttpRequest
+
+# AA Ledger
+from ledger.helpers.profiler import profile_phase
+from ledger.helpers.serializers import LedgerJSONEncoder, json_dumps
+
+
+class LedgerNinjaJSONEncoder(LedgerJSONEncoder, NinjaJSONEncoder):
+    """JSON Encoder for the Ledger API supporting Decimal, lazy translations and Pydantic Models."""
+
+
+class LedgerJSONRenderer(BaseRenderer):
+    """JSON Renderer for the Ledger API using orjson if installed."""
+
+    media_type = "application/json"
+
+    def render(self, request: HttpRequest, data: Any, *, response_status: int) -> Any:
+        with profile_phase("serialization"):
+            return json_dumps(data, encoder=LedgerNinjaJSONEncoder)
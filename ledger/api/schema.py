@@ -34,13 +34,14 @@ class EntitySchema(Schema):
         entity_id (int): The ID of the entity.
         entity_name (str): The name of the entity.
         icon (str | None): The URL of the entity's icon, if available.
+        popover (str | None): The popover of the entity's alts, if available.
     """
 
     entity_id: int
     entity_name: str
     alt_ids: list[int] = []
-    icon: str = ""
-    popover: str = ""
+    icon: str | None = None
+    popover: str | None = None
 
 
 class CategorySchema(Schema):
@@ -119,6 +120,7 @@ class OwnerLedgerRequestInfo(Schema):
     month: int | None = None
     day: int | None = None
     section: str = "summary"
+    data_only: bool = False
     dropdown_html: str | None = None
     footer_html: str | None = None
 
@@ -183,6 +185,41 @@ class AllianceLedgerRequestInfo(OwnerLedgerRequestInfo):
     corporation_id: int | None = None
 
 
+class LedgerPeriodSchema(Schema):
+    """
+    Schema for a single Ledger Period.
+
+    Attributes:
+        year (int): The year of the period.
+        month (int | None): The month of the period, if any.
+        day (int | None): The day of the period, if any.
+    """
+
+    year: int
+    month: int | None = None
+    day: int | None = None
+
+
+class LedgerPeriodSummarySchema(Schema):
+    period: LedgerPeriodSchema
+    ledger: CharacterLedgerSchema
+
+
+class LedgerSummaryResponse(Schema):
+    """
+    Schema for Ledger Summary Response.
+
+    Attributes:
+        owner_id (int): The ID of the owner.
+        granularity (str): The granularity of the periods.
+        periods (list[LedgerPeriodSummarySchema]): The ledger amounts for each period.
+    """
+
+    owner_id: int
+    granularity: str
+    periods: list[LedgerPeriodSummarySchema]
+
+
 class LedgerDetailsSummary(Schema):
     """
     Schema for summary of ledger details.
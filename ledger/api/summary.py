@@ -0,0 +1,272 @@
+# Standard Library
+from datetime import date
+from decimal import Decimal
+
+# Third Party
+from ninja import NinjaAPI
+
+# Django
+from django.core.handlers.wsgi import WSGIRequest
+from django.db.models import F, Q
+from django.utils.translation import gettext as _
+
+# Alliance Auth
+from allianceauth.services.hooks import get_extension_logger
+
+# AA Ledger
+from ledger import __title__
+from ledger.api.helpers.core import (
+    get_alliance_or_none,
+    get_characterowner_or_none,
+    get_corporationowner_or_none,
+)
+from ledger.api.helpers.periods import get_ledger_periods, get_periods_date_query
+from ledger.api.schema import (
+    CharacterLedgerSchema,
+    LedgerPeriodSchema,
+    LedgerPeriodSummarySchema,
+    LedgerSummaryResponse,
+)
+from ledger.models.characteraudit import (
+    CharacterMiningLedger,
+    CharacterWalletJournalEntry,
+)
+from ledger.models.corporationaudit import (
+    CorporationOwner,
+    CorporationWalletJournalEntry,
+)
+from ledger.providers import AppLogger
+
+logger = AppLogger(get_extension_logger(__name__), __title__)
+
+
+class LedgerSummaryApiEndpoints:
+    tags = ["Summary"]
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def __init__(self, api: NinjaAPI):
+        @api.get(
+            "character/{character_id}/summary/",
+            response={200: LedgerSummaryResponse, 400: dict, 403: dict, 404: dict},
+            tags=self.tags,
+        )
+        def get_character_ledger_summary(
+            request: WSGIRequest,
+            character_id: int,
+            start: date,
+            end: date = None,
+            granularity: str = "month",
+        ):
+            """Get the ledger of a character and its alts for multiple periods."""
+            try:
+                periods = get_ledger_periods(start, end, granularity)
+            except ValueError as e:
+                return 400, {"error": str(e)}
+
+            perms, owner = get_characterowner_or_none(
+                request=request, character_id=character_id
+            )
+
+            if owner is None:
+                return 404, {"error": _("Character not found in Ledger.")}
+
+            if perms is False:
+                return 403, {
+                    "error": _("You do not have permission to view this character.")
+                }
+
+            date_query = get_periods_date_query(periods, granularity)
+            wallet_journal = (
+                CharacterWalletJournalEntry.objects.filter(
+                    character__eve_character__character_id__in=owner.alt_ids,
+                    **date_query,
+                )
+                # Exclude Zero Amount Entries
+                .exclude(amount=Decimal("0.00"))
+                # Exclude Internal Donations between Alts
+                .exclude(
+                    Q(ref_type="player_donation")
+                    & (
+                        Q(first_party__in=owner.alt_ids)
+                        & Q(second_party__in=owner.alt_ids)
+                    )
+                )
+            )
+            mining_journal = CharacterMiningLedger.objects.filter(
+                character__eve_character__character_id__in=owner.alt_ids,
+                **date_query,
+            )
+
+            return self._summary_response(
+                owner_id=owner.eve_character.character_id,
+                periods=periods,
+                granularity=granularity,
+                amounts=wallet_journal.aggregate_by_period(granularity),
+                mining=mining_journal.aggregate_mining_by_period(granularity),
+            )
+
+        @api.get(
+            "corporation/{corporation_id}/summary/",
+            response={200: LedgerSummaryResponse, 400: dict, 403: dict, 404: dict},
+            tags=self.tags,
+        )
+        def get_corporation_ledger_summary(
+            request: WSGIRequest,
+            corporation_id: int,
+            start: date,
+            end: date = None,
+            granularity: str = "month",
+            division_id: int = None,
+        ):
+            """Get the ledger of a corporation for multiple periods."""
+            try:
+                periods = get_ledger_periods(start, end, granularity)
+            except ValueError as e:
+                return 400, {"error": str(e)}
+
+            perms, owner = get_corporationowner_or_none(
+                request=request, corporation_id=corporation_id
+            )
+
+            if owner is None:
+                return 404, {"error": _("Corporation not found in Ledger.")}
+
+            if perms is False:
+                return 403, {
+                    "error": _("You do not have permission to view this corporation.")
+                }
+
+            division_query = {}
+            if division_id is not None:
+                division_query["division__division_id"] = division_id
+
+            corp_journal = (
+                CorporationWalletJournalEntry.objects.filter(
+                    division__corporation=owner,
+                    **get_periods_date_query(periods, granularity),
+                    **division_query,
+                )
+                # Exclude Zero Amount Entries
+                .exclude(amount=Decimal("0.00"))
+                # Exclude Internal Transfers
+                .exclude(
+                    first_party_id=owner.eve_corporation.corporation_id,
+                    second_party_id=owner.eve_corporation.corporation_id,
+                )
+            )
+
+            return self._summary_response(
+                owner_id=owner.eve_corporation.corporation_id,
+                periods=periods,
+                granularity=granularity,
+                amounts=corp_journal.aggregate_by_period(granularity),
+            )
+
+        @api.get(
+            "alliance/{alliance_id}/summary/",
+            response={200: LedgerSummaryResponse, 400: dict, 403: dict, 404: dict},
+            tags=self.tags,
+        )
+        def get_alliance_ledger_summary(
+            request: WSGIRequest,
+            alliance_id: int,
+            start: date,
+            end: date = None,
+            granularity: str = "month",
+        ):
+            """Get the ledger of an alliance for multiple periods."""
+            try:
+                periods = get_ledger_periods(start, end, granularity)
+            except ValueError as e:
+                return 400, {"error": str(e)}
+
+            perms, owner = get_alliance_or_none(
+                request=request, alliance_id=alliance_id
+            )
+
+            if owner is None:
+                return 404, {"error": _("Alliance not found in Ledger.")}
+
+            if perms is False:
+                return 403, {
+                    "error": _("You do not have permission to view this alliance.")
+                }
+
+            corporations = CorporationOwner.objects.filter(
+                eve_corporation__alliance__alliance_id=owner.alliance_id
+            )
+            alliance_journal = (
+                CorporationWalletJournalEntry.objects.filter(
+                    division__corporation__in=corporations,
+                    **get_periods_date_query(periods, granularity),
+                )
+                # Exclude Zero Amount Entries
+                .exclude(amount=Decimal("0.00"))
+                # Exclude Internal Transfers of each Corporation
+                .exclude(
+                    first_party_id=F(
+                        "division__corporation__eve_corporation__corporation_id"
+                    ),
+                    second_party_id=F(
+                        "division__corporation__eve_corporation__corporation_id"
+                    ),
+                )
+            )
+
+            return self._summary_response(
+                owner_id=owner.alliance_id,
+                periods=periods,
+                granularity=granularity,
+                amounts=alliance_journal.aggregate_by_period(granularity),
+            )
+
+    def _summary_response(
+        self,
+        owner_id: int,
+        periods: list[tuple],
+        granularity: str,
+        amounts: dict[tuple, dict],
+        mining: dict[tuple, Decimal] = None,
+    ) -> LedgerSummaryResponse:
+        """
+        Build the summary response for the requested periods.
+
+        Periods without any journal entries are returned with zero amounts.
+
+        Args:
+            owner_id (int): The ID of the owner.
+            periods (list[tuple]): The ordered period keys.
+            granularity (str): The granularity of the periods.
+            amounts (dict[tuple, dict]): The aggregated wallet amounts per period.
+            mining (dict[tuple, Decimal], optional): The aggregated mining amounts per period.
+        Returns:
+            LedgerSummaryResponse: The summary response.
+        """
+        mining = mining or {}
+        summaries: list[LedgerPeriodSummarySchema] = []
+        for key in periods:
+            period_amounts = amounts.get(key, {})
+            bounty = period_amounts.get("bounty", 0)
+            ess = period_amounts.get("ess", 0)
+            miscellaneous = period_amounts.get("miscellaneous", 0)
+            costs = period_amounts.get("costs", 0)
+
+            summaries.append(
+                LedgerPeriodSummarySchema(
+                    period=LedgerPeriodSchema(year=key[0], month=key[1], day=key[2]),
+                    ledger=CharacterLedgerSchema(
+                        bounty=bounty,
+                        ess=ess,
+                        mining=mining.get(key, 0),
+                        costs=costs,
+                        miscellaneous=miscellaneous,
+                        total=sum([bounty, ess, miscellaneous, costs]),
+                    ),
+                )
+            )
+
+        return LedgerSummaryResponse(
+            owner_id=owner_id,
+            granularity=granularity,
+            periods=summaries,
+        )
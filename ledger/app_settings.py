@@ -2,6 +2,9 @@
 App Settings
 """
 
+# Standard Library
+from pathlib import Path
+
 # Django
 from django.conf import settings
 
@@ -24,6 +27,10 @@ LEDGER_STALE_TYPES = getattr(
     },
 )
 
+# Maximum interval in minutes between updates of a section,
+# the interval is doubled each run the ESI data has not changed.
+LEDGER_UPDATE_BACKOFF_MAX = getattr(settings, "LEDGER_UPDATE_BACKOFF_MAX", 60 * 6)
+
 # Mining Price Calculation
 LEDGER_USE_COMPRESSED = getattr(settings, "LEDGER_USE_COMPRESSED", True)
 LEDGER_PRICE_PERCENTAGE = getattr(settings, "LEDGER_PRICE_PERCENTAGE", 0.9)
@@ -35,3 +42,60 @@ LEDGER_PRICE_PERCENTAGE = getattr(settings, "LEDGER_PRICE_PERCENTAGE", 0.9)
 # Can be increased for better performance if your MySQL max_allowed_packet setting
 # is configured higher (default is usually 16-64MB).
 LEDGER_BULK_BATCH_SIZE = getattr(settings, "LEDGER_BULK_BATCH_SIZE", 500)
+
+# Cache Timeout in seconds for the visible Character & Corporation IDs of a User.
+# The cache is invalidated on ownership and permission changes.
+LEDGER_PERMISSION_CACHE_TIMEOUT = getattr(
+    settings, "LEDGER_PERMISSION_CACHE_TIMEOUT", 60 * 60
+)
+
+# ESI Budget of each ESI route group in section updates per window,
+# shared across all workers through the cache. Groups not listed are not limited.
+LEDGER_ESI_BUDGET = getattr(
+    settings,
+    "LEDGER_ESI_BUDGET",
+    {
+        "char-wallet": 150,
+        "char-industry": 150,
+        "char-planets": 150,
+        "corp-detail": 100,
+        "corp-wallet": 100,
+    },
+)
+# Window in seconds the ESI Budget is refilled
+LEDGER_ESI_BUDGET_WINDOW = getattr(settings, "LEDGER_ESI_BUDGET_WINDOW", 60)
+# Maximum seconds a task waits for the ESI Budget before it is requeued
+LEDGER_ESI_BUDGET_MAX_SLEEP = getattr(settings, "LEDGER_ESI_BUDGET_MAX_SLEEP", 5)
+
+# Private directory (mode 0700) the ESI spec trimmed to the Ledger operations is cached in,
+# the ESI client falls back to the full spec if it is not writable or accessible by other users.
+LEDGER_ESI_SPEC_CACHE_DIR = getattr(
+    settings,
+    "LEDGER_ESI_SPEC_CACHE_DIR",
+    Path(settings.BASE_DIR) / "aa-ledger-cache",
+)
+
+# Number of owners updated in-process by a single task of the update sweeps.
+# Keep the batch small enough to finish within LEDGER_TASKS_TIME_LIMIT.
+LEDGER_UPDATE_BATCH_SIZE = getattr(settings, "LEDGER_UPDATE_BATCH_SIZE", 20)
+
+# Cache Timeout in seconds for the Token of a Corporation with the required roles.
+# Also used for the roles of a Character if ESI returns no expiry.
+LEDGER_ROLE_CACHE_TIMEOUT = getattr(settings, "LEDGER_ROLE_CACHE_TIMEOUT", 60 * 60)
+
+# Cache Timeout in seconds for the resolved Token of a Character per scope set.
+# The cache is invalidated on token errors.
+LEDGER_TOKEN_CACHE_TIMEOUT = getattr(settings, "LEDGER_TOKEN_CACHE_TIMEOUT", 60 * 5)
+
+# Serve the Character, Corporation & Alliance Ledger endpoints with async views for ASGI deployments.
+# Enabled when `ledger` is in `APPS_WITH_PUBLIC_VIEWS`, otherwise Alliance Auth wraps the API
+# in its sync `main_character_required` decorator. The API authenticates each request itself.
+LEDGER_API_ASYNC = "ledger" in getattr(settings, "APPS_WITH_PUBLIC_VIEWS", [])
+
+# Profile all Ledger API requests and add a Server-Timing header to the response.
+# Superusers can profile single requests by sending the `X-Ledger-Profile: 1` header.
+LEDGER_API_PROFILING = getattr(settings, "LEDGER_API_PROFILING", False)
+# Number of the slowest queries of a profiled request logged with their EXPLAIN output.
+LEDGER_API_PROFILING_SLOW_QUERIES = getattr(
+    settings, "LEDGER_API_PROFILING_SLOW_QUERIES", 0
+)
@@ -18,4 +18,4 @@ class LedgerConfig(AppConfig):
     def ready(self):
         """Ready"""
         # pylint: disable=import-outside-toplevel, unused-import
-        from . import checks
+        from . import checks, signals
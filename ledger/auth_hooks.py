@@ -10,6 +10,7 @@ from allianceauth.services.hooks import MenuItemHook, UrlHook
 
 # AA Ledger
 from ledger import app_settings, urls
+from ledger.api import API_VIEWS
 from ledger.models.characteraudit import CharacterOwner
 
 
@@ -48,7 +49,8 @@ def register_menu():
 def register_urls():
     """Register app urls"""
 
-    return UrlHook(urls, "ledger", r"^ledger/")
+    # The API authenticates each request itself and may serve async views
+    return UrlHook(urls, "ledger", r"^ledger/", excluded_views=API_VIEWS)
 
 
 @hooks.register("charlink")
@@ -4,12 +4,14 @@ Decorators
 
 # Standard Library
 import time
+from functools import wraps
 
 # Alliance Auth
 from allianceauth.services.hooks import get_extension_logger
 
 # AA Ledger
 from ledger import __title__
+from ledger.helpers import metrics
 from ledger.providers import AppLogger
 
 logger = AppLogger(get_extension_logger(__name__), __title__)
@@ -21,10 +23,11 @@ def log_timing(logs):
     """
 
     def decorator(func):
+        @wraps(func)
         def wrapper(*args, **kwargs):
-            start_time = time.time()
+            start_time = time.perf_counter()
             result = func(*args, **kwargs)
-            end_time = time.time()
+            end_time = time.perf_counter()
             logs.debug(
                 "TIME: %s run for %s seconds with args: %s",
                 end_time - start_time,
@@ -36,3 +39,24 @@ def log_timing(logs):
         return wrapper
 
     return decorator
+
+
+def record_write(func):
+    """
+    Add the duration and the ingested rows of a DB write to the current section update metrics.
+
+    The rows are taken from the `objs` keyword argument.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        start_time = time.perf_counter()
+        result = func(*args, **kwargs)
+        metrics.add_phase(
+            "write",
+            time.perf_counter() - start_time,
+            rows=len(kwargs.get("objs") or []),
+        )
+        return result
+
+    return wrapper
@@ -7,7 +7,6 @@ from typing import TYPE_CHECKING, Any
 # Django
 from django.db.models import QuerySet, TextChoices
 from django.db.models.functions import TruncDay, TruncHour, TruncMonth
-from django.utils.functional import Promise
 from django.utils.timezone import datetime
 from django.utils.translation import gettext_lazy as _
 
@@ -16,6 +15,7 @@ from allianceauth.services.hooks import get_extension_logger
 
 # AA Ledger
 from ledger import __title__
+from ledger.helpers.serializers import json_compatible
 from ledger.providers import AppLogger
 
 logger = AppLogger(get_extension_logger(__name__), __title__)
@@ -30,21 +30,9 @@ class BillboardData:
     categories: list[dict]
     series: list[dict[str, Any]]
 
-    def serialize_decimals(self, obj):
-        if isinstance(obj, dict):  # Recursively serialize dicts
-            return {k: self.serialize_decimals(v) for k, v in obj.items()}
-        if isinstance(obj, list):  # Serialize lists of dicts
-            return [self.serialize_decimals(i) for i in obj]
-        if isinstance(obj, Decimal):  # Convert Decimal to float for JSON serialization
-            return float(obj)
-        if isinstance(obj, Promise):  # Handle lazy translation objects
-            return str(obj)
-        return obj
-
     def asdict(self) -> dict:
-        """Return this object as dict."""
-        serialized_data = self.serialize_decimals(asdict(self))
-        return serialized_data
+        """Return this object as JSON compatible dict."""
+        return json_compatible(asdict(self))
 
 
 class BillboardSystem:
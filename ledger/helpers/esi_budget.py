@@ -0,0 +1,175 @@
+# Standard Library
+import random
+import time
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Third Party
+from celery import Task
+
+# Django
+from django.core.cache import cache
+
+# Alliance Auth
+from allianceauth.services.hooks import get_extension_logger
+
+# AA Ledger
+from ledger import __title__
+from ledger.app_settings import (
+    LEDGER_ESI_BUDGET,
+    LEDGER_ESI_BUDGET_MAX_SLEEP,
+    LEDGER_ESI_BUDGET_WINDOW,
+)
+from ledger.helpers import metrics
+from ledger.providers import AppLogger
+
+logger = AppLogger(get_extension_logger(__name__), __title__)
+
+BUDGET_KEY = "ledger-esi-budget"
+
+# The Task & ESI route group charged for the ESI requests of the current section update
+_current_budget: ContextVar[tuple[Task, str] | None] = ContextVar(
+    "ledger_esi_budget", default=None
+)
+
+
+class ESIBudget:
+    """
+    Token bucket for an ESI route group shared across all Celery workers.
+
+    The bucket is refilled with `tokens` every `window` seconds and counted
+    in the Django cache, so the budget is shared by every worker using the same cache.
+    """
+
+    def __init__(self, group: str, tokens: int | None = None, window: int = None):
+        self.group = group
+        self.tokens = LEDGER_ESI_BUDGET.get(group) if tokens is None else tokens
+        self.window = window or LEDGER_ESI_BUDGET_WINDOW
+
+    def _current_window(self) -> tuple[int, float]:
+        """Return the current window and the seconds until it ends."""
+        now = time.time()
+        window = int(now // self.window)
+        return window, (window + 1) * self.window - now
+
+    def acquire(self, tokens: int = 1) -> float:
+        """
+        Acquire tokens from the bucket.
+
+        Args:
+            tokens (int, optional): The number of tokens to acquire. Defaults to 1.
+        Returns:
+            float: 0 if the tokens were acquired, otherwise the seconds until the bucket is refilled.
+        """
+        # Groups without a budget are not limited
+        if not self.tokens:
+            return 0
+
+        window, remaining = self._current_window()
+        key = f"{BUDGET_KEY}-{self.group}-{window}"
+        # Keep the counter until the window has passed on all workers
+        cache.add(key, 0, timeout=self.window * 2)
+        used = cache.incr(key, tokens)
+
+        if used <= self.tokens:
+            return 0
+
+        logger.debug(
+            "ESI budget for %s exhausted (%s/%s), refill in %.2f seconds",
+            self.group,
+            used,
+            self.tokens,
+            remaining,
+        )
+        return remaining
+
+    def remaining(self) -> int | None:
+        """Return the remaining tokens of the current window or None if not limited."""
+        if not self.tokens:
+            return None
+        window, _ = self._current_window()
+        used = cache.get(f"{BUDGET_KEY}-{self.group}-{window}", 0)
+        return max(self.tokens - used, 0)
+
+
+def acquire_esi_budget(task: Task, group: str) -> None:
+    """
+    Acquire the ESI Budget of a route group before calling ESI.
+
+    Waits if the budget is refilled within `LEDGER_ESI_BUDGET_MAX_SLEEP` seconds,
+    otherwise the task is requeued spread over the next window,
+    up to the `max_retries` of the task.
+
+    Args:
+        task (Task): The Celery Task calling ESI.
+        group (str): The ESI route group.
+    Raises:
+        Retry: If the budget is exhausted.
+        MaxRetriesExceededError: If the budget is still exhausted after `max_retries`.
+    """
+    budget = ESIBudget(group)
+    wait = budget.acquire()
+    if 0 < wait <= LEDGER_ESI_BUDGET_MAX_SLEEP:
+        time.sleep(wait)
+        wait = budget.acquire()
+    if wait:
+        # Spread requeued tasks over the window to prevent a thundering herd on refill
+        countdown = wait + random.uniform(0, budget.window)
+        if task.max_retries is not None and task.request.retries >= task.max_retries:
+            logger.warning(
+                "ESI budget for %s still exhausted after %s retries, giving up %s",
+                group,
+                task.request.retries,
+                task.name,
+            )
+        else:
+            logger.debug("Requeue %s in %.2f seconds", task.name, countdown)
+            metrics.record_retry("ESIBudget")
+        raise task.retry(countdown=countdown)
+
+
+@contextmanager
+def esi_budget(task: Task, group: str) -> Iterator[None]:
+    """
+    Charge the ESI requests made within the context to the budget of a route group.
+
+    Args:
+        task (Task): The Celery Task calling ESI.
+        group (str): The ESI route group.
+    """
+    reset_token = _current_budget.set((task, group))
+    try:
+        yield
+    finally:
+        _current_budget.reset(reset_token)
+
+
+def acquire_current_esi_budget() -> None:
+    """
+    Acquire the ESI Budget of the current `esi_budget` context before an ESI operation.
+
+    ESI operations outside of an `esi_budget` context are not limited.
+
+    Raises:
+        Retry: If the budget is exhausted.
+        MaxRetriesExceededError: If the budget is still exhausted after `max_retries`.
+    """
+    current = _current_budget.get()
+    if current is not None:
+        acquire_esi_budget(*current)
+
+
+def charge_current_esi_pages(headers: dict | None) -> None:
+    """
+    Charge the additional pages of a paginated ESI operation to the current ESI Budget.
+
+    The pages are already fetched, so the following ESI operations wait for the budget.
+
+    Args:
+        headers (dict | None): The headers of the ESI response.
+    """
+    current = _current_budget.get()
+    pages = int((headers or {}).get("X-Pages", 1))
+    if current is not None and pages > 1:
+        ESIBudget(current[1]).acquire(tokens=pages - 1)
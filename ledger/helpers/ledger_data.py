@@ -1,6 +1,22 @@
 # Standard Library
 from decimal import Decimal
 
+# Django
+from django.db.models import DecimalField, Q, QuerySet, Sum, Value
+from django.db.models.functions import Coalesce, TruncDay, TruncMonth, TruncYear
+from django.utils import timezone
+
+# AA Ledger
+from ledger.helpers.ref_type import RefTypeManager
+
+PERIOD_GRANULARITIES = ("year", "month", "day")
+
+PERIOD_TRUNC_FUNCTIONS = {
+    "year": TruncYear,
+    "month": TruncMonth,
+    "day": TruncDay,
+}
+
 
 def get_footer_text_class(value: int | float | Decimal, mining=False) -> str:
     """Get the text class for a value.
@@ -21,3 +37,142 @@ def get_footer_text_class(value: int | float | Decimal, mining=False) -> str:
     if value < 0:
         return "text-danger"
     return ""
+
+
+def get_period_trunc(granularity: str, field: str = "date"):
+    """Get the truncate expression for a period granularity.
+
+    Args:
+        granularity (str): The granularity of the period ('year', 'month' or 'day').
+        field (str, optional): The date field to truncate. Defaults to "date".
+    Returns:
+        Trunc: The truncate expression for the given granularity.
+    Raises:
+        ValueError: If the granularity is not supported.
+    """
+    try:
+        return PERIOD_TRUNC_FUNCTIONS[granularity](field)
+    except KeyError:
+        raise ValueError(f"Invalid granularity '{granularity}'.") from None
+
+
+def get_period_key(
+    date: timezone.datetime, granularity: str
+) -> tuple[int, int | None, int | None]:
+    """Get the (year, month, day) key of a date for a period granularity.
+
+    Args:
+        date (datetime): The (truncated) date of the period.
+        granularity (str): The granularity of the period ('year', 'month' or 'day').
+    Returns:
+        tuple[int, int | None, int | None]: The period key.
+    """
+    if granularity == "year":
+        return (date.year, None, None)
+    if granularity == "month":
+        return (date.year, date.month, None)
+    return (date.year, date.month, date.day)
+
+
+def get_period_amounts(row: dict) -> dict[str, Decimal]:
+    """Get the ledger amounts of an aggregated row.
+
+    Args:
+        row (dict): The row of an `annotate_by_period` or `annotate_by_field` queryset.
+    Returns:
+        dict[str, Decimal]: The bounty, ess, miscellaneous and costs amounts.
+    """
+    return {
+        "bounty": Decimal(row["total_bounty"]),
+        "ess": Decimal(row["total_ess"]),
+        "miscellaneous": Decimal(row["total_miscellaneous"]),
+        "costs": Decimal(row["total_costs"]),
+    }
+
+
+def get_empty_amounts() -> dict[str, Decimal]:
+    """Get the ledger amounts of an owner without any journal entries."""
+    return {
+        "bounty": Decimal("0.00"),
+        "ess": Decimal("0.00"),
+        "miscellaneous": Decimal("0.00"),
+        "costs": Decimal("0.00"),
+    }
+
+
+def get_ledger_amount_annotations() -> dict[str, Coalesce]:
+    """Get the annotations summing up the bounty, ess, miscellaneous and costs amounts."""
+    ledger_ref_types = RefTypeManager.ledger_ref_types()
+    return {
+        "total_bounty": Coalesce(
+            Sum("amount", filter=Q(ref_type__in=RefTypeManager.BOUNTY_PRIZES)),
+            Value(0),
+            output_field=DecimalField(),
+        ),
+        "total_ess": Coalesce(
+            Sum("amount", filter=Q(ref_type__in=RefTypeManager.ESS_TRANSFER)),
+            Value(0),
+            output_field=DecimalField(),
+        ),
+        "total_miscellaneous": Coalesce(
+            Sum("amount", filter=Q(ref_type__in=ledger_ref_types, amount__gt=0)),
+            Value(0),
+            output_field=DecimalField(),
+        ),
+        "total_costs": Coalesce(
+            Sum("amount", filter=Q(ref_type__in=ledger_ref_types, amount__lt=0)),
+            Value(0),
+            output_field=DecimalField(),
+        ),
+    }
+
+
+class LedgerAmountsQuerySetMixin:
+    """Grouped ledger aggregations for the character & corporation wallet journal querysets."""
+
+    def annotate_by_period(self: QuerySet, granularity: str) -> QuerySet:
+        """Annotate the ledger amounts grouped by period."""
+        return (
+            self.annotate(period=get_period_trunc(granularity))
+            .values("period")
+            .order_by("period")
+            .annotate(**get_ledger_amount_annotations())
+        )
+
+    def aggregate_by_period(self, granularity: str) -> dict[tuple, dict]:
+        """
+        Aggregate the ledger amounts grouped by period in a single query.
+
+        Args:
+            granularity (str): The granularity of the periods ('year', 'month' or 'day').
+        Returns:
+            dict[tuple, dict]: Mapping of (year, month, day) period keys to the aggregated amounts.
+        """
+        return {
+            get_period_key(row["period"], granularity): get_period_amounts(row)
+            for row in self.annotate_by_period(granularity)
+        }
+
+    def annotate_by_field(self: QuerySet, field: str) -> QuerySet:
+        """Annotate the ledger amounts grouped by a field, e.g. the owner."""
+        return self.values(field).order_by().annotate(**get_ledger_amount_annotations())
+
+    def aggregate_by_field(self, field: str) -> dict[int, dict]:
+        """
+        Aggregate the ledger amounts grouped by a field in a single query.
+
+        Args:
+            field (str): The field to group by, e.g. `character_id`.
+        Returns:
+            dict[int, dict]: Mapping of the field values to the aggregated amounts.
+        """
+        return {
+            row[field]: get_period_amounts(row) for row in self.annotate_by_field(field)
+        }
+
+    async def aaggregate_by_field(self, field: str) -> dict[int, dict]:
+        """Async variant of `aggregate_by_field`."""
+        return {
+            row[field]: get_period_amounts(row)
+            async for row in self.annotate_by_field(field)
+        }
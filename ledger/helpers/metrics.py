@@ -0,0 +1,297 @@
+# Standard Library
+import os
+import socket
+import threading
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+# Django
+from django.core.cache import cache
+
+METRICS_KEY = "ledger-metrics"
+# Slots of the processes with metrics and when they expire, every process writes its metrics to its own slot
+METRICS_SLOTS_KEY = f"{METRICS_KEY}-live-slots"
+METRICS_TIMEOUT = 60 * 60 * 24
+# Seconds between writing the metrics of this process to the cache
+FLUSH_INTERVAL = 10
+
+DEFAULT_BUCKETS = (
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1,
+    2.5,
+    5,
+    10,
+    30,
+    60,
+    float("inf"),
+)
+
+DESCRIPTIONS = {
+    "ledger_section_duration_seconds": "Duration of a section update",
+    "ledger_section_phase_duration_seconds": "Duration of a phase of a section update",
+    "ledger_section_updates_total": "Section updates by result",
+    "ledger_section_rows_total": "Rows ingested by section updates",
+    "ledger_esi_request_duration_seconds": "Duration of ESI requests",
+    "ledger_esi_requests_total": "ESI requests by status code, 0 is a cache hit",
+    "ledger_task_retries_total": "Task retries by issue",
+}
+
+_current_section: ContextVar[dict | None] = ContextVar(
+    "ledger_current_section", default=None
+)
+
+
+class MetricsRegistry:
+    """
+    Thread-safe in-process registry of counters and histograms.
+
+    Histograms store the count per bucket, the sum and the total count,
+    buckets are made cumulative when rendered.
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._last_flush = 0.0
+        self._slot_key: str | None = None
+        self.counters: dict[tuple, float] = defaultdict(float)
+        self.histograms: dict[tuple, list[float]] = {}
+
+    @staticmethod
+    def _key(name: str, labels: dict | None) -> tuple:
+        return name, tuple(sorted((labels or {}).items()))
+
+    def inc(self, name: str, labels: dict | None = None, value: float = 1) -> None:
+        """Increment a counter."""
+        with self._lock:
+            self.counters[self._key(name, labels)] += value
+
+    def observe(self, name: str, labels: dict | None, value: float) -> None:
+        """Observe a value of a histogram."""
+        key = self._key(name, labels)
+        with self._lock:
+            histogram = self.histograms.setdefault(key, [0.0] * (len(self.buckets) + 2))
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    histogram[i] += 1
+                    break
+            histogram[-2] += value
+            histogram[-1] += 1
+
+    def snapshot(self) -> dict:
+        """Return a copy of all metrics."""
+        with self._lock:
+            return {
+                "buckets": self.buckets,
+                "counters": dict(self.counters),
+                "histograms": {
+                    key: list(value) for key, value in self.histograms.items()
+                },
+            }
+
+    def reset(self) -> None:
+        """Remove all metrics."""
+        with self._lock:
+            self.counters.clear()
+            self.histograms.clear()
+
+    def flush(self, force: bool = False) -> None:
+        """Write the metrics of this process to the cache to be collected by the web process."""
+        now = time.monotonic()
+        if not force and now - self._last_flush < FLUSH_INTERVAL:
+            return
+        self._last_flush = now
+
+        process = f"{socket.gethostname()}-{os.getpid()}"
+        # Forked processes get their own slot
+        self._slot_key = f"{METRICS_KEY}-{process}-{id(self)}"
+        cache.set(
+            self._slot_key,
+            {"process": process, **self.snapshot()},
+            timeout=METRICS_TIMEOUT,
+        )
+        _register_slot(self._slot_key)
+
+
+def _register_slot(slot_key: str) -> None:
+    """
+    Register a live slot and forget the expired slots of stopped processes.
+
+    A registration lost to a concurrent write is restored by the next flush.
+    """
+    now = time.time()
+    slots = cache.get(METRICS_SLOTS_KEY, {})
+    # Renew the registration once half of its timeout has passed
+    if slots.get(slot_key, 0) > now + METRICS_TIMEOUT / 2:
+        return
+    slots = {key: expires_at for key, expires_at in slots.items() if expires_at > now}
+    slots[slot_key] = now + METRICS_TIMEOUT
+    cache.set(METRICS_SLOTS_KEY, slots, timeout=METRICS_TIMEOUT)
+
+
+registry = MetricsRegistry()
+
+
+def _section_labels() -> dict:
+    """Return the labels of the section updated in the current context."""
+    section = _current_section.get()
+    if section is None:
+        return {"owner_type": "", "section": ""}
+    return {"owner_type": section["owner_type"], "section": section["section"]}
+
+
+@contextmanager
+def section_update(owner_type: str, section: str):
+    """
+    Measure a section update.
+
+    Yields a dict to set the `result` of the update, phases and ESI requests
+    within the context are summed up and labeled with the section.
+
+    Args:
+        owner_type (str): The owner type, e.g. `character`.
+        section (str): The section value.
+    """
+    state = {
+        "owner_type": owner_type,
+        "section": section,
+        "result": "changed",
+        "phases": defaultdict(float),
+        "rows": 0,
+    }
+    token = _current_section.set(state)
+    start_time = time.perf_counter()
+    try:
+        yield state
+    except Exception:
+        state["result"] = "error"
+        raise
+    finally:
+        labels = _section_labels()
+        registry.observe(
+            "ledger_section_duration_seconds",
+            labels,
+            time.perf_counter() - start_time,
+        )
+        for phase, duration in state["phases"].items():
+            registry.observe(
+                "ledger_section_phase_duration_seconds",
+                {**labels, "phase": phase},
+                duration,
+            )
+        registry.inc("ledger_section_rows_total", labels, state["rows"])
+        registry.inc(
+            "ledger_section_updates_total", {**labels, "result": state["result"]}
+        )
+        _current_section.reset(token)
+        registry.flush()
+
+
+def add_phase(phase: str, duration: float, rows: int = 0) -> None:
+    """Add the duration and ingested rows of a phase to the current section update."""
+    state = _current_section.get()
+    if state is None:
+        return
+    state["phases"][phase] += duration
+    state["rows"] += rows
+
+
+def record_esi_request(operation: str, status_code: int, latency: float) -> None:
+    """Record an ESI request of a section update and add it to its fetch phase.
+
+    Requests outside of a section update, e.g. of Alliance Auth or other apps, are ignored.
+    """
+    if _current_section.get() is None:
+        return
+    labels = _section_labels()
+    registry.inc(
+        "ledger_esi_requests_total",
+        {**labels, "operation": operation, "status_code": str(status_code)},
+    )
+    registry.observe(
+        "ledger_esi_request_duration_seconds",
+        {**labels, "operation": operation},
+        latency,
+    )
+    add_phase("fetch", latency)
+
+
+def record_retry(issue: str) -> None:
+    """Record a task retry."""
+    registry.inc("ledger_task_retries_total", {"issue": issue})
+    registry.flush()
+
+
+def _format_labels(labels: tuple, **extra) -> str:
+    items = [*labels, *extra.items()]
+    if not items:
+        return ""
+    return "{" + ",".join(f'{key}="{value}"' for key, value in items) + "}"
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if bound == float("inf") else repr(float(bound))
+
+
+def render_prometheus(snapshots: list[dict]) -> str:
+    """
+    Render the merged metrics of all snapshots in the Prometheus text format.
+
+    Args:
+        snapshots (list[dict]): The snapshots of all processes.
+    Returns:
+        str: The metrics in the Prometheus text format.
+    """
+    counters: dict[tuple, float] = defaultdict(float)
+    histograms: dict[tuple, list[float]] = {}
+    buckets = DEFAULT_BUCKETS
+    for snapshot in snapshots:
+        if snapshot["buckets"] != buckets:
+            continue
+        for key, value in snapshot["counters"].items():
+            counters[key] += value
+        for key, values in snapshot["histograms"].items():
+            merged = histograms.setdefault(key, [0.0] * len(values))
+            for i, value in enumerate(values):
+                merged[i] += value
+
+    lines = []
+    for name in sorted({name for name, _ in counters}):
+        lines.append(f"# HELP {name} {DESCRIPTIONS.get(name, name)}")
+        lines.append(f"# TYPE {name} counter")
+        for (key_name, labels), value in sorted(counters.items()):
+            if key_name == name:
+                lines.append(f"{name}{_format_labels(labels)} {value:g}")
+
+    for name in sorted({name for name, _ in histograms}):
+        lines.append(f"# HELP {name} {DESCRIPTIONS.get(name, name)}")
+        lines.append(f"# TYPE {name} histogram")
+        for (key_name, labels), values in sorted(histograms.items()):
+            if key_name != name:
+                continue
+            cumulative = 0.0
+            for bound, count in zip(buckets, values):
+                cumulative += count
+                lines.append(
+                    f"{name}_bucket{_format_labels(labels, le=_format_bound(bound))} "
+                    f"{cumulative:g}"
+                )
+            lines.append(f"{name}_sum{_format_labels(labels)} {values[-2]:g}")
+            lines.append(f"{name}_count{_format_labels(labels)} {values[-1]:g}")
+    return "\n".join(lines) + "\n"
+
+
+def collect_metrics() -> str:
+    """Return the metrics of all processes in the Prometheus text format."""
+    registry.flush(force=True)
+    # Slots of stopped processes expire with their metrics
+    snapshots = cache.get_many(list(cache.get(METRICS_SLOTS_KEY, {}))).values()
+    return render_prometheus(list(snapshots))
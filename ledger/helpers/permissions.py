@@ -0,0 +1,118 @@
+# Standard Library
+from uuid import uuid4
+
+# Django
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.db.models import QuerySet
+
+# Alliance Auth
+from allianceauth.services.hooks import get_extension_logger
+
+# AA Ledger
+from ledger import __title__
+from ledger.app_settings import LEDGER_PERMISSION_CACHE_TIMEOUT
+from ledger.models.characteraudit import CharacterOwner
+from ledger.models.corporationaudit import CorporationOwner
+from ledger.providers import AppLogger
+
+logger = AppLogger(get_extension_logger(__name__), __title__)
+
+PERMISSION_GENERATION_KEY = "ledger-permission-generation"
+REQUEST_ATTRIBUTE = "_ledger_permission_resolver"
+
+
+def get_permission_generation() -> str:
+    """Return the current generation of the cached visible ID sets."""
+    return cache.get_or_set(PERMISSION_GENERATION_KEY, uuid4().hex, timeout=None)
+
+
+def invalidate_permission_cache() -> None:
+    """Invalidate all cached visible ID sets by starting a new generation."""
+    cache.set(PERMISSION_GENERATION_KEY, uuid4().hex, timeout=None)
+    logger.debug("Invalidated cached visible ID sets.")
+
+
+class PermissionResolver:
+    """
+    Resolve the characters and corporations visible to a user.
+
+    The visible ID sets are memoized on the resolver and cached per user,
+    so a permission check is a set lookup instead of evaluating the visible queryset.
+    `None` instead of a set means the user can see everything.
+    """
+
+    def __init__(self, user: User):
+        self.user = user
+        self._visible_ids = {}
+
+    @classmethod
+    def for_request(cls, request) -> "PermissionResolver":
+        """Return the resolver memoized on the request."""
+        resolver = getattr(request, REQUEST_ATTRIBUTE, None)
+        if resolver is None or resolver.user != request.user:
+            resolver = cls(request.user)
+            setattr(request, REQUEST_ATTRIBUTE, resolver)
+        return resolver
+
+    def _get_ids(self, kind: str, queryset: QuerySet, field: str) -> set[int] | None:
+        """Return the memoized or cached ID set of a visible queryset."""
+        if kind in self._visible_ids:
+            return self._visible_ids[kind]
+
+        # Unfiltered Queryset means the user can see everything
+        if not queryset.query.has_filters():
+            self._visible_ids[kind] = None
+            return None
+
+        key = f"ledger-visible-{kind}-{self.user.pk}-{get_permission_generation()}"
+        ids = cache.get(key)
+        if ids is None:
+            ids = set(queryset.values_list(field, flat=True))
+            cache.set(key, ids, timeout=LEDGER_PERMISSION_CACHE_TIMEOUT)
+        self._visible_ids[kind] = ids
+        return ids
+
+    def visible_character_ids(self) -> set[int] | None:
+        """Return the visible character IDs or None if all are visible."""
+        return self._get_ids(
+            "characters",
+            CharacterOwner.objects.visible_eve_characters(self.user),
+            "character_id",
+        )
+
+    def visible_corporation_ids(self) -> set[int] | None:
+        """Return the visible corporation IDs or None if all are visible."""
+        return self._get_ids(
+            "corporations",
+            CorporationOwner.objects.visible_to(self.user),
+            "eve_corporation__corporation_id",
+        )
+
+    def manageable_corporation_ids(self) -> set[int] | None:
+        """Return the manageable corporation IDs or None if all are manageable."""
+        return self._get_ids(
+            "manage-corporations",
+            CorporationOwner.objects.manage_to(self.user),
+            "eve_corporation__corporation_id",
+        )
+
+    def can_view_character(self, character_id: int) -> bool:
+        """Return True if the user can view the character."""
+        ids = self.visible_character_ids()
+        return ids is None or character_id in ids
+
+    def can_view_corporation(self, corporation_id: int) -> bool:
+        """Return True if the user can view the corporation."""
+        ids = self.visible_corporation_ids()
+        return ids is None or corporation_id in ids
+
+    def can_view_any_corporation(self, corporation_ids: list[int]) -> bool:
+        """Return True if the user can view at least one of the corporations."""
+        ids = self.visible_corporation_ids()
+        return ids is None or not ids.isdisjoint(corporation_ids)
+
+    def can_manage_corporation(self, corporation_id: int) -> bool:
+        """Return True if the user can manage the corporation."""
+        ids = self.manageable_corporation_ids()
+        return ids is None or corporation_id in ids
@@ -0,0 +1,208 @@
+# Standard Library
+import asyncio
+import time
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+# Django
+from django.db import DatabaseError, connection
+
+# Alliance Auth
+from allianceauth.services.hooks import get_extension_logger
+
+# AA Ledger
+from ledger import __title__
+from ledger.app_settings import LEDGER_API_PROFILING, LEDGER_API_PROFILING_SLOW_QUERIES
+from ledger.providers import AppLogger
+
+logger = AppLogger(get_extension_logger(__name__), __title__)
+
+# Superusers can profile a single request by sending `X-Ledger-Profile: 1`
+PROFILE_HEADER = "HTTP_X_LEDGER_PROFILE"
+# Time spent outside of a named phase, e.g. validation of the response schema
+OTHER_PHASE = "other"
+
+_current_profiler: ContextVar["RequestProfiler | None"] = ContextVar(
+    "ledger_current_profiler", default=None
+)
+
+
+class RequestProfiler:
+    """
+    Count the queries, DB time and Python time of each phase of an API request.
+
+    Phases can be nested, the time of a nested phase is only counted for
+    the nested phase. Queries are counted for the innermost phase.
+    """
+
+    def __init__(self):
+        self.phases: dict[str, dict] = defaultdict(
+            lambda: {"duration": 0.0, "db": 0.0, "queries": 0}
+        )
+        self.queries: list[tuple[float, str, str, tuple]] = []
+        self._stack: list[list] = []
+        self._start_time = None
+        self.duration = 0.0
+
+    @property
+    def current_phase(self) -> str:
+        return self._stack[-1][0] if self._stack else OTHER_PHASE
+
+    def _pause(self, now: float) -> None:
+        """Add the time since the last start to the current phase."""
+        if self._stack:
+            name, start_time = self._stack[-1]
+            self.phases[name]["duration"] += now - start_time
+
+    @contextmanager
+    def phase(self, name: str):
+        now = time.perf_counter()
+        self._pause(now)
+        self._stack.append([name, now])
+        try:
+            yield
+        finally:
+            now = time.perf_counter()
+            self._pause(now)
+            self._stack.pop()
+            if self._stack:
+                self._stack[-1][1] = now
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def _execute_wrapper(self, execute, sql, params, many, context):
+        start_time = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration = time.perf_counter() - start_time
+            phase = self.phases[self.current_phase]
+            phase["db"] += duration
+            phase["queries"] += 1
+            self.queries.append((duration, self.current_phase, sql, params))
+
+    @contextmanager
+    def profile(self):
+        """Profile all phases and queries within the context."""
+        token = _current_profiler.set(self)
+        self._start_time = time.perf_counter()
+        try:
+            with connection.execute_wrapper(self._execute_wrapper):
+                yield self
+        finally:
+            self.duration = time.perf_counter() - self._start_time
+            _current_profiler.reset(token)
+            named = sum(
+                values["duration"]
+                for name, values in self.phases.items()
+                if name != OTHER_PHASE
+            )
+            self.phases[OTHER_PHASE]["duration"] = max(self.duration - named, 0)
+
+    def server_timing(self) -> str:
+        """
+        Return the `Server-Timing` header of the profiled request.
+
+        Each phase reports its total duration, the description contains the
+        number of queries, the DB time and the Python time in milliseconds.
+        """
+        metrics = []
+        for name, values in self.phases.items():
+            if not values["duration"] and not values["queries"]:
+                continue
+            python_time = max(values["duration"] - values["db"], 0)
+            metrics.append(
+                f"{name};dur={values['duration'] * 1000:.1f};"
+                f'desc="{values["queries"]} queries, db {values["db"] * 1000:.1f}ms, '
+                f'python {python_time * 1000:.1f}ms"'
+            )
+        db_time = sum(values["db"] for values in self.phases.values())
+        metrics.append(
+            f'db;dur={db_time * 1000:.1f};desc="{len(self.queries)} queries"'
+        )
+        metrics.append(f"total;dur={self.duration * 1000:.1f}")
+        return ", ".join(metrics)
+
+    def log_slowest_queries(self, count: int) -> None:
+        """Log the slowest queries of the profiled request with their EXPLAIN output."""
+        for duration, phase, sql, params in sorted(
+            self.queries, key=lambda query: query[0], reverse=True
+        )[:count]:
+            logger.info(
+                "Slow query in %s phase (%.2f ms): %s\n%s",
+                phase,
+                duration * 1000,
+                sql,
+                self._explain(sql, params),
+            )
+
+    @staticmethod
+    def _explain(sql: str, params) -> str:
+        """Return the EXPLAIN output of a SELECT query."""
+        if not sql.lstrip().upper().startswith("SELECT"):
+            return ""
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(f"{connection.ops.explain_query_prefix()} {sql}", params)
+                return "\n".join(
+                    " ".join(str(column) for column in row) for row in cursor.fetchall()
+                )
+        except DatabaseError as e:
+            return f"EXPLAIN failed: {e}"
+
+
+@contextmanager
+def profile_phase(name: str):
+    """
+    Profile a phase of the current API request.
+
+    Does nothing if the request is not profiled.
+    Can be used as context manager or decorator.
+
+    Args:
+        name (str): The name of the phase, e.g. `aggregation`.
+    """
+    profiler = _current_profiler.get()
+    if profiler is None:
+        yield
+        return
+    with profiler.phase(name):
+        yield
+
+
+def is_profiling_enabled(request) -> bool:
+    """Return whether the request is profiled."""
+    if LEDGER_API_PROFILING:
+        return True
+    user = getattr(request, "user", None)
+    return bool(
+        request.META.get(PROFILE_HEADER) and user is not None and user.is_superuser
+    )
+
+
+def profile_api_request(func):
+    """
+    Profile an API operation and add the `Server-Timing` header to the response.
+
+    Applied as view decorator to all operations of the Ledger API.
+    """
+    # Async operations are not profiled, the phases can't be timed across awaits
+    if asyncio.iscoroutinefunction(func):
+        return func
+
+    @wraps(func)
+    def wrapper(request, *args, **kwargs):
+        if not is_profiling_enabled(request):
+            return func(request, *args, **kwargs)
+
+        profiler = RequestProfiler()
+        with profiler.profile():
+            response = func(request, *args, **kwargs)
+
+        response["Server-Timing"] = profiler.server_timing()
+        if LEDGER_API_PROFILING_SLOW_QUERIES:
+            profiler.log_slowest_queries(LEDGER_API_PROFILING_SLOW_QUERIES)
+        return response
+
+    return wrapper
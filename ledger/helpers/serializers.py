@@ -0,0 +1,75 @@
+# Standard Library
+import json
+from decimal import Decimal
+from typing import Any
+
+# Django
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.functional import Promise
+
+try:
+    # Third Party
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class LedgerJSONEncoder(DjangoJSONEncoder):
+    """JSON Encoder that serializes Decimal as float and lazy translations as str."""
+
+    def default(self, o: Any) -> Any:
+        if isinstance(o, Decimal):
+            return float(o)
+        if isinstance(o, Promise):
+            return str(o)
+        return super().default(o)
+
+
+def orjson_installed() -> bool:
+    """Return True if the optional orjson package is installed."""
+    return orjson is not None
+
+
+def json_dumps(data: Any, encoder: type[json.JSONEncoder] = LedgerJSONEncoder) -> bytes:
+    """Serialize data to JSON bytes.
+
+    Uses orjson if installed, which natively serializes datetimes and dataclasses,
+    otherwise falls back to the standard library. Other types, e.g. Decimal, go
+    through the `default` of the encoder, so convert large amounts of them with
+    `json_compatible` or a float schema field first.
+
+    Args:
+        data (Any): The data to serialize.
+        encoder (type[json.JSONEncoder], optional): The encoder for types not supported natively. Defaults to LedgerJSONEncoder.
+    Returns:
+        bytes: The JSON encoded data.
+    """
+    if orjson is not None:
+        return orjson.dumps(
+            data,
+            default=encoder().default,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z,
+        )
+    return json.dumps(data, cls=encoder).encode("utf-8")
+
+
+def json_compatible(data: Any) -> Any:
+    """Convert Decimal and lazy translation objects to their JSON types.
+
+    Walks the data recursively, so the result can be stored in a JSONField or
+    serialized by orjson without a `default` callback for every value.
+
+    Args:
+        data (Any): The data to convert.
+    Returns:
+        Any: The data containing only JSON compatible types.
+    """
+    if isinstance(data, dict):
+        return {key: json_compatible(value) for key, value in data.items()}
+    if isinstance(data, list):
+        return [json_compatible(value) for value in data]
+    if isinstance(data, Decimal):
+        return float(data)
+    if isinstance(data, Promise):
+        return str(data)
+    return data
@@ -14,7 +14,12 @@ from esi.errors import TokenError
 # AA Ledger
 from ledger import __title__
 from ledger.app_settings import LEDGER_BULK_BATCH_SIZE
-from ledger.decorators import log_timing
+from ledger.decorators import log_timing, record_write
+from ledger.helpers.esi_budget import (
+    acquire_current_esi_budget,
+    charge_current_esi_pages,
+)
+from ledger.helpers.ledger_data import LedgerAmountsQuerySetMixin
 from ledger.helpers.ref_type import RefTypeManager
 from ledger.models.helpers.update_manager import CharacterUpdateSection
 from ledger.providers import AppLogger, esi
@@ -98,7 +103,9 @@ class CharacterWalletCostQueryFilter(CharacterWalletOutSideFilter):
 
 
 # pylint: disable=used-before-assignment
-class CharacterWalletQuerySet(CharacterWalletCostQueryFilter):
+class CharacterWalletQuerySet(
+    LedgerAmountsQuerySetMixin, CharacterWalletCostQueryFilter
+):
     def aggregate_bounty(self) -> dict:
         """Aggregate bounty income."""
         return Decimal(
@@ -282,6 +289,10 @@ class CharacterWalletManager(models.Manager["CharacterWalletJournalEntryContext"
             income=income,
         )
 
+    def aggregate_by_period(self, granularity: str) -> dict[tuple, dict]:
+        """Aggregate the ledger amounts grouped by period."""
+        return self.get_queryset().aggregate_by_period(granularity=granularity)
+
     @log_timing(logger)
     def update_or_create_esi(
         self, owner: "CharacterOwner", force_refresh: bool = False
@@ -293,8 +304,8 @@ class CharacterWalletManager(models.Manager["CharacterWalletJournalEntryContext"
             force_refresh=force_refresh,
         )
 
-    def _fetch_esi_data(self, owner: "CharacterOwner", force_refresh: bool) -> None:
-        """Fetch wallet journal entries from ESI data."""
+    def _fetch_esi_data(self, owner: "CharacterOwner", force_refresh: bool) -> dict:
+        """Fetch wallet journal entries from ESI data. Return the ESI response headers."""
         req_scopes = ["esi-wallet.read_character_wallet.v1"]
         token = owner.get_token(scopes=req_scopes)
 
@@ -303,12 +314,17 @@ class CharacterWalletManager(models.Manager["CharacterWalletJournalEntryContext"
             token=token,
         )
 
-        journal_items = operation.results(
+        acquire_current_esi_budget()
+        journal_items, response = operation.results(
             force_refresh=force_refresh,
+            return_response=True,
         )
+        charge_current_esi_pages(response.headers)
 
         self._update_or_create_objs(character=owner, objs=journal_items)
+        return response.headers
 
+    @record_write
     @transaction.atomic()
     def _update_or_create_objs(
         self,
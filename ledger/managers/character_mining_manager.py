@@ -1,6 +1,7 @@
 # Standard Library
 import datetime as dt
 from collections import defaultdict
+from decimal import Decimal
 from typing import TYPE_CHECKING
 
 # Django
@@ -22,7 +23,12 @@ from allianceauth.services.hooks import get_extension_logger
 # AA Ledger
 from ledger import __title__
 from ledger.app_settings import LEDGER_BULK_BATCH_SIZE, LEDGER_PRICE_PERCENTAGE
-from ledger.decorators import log_timing
+from ledger.decorators import log_timing, record_write
+from ledger.helpers.esi_budget import (
+    acquire_current_esi_budget,
+    charge_current_esi_pages,
+)
+from ledger.helpers.ledger_data import get_period_key, get_period_trunc
 from ledger.models.helpers.update_manager import CharacterUpdateSection
 from ledger.providers import AppLogger, esi
 
@@ -97,6 +103,78 @@ class CharacterMiningLedgerEntryQueryset(models.QuerySet["MiningLedgerContext"])
             )
         )["total_amount"]
 
+    def annotate_mining_by_period(self, granularity: str) -> models.QuerySet:
+        """Annotate mining amounts grouped by period."""
+        return (
+            self.annotate_pricing()
+            .annotate(period=get_period_trunc(granularity))
+            .values("period")
+            .order_by("period")
+            .annotate(
+                total_amount=Round(
+                    Coalesce(
+                        Sum(F("total")),
+                        Value(0),
+                        output_field=DecimalField(),
+                    ),
+                    precision=2,
+                )
+            )
+        )
+
+    def aggregate_mining_by_period(self, granularity: str) -> dict[tuple, Decimal]:
+        """
+        Aggregate mining amounts grouped by period in a single query.
+
+        Args:
+            granularity (str): The granularity of the periods ('year', 'month' or 'day').
+        Returns:
+            dict[tuple, Decimal]: Mapping of (year, month, day) period keys to the mining amount.
+        """
+        return {
+            get_period_key(row["period"], granularity): row["total_amount"]
+            for row in self.annotate_mining_by_period(granularity)
+        }
+
+    def annotate_mining_by_field(self, field: str) -> models.QuerySet:
+        """Annotate mining amounts grouped by a field, e.g. the owner."""
+        return (
+            self.annotate_pricing()
+            .values(field)
+            .order_by()
+            .annotate(
+                total_amount=Round(
+                    Coalesce(
+                        Sum(F("total")),
+                        Value(0),
+                        output_field=DecimalField(),
+                    ),
+                    precision=2,
+                )
+            )
+        )
+
+    def aggregate_mining_by_field(self, field: str) -> dict[int, Decimal]:
+        """
+        Aggregate mining amounts grouped by a field in a single query.
+
+        Args:
+            field (str): The field to group by, e.g. `character_id`.
+        Returns:
+            dict[int, Decimal]: Mapping of the field values to the mining amount.
+        """
+        return {
+            row[field]: row["total_amount"]
+            for row in self.annotate_mining_by_field(field)
+        }
+
+    async def aaggregate_mining_by_field(self, field: str) -> dict[int, Decimal]:
+        """Async variant of `aggregate_mining_by_field`."""
+        return {
+            row[field]: row["total_amount"]
+            async for row in self.annotate_mining_by_field(field)
+        }
+
     def aggregate_amounts_information_modal(
         self, amounts: defaultdict, chars_list: list, filter_date: timezone.datetime
     ) -> dict:
@@ -159,6 +237,10 @@ class CharacterMiningLedgerEntryManager(models.Manager["MiningLedgerContext"]):
         """Aggregate mining amounts."""
         return self.get_queryset().aggregate_mining()
 
+    def aggregate_mining_by_period(self, granularity: str) -> dict[tuple, Decimal]:
+        """Aggregate mining amounts grouped by period."""
+        return self.get_queryset().aggregate_mining_by_period(granularity=granularity)
+
     def aggregate_amounts_information_modal(
         self, amounts: defaultdict, chars_list: list, filter_date: timezone.datetime
     ) -> dict:
@@ -184,8 +266,8 @@ class CharacterMiningLedgerEntryManager(models.Manager["MiningLedgerContext"]):
 
     def _fetch_esi_data(
         self, owner: "CharacterOwner", force_refresh: bool = False
-    ) -> None:
-        """Fetch mining ledger entries from ESI data."""
+    ) -> dict:
+        """Fetch mining ledger entries from ESI data. Return the ESI response headers."""
         req_scopes = ["esi-industry.read_character_mining.v1"]
         token = owner.get_token(scopes=req_scopes)
 
@@ -195,12 +277,18 @@ class CharacterMiningLedgerEntryManager(models.Manager["MiningLedgerContext"]):
             token=token,
         )
 
-        mining_items = operation.results(force_refresh=force_refresh)
+        acquire_current_esi_budget()
+        mining_items, response = operation.results(
+            force_refresh=force_refresh, return_response=True
+        )
+        charge_current_esi_pages(response.headers)
 
         # Process and update or create mining ledger entries
         self._update_or_create_objs(owner=owner, objs=mining_items)
         self._update_mining_price(owner=owner)
+        return response.headers
 
+    @record_write
     @transaction.atomic()
     def _update_or_create_objs(
         self,
@@ -258,17 +346,29 @@ class CharacterMiningLedgerEntryManager(models.Manager["MiningLedgerContext"]):
 
     def _update_mining_price(self, owner: "CharacterOwner") -> None:
         """Update prices for mining ledger entries."""
-        mining_ledger = owner.ledger_character_mining.filter(
-            price_per_unit__isnull=True,
-            date__gte=timezone.now() - timezone.timedelta(days=30),
+        # pylint: disable=import-outside-toplevel
+        # AA Ledger
+        from ledger.models.general import EveMarketPrice
+
+        mining_ledger = list(
+            owner.ledger_character_mining.filter(
+                price_per_unit__isnull=True,
+                date__gte=timezone.now() - timezone.timedelta(days=30),
+            )
         )
         logger.debug(
-            f"Checking {mining_ledger.count()} mining ledger entries for missing prices."
+            f"Checking {len(mining_ledger)} mining ledger entries for missing prices."
         )
+        if not mining_ledger:
+            return
 
+        # Resolve the price of each type once instead of per entry
+        npc_prices = EveMarketPrice.objects.get_npc_prices(
+            entry.type_id for entry in mining_ledger
+        )
         updated_entries = []
         for entry in mining_ledger:
-            npc_price = entry.get_npc_price()
+            npc_price = npc_prices.get(entry.type_id)
             if npc_price is not None:
                 entry.price_per_unit = npc_price
                 updated_entries.append(entry)
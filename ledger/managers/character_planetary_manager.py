@@ -17,9 +17,13 @@ from eve_sde.models.types import ItemType
 # AA Ledger
 from ledger import __title__
 from ledger.app_settings import LEDGER_BULK_BATCH_SIZE
-from ledger.decorators import log_timing
+from ledger.decorators import log_timing, record_write
+from ledger.helpers.esi_budget import acquire_current_esi_budget
 from ledger.models.characteraudit import CharacterOwner
-from ledger.models.helpers.update_manager import CharacterUpdateSection
+from ledger.models.helpers.update_manager import (
+    CharacterUpdateSection,
+    get_earliest_esi_headers,
+)
 from ledger.providers import AppLogger, esi
 
 if TYPE_CHECKING:  # pragma: no cover
@@ -61,8 +65,8 @@ class CharacterPlanetManager(models.Manager["PlanetContext"]):
 
     def _fetch_esi_data(
         self, owner: CharacterOwner, force_refresh: bool = False
-    ) -> None:
-        """Fetch planetary entries from ESI data."""
+    ) -> dict:
+        """Fetch planetary entries from ESI data. Return the ESI response headers."""
         req_scopes = ["esi-planets.manage_planets.v1"]
         token = owner.get_token(scopes=req_scopes)
 
@@ -72,10 +76,15 @@ class CharacterPlanetManager(models.Manager["PlanetContext"]):
             token=token,
         )
 
-        planets_items = operation.results(force_refresh=force_refresh)
+        acquire_current_esi_budget()
+        planets_items, response = operation.results(
+            force_refresh=force_refresh, return_response=True
+        )
 
         self._update_or_create_objs(owner=owner, objs=planets_items)
+        return response.headers
 
+    @record_write
     @transaction.atomic()
     def _update_or_create_objs(
         self, owner: CharacterOwner, objs: list["PlanetGetItem"]
@@ -365,8 +374,8 @@ class PlanetDetailsManager(models.Manager["PlanetDetailsContext"]):
 
     def _fetch_esi_data(
         self, owner: CharacterOwner, force_refresh: bool = False
-    ) -> None:
-        """Fetch planets details entries from ESI data."""
+    ) -> dict | None:
+        """Fetch planets details entries from ESI data. Return the ESI response headers expiring first."""
         # pylint: disable=import-outside-toplevel
         # AA Ledger
         from ledger.models.planetary import CharacterPlanet
@@ -379,6 +388,7 @@ class PlanetDetailsManager(models.Manager["PlanetDetailsContext"]):
             "eve_planet_id", flat=True
         )
         is_updated = False
+        headers_list = []
 
         for planet_id in planets_ids:
             # Make the ESI request
@@ -388,10 +398,15 @@ class PlanetDetailsManager(models.Manager["PlanetDetailsContext"]):
                 token=token,
             )
 
+            acquire_current_esi_budget()
             try:
-                planets_details_items = operation.results(force_refresh=force_refresh)
+                planets_details_items, response = operation.results(
+                    force_refresh=force_refresh, return_response=True
+                )
                 is_updated = True
-            except HTTPNotModified:
+                headers_list.append(response.headers)
+            except HTTPNotModified as exc:
+                headers_list.append(exc.headers)
                 continue
 
             self._update_or_create_objs(
@@ -401,8 +416,14 @@ class PlanetDetailsManager(models.Manager["PlanetDetailsContext"]):
             )
         # Raise if no update happened at all
         if not is_updated:
-            raise HTTPNotModified(304, {"msg": "Planets Details has Not Modified"})
+            raise HTTPNotModified(
+                304,
+                get_earliest_esi_headers(headers_list)
+                or {"msg": "Planets Details has Not Modified"},
+            )
+        return get_earliest_esi_headers(headers_list)
 
+    @record_write
     @transaction.atomic()
     def _update_or_create_objs(
         self,
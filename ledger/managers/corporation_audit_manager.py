@@ -3,7 +3,8 @@ from typing import TYPE_CHECKING
 
 # Django
 from django.db import models
-from django.db.models import Case, Count, Q, Value, When
+from django.db.models import Case, Count, Max, Q, Value, When
+from django.utils import timezone
 
 # Alliance Auth
 from allianceauth.authentication.models import User
@@ -11,6 +12,7 @@ from allianceauth.services.hooks import get_extension_logger
 
 # AA Ledger
 from ledger import __title__
+from ledger.app_settings import LEDGER_BULK_BATCH_SIZE
 from ledger.models.helpers.update_manager import CorporationUpdateSection, UpdateStatus
 from ledger.providers import AppLogger
 
@@ -104,9 +106,8 @@ class CorporationAuditQuerySet(models.QuerySet["CorporationOwner"]):
         return user
 
     def annotate_total_update_status(self):
-        """Get the total update status."""
+        """Annotate the number of total, ok, failed and token error sections."""
         sections = CorporationUpdateSection.get_sections()
-        num_sections_total = len(sections)
         qs = (
             self.annotate(
                 num_sections_total=Count(
@@ -141,9 +142,19 @@ class CorporationAuditQuerySet(models.QuerySet["CorporationOwner"]):
                     ),
                 )
             )
+        )
+
+        return qs
+
+    def annotate_calculated_update_status(self):
+        """Calculate the total update status and the last finished update from the sections."""
+        sections = CorporationUpdateSection.get_sections()
+        num_sections_total = len(sections)
+        qs = (
+            self.annotate_total_update_status()
             # pylint: disable=no-member
             .annotate(
-                total_update_status=Case(
+                calculated_update_status=Case(
                     When(
                         active=False,
                         then=Value(UpdateStatus.DISABLED),
@@ -166,11 +177,84 @@ class CorporationAuditQuerySet(models.QuerySet["CorporationOwner"]):
                     ),
                     default=Value(UpdateStatus.IN_PROGRESS),
                 )
+            ).annotate(
+                calculated_last_update_finished_at=Max(
+                    "ledger_corporation_update_status__last_update_finished_at",
+                    filter=Q(ledger_corporation_update_status__section__in=sections),
+                )
             )
         )
 
         return qs
 
+    def update_total_update_status(self) -> int:
+        """Recalculate and store the total update status. Return count of updated owners."""
+        owners = list(self.annotate_calculated_update_status())
+        for owner in owners:
+            owner.total_update_status = owner.calculated_update_status
+            owner.last_update_finished_at = owner.calculated_last_update_finished_at
+        return self.model.objects.bulk_update(
+            owners, ["total_update_status", "last_update_finished_at"]
+        )
+
+    def create_missing_update_status(self) -> int:
+        """Create the missing update status of each section, due now. Return count of created update status."""
+        status_model = self.model._meta.get_field(
+            "ledger_corporation_update_status"
+        ).related_model
+        sections = CorporationUpdateSection.get_sections()
+        existing = set(
+            status_model.objects.using(self.db)
+            .filter(owner__in=self)
+            .values_list("owner_id", "section")
+        )
+        now = timezone.now()
+        missing = [
+            status_model(owner_id=owner_id, section=section, next_due_at=now)
+            for owner_id in self.values_list("pk", flat=True)
+            for section in sections
+            if (owner_id, section) not in existing
+        ]
+        status_model.objects.using(self.db).bulk_create(
+            missing, batch_size=LEDGER_BULK_BATCH_SIZE
+        )
+        return len(missing)
+
+    def due_for_update(self, limit: int) -> dict[int, list[str]]:
+        """Return the due sections of up to `limit` active corporations, most overdue first.
+
+        Each section has an update status from the moment the owner or section is added,
+        so the due sections are read from the `next_due_at` index only.
+
+        Args:
+            limit (int): The maximum number of owners.
+        Returns:
+            dict[int, list[str]]: Mapping of the Eve IDs of the owners to their due sections.
+        """
+        sections = CorporationUpdateSection.get_sections()
+        due = (
+            self.filter(
+                active=True,
+                ledger_corporation_update_status__section__in=sections,
+                ledger_corporation_update_status__next_due_at__lte=timezone.now(),
+            )
+            .order_by("ledger_corporation_update_status__next_due_at")
+            .values_list(
+                "eve_corporation__corporation_id",
+                "ledger_corporation_update_status__section",
+            )
+        )
+
+        owners: dict[int, list[str]] = {}
+        # Each owner can appear once per due section
+        for eve_id, section in due[: limit * len(sections)]:
+            if eve_id not in owners:
+                if len(owners) >= limit:
+                    continue
+                owners[eve_id] = []
+            owners[eve_id].append(section)
+        return owners
+
 
 class CorporationAuditManager(models.Manager["CorporationOwner"]):
     def get_queryset(self) -> CorporationAuditQuerySet:
@@ -182,6 +266,18 @@ class CorporationAuditManager(models.Manager["CorporationOwner"]):
     def annotate_total_update_status(self):
         return self.get_queryset().annotate_total_update_status()
 
+    def annotate_calculated_update_status(self):
+        return self.get_queryset().annotate_calculated_update_status()
+
+    def update_total_update_status(self) -> int:
+        return self.get_queryset().update_total_update_status()
+
+    def create_missing_update_status(self) -> int:
+        return self.get_queryset().create_missing_update_status()
+
+    def due_for_update(self, limit: int) -> dict[int, list[str]]:
+        return self.get_queryset().due_for_update(limit)
+
     def visible_to(self, user):
         return self.get_queryset().visible_to(user)
 
@@ -15,11 +15,19 @@ from esi.exceptions import HTTPNotModified
 # AA Ledger
 from ledger import __title__
 from ledger.app_settings import LEDGER_BULK_BATCH_SIZE
-from ledger.decorators import log_timing
+from ledger.decorators import log_timing, record_write
 from ledger.errors import DatabaseError
+from ledger.helpers.esi_budget import (
+    acquire_current_esi_budget,
+    charge_current_esi_pages,
+)
+from ledger.helpers.ledger_data import LedgerAmountsQuerySetMixin
 from ledger.helpers.ref_type import RefTypeManager
 from ledger.models.general import EveEntity
-from ledger.models.helpers.update_manager import CorporationUpdateSection
+from ledger.models.helpers.update_manager import (
+    CorporationUpdateSection,
+    get_earliest_esi_headers,
+)
 from ledger.providers import AppLogger, esi
 
 if TYPE_CHECKING:
@@ -40,7 +48,7 @@ if TYPE_CHECKING:
 logger = AppLogger(get_extension_logger(__name__), __title__)
 
 
-class CorporationWalletQuerySet(models.QuerySet):
+class CorporationWalletQuerySet(LedgerAmountsQuerySetMixin, models.QuerySet):
     # pylint: disable=duplicate-code
     def annotate_bounty_income(
         self,
@@ -199,6 +207,10 @@ class CorporationWalletManager(models.Manager["CorporationWalletJournalEntry"]):
         """Aggregate costs."""
         return self.get_queryset().aggregate_costs()
 
+    def aggregate_by_period(self, granularity: str) -> dict[tuple, dict]:
+        """Aggregate the ledger amounts grouped by period."""
+        return self.get_queryset().aggregate_by_period(granularity=granularity)
+
     # pylint: disable=too-many-positional-arguments
     def aggregate_ref_type(
         self,
@@ -226,8 +238,8 @@ class CorporationWalletManager(models.Manager["CorporationWalletJournalEntry"]):
 
     def _fetch_esi_data(
         self, owner: "CorporationOwner", force_refresh: bool = False
-    ) -> None:
-        """Fetch wallet journal entries from ESI data."""
+    ) -> dict | None:
+        """Fetch wallet journal entries from ESI data. Return the ESI response headers expiring first."""
         # AA Ledger
         # pylint: disable=import-outside-toplevel
         from ledger.models.corporationaudit import CorporationWalletDivision
@@ -245,6 +257,7 @@ class CorporationWalletManager(models.Manager["CorporationWalletJournalEntry"]):
 
         divisions = CorporationWalletDivision.objects.filter(corporation=owner)
         is_updated = False
+        headers_list = []
 
         for division in divisions:
             # Make the ESI request
@@ -257,17 +270,29 @@ class CorporationWalletManager(models.Manager["CorporationWalletJournalEntry"]):
             )
 
             # pylint: disable=duplicate-code
+            acquire_current_esi_budget()
             try:
-                journal_items = operation.results(force_refresh=force_refresh)
+                journal_items, response = operation.results(
+                    force_refresh=force_refresh, return_response=True
+                )
+                charge_current_esi_pages(response.headers)
                 is_updated = True
-            except HTTPNotModified:
+                headers_list.append(response.headers)
+            except HTTPNotModified as exc:
+                headers_list.append(exc.headers)
                 continue
 
             self._update_or_create_objs(division=division, objs=journal_items)
         # Raise if no update happened at all
         if not is_updated:
-            raise HTTPNotModified(304, {"msg": "Wallet Journal has Not Modified"})
+            raise HTTPNotModified(
+                304,
+                get_earliest_esi_headers(headers_list)
+                or {"msg": "Wallet Journal has Not Modified"},
+            )
+        return get_earliest_esi_headers(headers_list)
 
+    @record_write
     @transaction.atomic()
     def _update_or_create_objs(
         self,
@@ -345,8 +370,8 @@ class CorporationDivisionManager(models.Manager["CorporationWalletDivision"]):
 
     def _fetch_esi_data(
         self, owner: "CorporationOwner", force_refresh: bool = False
-    ) -> None:
-        """Fetch division entries from ESI data."""
+    ) -> dict:
+        """Fetch division entries from ESI data. Return the ESI response headers."""
         req_scopes = [
             "esi-wallet.read_corporation_wallets.v1",
             "esi-characters.read_corporation_roles.v1",
@@ -363,9 +388,13 @@ class CorporationDivisionManager(models.Manager["CorporationWalletDivision"]):
             corporation_id=owner.eve_corporation.corporation_id,
             token=token,
         )
-        division_items = operation.results(force_refresh=force_refresh)
+        acquire_current_esi_budget()
+        division_items, response = operation.results(
+            force_refresh=force_refresh, return_response=True
+        )
 
         self._update_or_create_objs(owner=owner, objs=division_items)
+        return response.headers
 
     @log_timing(logger)
     def update_or_create_esi_names(
@@ -380,8 +409,8 @@ class CorporationDivisionManager(models.Manager["CorporationWalletDivision"]):
 
     def _fetch_esi_data_names(
         self, owner: "CorporationOwner", force_refresh: bool = False
-    ) -> None:
-        """Fetch division entries from ESI data."""
+    ) -> dict:
+        """Fetch division names from ESI data. Return the ESI response headers."""
         req_scopes = [
             "esi-corporations.read_divisions.v1",
         ]
@@ -396,10 +425,15 @@ class CorporationDivisionManager(models.Manager["CorporationWalletDivision"]):
             corporation_id=owner.eve_corporation.corporation_id,
             token=token,
         )
-        division_items = operation.results(force_refresh=force_refresh)
+        acquire_current_esi_budget()
+        division_items, response = operation.results(
+            force_refresh=force_refresh, return_response=True
+        )
 
         self._update_or_create_objs_division(owner=owner, objs=division_items)
+        return response.headers
 
+    @record_write
     @transaction.atomic()
     def _update_or_create_objs_division(
         self,
@@ -423,6 +457,7 @@ class CorporationDivisionManager(models.Manager["CorporationWalletDivision"]):
                     obj.name = name
                     obj.save()
 
+    @record_write
     @transaction.atomic()
     def _update_or_create_objs(
         self,
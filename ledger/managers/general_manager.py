@@ -1,23 +1,30 @@
 # Standard Library
+import hashlib
+from collections import defaultdict
+from collections.abc import Iterable
 from typing import TYPE_CHECKING, Any
 
 # Django
+from django.core.cache import cache
 from django.db import models
 from django.utils import timezone
 
 # Alliance Auth
 from allianceauth.services.hooks import get_extension_logger
+from esi.exceptions import HTTPNotModified
 
 # Alliance Auth (External Libs)
 from eve_sde.models import ItemType
 
 # AA Ledger
 from ledger import __title__
-from ledger.app_settings import LEDGER_BULK_BATCH_SIZE
+from ledger.app_settings import LEDGER_BULK_BATCH_SIZE, LEDGER_USE_COMPRESSED
 from ledger.providers import AppLogger, esi
 
 logger = AppLogger(get_extension_logger(__name__), __title__)
 
+MARKET_PRICES_HASH_KEY = "ledger-market-prices-hash"
+
 if TYPE_CHECKING:
     # Alliance Auth
     from esi.stubs import MarketsPricesGetItem
@@ -89,24 +96,109 @@ class EveEntityManager(models.Manager["EveEntityContext"]):
 
 
 class EveMarketPriceManager(models.Manager["EveMarketPriceContext"]):
-    def update_from_esi(self) -> int:
-        """Update or create EveMarketPrice from ESI data."""
+    def update_from_esi(self, force_refresh: bool = False) -> int:
+        """Update or create EveMarketPrice from ESI data if the prices have changed.
+
+        Args:
+            force_refresh (bool, optional): Ignore the ETag and the stored hash. Defaults to False.
+        Returns:
+            int: The number of created or updated prices.
+        """
+        try:
+            prices = self.fetch_data_from_esi(force_refresh=force_refresh)
+        except HTTPNotModified:
+            logger.debug("Market prices not modified since last update.")
+            return 0
 
-        prices = self.fetch_data_from_esi()
         if not prices:
             logger.debug("No market price data fetched from ESI.")
             return 0
 
+        # ESI can return a new ETag for unchanged prices
+        prices_hash = self.get_prices_hash(prices)
+        if not force_refresh and cache.get(MARKET_PRICES_HASH_KEY) == prices_hash:
+            logger.debug("Market prices unchanged since last update.")
+            return 0
+
         updated_prices = self.update_objs_from_esi(prices)
+        cache.set(MARKET_PRICES_HASH_KEY, prices_hash, timeout=None)
         return updated_prices
 
-    def fetch_data_from_esi(self) -> list["MarketsPricesGetItem"]:
-        """Fetch market price data from ESI."""
-        response = esi.client.Market.GetMarketsPrices().results(use_etag=False)
+    def fetch_data_from_esi(
+        self, force_refresh: bool = False
+    ) -> list["MarketsPricesGetItem"]:
+        """Fetch market price data from ESI.
+
+        Raises:
+            HTTPNotModified: If the prices have not changed since the last fetch.
+        """
+        response = esi.client.Market.GetMarketsPrices().results(
+            force_refresh=force_refresh
+        )
         return response
 
+    def get_npc_prices(self, type_ids: Iterable[int]) -> dict[int, float | None]:
+        """Return the NPC price of each type with at most two queries.
+
+        With `LEDGER_USE_COMPRESSED` the price of the compressed variant is used,
+        the price of the type itself if there is none or more than one.
+
+        Args:
+            type_ids (Iterable[int]): The IDs of the types.
+        Returns:
+            dict[int, float | None]: The average price by type ID, types without a price are missing.
+        """
+        type_ids = set(type_ids)
+        if not type_ids:
+            return {}
+        if not LEDGER_USE_COMPRESSED:
+            return dict(
+                self.filter(eve_type_id__in=type_ids).values_list(
+                    "eve_type_id", "average_price"
+                )
+            )
+
+        compressed_names = {
+            type_id: f"Compressed {name}"
+            for type_id, name in ItemType.objects.filter(id__in=type_ids).values_list(
+                "id", "name"
+            )
+        }
+        type_prices = {}
+        compressed_prices = defaultdict(list)
+        for eve_type_id, name, average_price in self.filter(
+            models.Q(eve_type_id__in=type_ids)
+            | models.Q(eve_type__name__in=compressed_names.values())
+        ).values_list("eve_type_id", "eve_type__name", "average_price"):
+            if eve_type_id in type_ids:
+                type_prices[eve_type_id] = average_price
+            compressed_prices[name].append(average_price)
+
+        prices = {}
+        for type_id in type_ids:
+            compressed = compressed_prices.get(compressed_names.get(type_id), [])
+            if len(compressed) == 1:
+                prices[type_id] = compressed[0]
+            elif type_id in type_prices:
+                prices[type_id] = type_prices[type_id]
+        return prices
+
+    @staticmethod
+    def get_prices_hash(objs: list["MarketsPricesGetItem"]) -> str:
+        """Return a hash of the market prices independent of their order."""
+        prices = sorted(
+            (obj.type_id, obj.average_price, obj.adjusted_price) for obj in objs
+        )
+        return hashlib.sha256(repr(prices).encode("utf-8")).hexdigest()
+
     def update_objs_from_esi(self, objs: list["MarketsPricesGetItem"]) -> int:
-        """Update or create EveMarketPrice objects from ESI data."""
+        """Update or create EveMarketPrice objects from ESI data.
+
+        Only prices that have moved are written.
+
+        Returns:
+            int: The number of created or updated prices.
+        """
         # pylint: disable=import-outside-toplevel
         # AA Ledger
         from ledger.models.general import EveMarketPrice
@@ -120,25 +212,36 @@ class EveMarketPriceManager(models.Manager["EveMarketPriceContext"]):
                 eve_type_id__in=_esi_market_type_ids
             )
         }
+        # Resolve all new types with a single query, types unknown to the SDE are skipped
+        _known_type_ids = set(
+            ItemType.objects.filter(
+                id__in=_esi_market_type_ids - _current_market_prices.keys()
+            ).values_list("id", flat=True)
+        )
         _now = timezone.now()
 
         for obj in objs:
             if obj.type_id in _current_market_prices:
                 eve_market_type = _current_market_prices[obj.type_id]
+                if (
+                    eve_market_type.average_price == obj.average_price
+                    and eve_market_type.adjusted_price == obj.adjusted_price
+                ):
+                    continue
                 eve_market_type.average_price = obj.average_price
                 eve_market_type.adjusted_price = obj.adjusted_price
                 eve_market_type.updated_at = _now
                 _update_price.append(eve_market_type)
-            else:
+            elif obj.type_id in _known_type_ids:
                 eve_market_type = EveMarketPrice(
-                    eve_type=ItemType.objects.get(
-                        id=obj.type_id
-                    ),  # TODO: optimize get? to avoid that much queries
+                    eve_type_id=obj.type_id,
                     average_price=obj.average_price,
                     adjusted_price=obj.adjusted_price,
                     updated_at=_now,
                 )
                 _new_price.append(eve_market_type)
+            else:
+                logger.debug("Skipping market price of unknown type %s", obj.type_id)
 
         if _update_price:
             self.bulk_update(
@@ -150,4 +253,4 @@ class EveMarketPriceManager(models.Manager["EveMarketPriceContext"]):
             self.bulk_create(
                 _new_price, batch_size=LEDGER_BULK_BATCH_SIZE, ignore_conflicts=True
             )
-        return len(objs)
+        return len(_update_price) + len(_new_price)
@@ -3,6 +3,7 @@ from typing import TYPE_CHECKING, Union
 
 # Django
 from django.db import models
+from django.utils import timezone
 
 # Alliance Auth
 from allianceauth.eveonline.models import EveAllianceInfo
@@ -10,7 +11,7 @@ from allianceauth.services.hooks import get_extension_logger
 
 # AA Ledger
 from ledger import __title__
-from ledger.helpers.billboard import BillboardSystem
+from ledger.app_settings import LEDGER_BULK_BATCH_SIZE
 from ledger.models.characteraudit import (
     CharacterMiningLedger,
     CharacterOwner,
@@ -34,12 +35,88 @@ if TYPE_CHECKING:
     from ledger.models.ledger import (
         CharacterBillboardEntry,
         CorporationBillboardEntry,
+        LedgerEntry,
     )
 
 
 logger = AppLogger(get_extension_logger(__name__), __title__)
 
 
+class LedgerEntryQueryset(models.QuerySet["LedgerEntry"]):
+    def filter_request_period(
+        self,
+        request_info: Union[
+            "OwnerLedgerRequestInfo",
+            "CorporationLedgerRequestInfo",
+            "AllianceLedgerRequestInfo",
+        ],
+    ) -> models.QuerySet:
+        """Filter the ledger entries of the requested period."""
+        return self.filter(
+            year=request_info.year,
+            month=request_info.month,
+            day=request_info.day,
+        )
+
+
+class LedgerEntryManager(models.Manager["LedgerEntry"]):
+    def get_queryset(self) -> LedgerEntryQueryset:
+        return LedgerEntryQueryset(self.model, using=self._db)
+
+    def filter_request_period(
+        self,
+        request_info: Union[
+            "OwnerLedgerRequestInfo",
+            "CorporationLedgerRequestInfo",
+            "AllianceLedgerRequestInfo",
+        ],
+    ) -> models.QuerySet:
+        """Filter the ledger entries of the requested period."""
+        return self.get_queryset().filter_request_period(request_info)
+
+    def bulk_update_or_create(self, entries: list["LedgerEntry"], fields: list[str]):
+        """
+        Save the aggregated ledger entries with one bulk create and one bulk update.
+
+        Args:
+            entries (list[LedgerEntry]): The new and changed ledger entries.
+            fields (list[str]): The aggregated fields to update on existing entries.
+        """
+        new_entries, changed_entries = self._split_entries(entries)
+        self.bulk_create(new_entries, batch_size=LEDGER_BULK_BATCH_SIZE)
+        self.bulk_update(
+            changed_entries,
+            fields=[*fields, "last_updated"],
+            batch_size=LEDGER_BULK_BATCH_SIZE,
+        )
+
+    async def abulk_update_or_create(
+        self, entries: list["LedgerEntry"], fields: list[str]
+    ):
+        """Async variant of `bulk_update_or_create`."""
+        new_entries, changed_entries = self._split_entries(entries)
+        await self.abulk_create(new_entries, batch_size=LEDGER_BULK_BATCH_SIZE)
+        await self.abulk_update(
+            changed_entries,
+            fields=[*fields, "last_updated"],
+            batch_size=LEDGER_BULK_BATCH_SIZE,
+        )
+
+    @staticmethod
+    def _split_entries(
+        entries: list["LedgerEntry"],
+    ) -> tuple[list["LedgerEntry"], list["LedgerEntry"]]:
+        """Split the ledger entries into new and changed entries."""
+        # Bulk updates skip `auto_now`, the entries are marked as updated explicitly
+        now = timezone.now()
+        for entry in entries:
+            entry.last_updated = now
+        return (
+            [entry for entry in entries if entry.pk is None],
+            [entry for entry in entries if entry.pk is not None],
+        )
+
+
 class BillboardEntryQueryset(models.QuerySet["CharacterBillboardEntry"]):
     pass
 
@@ -61,7 +138,7 @@ class BillboardEntryManager(
         wallet_journal: CharacterWalletJournalEntry | CorporationWalletJournalEntry,
         ledger_list: list,
         mining_journal: CharacterMiningLedger | None = None,
-    ) -> None:
+    ) -> Union["CharacterBillboardEntry", "CorporationBillboardEntry", None]:
         """
         Update or create the billboard entry for the given owner based on the most recent ledger entry.
 
@@ -72,8 +149,12 @@ class BillboardEntryManager(
             ledger_list (list): A list of ledger entries to be used for generating the chord billboard.
             mining_journal (CharacterMiningLedger, optional): The mining journal entry to be used for generating the billboard data. Defaults to None.
         Returns:
-            None
+            CharacterBillboardEntry | CorporationBillboardEntry | None: The billboard entry or None if there is no data.
         """
+        # pylint: disable=import-outside-toplevel
+        # AA Ledger
+        from ledger.helpers.billboard import BillboardSystem
+
         billoard_system = BillboardSystem()
 
         wallet_timeline = (
@@ -104,7 +185,7 @@ class BillboardEntryManager(
         chord_billboard = billoard_system.create_chord_billboard(ledger_list)
 
         if not xy_billboard or not chord_billboard:
-            return
+            return None
 
         # Determine the name for the billboard entry based on the owner type
         if isinstance(owner, CharacterOwner):
@@ -117,7 +198,7 @@ class BillboardEntryManager(
             raise ValueError("Invalid owner type for billboard entry")
 
         # Update or create the billboard entry for the character
-        self.update_or_create(
+        billboard, __ = self.update_or_create(
             owner=owner,
             year=request_info.year,
             month=request_info.month,
@@ -129,3 +210,4 @@ class BillboardEntryManager(
                 "final_data": request_info.is_final_data,
             },
         )
+        return billboard
@@ -0,0 +1,128 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:48
+
+# Django
+from django.db import migrations, models
+
+# Sections & status values at the time of this migration
+CHARACTER_SECTIONS = ["wallet_journal", "mining_ledger", "planets", "planets_details"]
+CORPORATION_SECTIONS = ["wallet_division_names", "wallet_division", "wallet_journal"]
+
+DISABLED = "disabled"
+TOKEN_ERROR = "token_error"
+ERROR = "error"
+OK = "ok"
+INCOMPLETE = "incomplete"
+IN_PROGRESS = "in_progress"
+
+
+def calculate_total_update_status(owner, statuses, num_sections_total) -> str:
+    """Calculate the total update status like `annotate_calculated_update_status`."""
+    if not owner.active:
+        return DISABLED
+    if sum(status.has_token_error for status in statuses) == 1:
+        return TOKEN_ERROR
+    if any(status.is_success is False for status in statuses):
+        return ERROR
+    if sum(status.is_success is True for status in statuses) == num_sections_total:
+        return OK
+    if len(statuses) < num_sections_total:
+        return INCOMPLETE
+    return IN_PROGRESS
+
+
+def set_total_update_status(apps, schema_editor):
+    for owner_model, status_model, section_list in [
+        ("CharacterOwner", "CharacterUpdateStatus", CHARACTER_SECTIONS),
+        ("CorporationOwner", "CorporationUpdateStatus", CORPORATION_SECTIONS),
+    ]:
+        Owner = apps.get_model("ledger", owner_model)
+        Status = apps.get_model("ledger", status_model)
+
+        statuses_by_owner = {}
+        for status in Status.objects.filter(section__in=section_list):
+            statuses_by_owner.setdefault(status.owner_id, []).append(status)
+
+        owners = list(Owner.objects.all())
+        for owner in owners:
+            statuses = statuses_by_owner.get(owner.pk, [])
+            owner.total_update_status = calculate_total_update_status(
+                owner, statuses, len(section_list)
+            )
+            owner.last_update_finished_at = max(
+                (
+                    status.last_update_finished_at
+                    for status in statuses
+                    if status.last_update_finished_at
+                ),
+                default=None,
+            )
+        Owner.objects.bulk_update(
+            owners, ["total_update_status", "last_update_finished_at"], batch_size=500
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ledger", "0005_alter_alliancebillboardentry_owner_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="characterowner",
+            name="last_update_finished_at",
+            field=models.DateTimeField(
+                db_index=True,
+                default=None,
+                help_text="Last update of any section has been successful finished at this time",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="characterowner",
+            name="total_update_status",
+            field=models.CharField(
+                choices=[
+                    ("disabled", "Disabled"),
+                    ("token_error", "Token Error"),
+                    ("error", "Error"),
+                    ("ok", "OK"),
+                    ("incomplete", "Incomplete"),
+                    ("in_progress", "In Progress"),
+                ],
+                db_index=True,
+                default="incomplete",
+                help_text="Total update status of all sections",
+                max_length=32,
+            ),
+        ),
+        migrations.AddField(
+            model_name="corporationowner",
+            name="last_update_finished_at",
+            field=models.DateTimeField(
+                db_index=True,
+                default=None,
+                help_text="Last update of any section has been successful finished at this time",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="corporationowner",
+            name="total_update_status",
+            field=models.CharField(
+                choices=[
+                    ("disabled", "Disabled"),
+                    ("token_error", "Token Error"),
+                    ("error", "Error"),
+                    ("ok", "OK"),
+                    ("incomplete", "Incomplete"),
+                    ("in_progress", "In Progress"),
+                ],
+                db_index=True,
+                default="incomplete",
+                help_text="Total update status of all sections",
+                max_length=32,
+            ),
+        ),
+        migrations.RunPython(set_total_update_status, migrations.RunPython.noop),
+    ]
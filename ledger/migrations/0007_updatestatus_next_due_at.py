@@ -0,0 +1,63 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:51
+
+# Standard Library
+import datetime
+
+# Django
+from django.db import migrations, models
+from django.utils import timezone
+
+# AA Ledger
+from ledger import app_settings
+
+
+def set_next_due_at(apps, schema_editor):
+    now = timezone.now()
+    for status_model in ["CharacterUpdateStatus", "CorporationUpdateStatus"]:
+        Status = apps.get_model("ledger", status_model)
+
+        statuses = list(Status.objects.all())
+        for status in statuses:
+            if status.has_token_error:
+                status.next_due_at = None
+            elif not status.is_success or not status.last_update_finished_at:
+                status.next_due_at = now
+            else:
+                status.next_due_at = (
+                    status.last_update_finished_at
+                    + datetime.timedelta(
+                        minutes=app_settings.LEDGER_STALE_TYPES.get(status.section, 60)
+                    )
+                )
+        Status.objects.bulk_update(statuses, ["next_due_at"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ledger", "0006_owner_total_update_status"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="characterupdatestatus",
+            name="next_due_at",
+            field=models.DateTimeField(
+                db_index=True,
+                default=None,
+                help_text="Next update is due at this time",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="corporationupdatestatus",
+            name="next_due_at",
+            field=models.DateTimeField(
+                db_index=True,
+                default=None,
+                help_text="Next update is due at this time",
+                null=True,
+            ),
+        ),
+        migrations.RunPython(set_next_due_at, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.18 on 2026-10-19 02:54
+
+# Django
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ledger", "0007_updatestatus_next_due_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="characterupdatestatus",
+            name="esi_expires_at",
+            field=models.DateTimeField(
+                default=None,
+                help_text="ESI data will not change before this time",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="characterupdatestatus",
+            name="not_modified_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="Number of consecutive runs without changed ESI data",
+            ),
+        ),
+        migrations.AddField(
+            model_name="corporationupdatestatus",
+            name="esi_expires_at",
+            field=models.DateTimeField(
+                default=None,
+                help_text="ESI data will not change before this time",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="corporationupdatestatus",
+            name="not_modified_count",
+            field=models.PositiveIntegerField(
+                default=0,
+                help_text="Number of consecutive runs without changed ESI data",
+            ),
+        ),
+    ]
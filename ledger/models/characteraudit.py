@@ -6,7 +6,8 @@ Character Audit Model
 from typing import TYPE_CHECKING
 
 # Django
-from django.core.exceptions import MultipleObjectsReturned, ObjectDoesNotExist
+from django.core.cache import cache
+from django.core.exceptions import ObjectDoesNotExist
 from django.db import models
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
@@ -21,9 +22,7 @@ from eve_sde.models.map import SolarSystem
 
 # AA Ledger
 from ledger import __title__
-from ledger.app_settings import (
-    LEDGER_USE_COMPRESSED,
-)
+from ledger.app_settings import LEDGER_TOKEN_CACHE_TIMEOUT
 from ledger.errors import TokenDoesNotExist
 from ledger.helpers.eveonline import get_character_portrait_url
 from ledger.managers.character_audit_manager import (
@@ -91,6 +90,21 @@ class CharacterOwner(models.Model):
         max_digits=20, decimal_places=2, null=True, default=None
     )
 
+    total_update_status = models.CharField(
+        max_length=32,
+        choices=UpdateStatus.choices,
+        default=UpdateStatus.INCOMPLETE,
+        db_index=True,
+        help_text="Total update status of all sections",
+    )
+
+    last_update_finished_at = models.DateTimeField(
+        default=None,
+        null=True,
+        db_index=True,
+        help_text="Last update of any section has been successful finished at this time",
+    )
+
     def __str__(self) -> str:
         try:
             return f"{self.eve_character.character_name} ({self.id})"
@@ -121,9 +135,27 @@ class CharacterOwner(models.Model):
         if self.active is False:
             return UpdateStatus.DISABLED
 
-        qs = CharacterOwner.objects.filter(pk=self.pk).annotate_total_update_status()
-        total_update_status = list(qs.values_list("total_update_status", flat=True))[0]
-        return UpdateStatus(total_update_status)
+        return UpdateStatus(self.total_update_status)
+
+    def update_total_update_status(self) -> UpdateStatus:
+        """Recalculate and store the total update status of this character."""
+        values = (
+            CharacterOwner.objects.filter(pk=self.pk)
+            .annotate_calculated_update_status()
+            .values_list(
+                "calculated_update_status", "calculated_last_update_finished_at"
+            )
+            .first()
+        )
+        if values is None:
+            return self.get_status
+
+        self.total_update_status, self.last_update_finished_at = values
+        CharacterOwner.objects.filter(pk=self.pk).update(
+            total_update_status=self.total_update_status,
+            last_update_finished_at=self.last_update_finished_at,
+        )
+        return self.get_status
 
     @cached_property
     def alt_ids(self) -> models.QuerySet[EveCharacter]:
@@ -187,24 +219,61 @@ class CharacterOwner(models.Model):
         )
 
     def get_token(self, scopes=None) -> Token:
-        """Get the token for this character."""
+        """Get the token for this character.
+
+        Resolved tokens are memoized per scope set on this instance and
+        cached for `LEDGER_TOKEN_CACHE_TIMEOUT` seconds across tasks.
+        Cached tokens are checked for their scopes & validity before they are used.
+        """
         if self.is_orphan:  # pylint: disable=using-constant-test
             raise TokenDoesNotExist(
                 f"Character {self} is an orphan and has no token."
             ) from None
 
-        token = (
-            Token.objects.filter(character_id=self.eve_character.character_id)
-            .require_scopes(scopes if scopes else self.get_esi_scopes())
-            .require_valid()
-            .first()
-        )
-        if not token:
-            raise TokenDoesNotExist(
-                f"Token does not exist for {self} with scopes {scopes}"
+        scopes = scopes if scopes else self.get_esi_scopes()
+        scopes_key = " ".join(sorted(scopes))
+        if scopes_key in self._resolved_tokens:
+            return self._resolved_tokens[scopes_key]
+
+        tokens = Token.objects.filter(character_id=self.eve_character.character_id)
+        token_ids = cache.get(self._token_cache_key, {})
+        token = None
+        if scopes_key in token_ids:
+            # The cached token may have been revoked or lost its scopes since
+            token = (
+                tokens.filter(pk=token_ids[scopes_key])
+                .require_scopes(scopes)
+                .require_valid()
+                .first()
             )
+
+        if token is None:
+            token = tokens.require_scopes(scopes).require_valid().first()
+            if not token:
+                raise TokenDoesNotExist(
+                    f"Token does not exist for {self} with scopes {scopes}"
+                )
+            token_ids[scopes_key] = token.pk
+            cache.set(
+                self._token_cache_key, token_ids, timeout=LEDGER_TOKEN_CACHE_TIMEOUT
+            )
+
+        self._resolved_tokens[scopes_key] = token
         return token
 
+    @cached_property
+    def _resolved_tokens(self) -> dict[str, Token]:
+        return {}
+
+    @property
+    def _token_cache_key(self) -> str:
+        return f"ledger-character-token-{self.eve_character.character_id}"
+
+    def invalidate_token_cache(self) -> None:
+        """Forget the resolved tokens of this character."""
+        self._resolved_tokens.clear()
+        cache.delete(self._token_cache_key)
+
     # Task Section
     def update_wallet_journal(self, force_refresh: bool) -> UpdateSectionResult:
         return self.ledger_character_journal.update_or_create_esi(
@@ -285,32 +354,14 @@ class CharacterMiningLedger(models.Model):
         return f"{mining_record.date.strftime('%Y%m%d')}-{mining_record.type_id}-{character_id}-{mining_record.solar_system_id}"
 
     @staticmethod
-    def update_evemarket_price():
+    def update_evemarket_price(force_refresh: bool = False):
         """Update Prices for the EveMarketPrice."""
-        updated = EveMarketPrice.objects.update_from_esi()
+        updated = EveMarketPrice.objects.update_from_esi(force_refresh=force_refresh)
         return updated
 
     def get_npc_price(self):
         """Get the NPC price for the type."""
-        try:
-            if LEDGER_USE_COMPRESSED:
-                # price = ItemType.objects.get(name=type_name).market_price.average_price
-                try:
-                    type_name = f"Compressed {self.type.name}"
-                    price = (
-                        EveMarketPrice.objects.exclude(
-                            eve_type__name__startswith="Batch Compressed"
-                        )
-                        .get(eve_type__name=type_name)
-                        .average_price
-                    )
-                except (MultipleObjectsReturned, ObjectDoesNotExist):
-                    price = EveMarketPrice.objects.get(eve_type=self.type).average_price
-            else:
-                price = EveMarketPrice.objects.get(eve_type=self.type).average_price
-        except ObjectDoesNotExist:
-            price = None
-        return price
+        return EveMarketPrice.objects.get_npc_prices([self.type_id]).get(self.type_id)
 
     def __str__(self) -> str:
         return f"{self.character} {self.id}"
@@ -6,7 +6,9 @@ Corporation Audit Model
 from typing import TYPE_CHECKING
 
 # Django
+from django.core.cache import cache
 from django.db import models
+from django.utils import timezone
 from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
@@ -19,6 +21,7 @@ from esi.models import Token
 
 # AA Ledger
 from ledger import __title__
+from ledger.app_settings import LEDGER_ROLE_CACHE_TIMEOUT
 from ledger.helpers.eveonline import get_corporation_logo_url
 from ledger.managers.corporation_audit_manager import CorporationAuditManager
 from ledger.managers.corporation_journal_manager import (
@@ -33,6 +36,7 @@ from ledger.models.helpers.update_manager import (
     CorporationUpdateSection,
     UpdateManager,
     UpdateStatus,
+    get_esi_expiry,
 )
 from ledger.providers import AppLogger, esi
 
@@ -75,6 +79,21 @@ class CorporationOwner(models.Model):
         related_name="ledger_corporationaudit",
     )
 
+    total_update_status = models.CharField(
+        max_length=32,
+        choices=UpdateStatus.choices,
+        default=UpdateStatus.INCOMPLETE,
+        db_index=True,
+        help_text="Total update status of all sections",
+    )
+
+    last_update_finished_at = models.DateTimeField(
+        default=None,
+        null=True,
+        db_index=True,
+        help_text="Last update of any section has been successful finished at this time",
+    )
+
     def __str__(self) -> str:
         try:
             return f"{self.eve_corporation.corporation_name} ({self.id})"
@@ -109,16 +128,38 @@ class CorporationOwner(models.Model):
         if self.active is False:
             return UpdateStatus.DISABLED
 
-        qs = CorporationOwner.objects.filter(pk=self.pk).annotate_total_update_status()
-        total_update_status = list(qs.values_list("total_update_status", flat=True))[0]
-        return UpdateStatus(total_update_status)
+        return UpdateStatus(self.total_update_status)
+
+    def update_total_update_status(self) -> UpdateStatus:
+        """Recalculate and store the total update status of this corporation."""
+        values = (
+            CorporationOwner.objects.filter(pk=self.pk)
+            .annotate_calculated_update_status()
+            .values_list(
+                "calculated_update_status", "calculated_last_update_finished_at"
+            )
+            .first()
+        )
+        if values is None:
+            return self.get_status
+
+        self.total_update_status, self.last_update_finished_at = values
+        CorporationOwner.objects.filter(pk=self.pk).update(
+            total_update_status=self.total_update_status,
+            last_update_finished_at=self.last_update_finished_at,
+        )
+        return self.get_status
 
     @property
     def update_status(self):
         return self.ledger_corporation_update_status
 
     def get_token(self, scopes: list, req_roles: list) -> Token:
-        """Get the token for this corporation."""
+        """Get the token for this corporation.
+
+        The last token with the required roles is tried first
+        and the roles of each character are cached until the ESI data expires.
+        """
         if "esi-characters.read_corporation_roles.v1" not in scopes:
             scopes.append("esi-characters.read_corporation_roles.v1")
 
@@ -126,20 +167,25 @@ class CorporationOwner(models.Model):
             corporation_id=self.eve_corporation.corporation_id
         ).values("character_id")
 
-        tokens = Token.objects.filter(character_id__in=char_ids).require_scopes(scopes)
+        tokens = list(
+            Token.objects.filter(character_id__in=char_ids).require_scopes(scopes)
+        )
+
+        roles_key = "-".join(sorted(req_roles))
+        token_ids = cache.get(self._token_cache_key, {})
+        # Prefer the last known-good token
+        tokens.sort(key=lambda token: token.pk != token_ids.get(roles_key))
 
         for token in tokens:
             try:
-                roles = esi.client.Character.GetCharactersCharacterIdRoles(
-                    character_id=token.character_id, token=token
-                ).result(use_etag=False)
-
-                has_roles = False
-                for role in roles.roles:
-                    if role in req_roles:
-                        has_roles = True
-
-                if has_roles:
+                roles = self._get_character_roles(token)
+                if any(role in req_roles for role in roles):
+                    token_ids[roles_key] = token.pk
+                    cache.set(
+                        self._token_cache_key,
+                        token_ids,
+                        timeout=LEDGER_ROLE_CACHE_TIMEOUT,
+                    )
                     return token
             except TokenError as e:
                 logger.error(
@@ -147,8 +193,37 @@ class CorporationOwner(models.Model):
                     token.pk,
                     e,
                 )
+        self.invalidate_token_cache()
         return False
 
+    @property
+    def _token_cache_key(self) -> str:
+        return f"ledger-corporation-token-{self.eve_corporation.corporation_id}"
+
+    def invalidate_token_cache(self) -> None:
+        """Forget the known-good tokens of this corporation."""
+        cache.delete(self._token_cache_key)
+
+    @staticmethod
+    def _get_character_roles(token: Token) -> list[str]:
+        """Get the corporation roles of the token's character, cached until the ESI data expires."""
+        roles_key = f"ledger-character-roles-{token.character_id}"
+        roles = cache.get(roles_key)
+        if roles is not None:
+            return roles
+
+        data, response = esi.client.Character.GetCharactersCharacterIdRoles(
+            character_id=token.character_id, token=token
+        ).result(use_etag=False, return_response=True)
+        roles = list(data.roles)
+
+        timeout = LEDGER_ROLE_CACHE_TIMEOUT
+        expires_at = get_esi_expiry(response.headers)
+        if expires_at is not None:
+            timeout = max(int((expires_at - timezone.now()).total_seconds()), 1)
+        cache.set(roles_key, roles, timeout=timeout)
+        return roles
+
     @cached_property
     def corp_members_ids(self):
         """Return the member ids for this corporation."""
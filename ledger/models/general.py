@@ -203,6 +203,7 @@ class UpdateSectionResult(NamedTuple):
     has_token_error: bool = False
     error_message: str | None = None
     data: Any = None
+    expires_at: datetime.datetime | None = None
 
 
 @dataclass(frozen=True)
@@ -255,19 +256,61 @@ class UpdateStatusBaseModel(models.Model):
         db_index=True,
         help_text="Last update has been successful finished at this time",
     )
+    next_due_at = models.DateTimeField(
+        default=None,
+        null=True,
+        db_index=True,
+        help_text="Next update is due at this time",
+    )
+    esi_expires_at = models.DateTimeField(
+        default=None,
+        null=True,
+        help_text="ESI data will not change before this time",
+    )
+    not_modified_count = models.PositiveIntegerField(
+        default=0,
+        help_text="Number of consecutive runs without changed ESI data",
+    )
+
+    def save(self, *args, **kwargs):
+        self.next_due_at = self.calc_next_due_at()
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "next_due_at"}
+        super().save(*args, **kwargs)
+
+    def _calc_due_at(self) -> datetime.datetime:
+        """Calculate when the next update is due from the last run and the ESI expiry."""
+        last_finished = [
+            finished_at
+            for finished_at in (self.last_run_finished_at, self.last_update_finished_at)
+            if finished_at
+        ]
+        if not self.is_success or not last_finished:
+            return timezone.now()
+
+        section_time_stale = app_settings.LEDGER_STALE_TYPES.get(self.section, 60)
+        # Back off for sections which ESI data has not changed on the last runs
+        interval = min(
+            section_time_stale * 2 ** min(self.not_modified_count, 10),
+            max(section_time_stale, app_settings.LEDGER_UPDATE_BACKOFF_MAX),
+        )
+        due_at = max(last_finished) + datetime.timedelta(minutes=interval)
+
+        # ESI returns the cached data until it expires
+        if self.esi_expires_at and self.esi_expires_at > due_at:
+            due_at = self.esi_expires_at
+        return due_at
+
+    def calc_next_due_at(self) -> datetime.datetime | None:
+        """Calculate when the next update is due, None if it is blocked by a token error."""
+        if self.has_token_error:
+            return None
+        return self._calc_due_at()
 
     def need_update(self) -> bool:
         """Check if the update is needed."""
-        if not self.is_success or not self.last_update_finished_at:
-            needs_update = True
-        else:
-            section_time_stale = app_settings.LEDGER_STALE_TYPES.get(self.section, 60)
-            stale = timezone.now() - timezone.timedelta(minutes=section_time_stale)
-
-            try:
-                needs_update = self.last_update_finished_at <= stale
-            except AttributeError:
-                needs_update = True
+        needs_update = self._calc_due_at() <= timezone.now()
 
         if needs_update and self.has_token_error:
             logger.info(
@@ -1,6 +1,11 @@
 # Standard Library
+import datetime
+from email.utils import parsedate_to_datetime
 from typing import TYPE_CHECKING, Union
 
+# Third Party
+from celery.exceptions import MaxRetriesExceededError, Retry
+
 # Django
 from django.db import models
 from django.utils import timezone
@@ -9,10 +14,12 @@ from django.utils.translation import gettext_lazy as _
 
 # Alliance Auth
 from allianceauth.services.hooks import get_extension_logger
+from esi.errors import TokenError
 from esi.exceptions import HTTPClientError, HTTPNotModified, HTTPServerError
 
 # AA Ledger
 from ledger import __title__
+from ledger.helpers import metrics
 from ledger.models.general import (
     UpdateSectionResult,
     _NeedsUpdate,
@@ -29,6 +36,48 @@ from ledger.providers import AppLogger
 logger = AppLogger(get_extension_logger(__name__), __title__)
 
 
+def get_esi_expiry(headers: dict | None) -> datetime.datetime | None:
+    """
+    Get the expiry of the ESI data from the response headers.
+
+    Args:
+        headers (dict | None): The ESI response headers.
+    Returns:
+        datetime | None: The time the ESI data expires or None if unknown.
+    """
+    if not headers:
+        return None
+    expires = headers.get("Expires") or headers.get("expires")
+    if not expires:
+        return None
+    try:
+        return parsedate_to_datetime(str(expires))
+    except (TypeError, ValueError):
+        logger.debug("Invalid ESI Expires header: %s", expires)
+        return None
+
+
+def get_earliest_esi_headers(headers_list: list[dict]) -> dict | None:
+    """
+    Get the headers of the ESI response that expires first.
+
+    Sections fetched with several ESI requests can change once any of them expires.
+
+    Args:
+        headers_list (list[dict]): The headers of each ESI response.
+    Returns:
+        dict | None: The headers that expire first or None if no expiry is known.
+    """
+    expiring = [
+        (expires_at, headers)
+        for headers in headers_list
+        if (expires_at := get_esi_expiry(headers)) is not None
+    ]
+    if not expiring:
+        return None
+    return min(expiring, key=lambda item: item[0])[1]
+
+
 class UpdateStatus(models.TextChoices):
     DISABLED = "disabled", _("Disabled")
     TOKEN_ERROR = "token_error", _("Token Error")
@@ -95,6 +144,17 @@ class CharacterUpdateSection(models.TextChoices):
         """Return method name for this section."""
         return f"update_{self.value}"
 
+    @property
+    def esi_group(self) -> str:
+        """Return the ESI route group of this section."""
+        group_map = {
+            self.WALLET_JOURNAL: "char-wallet",
+            self.MINING_LEDGER: "char-industry",
+            self.PLANETS: "char-planets",
+            self.PLANETS_DETAILS: "char-planets",
+        }
+        return group_map[self]
+
 
 class CorporationUpdateSection(models.TextChoices):
     WALLET_DIVISION_NAMES = "wallet_division_names", _("Divisions Names")
@@ -111,6 +171,16 @@ class CorporationUpdateSection(models.TextChoices):
         """Return method name for this section."""
         return f"update_{self.value}"
 
+    @property
+    def esi_group(self) -> str:
+        """Return the ESI route group of this section."""
+        group_map = {
+            self.WALLET_DIVISION_NAMES: "corp-detail",
+            self.WALLET_DIVISION: "corp-wallet",
+            self.WALLET_JOURNAL: "corp-wallet",
+        }
+        return group_map[self]
+
 
 class UpdateManager:
     """Manager class to handle update operations for CharacterOwner and CorporationOwner.
@@ -168,6 +238,19 @@ class UpdateManager:
         update_status_obj.reset()
         return update_status_obj
 
+    def create_update_status(self) -> int:
+        """
+        Create the missing update status of each section, due now.
+
+        Returns:
+            int: The number of created update status.
+        """
+        return (
+            type(self.owner)
+            .objects.filter(pk=self.owner.pk)
+            .create_missing_update_status()
+        )
+
     def reset_has_token_error(self) -> None:
         """
         Reset has_token_error for all sections.
@@ -175,11 +258,16 @@ class UpdateManager:
         Returns:
             None
         """
-        self.update_status.objects.filter(
+        token_errors = self.update_status.objects.filter(
             has_token_error=True,
-        ).update(
+        )
+        owner_ids = list(token_errors.values_list("owner_id", flat=True).distinct())
+        token_errors.update(
             has_token_error=False,
+            next_due_at=timezone.now(),
         )
+        # Bulk updates bypass the signals storing the total update status
+        type(self.owner).objects.filter(pk__in=owner_ids).update_total_update_status()
 
     def update_section_if_changed(
         self, section: models.TextChoices, fetch_func, force_refresh: bool = False
@@ -198,36 +286,46 @@ class UpdateManager:
             HTTPNotModified: If the data has not been modified.
         """
         section = self.update_section(section)
-        try:
-            data = fetch_func(owner=self.owner, force_refresh=force_refresh)
-            logger.debug(
-                "%s: Update has changed, section: %s", self.owner, section.label
-            )
-        except HTTPNotModified:
-            logger.debug(
-                "%s: Update has not changed, section: %s", self.owner, section.label
-            )
-            return UpdateSectionResult(is_changed=False, is_updated=False)
-        except HTTPClientError as exc:
-            error_message = f"{type(exc).__name__}: {str(exc)}"
-            logger.error(
-                "%s: %s: Update has Client Error: %s %s",
-                self.owner,
-                section.label,
-                error_message,
-                exc.status_code,
-            )
+        owner_type = self.owner._meta.model_name.removesuffix("owner")
+        with metrics.section_update(owner_type, section.value) as update_metrics:
+            try:
+                # The fetch functions return the headers of their ESI response
+                headers = fetch_func(owner=self.owner, force_refresh=force_refresh)
+                logger.debug(
+                    "%s: Update has changed, section: %s", self.owner, section.label
+                )
+            except HTTPNotModified as exc:
+                logger.debug(
+                    "%s: Update has not changed, section: %s", self.owner, section.label
+                )
+                update_metrics["result"] = "not_modified"
+                return UpdateSectionResult(
+                    is_changed=False,
+                    is_updated=False,
+                    expires_at=get_esi_expiry(exc.headers),
+                )
+            except HTTPClientError as exc:
+                error_message = f"{type(exc).__name__}: {str(exc)}"
+                logger.error(
+                    "%s: %s: Update has Client Error: %s %s",
+                    self.owner,
+                    section.label,
+                    error_message,
+                    exc.status_code,
+                )
+                self.owner.invalidate_token_cache()
+                update_metrics["result"] = "client_error"
+                return UpdateSectionResult(
+                    is_changed=False,
+                    is_updated=False,
+                    has_token_error=True,
+                    error_message=error_message,
+                )
             return UpdateSectionResult(
-                is_changed=False,
-                is_updated=False,
-                has_token_error=True,
-                error_message=error_message,
+                is_changed=True,
+                is_updated=True,
+                expires_at=get_esi_expiry(headers),
             )
-        return UpdateSectionResult(
-            is_changed=True,
-            is_updated=True,
-            data=data,
-        )
 
     def update_section_log(
         self, section: models.TextChoices, result: UpdateSectionResult
@@ -248,15 +346,22 @@ class UpdateManager:
             "has_token_error": result.has_token_error,
             "last_run_finished_at": timezone.now(),
         }
-        obj = self.update_status.objects.update_or_create(
+        obj = self.update_status.objects.get_or_create(
             owner=self.owner,
             section=section,
-            defaults=defaults,
         )[0]
+        for key, value in defaults.items():
+            setattr(obj, key, value)
         if result.is_updated:
             obj.last_update_at = obj.last_run_at
             obj.last_update_finished_at = timezone.now()
-            obj.save()
+        # Count the runs without changed data to back off the next update
+        if result.is_changed is False and is_success:
+            obj.not_modified_count += 1
+        else:
+            obj.not_modified_count = 0
+        obj.esi_expires_at = result.expires_at
+        obj.save()
         status = "successfully" if is_success else "with errors"
         logger.info("%s: %s Update run completed %s", self.owner, section.label, status)
 
@@ -274,11 +379,12 @@ class UpdateManager:
             Any: The result of the method call.
         Raises:
             HTTPServerError: If there is a server error during the method call.
+            Retry: If the ESI Budget is exhausted during the method call.
             Exception: Reraises any exception encountered during the method call.
         """
         try:
             result = method(*args, **kwargs)
-        except HTTPServerError as exc:
+        except (HTTPServerError, Retry, MaxRetriesExceededError) as exc:
             raise exc
         except Exception as exc:
             error_message = f"{type(exc).__name__}: {str(exc)}"
@@ -288,6 +394,8 @@ class UpdateManager:
                 section.label,
                 error_message,
             )
+            if isinstance(exc, TokenError):
+                self.owner.invalidate_token_cache()
             self.update_status.objects.update_or_create(
                 owner=self.owner,
                 section=section,
@@ -13,7 +13,7 @@ from allianceauth.services.hooks import get_extension_logger
 
 # AA Ledger
 from ledger import __title__
-from ledger.managers.ledger_manager import BillboardEntryManager
+from ledger.managers.ledger_manager import BillboardEntryManager, LedgerEntryManager
 from ledger.models.characteraudit import CharacterOwner
 from ledger.models.corporationaudit import CorporationOwner
 from ledger.providers import AppLogger
@@ -29,6 +29,8 @@ class LedgerEntry(models.Model):
         default_permissions = ()
         permissions = ()
 
+    objects: LedgerEntryManager = LedgerEntryManager()
+
     id = models.AutoField(primary_key=True)
 
     year = models.PositiveSmallIntegerField(null=True, default=None)
@@ -1,18 +1,22 @@
 """Shared ESI client for Ledger."""
 
 # Standard Library
+import hashlib
+import json
 import logging
+import os
 import random
 from contextlib import contextmanager
 from http import HTTPStatus
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 # Third Party
 from aiopenapi3 import RequestError
-from celery import Task
 
 # Django
 from django.utils import timezone
+from django.utils.crypto import constant_time_compare, salted_hmac
 
 # Alliance Auth
 from allianceauth.services.hooks import get_extension_logger
@@ -21,7 +25,6 @@ from esi.exceptions import (
     ESIErrorLimitException,
     HTTPServerError,
 )
-from esi.openapi_clients import ESIClientProvider
 
 # AA Ledger
 from ledger import (
@@ -32,17 +35,16 @@ from ledger import (
     __title__,
     __version__,
 )
+from ledger.app_settings import LEDGER_ESI_SPEC_CACHE_DIR
 from ledger.errors import DownTimeError
+from ledger.helpers import metrics
 
-spec_file = Path(__file__).parent / "openapi_2026-07-21.json"
-esi = ESIClientProvider(
-    compatibility_date=__esi_compatibility_date__,
-    ua_appname=__app_name_useragent__,
-    ua_version=__version__,
-    ua_url=__github_url__,
-    operations=__operations__,
-    spec_file=spec_file,
-)
+if TYPE_CHECKING:
+    # Third Party
+    from celery import Task
+
+    # Alliance Auth
+    from esi.openapi_clients import ESIClient, ESIClientProvider
 
 DOWNTIME_TIMER = 60 * 10  # 10 minutes
 
@@ -85,9 +87,218 @@ class AppLogger(logging.LoggerAdapter):
 
 logger = AppLogger(my_logger=get_extension_logger(__name__), prefix=__title__)
 
+spec_file = Path(__file__).parent / f"openapi_{__esi_compatibility_date__}.json"
+
+HTTP_METHODS = ("get", "post", "put", "delete", "patch", "options", "head")
+# Schemas patched by the django-esi plugins, kept to avoid warnings on each load
+KEEP_SCHEMAS = ("UniverseBloodlinesGet",)
+
+
+def _find_refs(node, refs: set[str]):
+    """Collect the `$ref` targets of a spec node."""
+    if isinstance(node, dict):
+        if isinstance(node.get("$ref"), str):
+            refs.add(node["$ref"])
+        for value in node.values():
+            _find_refs(value, refs)
+    elif isinstance(node, list):
+        for value in node:
+            _find_refs(value, refs)
+
+
+def trim_spec(spec: dict, operations: list[str]) -> dict:
+    """
+    Return a copy of the OpenAPI spec with only the given operations.
+
+    Keeps the paths of the operations and the components they reference,
+    everything else django-esi would remove on each client load.
+
+    Args:
+        spec (dict): The parsed OpenAPI spec.
+        operations (list[str]): The operation IDs to keep.
+    Returns:
+        dict: The trimmed spec.
+    """
+    paths = {}
+    for name, path_item in spec.get("paths", {}).items():
+        kept = {
+            key: value
+            for key, value in path_item.items()
+            if key not in HTTP_METHODS or value.get("operationId") in operations
+        }
+        if set(kept).intersection(HTTP_METHODS):
+            paths[name] = kept
+
+    components = spec.get("components", {})
+    kept_components = {
+        "securitySchemes": components.get("securitySchemes", {}),
+    }
+    pending = {f"#/components/schemas/{name}" for name in KEEP_SCHEMAS}
+    _find_refs(paths, pending)
+    seen: set[str] = set()
+    while pending:
+        ref = pending.pop()
+        seen.add(ref)
+        # Only local references like `#/components/schemas/Name`
+        section, _, name = ref.removeprefix("#/components/").partition("/")
+        if name not in components.get(section, {}):
+            continue
+        node = components[section][name]
+        kept_components.setdefault(section, {})[name] = node
+        refs: set[str] = set()
+        _find_refs(node, refs)
+        pending.update(refs - seen)
+
+    used_tags = {
+        tag
+        for path_item in paths.values()
+        for key, method in path_item.items()
+        if key in HTTP_METHODS
+        for tag in method.get("tags", [])
+    }
+    return {
+        **spec,
+        "paths": paths,
+        "components": kept_components,
+        "tags": [tag for tag in spec.get("tags", []) if tag["name"] in used_tags],
+    }
+
+
+def _sign_spec(content: bytes) -> str:
+    """Return the signature of a trimmed spec, keyed with the `SECRET_KEY`."""
+    return salted_hmac(
+        "ledger.providers.trimmed_spec", content, algorithm="sha256"
+    ).hexdigest()
+
+
+def _get_spec_cache_dir() -> Path:
+    """
+    Return the spec cache directory, created private to the current user.
+
+    Raises:
+        PermissionError: If the directory is owned by another user.
+    """
+    cache_dir = Path(LEDGER_ESI_SPEC_CACHE_DIR)
+    cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+    stat = cache_dir.stat()
+    if hasattr(os, "getuid") and stat.st_uid != os.getuid():
+        raise PermissionError(f"{cache_dir} is owned by another user")
+    if stat.st_mode & 0o077:
+        cache_dir.chmod(0o700)
+    return cache_dir
+
+
+def get_trimmed_spec_file(path: Path, operations: list[str]) -> Path:
+    """
+    Return the trimmed spec of `path`, cached in `LEDGER_ESI_SPEC_CACHE_DIR`.
+
+    The cached file is keyed by the spec file & the operations and is only used
+    if its signature matches, a changed spec is trimmed again and replaces the old files.
+    If the cache is not writable the full spec is returned.
+
+    Args:
+        path (Path): The full OpenAPI spec file.
+        operations (list[str]): The operation IDs to keep.
+    Returns:
+        Path: The trimmed or the full spec file.
+    """
+    path = Path(path)
+    try:
+        stat = path.stat()
+        key = hashlib.blake2b(
+            json.dumps(
+                [
+                    str(path.resolve()),
+                    stat.st_size,
+                    stat.st_mtime_ns,
+                    sorted(operations),
+                ]
+            ).encode(),
+            digest_size=8,
+        ).hexdigest()
+        cache_dir = _get_spec_cache_dir()
+        trimmed_file = cache_dir / f"{path.stem}.{key}.json"
+        signature_file = trimmed_file.with_suffix(".sig")
+        if trimmed_file.exists() and signature_file.exists():
+            if constant_time_compare(
+                _sign_spec(trimmed_file.read_bytes()),
+                signature_file.read_text(encoding="utf-8"),
+            ):
+                return trimmed_file
+            logger.warning("Cached ESI spec %s is not verified", trimmed_file)
+
+        spec = json.loads(path.read_bytes())
+        content = json.dumps(trim_spec(spec, operations)).encode()
+        # Remove the trimmed specs of older spec files
+        for old_file in [*cache_dir.glob("*.json"), *cache_dir.glob("*.sig")]:
+            if old_file not in (trimmed_file, signature_file):
+                old_file.unlink(missing_ok=True)
+        # Write to temporary files first, other processes may read the cache
+        for target, data in [
+            (signature_file, _sign_spec(content).encode()),
+            (trimmed_file, content),
+        ]:
+            temp_file = target.with_suffix(f"{target.suffix}.{os.getpid()}.tmp")
+            temp_file.write_bytes(data)
+            os.replace(temp_file, target)
+        return trimmed_file
+    except OSError as exc:
+        logger.warning("Could not cache the trimmed ESI spec: %s", exc)
+        return path
+
+
+class LedgerESIClientProvider:
+    """
+    ESI client provider loading a trimmed spec with only the Ledger operations.
+
+    django-esi, the spec and the client are loaded on first use, processes that
+    never call ESI (web workers, beat, management commands) do not load them at all.
+
+    Args:
+        spec_file (Path): The full OpenAPI spec file.
+        operations (list[str]): The operation IDs to keep.
+        **kwargs: Passed to the django-esi `ESIClientProvider`.
+    """
+
+    def __init__(self, spec_file: Path, operations: list[str], **kwargs):
+        self._spec_file = spec_file
+        self._operations = operations
+        self._kwargs = kwargs
+        self._provider: "ESIClientProvider | None" = None
+
+    @property
+    def provider(self) -> "ESIClientProvider":
+        """The django-esi client provider."""
+        if self._provider is None:
+            # pylint: disable=import-outside-toplevel
+            # Alliance Auth
+            from esi.openapi_clients import ESIClientProvider
+
+            self._provider = ESIClientProvider(
+                spec_file=get_trimmed_spec_file(self._spec_file, self._operations),
+                operations=self._operations,
+                **self._kwargs,
+            )
+        return self._provider
+
+    @property
+    def client(self) -> "ESIClient":
+        """The ESI client, created on first use."""
+        return self.provider.client
+
+
+esi = LedgerESIClientProvider(
+    compatibility_date=__esi_compatibility_date__,
+    ua_appname=__app_name_useragent__,
+    ua_version=__version__,
+    ua_url=__github_url__,
+    operations=__operations__,
+    spec_file=spec_file,
+)
+
 
 @contextmanager
-def retry_task_on_esi_error(task: Task):
+def retry_task_on_esi_error(task: "Task"):
     """Retry Task when a ESI error occurs.
 
     Taken from the `allianceauth-app-utils` package.
@@ -108,6 +319,7 @@ def retry_task_on_esi_error(task: Task):
     def retry(exc: Exception, retry_after: float, issue: str):
         backoff_jitter = int(random.uniform(2, 5) ** task.request.retries)
         countdown = retry_after + backoff_jitter
+        metrics.record_retry(type(exc).__name__)
         if not isinstance(exc, DownTimeError):
             logger.warning(
                 "ESI Error encountered: %s. Retrying after %.2f seconds. Issue: %s",
@@ -0,0 +1,127 @@
+"""App Signals"""
+
+# Django
+from django.contrib.auth.models import Group, User
+from django.db.models.signals import (
+    m2m_changed,
+    post_delete,
+    post_init,
+    post_migrate,
+    post_save,
+)
+from django.dispatch import receiver
+
+# Alliance Auth
+from allianceauth.authentication.models import CharacterOwnership, State, UserProfile
+from allianceauth.eveonline.models import EveCharacter
+from esi.signals import esi_request_statistics
+
+# AA Ledger
+from ledger.helpers import metrics
+from ledger.helpers.permissions import invalidate_permission_cache
+from ledger.models.characteraudit import CharacterOwner, CharacterUpdateStatus
+from ledger.models.corporationaudit import CorporationOwner, CorporationUpdateStatus
+
+AFFILIATION_FIELDS = ("corporation_id", "alliance_id")
+
+
+def _get_affiliation(character: EveCharacter) -> tuple:
+    return tuple(character.__dict__.get(field) for field in AFFILIATION_FIELDS)
+
+
+# pylint: disable=unused-argument
+@receiver(post_init, sender=EveCharacter)
+def remember_character_affiliation(sender, instance, **kwargs):
+    """Remember the loaded affiliation to detect corporation & alliance changes."""
+    instance._ledger_affiliation = _get_affiliation(instance)
+
+
+# pylint: disable=unused-argument
+@receiver(post_save, sender=EveCharacter)
+def invalidate_visible_ids_on_affiliation_change(
+    sender, instance, created, update_fields, **kwargs
+):
+    """Invalidate the cached visible IDs when a character changes corporation or alliance."""
+    if update_fields is not None and not set(AFFILIATION_FIELDS) & set(update_fields):
+        return
+    affiliation = _get_affiliation(instance)
+    if created or affiliation != instance._ledger_affiliation:
+        invalidate_permission_cache()
+    instance._ledger_affiliation = affiliation
+
+
+# pylint: disable=unused-argument
+@receiver(post_save, sender=CorporationOwner)
+def invalidate_visible_ids_on_corporation_created(sender, created, **kwargs):
+    """Invalidate the cached visible IDs when a corporation is added."""
+    if created:
+        invalidate_permission_cache()
+
+
+# pylint: disable=unused-argument
+@receiver(post_save, sender=CharacterOwnership)
+@receiver(post_delete, sender=CharacterOwnership)
+@receiver(post_save, sender=UserProfile)
+@receiver(post_delete, sender=CorporationOwner)
+def invalidate_visible_ids_on_ownership_change(sender, **kwargs):
+    """Invalidate the cached visible IDs when ownerships, mains or corporations change."""
+    invalidate_permission_cache()
+
+
+# pylint: disable=unused-argument
+@receiver(m2m_changed, sender=User.user_permissions.through)
+@receiver(m2m_changed, sender=User.groups.through)
+@receiver(m2m_changed, sender=Group.permissions.through)
+@receiver(m2m_changed, sender=State.permissions.through)
+def invalidate_visible_ids_on_permission_change(sender, action, **kwargs):
+    """Invalidate the cached visible IDs when permissions change."""
+    if action in ("post_add", "post_remove", "post_clear"):
+        invalidate_permission_cache()
+
+
+# pylint: disable=unused-argument
+@receiver(post_save, sender=CharacterUpdateStatus)
+@receiver(post_delete, sender=CharacterUpdateStatus)
+def update_character_total_update_status(sender, instance, **kwargs):
+    """Store the total update status of the character when a section changes."""
+    CharacterOwner.objects.filter(pk=instance.owner_id).update_total_update_status()
+
+
+# pylint: disable=unused-argument
+@receiver(post_save, sender=CorporationUpdateStatus)
+@receiver(post_delete, sender=CorporationUpdateStatus)
+def update_corporation_total_update_status(sender, instance, **kwargs):
+    """Store the total update status of the corporation when a section changes."""
+    CorporationOwner.objects.filter(pk=instance.owner_id).update_total_update_status()
+
+
+# pylint: disable=unused-argument
+@receiver(post_save, sender=CharacterOwner)
+@receiver(post_save, sender=CorporationOwner)
+def update_owner_total_update_status(sender, instance, update_fields, **kwargs):
+    """Store the total update status of the owner when it is enabled or disabled."""
+    if update_fields is None or "active" in update_fields:
+        instance.update_total_update_status()
+
+
+# pylint: disable=unused-argument
+@receiver(post_migrate)
+def create_missing_update_status(sender, apps, using, **kwargs):
+    """Create the update status of sections added since the last migration, due now."""
+    if sender.name != "ledger":
+        return
+    try:
+        # Migrated backwards before the update status models exist
+        apps.get_model("ledger", "CharacterUpdateStatus")
+        apps.get_model("ledger", "CorporationUpdateStatus")
+    except LookupError:
+        return
+    CharacterOwner.objects.using(using).create_missing_update_status()
+    CorporationOwner.objects.using(using).create_missing_update_status()
+
+
+# pylint: disable=unused-argument
+@receiver(esi_request_statistics)
+def record_esi_request_statistics(sender, operation, status_code, latency, **kwargs):
+    """Record the ESI requests of section updates in the update metrics."""
+    metrics.record_esi_request(operation, status_code, latency)
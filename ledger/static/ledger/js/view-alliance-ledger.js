@@ -75,7 +75,7 @@ $(document).ready(() => {
                     columns: [
                         {
                             data: {
-                                display: (data) => data.corporation.icon + ' ' + data.corporation.entity_name + ' ' + data.corporation.popover,
+                                display: (data) => (data.corporation.icon ?? '') + ' ' + data.corporation.entity_name + ' ' + (data.corporation.popover ?? ''),
                                 sort: (data) => data.corporation.entity_name,
                                 filter: (data) => data.corporation.entity_name
                             }
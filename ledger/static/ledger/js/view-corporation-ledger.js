@@ -80,7 +80,7 @@ $(document).ready(() => {
                     columns: [
                         {
                             data: {
-                                display: (data) => data.entity.icon + ' ' + data.entity.entity_name + ' ' + data.entity.popover,
+                                display: (data) => (data.entity.icon ?? '') + ' ' + data.entity.entity_name + ' ' + (data.entity.popover ?? ''),
                                 sort: (data) => data.entity.entity_name,
                                 filter: (data) => data.entity.entity_name
                             }
@@ -6,9 +6,9 @@ from collections.abc import Callable
 
 # Third Party
 from celery import Task, chain, shared_task
+from celery.exceptions import MaxRetriesExceededError, Retry
 
 # Django
-from django.db.models import Min
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
 
@@ -20,6 +20,7 @@ from allianceauth.services.tasks import QueueOnce
 # AA Ledger
 from ledger import __title__, app_settings
 from ledger.helpers.discord import send_user_notification
+from ledger.helpers.esi_budget import esi_budget
 from ledger.models.characteraudit import CharacterMiningLedger, CharacterOwner
 from ledger.models.corporationaudit import CorporationOwner
 from ledger.models.helpers.update_manager import (
@@ -53,6 +54,17 @@ TASK_DEFAULTS_BIND_ONCE_OWNER = {
     **{"once": {"keys": ["eve_id"], "graceful": True}},
 }
 
+TASK_DEFAULTS_BIND_ONCE_BATCH = {
+    **TASK_DEFAULTS_BIND_ONCE,
+    **{"once": {"keys": ["eve_ids"], "graceful": True}},
+}
+
+
+def _get_batches(eve_ids: list[int]) -> list[list[int]]:
+    """Split the owner IDs into batches of `LEDGER_UPDATE_BATCH_SIZE`."""
+    size = max(app_settings.LEDGER_UPDATE_BATCH_SIZE, 1)
+    return [eve_ids[i : i + size] for i in range(0, len(eve_ids), size)]
+
 
 # pylint: disable=unused-argument, too-many-locals
 @shared_task(**TASK_DEFAULTS_ONCE)
@@ -121,21 +133,30 @@ def check_planetary_alarms(runs: int = 0):
     logger.info("Queued %s Planetary Alarms.", runs)
 
 
+@shared_task(**TASK_DEFAULTS_ONCE)
+def update_evemarket_prices(force_refresh=False):
+    """Update the EveMarketPrice if the ESI market prices have changed"""
+    updated = CharacterMiningLedger.update_evemarket_price(force_refresh=force_refresh)
+    logger.debug("Updated %s Market Prices", updated)
+
+
 @shared_task(**TASK_DEFAULTS_ONCE)
 def update_all_characters(runs: int = 0, force_refresh=False):
     """Update all characters"""
     # Disable characters with no owner
     CharacterOwner.objects.disable_characters_with_no_owner()
-    # Update EveMarketPrice
-    CharacterMiningLedger.update_evemarket_price()
 
-    characters = CharacterOwner.objects.select_related("eve_character").filter(active=1)
-    for character in characters:
-        update_character.apply_async(
-            args=[character.eve_id], kwargs={"force_refresh": force_refresh}
+    eve_ids = list(
+        CharacterOwner.objects.filter(active=1).values_list(
+            "eve_character__character_id", flat=True
+        )
+    )
+    for batch in _get_batches(eve_ids):
+        update_characters_batch.apply_async(
+            args=[batch], kwargs={"force_refresh": force_refresh}
         )
         runs = runs + 1
-    logger.debug("Queued %s Character Audit Tasks", runs)
+    logger.debug("Queued %s Character Audit Batch Tasks", runs)
 
 
 @shared_task(**TASK_DEFAULTS_ONCE)
@@ -143,8 +164,6 @@ def update_subset_characters(subset=2, min_runs=50, max_runs=500, force_refresh=
     """Update a batch of characters to prevent overload ESI"""
     # Disable characters with no owner
     CharacterOwner.objects.disable_characters_with_no_owner()
-    # Update EveMarketPrice
-    CharacterMiningLedger.update_evemarket_price()
 
     # Calculate number of characters to update
     total_characters = CharacterOwner.objects.filter(active=1).count()
@@ -153,19 +172,23 @@ def update_subset_characters(subset=2, min_runs=50, max_runs=500, force_refresh=
     # Limit the number of characters to update to prevent overload ESI
     characters_count = min(characters_count, max_runs)
 
-    # Annotate characters with the oldest `last_run_finished` across all update sections
-    characters = (
-        CharacterOwner.objects.filter(active=1)
-        .annotate(oldest_update=Min("ledger_update_status__last_run_finished_at"))
-        .order_by("oldest_update")
-        .distinct()[:characters_count]
-    )
-
-    for character in characters:
-        update_character.apply_async(
-            args=[character.eve_id], kwargs={"force_refresh": force_refresh}
+    # Pick characters with sections due for an update, most overdue first
+    due_sections = CharacterOwner.objects.due_for_update(characters_count)
+
+    batches = _get_batches(list(due_sections))
+    for batch in batches:
+        update_characters_batch.apply_async(
+            args=[batch],
+            kwargs={
+                "force_refresh": force_refresh,
+                "sections": [due_sections[eve_id] for eve_id in batch],
+            },
         )
-    logger.debug("Queued %s Character Audit Tasks", len(characters))
+    logger.debug(
+        "Queued %s Character Audit Tasks in %s Batches",
+        len(due_sections),
+        len(batches),
+    )
 
 
 @shared_task(**TASK_DEFAULTS_BIND_ONCE_OWNER)
@@ -285,39 +308,73 @@ def _update_character_section(
     task: Task, eve_id: int, section: str, force_refresh: bool
 ):
     """Update a specific section of the character audit."""
-    section = CharacterUpdateSection(section)
     character = CharacterOwner.objects.get(eve_character__character_id=eve_id)
-    logger.debug(
-        "Updating %s for %s", section.label, character.eve_character.character_name
+    _update_owner_section(
+        task=task,
+        owner=character,
+        section=CharacterUpdateSection(section),
+        force_refresh=force_refresh,
     )
 
-    character.update_manager.reset_update_status(section)
 
-    method: Callable = getattr(character, section.method_name)
-    method_signature = inspect.signature(method)
+@shared_task(**TASK_DEFAULTS_BIND_ONCE_BATCH)
+def update_characters_batch(
+    self: Task,
+    eve_ids: list[int],
+    force_refresh=False,
+    sections: list[list[str]] | None = None,
+) -> int:
+    """Update the due sections of multiple character owners in a single task.
 
-    if "force_refresh" in method_signature.parameters:
-        kwargs = {"force_refresh": force_refresh}
-    else:
-        kwargs = {}
+    Args:
+        eve_ids (list[int]): Eve IDs of the CharacterOwners to update
+        force_refresh (bool): Whether to force a refresh of all sections
+        sections (list[list[str]] | None): The due sections of each owner, all due sections if None
 
-    with retry_task_on_esi_error(task):
-        result = character.update_manager.perform_update_status(
-            section, method, **kwargs
+    Returns:
+        The number of updated character owners
+    """
+    due_sections = dict(zip(eve_ids, sections or []))
+    characters = (
+        CharacterOwner.objects.select_related(
+            "eve_character__character_ownership__user"
         )
-    character.update_manager.update_section_log(section, result)
+        .filter(eve_character__character_id__in=eve_ids, active=True)
+        .order_by("pk")
+    )
+
+    updated = 0
+    for character in characters:
+        if character.is_orphan:
+            logger.info("Character %s is an orphan. Skipping update.", character)
+            continue
+        if _update_owner_sections_isolated(
+            self,
+            character,
+            CharacterUpdateSection,
+            force_refresh,
+            sections=due_sections.get(character.eve_id),
+        ):
+            updated += 1
+
+    logger.debug("Updated %s of %s Characters in Batch", updated, len(eve_ids))
+    return updated
 
 
 # Corporation Audit - Tasks
 @shared_task(**TASK_DEFAULTS_ONCE)
 def update_all_corporations(runs: int = 0, force_refresh=False):
-    corporations = CorporationOwner.objects.filter(active=1)
-    for corporation in corporations:
-        update_corporation.apply_async(
-            args=[corporation.eve_id], kwargs={"force_refresh": force_refresh}
+    eve_ids = list(
+        CorporationOwner.objects.filter(active=1).values_list(
+            "eve_corporation__corporation_id", flat=True
+        )
+    )
+    for batch in _get_batches(eve_ids):
+        update_corporations_batch.apply_async(
+            args=[batch], kwargs={"force_refresh": force_refresh}
         )
         runs = runs + 1
-    logger.info("Queued %s Corporation Audit Tasks", runs)
+    logger.info("Queued %s Corporation Audit Batch Tasks", runs)
 
 
 @shared_task(**TASK_DEFAULTS_ONCE)
@@ -333,22 +390,24 @@ def update_subset_corporations(
     # Limit the number of corporations to update to prevent overload ESI
     corporations_count = min(corporations_count, max_runs)
 
-    # Annotate corporations with the oldest `last_run_finished` across all update sections
-    corporations = (
-        CorporationOwner.objects.filter(active=1)
-        .annotate(
-            oldest_update=Min("ledger_corporation_update_status__last_run_finished_at")
+    # Pick corporations with sections due for an update, most overdue first
+    due_sections = CorporationOwner.objects.due_for_update(corporations_count)
+
+    batches = _get_batches(list(due_sections))
+    for batch in batches:
+        update_corporations_batch.apply_async(
+            args=[batch],
+            kwargs={
+                "force_refresh": force_refresh,
+                "sections": [due_sections[eve_id] for eve_id in batch],
+            },
         )
-        .order_by("oldest_update")
-        .distinct()[:corporations_count]
+    logger.debug(
+        "Queued %s Corporation Audit Tasks in %s Batches",
+        len(due_sections),
+        len(batches),
     )
 
-    for corp in corporations:
-        update_corporation.apply_async(
-            args=[corp.eve_id], kwargs={"force_refresh": force_refresh}
-        )
-    logger.debug("Queued %s Corporation Audit Tasks", len(corporations))
-
 
 @shared_task(**TASK_DEFAULTS_BIND_ONCE_OWNER)
 def update_corporation(
@@ -449,18 +508,129 @@ def update_corp_wallet_journal(self: Task, eve_id: int, force_refresh: bool):
 def _update_corporation_section(
     task: Task, eve_id: int, section: str, force_refresh: bool
 ):
-    """Update a specific section of the character audit."""
-    section = CorporationUpdateSection(section)
+    """Update a specific section of the corporation audit."""
     corporation = CorporationOwner.objects.get(eve_corporation__corporation_id=eve_id)
-    logger.debug(
-        "Updating %s for %s",
-        section.label,
-        corporation.eve_corporation.corporation_name,
+    _update_owner_section(
+        task=task,
+        owner=corporation,
+        section=CorporationUpdateSection(section),
+        force_refresh=force_refresh,
+    )
+
+
+@shared_task(**TASK_DEFAULTS_BIND_ONCE_BATCH)
+def update_corporations_batch(
+    self: Task,
+    eve_ids: list[int],
+    force_refresh=False,
+    sections: list[list[str]] | None = None,
+) -> int:
+    """Update the due sections of multiple corporation owners in a single task.
+
+    Args:
+        eve_ids (list[int]): Eve IDs of the CorporationOwners to update
+        force_refresh (bool): Whether to force a refresh of all sections
+        sections (list[list[str]] | None): The due sections of each owner, all due sections if None
+
+    Returns:
+        The number of updated corporation owners
+    """
+    due_sections = dict(zip(eve_ids, sections or []))
+    corporations = (
+        CorporationOwner.objects.select_related("eve_corporation")
+        .filter(eve_corporation__corporation_id__in=eve_ids, active=True)
+        .order_by("pk")
     )
 
-    corporation.update_manager.reset_update_status(section)
+    updated = 0
+    for corporation in corporations:
+        if _update_owner_sections_isolated(
+            self,
+            corporation,
+            CorporationUpdateSection,
+            force_refresh,
+            sections=due_sections.get(corporation.eve_id),
+        ):
+            updated += 1
+
+    logger.debug("Updated %s of %s Corporations in Batch", updated, len(eve_ids))
+    return updated
+
+
+def _update_owner_sections_isolated(
+    task: Task,
+    owner: CharacterOwner | CorporationOwner,
+    update_section: type[CharacterUpdateSection] | type[CorporationUpdateSection],
+    force_refresh: bool,
+    sections: list[str] | None = None,
+) -> bool:
+    """Update all due sections of an owner without failing the other owners of a batch.
+
+    Returns:
+        True if any section was updated, False otherwise
+    """
+    try:
+        return _update_owner_sections(
+            task, owner, update_section, force_refresh, sections=sections
+        )
+    except (Retry, MaxRetriesExceededError):
+        raise
+    except Exception:  # pylint: disable=broad-except
+        logger.exception("Update of %s failed, continuing with the batch", owner)
+        return False
+
+
+def _update_owner_sections(
+    task: Task,
+    owner: CharacterOwner | CorporationOwner,
+    update_section: type[CharacterUpdateSection] | type[CorporationUpdateSection],
+    force_refresh: bool,
+    sections: list[str] | None = None,
+) -> bool:
+    """Update all due sections of an owner in-process.
 
-    method: Callable = getattr(corporation, section.method_name)
+    Args:
+        sections (list[str] | None): Update only these due sections, all due sections if None
+
+    Returns:
+        True if any section was updated, False otherwise
+    """
+    if force_refresh:
+        # Reset Token Error if we are forcing a refresh
+        owner.update_manager.reset_has_token_error()
+
+    needs_update = owner.update_manager.calc_update_needed()
+
+    if not needs_update and not force_refresh:
+        logger.debug("No updates needed for %s", owner)
+        return False
+
+    for section in update_section.get_sections():
+        if sections is not None and section not in sections:
+            continue
+        if not force_refresh and not needs_update.for_section(section):
+            continue
+        _update_owner_section(
+            task=task,
+            owner=owner,
+            section=update_section(section),
+            force_refresh=force_refresh,
+        )
+    return True
+
+
+def _update_owner_section(
+    task: Task,
+    owner: CharacterOwner | CorporationOwner,
+    section: CharacterUpdateSection | CorporationUpdateSection,
+    force_refresh: bool,
+):
+    """Update a specific section of an owner."""
+    logger.debug("Updating %s for %s", section.label, owner)
+
+    owner.update_manager.reset_update_status(section)
+
+    method: Callable = getattr(owner, section.method_name)
     method_signature = inspect.signature(method)
 
     if "force_refresh" in method_signature.parameters:
@@ -468,9 +638,8 @@ def _update_corporation_section(
     else:
         kwargs = {}
 
-    with retry_task_on_esi_error(task):
-        result = corporation.update_manager.perform_update_status(
-            section, method, **kwargs
-        )
+    # Each ESI operation of the section waits for the ESI Budget of its route group
+    with retry_task_on_esi_error(task), esi_budget(task, section.esi_group):
+        result = owner.update_manager.perform_update_status(section, method, **kwargs)
 
-    corporation.update_manager.update_section_log(section, result)
+    owner.update_manager.update_section_log(section, result)
@@ -0,0 +1,462 @@
+# Standard Library
+import datetime as dt
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass
+from decimal import Decimal
+
+# Django
+from django.contrib.auth.models import User
+from django.db import models
+from django.utils import timezone
+
+# Alliance Auth
+from allianceauth.authentication.models import (
+    CharacterOwnership,
+    UserProfile,
+    get_guest_state,
+)
+from allianceauth.eveonline.models import (
+    EveAllianceInfo,
+    EveCharacter,
+    EveCorporationInfo,
+)
+
+# AA Ledger
+from ledger.models import (
+    CharacterMiningLedger,
+    CharacterOwner,
+    CharacterPlanet,
+    CharacterWalletJournalEntry,
+    CorporationOwner,
+    CorporationWalletDivision,
+    CorporationWalletJournalEntry,
+    EveEntity,
+)
+from ledger.models.characteraudit import CharacterUpdateStatus
+from ledger.models.helpers.update_manager import CharacterUpdateSection
+from ledger.tests.testdata.factory import (
+    ItemTypeFactory,
+    PlanetFactory,
+    SolarSystemFactory,
+)
+
+# Year of all generated journal rows, the ledger of a past year is final
+BENCHMARK_YEAR = 2025
+BATCH_SIZE = 10_000
+
+ALLIANCE_ID_START = 99_100_000
+CORPORATION_ID_START = 98_100_000
+CHARACTER_ID_START = 92_000_000
+CONCORD_ID = 1_000_125
+
+# Weighted ref types of the generated wallet journal rows
+CHARACTER_REF_TYPES = (
+    ("bounty_prizes", 40),
+    ("ess_escrow_transfer", 10),
+    ("market_transaction", 20),
+    ("player_donation", 10),
+    ("industry_job_tax", 8),
+    ("brokers_fee", 7),
+    ("transaction_tax", 5),
+)
+CORPORATION_REF_TYPES = (
+    ("bounty_prizes", 50),
+    ("ess_escrow_transfer", 15),
+    ("corporation_account_withdrawal", 10),
+    ("market_transaction", 15),
+    ("brokers_fee", 10),
+)
+COST_REF_TYPES = {"brokers_fee", "transaction_tax", "corporation_account_withdrawal"}
+
+
+@dataclass(frozen=True)
+class DatasetSize:
+    """Number of rows of the benchmark dataset at scale 1."""
+
+    alliances: int = 20
+    corporations: int = 200
+    characters: int = 1_000
+    characters_per_user: int = 3
+    character_journal: int = 8_000_000
+    corporation_journal: int = 2_000_000
+    mining: int = 500_000
+    planets_per_character: int = 3
+
+    def scaled(self, scale: float) -> "DatasetSize":
+        """Return the size scaled by `scale`, with at least one row of each kind."""
+        return DatasetSize(
+            **{
+                field: (
+                    value
+                    if field in ("characters_per_user", "planets_per_character")
+                    else max(int(value * scale), 1)
+                )
+                for field, value in self.__dict__.items()
+            }
+        )
+
+
+@dataclass
+class Dataset:
+    """IDs of the generated benchmark dataset."""
+
+    size: DatasetSize
+    user: User
+    character_id: int
+    corporation_id: int
+    alliance_id: int
+    counts: dict
+
+
+def _bulk_create(model: type[models.Model], objs: Iterator) -> int:
+    """Create the objects of a generator in batches and return the count."""
+    count = 0
+    batch = []
+    for obj in objs:
+        batch.append(obj)
+        if len(batch) >= BATCH_SIZE:
+            model.objects.bulk_create(batch, batch_size=BATCH_SIZE)
+            count += len(batch)
+            batch = []
+    if batch:
+        model.objects.bulk_create(batch, batch_size=BATCH_SIZE)
+        count += len(batch)
+    return count
+
+
+class DatasetBuilder:
+    """
+    Build a reproducible synthetic dataset of realistic volume.
+
+    Rows are created with `bulk_create` in batches, the same seed
+    creates the same dataset.
+    """
+
+    def __init__(
+        self, scale: float = 1.0, seed: int = 42, size: DatasetSize | None = None
+    ):
+        self.size = size or DatasetSize().scaled(scale)
+        self.random = random.Random(seed)
+        self._start = timezone.make_aware(dt.datetime(BENCHMARK_YEAR, 1, 1))
+        self._seconds = 365 * 24 * 60 * 60
+
+    def _date(self) -> dt.datetime:
+        return self._start + dt.timedelta(seconds=self.random.randrange(self._seconds))
+
+    def _amount(self, ref_type: str) -> Decimal:
+        amount = Decimal(self.random.randrange(1_000, 50_000_000))
+        return -amount if ref_type in COST_REF_TYPES else amount
+
+    def _ref_types(self, choices: tuple, count: int) -> list[str]:
+        ref_types, weights = zip(*choices)
+        return self.random.choices(ref_types, weights=weights, k=count)
+
+    def _create_eve_models(self) -> tuple[list[int], list[int], list[int]]:
+        alliance_ids = [ALLIANCE_ID_START + i for i in range(self.size.alliances)]
+        EveAllianceInfo.objects.bulk_create(
+            EveAllianceInfo(
+                alliance_id=alliance_id,
+                alliance_name=f"Benchmark Alliance {alliance_id}",
+                alliance_ticker=f"BA{i}",
+                executor_corp_id=CORPORATION_ID_START + i,
+            )
+            for i, alliance_id in enumerate(alliance_ids)
+        )
+        alliances = EveAllianceInfo.objects.in_bulk(
+            alliance_ids, field_name="alliance_id"
+        )
+
+        corporation_ids = [
+            CORPORATION_ID_START + i for i in range(self.size.corporations)
+        ]
+        EveCorporationInfo.objects.bulk_create(
+            EveCorporationInfo(
+                corporation_id=corporation_id,
+                corporation_name=f"Benchmark Corporation {corporation_id}",
+                corporation_ticker=f"BC{i}",
+                member_count=self.size.characters // self.size.corporations + 1,
+                alliance=alliances[alliance_ids[i % len(alliance_ids)]],
+            )
+            for i, corporation_id in enumerate(corporation_ids)
+        )
+
+        character_ids = [CHARACTER_ID_START + i for i in range(self.size.characters)]
+        EveCharacter.objects.bulk_create(
+            self._eve_characters(character_ids, corporation_ids, alliance_ids)
+        )
+
+        EveEntity.objects.bulk_create(
+            [
+                EveEntity(eve_id=CONCORD_ID, category="corporation", name="CONCORD"),
+                *(
+                    EveEntity(eve_id=eve_id, category="alliance", name=str(eve_id))
+                    for eve_id in alliance_ids
+                ),
+                *(
+                    EveEntity(eve_id=eve_id, category="corporation", name=str(eve_id))
+                    for eve_id in corporation_ids
+                ),
+                *(
+                    EveEntity(eve_id=eve_id, category="character", name=str(eve_id))
+                    for eve_id in character_ids
+                ),
+            ],
+            batch_size=BATCH_SIZE,
+        )
+        return alliance_ids, corporation_ids, character_ids
+
+    @staticmethod
+    def _eve_characters(
+        character_ids: list[int], corporation_ids: list[int], alliance_ids: list[int]
+    ) -> Iterator[EveCharacter]:
+        """Spread the characters evenly over the corporations."""
+        for i, character_id in enumerate(character_ids):
+            corporation_index = i % len(corporation_ids)
+            alliance_index = corporation_index % len(alliance_ids)
+            yield EveCharacter(
+                character_id=character_id,
+                character_name=f"Benchmark Character {character_id}",
+                corporation_id=corporation_ids[corporation_index],
+                corporation_name=f"Benchmark Corporation {corporation_ids[corporation_index]}",
+                corporation_ticker=f"BC{corporation_index}",
+                alliance_id=alliance_ids[alliance_index],
+                alliance_name=f"Benchmark Alliance {alliance_ids[alliance_index]}",
+                alliance_ticker=f"BA{alliance_index}",
+            )
+
+    def _create_users(self, character_ids: list[int]) -> None:
+        """Create users owning `characters_per_user` characters each, the first one is the main."""
+        characters = EveCharacter.objects.in_bulk(
+            character_ids, field_name="character_id"
+        )
+        mains = character_ids[:: self.size.characters_per_user]
+        User.objects.bulk_create(
+            User(username=f"benchmark_{character_id}") for character_id in mains
+        )
+        users = {
+            user.username: user
+            for user in User.objects.filter(username__startswith="benchmark_")
+        }
+        state = get_guest_state()
+        UserProfile.objects.bulk_create(
+            UserProfile(
+                user=users[f"benchmark_{character_id}"],
+                main_character=characters[character_id],
+                state=state,
+            )
+            for character_id in mains
+        )
+        CharacterOwnership.objects.bulk_create(
+            (
+                CharacterOwnership(
+                    character=characters[character_id],
+                    owner_hash=f"benchmark-{character_id}",
+                    user=users[
+                        f"benchmark_{mains[i // self.size.characters_per_user]}"
+                    ],
+                )
+                for i, character_id in enumerate(character_ids)
+            ),
+            batch_size=BATCH_SIZE,
+        )
+
+    def _create_owners(
+        self, corporation_ids: list[int], character_ids: list[int]
+    ) -> tuple[list[CorporationOwner], list[CharacterOwner]]:
+        corporations = EveCorporationInfo.objects.in_bulk(
+            corporation_ids, field_name="corporation_id"
+        )
+        CorporationOwner.objects.bulk_create(
+            CorporationOwner(
+                eve_corporation=corporation,
+                corporation_name=corporation.corporation_name,
+            )
+            for corporation in corporations.values()
+        )
+        corporation_owners = list(CorporationOwner.objects.all())
+        CorporationWalletDivision.objects.bulk_create(
+            CorporationWalletDivision(
+                corporation=owner,
+                division_id=division_id,
+                name=f"Division {division_id}",
+                balance=Decimal(1_000_000_000),
+            )
+            for owner in corporation_owners
+            for division_id in range(1, 8)
+        )
+
+        characters = EveCharacter.objects.in_bulk(
+            character_ids, field_name="character_id"
+        )
+        CharacterOwner.objects.bulk_create(
+            (
+                CharacterOwner(
+                    eve_character=character,
+                    character_name=character.character_name,
+                    balance=Decimal(100_000_000),
+                )
+                for character in characters.values()
+            ),
+            batch_size=BATCH_SIZE,
+        )
+        character_owners = list(CharacterOwner.objects.select_related("eve_character"))
+
+        # Spread the next update of the sections over the last day
+        now = timezone.now()
+        _bulk_create(
+            CharacterUpdateStatus,
+            (
+                CharacterUpdateStatus(
+                    owner=owner,
+                    section=section,
+                    is_success=True,
+                    next_due_at=now
+                    - dt.timedelta(seconds=self.random.randrange(-43_200, 43_200)),
+                )
+                for owner in character_owners
+                for section in CharacterUpdateSection
+            ),
+        )
+        return corporation_owners, character_owners
+
+    def _character_journal(
+        self, owners: list[CharacterOwner], corporation_ids: list[int]
+    ) -> Iterator[CharacterWalletJournalEntry]:
+        ref_types = self._ref_types(CHARACTER_REF_TYPES, self.size.character_journal)
+        for entry_id, ref_type in enumerate(ref_types, start=1):
+            owner = owners[entry_id % len(owners)]
+            if ref_type in ("bounty_prizes", "ess_escrow_transfer"):
+                first_party_id = CONCORD_ID
+            elif ref_type == "player_donation":
+                first_party_id = owners[
+                    self.random.randrange(len(owners))
+                ].eve_character.character_id
+            else:
+                first_party_id = self.random.choice(corporation_ids)
+            amount = self._amount(ref_type)
+            yield CharacterWalletJournalEntry(
+                character=owner,
+                entry_id=entry_id,
+                amount=amount,
+                balance=owner.balance + amount,
+                date=self._date(),
+                description=ref_type,
+                ref_type=ref_type,
+                first_party_id=first_party_id,
+                second_party_id=owner.eve_character.character_id,
+            )
+
+    def _corporation_journal(
+        self, owners: list[CorporationOwner], character_ids: list[int]
+    ) -> Iterator[CorporationWalletJournalEntry]:
+        divisions: dict[int, list[CorporationWalletDivision]] = {}
+        for division in CorporationWalletDivision.objects.order_by("division_id"):
+            divisions.setdefault(division.corporation_id, []).append(division)
+        ref_types = self._ref_types(
+            CORPORATION_REF_TYPES, self.size.corporation_journal
+        )
+        for entry_id, ref_type in enumerate(ref_types, start=1):
+            owner = owners[entry_id % len(owners)]
+            # Most entries are booked in the master wallet
+            division = divisions[owner.pk][
+                0 if self.random.random() < 0.8 else self.random.randrange(7)
+            ]
+            amount = self._amount(ref_type)
+            yield CorporationWalletJournalEntry(
+                division=division,
+                entry_id=entry_id,
+                amount=amount,
+                balance=division.balance + amount,
+                date=self._date(),
+                description=ref_type,
+                ref_type=ref_type,
+                first_party_id=(
+                    CONCORD_ID
+                    if ref_type in ("bounty_prizes", "ess_escrow_transfer")
+                    else self.random.choice(character_ids)
+                ),
+                second_party_id=owner.eve_corporation.corporation_id,
+            )
+
+    def _mining(self, owners: list[CharacterOwner]) -> Iterator[CharacterMiningLedger]:
+        if not self.size.mining:
+            return
+        types = [ItemTypeFactory(id=type_id) for type_id in range(1230, 1240)]
+        systems = [
+            SolarSystemFactory(id=system_id)
+            for system_id in range(30_000_001, 30_000_011)
+        ]
+        seen = set()
+        for _ in range(self.size.mining):
+            owner = self.random.choice(owners)
+            date = self._date()
+            eve_type = self.random.choice(types)
+            system = self.random.choice(systems)
+            key = f"{date:%Y%m%d}-{eve_type.pk}-{owner.eve_character.character_id}-{system.pk}"
+            if key in seen:
+                continue
+            seen.add(key)
+            yield CharacterMiningLedger(
+                id=key,
+                character=owner,
+                date=date,
+                type=eve_type,
+                system=system,
+                quantity=self.random.randrange(100, 50_000),
+                price_per_unit=Decimal(self.random.randrange(5, 5_000)),
+            )
+
+    def _planets(self, owners: list[CharacterOwner]) -> Iterator[CharacterPlanet]:
+        planets = [
+            PlanetFactory(id=planet_id)
+            for planet_id in range(
+                40_000_001, 40_000_001 + self.size.planets_per_character
+            )
+        ]
+        for owner in owners:
+            for planet in planets:
+                yield CharacterPlanet(
+                    character=owner,
+                    eve_planet=planet,
+                    name=planet.name,
+                    upgrade_level=self.random.randrange(6),
+                    num_pins=self.random.randrange(1, 20),
+                )
+
+    def build(self) -> Dataset:
+        """Create the dataset and return the IDs used by the benchmarks."""
+        alliance_ids, corporation_ids, character_ids = self._create_eve_models()
+        self._create_users(character_ids)
+        corporation_owners, character_owners = self._create_owners(
+            corporation_ids, character_ids
+        )
+
+        counts = {
+            "characters": len(character_owners),
+            "corporations": len(corporation_owners),
+            "character_journal": _bulk_create(
+                CharacterWalletJournalEntry,
+                self._character_journal(character_owners, corporation_ids),
+            ),
+            "corporation_journal": _bulk_create(
+                CorporationWalletJournalEntry,
+                self._corporation_journal(corporation_owners, character_ids),
+            ),
+            "mining": _bulk_create(
+                CharacterMiningLedger, self._mining(character_owners)
+            ),
+            "planets": _bulk_create(CharacterPlanet, self._planets(character_owners)),
+        }
+
+        user = User.objects.get(username=f"benchmark_{character_ids[0]}")
+        user.is_superuser = True
+        user.save()
+        return Dataset(
+            size=self.size,
+            user=user,
+            character_id=character_ids[0],
+            corporation_id=corporation_ids[0],
+            alliance_id=alliance_ids[0],
+            counts=counts,
+        )
@@ -0,0 +1,541 @@
+"""
+Local stand-in for ESI serving synthetic data for the Ledger operations.
+
+The routes and response bodies are generated from the bundled OpenAPI spec,
+so every operation of `ledger.__operations__` is served in the shape ESI returns.
+The server adds latency, answers `If-None-Match` with 304 responses,
+sends the error limit & rate limit headers of ESI and returns bursts of server errors.
+
+Run it standalone with `python ledger/tests/benchmarks/fake_esi.py --help`
+or use `FakeESIServer.patch_client()` to point the Ledger ESI client at it.
+"""
+
+# Standard Library
+import argparse
+import datetime as dt
+import hashlib
+import json
+import random
+import re
+import tempfile
+import threading
+import time
+from collections import Counter, deque
+from collections.abc import Callable, Iterator, Mapping
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from email.utils import formatdate
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+# AA Ledger
+from ledger import __esi_compatibility_date__, __operations__
+
+SPEC_FILE = Path(__file__).parents[2] / f"openapi_{__esi_compatibility_date__}.json"
+
+# Number of wallet divisions & hangars of a corporation
+DIVISIONS = 7
+
+WINDOW_UNITS = {"s": 1, "m": 60, "h": 60 * 60}
+
+# Values of fields with a small range in ESI
+DEFAULT_CHOICES = {
+    "upgrade_level": list(range(6)),
+    "link_level": list(range(6)),
+}
+
+
+@dataclass
+class FakeESIConfig:
+    """Behaviour of the fake ESI server."""
+
+    # Seconds added to each response
+    latency: float = 0.0
+    latency_jitter: float = 0.0
+    # Rows of each page and number of pages of paged operations
+    rows_per_page: int = 50
+    pages: int = 1
+    # Items of other arrays, e.g. planets of a character
+    items: int = 3
+    # Seconds the data is cached, defaults to the `x-cache-age` of each operation
+    cache_age: int | None = None
+    # Answer `If-None-Match` with a 304 response while the data is unchanged
+    etag: bool = True
+    # Errors allowed per window before ESI responds with 420
+    error_limit: int = 100
+    error_limit_window: int = 60
+    # Enforce the `x-rate-limit` of each operation per route group & token
+    rate_limit: bool = False
+    # Every `burst_every` requests the last `burst_length` fail with `burst_status`
+    burst_every: int = 0
+    burst_length: int = 5
+    burst_status: int = HTTPStatus.SERVICE_UNAVAILABLE
+    # Values to choose from for a field name, e.g. the type IDs known to the SDE
+    choices: dict[str, list] = field(default_factory=lambda: dict(DEFAULT_CHOICES))
+    seed: int = 42
+
+
+@dataclass
+class FakeResponse:
+    status: int
+    headers: dict[str, str]
+    body: bytes = b""
+
+
+@dataclass
+class Route:
+    operation_id: str
+    pattern: re.Pattern
+    schema: dict
+    paged: bool
+    cache_age: int
+    rate_limit: dict | None
+
+
+def _parse_window(window: str) -> int:
+    """Return the seconds of a `x-rate-limit` window size, e.g. `15m`."""
+    return int(window[:-1]) * WINDOW_UNITS[window[-1]]
+
+
+def _universe_names(_data: list, body: list) -> list:
+    """Resolve the posted IDs instead of generating random entities."""
+    return [
+        {"id": eve_id, "name": f"Fake Entity {eve_id}", "category": "character"}
+        for eve_id in body
+    ]
+
+
+def _divisions(data: dict, _body) -> dict:
+    for key in ("hangar", "wallet"):
+        data[key] = [
+            {"division": division, "name": f"Division {division}"}
+            for division in range(1, DIVISIONS + 1)
+        ]
+    return data
+
+
+def _wallets(data: list, _body) -> list:
+    return [
+        {**data[index % len(data)], "division": index + 1} for index in range(DIVISIONS)
+    ]
+
+
+def _unique(*keys: str) -> Callable:
+    """Drop rows repeating the keys, which are unique on ESI."""
+
+    def hook(data: list, _body) -> list:
+        return list({tuple(row[key] for key in keys): row for row in data}.values())
+
+    return hook
+
+
+# Post-process the generated data where the Ledger relies on consistent values
+RESPONSE_HOOKS: dict[str, Callable] = {
+    "PostUniverseNames": _universe_names,
+    "GetCorporationsCorporationIdDivisions": _divisions,
+    "GetCorporationsCorporationIdWallets": _wallets,
+    "GetCharactersCharacterIdPlanets": _unique("planet_id"),
+    "GetCharactersCharacterIdMining": _unique("date", "type_id", "solar_system_id"),
+}
+
+
+class FakeESI:
+    """
+    Generate ESI responses for the operations of the bundled OpenAPI spec.
+
+    The data of each URL & page is seeded by the URL and the current cache window,
+    so it is stable until the cache expires and changes with a new ETag afterwards like on ESI.
+    """
+
+    def __init__(
+        self,
+        config: FakeESIConfig | None = None,
+        spec_file: Path = SPEC_FILE,
+        operations: list[str] | None = None,
+    ):
+        self.config = config or FakeESIConfig()
+        self.spec = json.loads(spec_file.read_text(encoding="utf-8"))
+        self.routes: dict[str, list[Route]] = {}
+        for method, route in self._load_routes(operations or __operations__):
+            self.routes.setdefault(method, []).append(route)
+        # Responses by operation ID & status code
+        self.stats: Counter = Counter()
+        self._lock = threading.Lock()
+        self._requests = 0
+        self._errors: deque[float] = deque()
+        self._rate_limits: Counter = Counter()
+
+    def _resolve(self, schema: dict) -> dict:
+        """Return the schema a `$ref` points to."""
+        while "$ref" in schema:
+            target = self.spec
+            for key in schema["$ref"].lstrip("#/").split("/"):
+                target = target[key]
+            schema = target
+        return schema
+
+    def _load_routes(self, operations: list[str]) -> Iterator[tuple[str, Route]]:
+        for path, item in self.spec["paths"].items():
+            for method, operation in item.items():
+                if operation.get("operationId") not in operations:
+                    continue
+                parameters = [
+                    self._resolve(parameter).get("name")
+                    for parameter in operation.get("parameters", [])
+                ]
+                content = operation["responses"]["200"]["content"]
+                yield method.upper(), Route(
+                    operation_id=operation["operationId"],
+                    pattern=re.compile(
+                        "^" + re.sub(r"\{(\w+)\}", r"(?P<\1>[^/]+)", path) + "/?$"
+                    ),
+                    schema=content["application/json"]["schema"],
+                    paged="page" in parameters,
+                    cache_age=operation.get("x-cache-age", 300),
+                    rate_limit=operation.get("x-rate-limit"),
+                )
+
+    def _match(self, method: str, path: str) -> Route | None:
+        for route in self.routes.get(method, []):
+            if route.pattern.match(path):
+                return route
+        return None
+
+    # pylint: disable=too-many-return-statements
+    def _generate(self, schema: dict, rng: random.Random, name: str, ids: Iterator):
+        """Generate a value for a schema, the `id` fields are unique."""
+        schema = self._resolve(schema)
+        if name in self.config.choices:
+            return rng.choice(self.config.choices[name])
+        if "enum" in schema:
+            return rng.choice(schema["enum"])
+
+        schema_type = schema.get("type")
+        if schema_type == "object":
+            return {
+                key: self._generate(value, rng, key, ids)
+                for key, value in schema.get("properties", {}).items()
+            }
+        if schema_type == "array":
+            items = self._resolve(schema["items"])
+            # Enum lists like the roles of a character contain every value
+            if "enum" in items:
+                return list(items["enum"])
+            return [
+                self._generate(items, rng, name, ids) for _ in range(self.config.items)
+            ]
+        if schema_type == "integer":
+            if name == "id":
+                return next(ids)
+            if name.endswith("_id"):
+                return rng.randrange(1, 2**31)
+            return rng.randrange(1, 100_000)
+        if schema_type == "number":
+            # Amounts are negative when ISK is withdrawn
+            low = -10_000_000 if name == "amount" else 0
+            return round(rng.uniform(low, 10_000_000), 2)
+        if schema_type == "boolean":
+            return rng.random() < 0.5
+        if schema.get("format") in ("date-time", "date"):
+            date = dt.datetime.now(dt.timezone.utc) - dt.timedelta(
+                seconds=rng.randrange(30 * 24 * 60 * 60)
+            )
+            if schema["format"] == "date":
+                return date.date().isoformat()
+            return date.replace(microsecond=0).isoformat().replace("+00:00", "Z")
+        return f"{name} {rng.randrange(1_000_000)}"
+
+    def generate(self, route: Route, url: str, page: int, window: int, body) -> list:
+        """Generate the data of a page, seeded by the URL & cache window."""
+        digest = hashlib.blake2b(
+            f"{self.config.seed}:{url}:{page}:{window}".encode(), digest_size=8
+        ).digest()
+        rng = random.Random(digest)
+
+        def unique_ids() -> Iterator[int]:
+            # 48 bit IDs of the URL, page & window, e.g. of journal entries
+            start = int.from_bytes(digest[:6], "big") & ~0xFFFF
+            yield from range(start, start + 0xFFFF)
+
+        ids = unique_ids()
+        schema = self._resolve(route.schema)
+        if route.paged:
+            items = self._resolve(schema["items"])
+            data = [
+                self._generate(items, rng, "", ids)
+                for _ in range(self.config.rows_per_page)
+            ]
+        else:
+            data = self._generate(schema, rng, "", ids)
+        hook = RESPONSE_HOOKS.get(route.operation_id)
+        return hook(data, body) if hook else data
+
+    def _error_limit_headers(self, now: float) -> dict[str, str]:
+        while self._errors and self._errors[0] <= now - self.config.error_limit_window:
+            self._errors.popleft()
+        reset = self.config.error_limit_window - int(
+            now % self.config.error_limit_window
+        )
+        return {
+            "X-ESI-Error-Limit-Remain": str(
+                max(self.config.error_limit - len(self._errors), 0)
+            ),
+            "X-ESI-Error-Limit-Reset": str(reset),
+        }
+
+    def _error(self, route: Route | None, status: int, message: str, now: float):
+        with self._lock:
+            self._errors.append(now)
+            headers = self._error_limit_headers(now)
+        return self._response(route, status, {"error": message}, headers)
+
+    def _response(self, route: Route | None, status: int, data, headers: dict):
+        self.stats[(route.operation_id if route else "unknown", int(status))] += 1
+        body = b"" if data is None else json.dumps(data).encode()
+        return FakeResponse(
+            status=status,
+            headers={"Content-Type": "application/json", **headers},
+            body=body,
+        )
+
+    def _rate_limit_headers(
+        self, route: Route, authorization: str, now: float
+    ) -> tuple[dict[str, str], int]:
+        """Count the request in the token bucket and return its headers & the retry seconds."""
+        limit = route.rate_limit
+        window = _parse_window(limit["window-size"])
+        key = (limit["group"], authorization, int(now // window))
+        with self._lock:
+            self._rate_limits[key] += 1
+            used = self._rate_limits[key]
+        headers = {
+            "X-Ratelimit-Group": limit["group"],
+            "X-Ratelimit-Limit": f"{limit['max-tokens']}/{limit['window-size']}",
+            "X-Ratelimit-Remaining": str(max(limit["max-tokens"] - used, 0)),
+            "X-Ratelimit-Used": str(used),
+        }
+        retry_after = window - int(now % window) if used > limit["max-tokens"] else 0
+        return headers, retry_after
+
+    # pylint: disable=too-many-locals
+    def handle(
+        self, method: str, url: str, headers: Mapping[str, str], body: bytes = b""
+    ) -> FakeResponse:
+        """Return the response of a request."""
+        now = time.time()
+        with self._lock:
+            self._requests += 1
+            request_number = self._requests
+            error_headers = self._error_limit_headers(now)
+
+        if error_headers["X-ESI-Error-Limit-Remain"] == "0":
+            # django-esi reads the reset of the error limit from X-RateLimit-Reset
+            error_headers["X-RateLimit-Reset"] = error_headers[
+                "X-ESI-Error-Limit-Reset"
+            ]
+            return self._response(
+                None,
+                420,
+                {"error": "This software has exceeded the error limit for ESI."},
+                error_headers,
+            )
+
+        parts = urlsplit(url)
+        route = self._match(method, parts.path)
+        if route is None:
+            return self._error(None, HTTPStatus.NOT_FOUND, "Not found", now)
+
+        config = self.config
+        if config.burst_every and (
+            (request_number - 1) % config.burst_every
+            >= config.burst_every - config.burst_length
+        ):
+            return self._error(route, config.burst_status, "Service Unavailable", now)
+
+        rate_headers = {}
+        if config.rate_limit and route.rate_limit:
+            rate_headers, retry_after = self._rate_limit_headers(
+                route, headers.get("Authorization", ""), now
+            )
+            if retry_after:
+                return self._error(
+                    route, HTTPStatus.TOO_MANY_REQUESTS, "Too many requests", now
+                )
+
+        page = int(parse_qs(parts.query).get("page", ["1"])[0])
+        if route.paged and page > config.pages:
+            return self._error(
+                route, HTTPStatus.NOT_FOUND, "Requested page does not exist!", now
+            )
+
+        cache_age = config.cache_age or route.cache_age
+        window = int(now // cache_age)
+        data = self.generate(
+            route, parts.path, page, window, json.loads(body) if body else None
+        )
+        payload = json.dumps(data).encode()
+        etag = f'"{hashlib.sha1(payload, usedforsecurity=False).hexdigest()}"'
+        expires = (window + 1) * cache_age
+        response_headers = {
+            "ETag": etag,
+            "Cache-Control": f"public, max-age={int(expires - now)}",
+            "Expires": formatdate(expires, usegmt=True),
+            "Last-Modified": formatdate(window * cache_age, usegmt=True),
+            **error_headers,
+            **rate_headers,
+        }
+        if route.paged:
+            response_headers["X-Pages"] = str(config.pages)
+
+        if config.etag and headers.get("If-None-Match") == etag:
+            return self._response(
+                route, HTTPStatus.NOT_MODIFIED, None, response_headers
+            )
+        self.stats[(route.operation_id, int(HTTPStatus.OK))] += 1
+        return FakeResponse(
+            status=HTTPStatus.OK,
+            headers={"Content-Type": "application/json", **response_headers},
+            body=payload,
+        )
+
+    @property
+    def requests(self) -> int:
+        return self._requests
+
+
+class FakeESIServer:
+    """
+    Serve a `FakeESI` over HTTP on localhost in a background thread.
+
+    Example:
+        .. code-block:: python
+
+            with FakeESIServer(FakeESIConfig(latency=0.05)) as server:
+                with server.patch_client():
+                    update_characters_batch.apply(kwargs={"eve_ids": eve_ids})
+            print(server.fake.stats)
+    """
+
+    def __init__(self, config: FakeESIConfig | None = None, host="127.0.0.1", port=0):
+        self.fake = FakeESI(config)
+        self.httpd = ThreadingHTTPServer((host, port), self._handler())
+        self.httpd.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    def _handler(self) -> type[BaseHTTPRequestHandler]:
+        fake = self.fake
+
+        class Handler(BaseHTTPRequestHandler):
+            # Keep the connections of the client pool alive
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self):
+                length = int(self.headers.get("Content-Length", 0))
+                body = self.rfile.read(length) if length else b""
+                response = fake.handle(self.command, self.path, self.headers, body)
+                config = fake.config
+                if config.latency or config.latency_jitter:
+                    time.sleep(
+                        config.latency + random.uniform(0, config.latency_jitter)
+                    )
+                self.send_response(response.status)
+                for key, value in response.headers.items():
+                    self.send_header(key, value)
+                self.send_header("Content-Length", str(len(response.body)))
+                self.end_headers()
+                self.wfile.write(response.body)
+
+            do_GET = _handle
+            do_POST = _handle
+
+            def log_message(self, format, *args):  # pylint: disable=redefined-builtin
+                pass
+
+        return Handler
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeESIServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> "FakeESIServer":
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
+
+    def write_spec(self, path: Path) -> Path:
+        """Write a copy of the bundled spec with the server as ESI host."""
+        spec = dict(self.fake.spec, servers=[{"url": self.url}])
+        path.write_text(json.dumps(spec), encoding="utf-8")
+        return path
+
+    @contextmanager
+    def patch_client(self):
+        """Point the Ledger ESI client at this server."""
+        # pylint: disable=import-outside-toplevel, protected-access
+        # AA Ledger
+        from ledger.providers import esi
+
+        with tempfile.TemporaryDirectory() as directory:
+            spec_file = self.write_spec(Path(directory) / SPEC_FILE.name)
+            original = esi._spec_file, esi._provider
+            esi._spec_file, esi._provider = spec_file, None
+            try:
+                yield esi
+            finally:
+                esi._spec_file, esi._provider = original
+
+
+def main(argv: list[str] | None = None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8080)
+    defaults = FakeESIConfig()
+    for name in (
+        "latency",
+        "latency_jitter",
+        "rows_per_page",
+        "pages",
+        "cache_age",
+        "error_limit",
+        "burst_every",
+        "burst_length",
+        "burst_status",
+    ):
+        default = getattr(defaults, name)
+        parser.add_argument(
+            f"--{name.replace('_', '-')}",
+            type=float if isinstance(default, float) else int,
+            default=default,
+        )
+    parser.add_argument("--rate-limit", action="store_true")
+    parser.add_argument("--no-etag", dest="etag", action="store_false")
+    args = vars(parser.parse_args(argv))
+    host, port = args.pop("host"), args.pop("port")
+
+    server = FakeESIServer(FakeESIConfig(**args), host=host, port=port)
+    print(f"Fake ESI listening on {server.url}, press Ctrl+C to stop")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+        for (operation_id, status), count in sorted(server.fake.stats.items()):
+            print(f"{operation_id:<55} {status} {count}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,133 @@
+"""
+Import time of the Ledger app startup.
+
+Runs `django.setup()` in a fresh interpreter with `python -X importtime` and
+reports the time spent importing the Ledger modules.
+
+Usage:
+    python ledger/tests/benchmarks/importtime.py --budget 300
+"""
+
+# Standard Library
+import argparse
+import os
+import re
+import subprocess
+import sys
+from dataclasses import dataclass
+
+STARTUP_CODE = "import django; django.setup()"
+
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+@dataclass
+class ImportTime:
+    """A module imported during the run, times in microseconds."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+    depth: int
+    importer: str | None = None
+
+
+def measure_imports(code: str = STARTUP_CODE) -> list[ImportTime]:
+    """
+    Run `code` in a fresh interpreter and return the modules it imported.
+
+    The interpreter inherits the environment & the import path of this process,
+    e.g. the `DJANGO_SETTINGS_MODULE`.
+
+    Args:
+        code (str): The Python code to run.
+    Returns:
+        list[ImportTime]: The imported modules in the order of `-X importtime`.
+    """
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(filter(None, sys.path))}
+    env.setdefault("DJANGO_SETTINGS_MODULE", "testauth.settings.local")
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+
+    imports = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, module = match.groups()
+            imports.append(
+                ImportTime(module, int(self_us), int(cumulative_us), len(indent) // 2)
+            )
+
+    # A module is listed before its importer, which is the next one with less depth
+    for index, entry in enumerate(imports):
+        entry.importer = next(
+            (
+                parent.module
+                for parent in imports[index + 1 :]
+                if parent.depth < entry.depth
+            ),
+            None,
+        )
+    return imports
+
+
+def imported_by(imports: list[ImportTime], prefix: str) -> set[str]:
+    """Return the modules first imported by a module starting with `prefix`."""
+    importers = {entry.module: entry.importer for entry in imports}
+    modules = set()
+    for entry in imports:
+        importer = entry.importer
+        while importer:
+            if importer.startswith(prefix):
+                modules.add(entry.module)
+                break
+            importer = importers.get(importer)
+    return modules
+
+
+def is_ledger_module(module: str) -> bool:
+    return module == "ledger" or module.startswith("ledger.")
+
+
+def ledger_import_time(imports: list[ImportTime]) -> int:
+    """Return the time in microseconds spent in the Ledger modules themselves."""
+    return sum(entry.self_us for entry in imports if is_ledger_module(entry.module))
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--budget", type=float, help="Fail if the Ledger modules take longer (ms)"
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="Runs, the fastest run is reported"
+    )
+    parser.add_argument("--top", type=int, default=15, help="Slowest modules shown")
+    args = parser.parse_args(argv)
+
+    runs = [measure_imports() for _ in range(args.repeat)]
+    imports = min(runs, key=ledger_import_time)
+    total_ms = ledger_import_time(imports) / 1000
+
+    ledger_modules = sorted(
+        (entry for entry in imports if is_ledger_module(entry.module)),
+        key=lambda entry: entry.self_us,
+        reverse=True,
+    )
+    for entry in ledger_modules[: args.top]:
+        print(f"{entry.self_us / 1000:8.2f} ms  {entry.module}")
+    print(f"{total_ms:8.2f} ms  {len(ledger_modules)} Ledger modules")
+
+    if args.budget is not None and total_ms > args.budget:
+        print(f"Import time exceeds the budget of {args.budget:.0f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+# Standard Library
+import json
+import platform
+import statistics
+import subprocess
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+# Django
+import django
+from django.db import connection
+from django.utils import timezone
+
+# AA Ledger
+from ledger import __version__
+
+
+def get_git_commit() -> str:
+    """Return the current git commit or `unknown` outside of a git checkout."""
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+            cwd=Path(__file__).parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+class QueryCounter:
+    """Database execute wrapper counting the queries, unlike the query log it is not capped."""
+
+    def __init__(self):
+        self.count = 0
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class BenchmarkRecorder:
+    """
+    Time benchmark paths and store the results as JSON.
+
+    Each path is run `repeat` times, the duration in milliseconds and the
+    number of queries of the runs are stored for comparison across commits.
+    """
+
+    def __init__(self, scale: float, seed: int):
+        self.scale = scale
+        self.seed = seed
+        self.commit = get_git_commit()
+        self.dataset: dict = {}
+        self.results: dict[str, dict] = {}
+
+    def measure(self, name: str, func: Callable, repeat: int = 5, setup=None):
+        """
+        Run `func` `repeat` times and record its timings.
+
+        Args:
+            name (str): The name of the benchmark path.
+            func (Callable): The function to benchmark.
+            repeat (int, optional): Number of runs. Defaults to 5.
+            setup (Callable, optional): Called before each run, not timed.
+        Returns:
+            Any: The result of the last run.
+        """
+        durations = []
+        queries = []
+        result = None
+        for _ in range(repeat):
+            if setup is not None:
+                setup()
+            counter = QueryCounter()
+            with connection.execute_wrapper(counter):
+                start_time = time.perf_counter()
+                result = func()
+                durations.append((time.perf_counter() - start_time) * 1000)
+            queries.append(counter.count)
+
+        self.results[name] = {
+            "runs": repeat,
+            "min_ms": round(min(durations), 3),
+            "median_ms": round(statistics.median(durations), 3),
+            "mean_ms": round(statistics.mean(durations), 3),
+            "max_ms": round(max(durations), 3),
+            "queries": max(queries),
+        }
+        return result
+
+    def to_dict(self) -> dict:
+        return {
+            "commit": self.commit,
+            "version": __version__,
+            "created": timezone.now().isoformat(),
+            "scale": self.scale,
+            "seed": self.seed,
+            "python": platform.python_version(),
+            "django": django.get_version(),
+            "database": connection.vendor,
+            "dataset": self.dataset,
+            "results": self.results,
+        }
+
+    def write(self, output_dir: Path) -> Path:
+        """Write the results to `<output_dir>/<commit>.json` and return the path."""
+        output_dir.mkdir(parents=True, exist_ok=True)
+        path = output_dir / f"{self.commit}.json"
+        path.write_text(json.dumps(self.to_dict(), indent=2), encoding="utf-8")
+        return path
+
+    def compare(self, baseline_path: Path) -> str:
+        """Return a table comparing the median durations with a baseline result file."""
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        lines = [
+            f"Benchmark {baseline['commit']} -> {self.commit} (median ms, queries)",
+        ]
+        for name, result in self.results.items():
+            before = baseline["results"].get(name)
+            if before is None:
+                lines.append(f"{name:<40} {result['median_ms']:>12.1f} (new)")
+                continue
+            change = (
+                (result["median_ms"] - before["median_ms"]) / before["median_ms"] * 100
+                if before["median_ms"]
+                else 0
+            )
+            lines.append(
+                f"{name:<40} {before['median_ms']:>12.1f} -> {result['median_ms']:>12.1f}"
+                f" ({change:+.1f}%) queries {before['queries']} -> {result['queries']}"
+            )
+        return "\n".join(lines)
@@ -0,0 +1,222 @@
+# Standard Library
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import skipUnless
+from unittest.mock import patch
+
+# Django
+from django.urls import reverse
+from django.utils import timezone
+
+# AA Ledger
+from ledger.models import (
+    AllianceBillboardEntry,
+    AllianceLedgerEntry,
+    CharacterBillboardEntry,
+    CharacterLedgerEntry,
+    CharacterOwner,
+    CharacterWalletJournalEntry,
+    CorporationBillboardEntry,
+    CorporationLedgerEntry,
+)
+from ledger.tasks import update_subset_characters
+from ledger.tests import NoSocketsTestCase
+from ledger.tests.benchmarks.dataset import (
+    BENCHMARK_YEAR,
+    CONCORD_ID,
+    DatasetBuilder,
+)
+from ledger.tests.benchmarks.recorder import BenchmarkRecorder
+
+BENCHMARK_ENABLED = bool(os.environ.get("LEDGER_BENCHMARK"))
+BENCHMARK_SCALE = float(os.environ.get("LEDGER_BENCHMARK_SCALE", "1.0"))
+BENCHMARK_SEED = int(os.environ.get("LEDGER_BENCHMARK_SEED", "42"))
+BENCHMARK_REPEAT = int(os.environ.get("LEDGER_BENCHMARK_REPEAT", "5"))
+BENCHMARK_OUTPUT = Path(os.environ.get("LEDGER_BENCHMARK_OUTPUT", ".benchmarks"))
+BENCHMARK_BASELINE = os.environ.get("LEDGER_BENCHMARK_BASELINE")
+
+# Entries of a full ESI wallet journal page
+INGEST_ROWS = 2_500
+INGEST_ENTRY_ID_START = 900_000_000
+
+
+@skipUnless(BENCHMARK_ENABLED, "Set LEDGER_BENCHMARK=1 to run the benchmarks")
+class TestBenchmarks(NoSocketsTestCase):
+    """
+    Time the key paths of the Ledger on a synthetic dataset of realistic volume.
+
+    Run with `make benchmark` or `LEDGER_BENCHMARK=1 python runtests.py ledger.tests.benchmarks`.
+    The results are written to `LEDGER_BENCHMARK_OUTPUT/<commit>.json`
+    and compared with `LEDGER_BENCHMARK_BASELINE` if set.
+    """
+
+    recorder: BenchmarkRecorder
+
+    @classmethod
+    def setUpClass(cls):
+        cls.recorder = BenchmarkRecorder(scale=BENCHMARK_SCALE, seed=BENCHMARK_SEED)
+        super().setUpClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.dataset = DatasetBuilder(scale=BENCHMARK_SCALE, seed=BENCHMARK_SEED).build()
+        cls.recorder.dataset = cls.dataset.counts
+
+    @classmethod
+    def tearDownClass(cls):
+        path = cls.recorder.write(BENCHMARK_OUTPUT)
+        sys.stderr.write(f"\nBenchmark results written to {path}\n")
+        if BENCHMARK_BASELINE:
+            sys.stderr.write(cls.recorder.compare(Path(BENCHMARK_BASELINE)) + "\n")
+        super().tearDownClass()
+
+    def setUp(self):
+        self.client.force_login(self.dataset.user)
+
+    def _get(self, viewname: str, **kwargs):
+        response = self.client.get(reverse(f"ledger:api:{viewname}", kwargs=kwargs))
+        self.assertEqual(response.status_code, 200)
+        return response
+
+    @staticmethod
+    def _clear_character_ledger():
+        CharacterLedgerEntry.objects.all().delete()
+        CharacterBillboardEntry.objects.all().delete()
+
+    def test_journal_ingest(self):
+        owner = CharacterOwner.objects.get(
+            eve_character__character_id=self.dataset.character_id
+        )
+        now = timezone.now()
+        objs = [
+            SimpleNamespace(
+                id=entry_id,
+                amount=1_000_000,
+                balance=1_000_000,
+                context_id=None,
+                context_id_type=None,
+                date=now,
+                description="bounty_prizes",
+                first_party_id=CONCORD_ID,
+                reason="",
+                ref_type="bounty_prizes",
+                second_party_id=self.dataset.character_id,
+                tax=0,
+                tax_receiver_id=None,
+            )
+            for entry_id in range(
+                INGEST_ENTRY_ID_START, INGEST_ENTRY_ID_START + INGEST_ROWS
+            )
+        ]
+
+        self.recorder.measure(
+            "journal_ingest",
+            lambda: CharacterWalletJournalEntry.objects._update_or_create_objs(
+                character=owner, objs=objs
+            ),
+            repeat=BENCHMARK_REPEAT,
+            setup=lambda: CharacterWalletJournalEntry.objects.filter(
+                entry_id__gte=INGEST_ENTRY_ID_START
+            ).delete(),
+        )
+
+    def test_character_ledger(self):
+        kwargs = {"character_id": self.dataset.character_id, "year": BENCHMARK_YEAR}
+
+        self.recorder.measure(
+            "character_ledger_year",
+            lambda: self._get("get_character_ledger", **kwargs),
+            repeat=BENCHMARK_REPEAT,
+            setup=self._clear_character_ledger,
+        )
+        self.recorder.measure(
+            "character_ledger_year_stored",
+            lambda: self._get("get_character_ledger", **kwargs),
+            repeat=BENCHMARK_REPEAT,
+        )
+        self.recorder.measure(
+            "character_ledger_month",
+            lambda: self._get("get_character_ledger", month=6, **kwargs),
+            repeat=BENCHMARK_REPEAT,
+            setup=self._clear_character_ledger,
+        )
+
+    def test_character_details(self):
+        self.recorder.measure(
+            "character_details_year",
+            lambda: self._get(
+                "get_character_ledger_details",
+                character_id=self.dataset.character_id,
+                year=BENCHMARK_YEAR,
+                section="summary",
+            ),
+            repeat=BENCHMARK_REPEAT,
+        )
+
+    def test_character_billboard(self):
+        kwargs = {"character_id": self.dataset.character_id, "year": BENCHMARK_YEAR}
+        self._get("get_character_ledger", **kwargs)
+
+        self.recorder.measure(
+            "character_billboard_year",
+            lambda: self._get("get_character_ledger", **kwargs),
+            repeat=BENCHMARK_REPEAT,
+            setup=lambda: CharacterBillboardEntry.objects.all().delete(),
+        )
+
+    def test_corporation_ledger(self):
+        def clear():
+            CorporationLedgerEntry.objects.all().delete()
+            CorporationBillboardEntry.objects.all().delete()
+
+        self.recorder.measure(
+            "corporation_ledger_year",
+            lambda: self._get(
+                "get_corporation_ledger",
+                corporation_id=self.dataset.corporation_id,
+                year=BENCHMARK_YEAR,
+            ),
+            repeat=BENCHMARK_REPEAT,
+            setup=clear,
+        )
+
+    def test_corporation_details(self):
+        self.recorder.measure(
+            "corporation_details_year",
+            lambda: self._get(
+                "get_corporation_ledger_details",
+                corporation_id=self.dataset.corporation_id,
+                year=BENCHMARK_YEAR,
+                section="summary",
+                entity_id=self.dataset.character_id,
+            ),
+            repeat=BENCHMARK_REPEAT,
+        )
+
+    def test_alliance_ledger(self):
+        def clear():
+            AllianceLedgerEntry.objects.all().delete()
+            AllianceBillboardEntry.objects.all().delete()
+
+        self.recorder.measure(
+            "alliance_ledger_year",
+            lambda: self._get(
+                "get_alliance_ledger",
+                alliance_id=self.dataset.alliance_id,
+                year=BENCHMARK_YEAR,
+            ),
+            repeat=BENCHMARK_REPEAT,
+            setup=clear,
+        )
+
+    @patch("ledger.tasks.update_characters_batch.apply_async")
+    def test_subset_scheduling(self, mock_apply_async):
+        self.recorder.measure(
+            "subset_scheduling_characters",
+            update_subset_characters.run,
+            repeat=BENCHMARK_REPEAT,
+        )
+
+        mock_apply_async.assert_called()
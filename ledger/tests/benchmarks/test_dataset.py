@@ -0,0 +1,45 @@
+# AA Ledger
+from ledger.models import (
+    CharacterOwner,
+    CharacterWalletJournalEntry,
+    CorporationOwner,
+    CorporationWalletJournalEntry,
+)
+from ledger.tests import NoSocketsTestCase
+from ledger.tests.benchmarks.dataset import DatasetBuilder, DatasetSize
+
+
+class TestBenchmarkDataset(NoSocketsTestCase):
+    def test_scaled_size(self):
+        """
+        Test that the dataset size is scaled.
+
+        ### Expected Result
+        - Row counts are scaled with at least one row of each kind.
+        - Rows per owner are not scaled.
+        """
+        size = DatasetSize().scaled(0.0001)
+
+        self.assertEqual(size.characters, 1)
+        self.assertEqual(size.character_journal, 800)
+        self.assertEqual(size.planets_per_character, 3)
+
+    def test_build(self):
+        """
+        Test that the dataset is built with the scaled row counts.
+
+        ### Expected Result
+        - Owners and journal rows are created.
+        - The benchmark user is a superuser owning the benchmark character.
+        """
+        dataset = DatasetBuilder(scale=0.01).build()
+
+        self.assertEqual(CharacterOwner.objects.count(), 10)
+        self.assertEqual(CorporationOwner.objects.count(), 2)
+        self.assertEqual(CharacterWalletJournalEntry.objects.count(), 80_000)
+        self.assertEqual(CorporationWalletJournalEntry.objects.count(), 20_000)
+        self.assertEqual(dataset.counts["planets"], 30)
+        self.assertTrue(dataset.user.is_superuser)
+        self.assertEqual(
+            dataset.user.profile.main_character.character_id, dataset.character_id
+        )
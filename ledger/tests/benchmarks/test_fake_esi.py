@@ -0,0 +1,132 @@
+# Standard Library
+import json
+from http import HTTPStatus
+
+# AA Ledger
+from ledger import __operations__
+from ledger.tests import NoSocketsTestCase
+from ledger.tests.benchmarks.fake_esi import FakeESI, FakeESIConfig
+
+JOURNAL_URL = "/characters/1001/wallet/journal"
+
+
+class TestFakeESI(NoSocketsTestCase):
+    def test_routes(self):
+        """
+        Test that the routes are loaded from the bundled spec.
+
+        ### Expected Result
+        - Every Ledger operation is served.
+        """
+        operation_ids = {
+            route.operation_id
+            for routes in FakeESI().routes.values()
+            for route in routes
+        }
+
+        self.assertEqual(operation_ids, set(__operations__))
+
+    def test_paged_journal(self):
+        """
+        Test that the journal is served in pages of unique entries.
+
+        ### Expected Result
+        - Each page has `rows_per_page` entries with unique IDs.
+        - Pages after the last page are not found.
+        """
+        fake = FakeESI(FakeESIConfig(rows_per_page=10, pages=2))
+
+        first = fake.handle("GET", f"{JOURNAL_URL}?page=1", {})
+        second = fake.handle("GET", f"{JOURNAL_URL}?page=2", {})
+        missing = fake.handle("GET", f"{JOURNAL_URL}?page=3", {})
+
+        self.assertEqual(first.status, HTTPStatus.OK)
+        self.assertEqual(first.headers["X-Pages"], "2")
+        ids = [row["id"] for row in json.loads(first.body) + json.loads(second.body)]
+        self.assertEqual(len(set(ids)), 20)
+        self.assertEqual(missing.status, HTTPStatus.NOT_FOUND)
+
+    def test_etag(self):
+        """
+        Test that unchanged data is answered with 304.
+
+        ### Expected Result
+        - The same data is served with the same ETag.
+        - A matching If-None-Match is answered with 304 without body.
+        """
+        fake = FakeESI()
+
+        response = fake.handle("GET", JOURNAL_URL, {})
+        cached = fake.handle("GET", JOURNAL_URL, {})
+        not_modified = fake.handle(
+            "GET", JOURNAL_URL, {"If-None-Match": response.headers["ETag"]}
+        )
+
+        self.assertEqual(cached.body, response.body)
+        self.assertEqual(not_modified.status, HTTPStatus.NOT_MODIFIED)
+        self.assertEqual(not_modified.body, b"")
+
+    def test_burst_and_error_limit(self):
+        """
+        Test the server error bursts and the error limit.
+
+        ### Expected Result
+        - The last requests of each burst cycle fail.
+        - The error limit is counted down and exhausted with 420.
+        """
+        fake = FakeESI(FakeESIConfig(burst_every=4, burst_length=2, error_limit=3))
+
+        statuses = [fake.handle("GET", JOURNAL_URL, {}).status for _ in range(6)]
+        limited = fake.handle("GET", JOURNAL_URL, {})
+
+        self.assertEqual(
+            statuses,
+            [
+                HTTPStatus.OK,
+                HTTPStatus.OK,
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                HTTPStatus.SERVICE_UNAVAILABLE,
+                HTTPStatus.OK,
+                HTTPStatus.OK,
+            ],
+        )
+        self.assertEqual(limited.status, HTTPStatus.SERVICE_UNAVAILABLE)
+        self.assertEqual(fake.handle("GET", JOURNAL_URL, {}).status, 420)
+        self.assertEqual(fake.stats[("GetCharactersCharacterIdWalletJournal", 503)], 3)
+
+    def test_rate_limit(self):
+        """
+        Test that the rate limit of the spec is enforced per token.
+
+        ### Expected Result
+        - The rate limit headers are sent.
+        - Requests above the limit of a token are answered with 429.
+        """
+        fake = FakeESI(FakeESIConfig(rate_limit=True, error_limit=1_000))
+        token = {"Authorization": "Bearer 1"}
+
+        response = fake.handle("GET", JOURNAL_URL, token)
+        for _ in range(149):
+            fake.handle("GET", JOURNAL_URL, token)
+
+        self.assertEqual(response.headers["X-Ratelimit-Group"], "char-wallet")
+        self.assertEqual(response.headers["X-Ratelimit-Remaining"], "149")
+        self.assertEqual(
+            fake.handle("GET", JOURNAL_URL, token).status,
+            HTTPStatus.TOO_MANY_REQUESTS,
+        )
+        self.assertEqual(
+            fake.handle("GET", JOURNAL_URL, {"Authorization": "Bearer 2"}).status,
+            HTTPStatus.OK,
+        )
+
+    def test_universe_names(self):
+        """
+        Test that posted IDs are resolved.
+
+        ### Expected Result
+        - A name is returned for each posted ID.
+        """
+        response = FakeESI().handle("POST", "/universe/names", {}, b"[1, 2]")
+
+        self.assertEqual([entity["id"] for entity in json.loads(response.body)], [1, 2])
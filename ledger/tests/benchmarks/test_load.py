@@ -0,0 +1,221 @@
+# Standard Library
+import datetime as dt
+import os
+import sys
+from contextlib import ExitStack
+from unittest import skipUnless
+from unittest.mock import patch
+
+# Django
+from django.core.cache import cache
+from django.test import TestCase
+from django.utils import timezone
+
+# Alliance Auth
+from allianceauth.authentication.models import CharacterOwnership
+from esi.models import Scope, Token
+
+# Alliance Auth (External Libs)
+from eve_sde.models import ItemType
+from eve_sde.models.map import Planet, SolarSystem
+
+# AA Ledger
+from ledger.app_settings import LEDGER_ESI_BUDGET, LEDGER_UPDATE_BATCH_SIZE
+from ledger.models import CharacterOwner, CorporationOwner
+from ledger.models.characteraudit import CharacterUpdateStatus
+from ledger.models.corporationaudit import CorporationUpdateStatus
+from ledger.tasks import update_characters_batch, update_corporations_batch
+from ledger.tests.benchmarks.dataset import DatasetBuilder, DatasetSize
+from ledger.tests.benchmarks.fake_esi import FakeESIConfig, FakeESIServer
+from ledger.tests.benchmarks.recorder import BenchmarkRecorder
+from ledger.tests.benchmarks.test_benchmarks import BENCHMARK_OUTPUT, BENCHMARK_SEED
+from ledger.tests.testdata.factory import (
+    ItemTypeFactory,
+    PlanetFactory,
+    SolarSystemFactory,
+)
+
+LOADTEST_ENABLED = bool(os.environ.get("LEDGER_LOADTEST"))
+LOADTEST_OWNERS = int(os.environ.get("LEDGER_LOADTEST_OWNERS", "1000"))
+LOADTEST_LATENCY = float(os.environ.get("LEDGER_LOADTEST_LATENCY", "0.05"))
+LOADTEST_BURST_EVERY = int(os.environ.get("LEDGER_LOADTEST_BURST_EVERY", "0"))
+LOADTEST_ROWS = int(os.environ.get("LEDGER_LOADTEST_ROWS", "50"))
+
+# Fields of the ESI data referencing the SDE & the factory of the rows to create
+# if the SDE is not loaded
+SDE_CHOICES = {
+    ("type_id", "product_type_id", "content_type_id"): (ItemType, ItemTypeFactory),
+    ("solar_system_id",): (SolarSystem, SolarSystemFactory),
+    ("planet_id",): (Planet, PlanetFactory),
+}
+
+
+def _create_tokens(character_ids) -> None:
+    """Create a token with the character & corporation scopes for each character."""
+    scopes = [
+        Scope.objects.get_or_create(name=name)[0]
+        for name in set(
+            CharacterOwner.get_esi_scopes() + CorporationOwner.get_esi_scopes()
+        )
+    ]
+    ownerships = CharacterOwnership.objects.filter(
+        character__character_id__in=character_ids
+    ).select_related("character")
+    tokens = Token.objects.bulk_create(
+        Token(
+            user_id=ownership.user_id,
+            character_id=ownership.character.character_id,
+            character_name=ownership.character.character_name,
+            character_owner_hash=ownership.owner_hash,
+            access_token=f"loadtest-{ownership.character.character_id}",
+            refresh_token="loadtest",
+            token_type="character",
+        )
+        for ownership in ownerships
+    )
+    Token.scopes.through.objects.bulk_create(
+        Token.scopes.through(token_id=token.pk, scope_id=scope.pk)
+        for token in tokens
+        for scope in scopes
+    )
+
+
+@skipUnless(LOADTEST_ENABLED, "Set LEDGER_LOADTEST=1 to run the load test")
+class TestUpdateSweepLoad(TestCase):
+    """
+    Measure the throughput of full update sweeps against a local fake ESI server.
+
+    Run with `make loadtest` or `LEDGER_LOADTEST=1 python runtests.py ledger.tests.benchmarks.test_load`.
+    The sweeps run the batch tasks in-process, each sweep is run cold with empty caches
+    and warm, where the unchanged ESI data is answered by the ETag cache.
+    """
+
+    recorder: BenchmarkRecorder
+
+    @classmethod
+    def setUpClass(cls):
+        cls.recorder = BenchmarkRecorder(
+            scale=LOADTEST_OWNERS / DatasetSize().characters, seed=BENCHMARK_SEED
+        )
+        cls.server = FakeESIServer(
+            FakeESIConfig(
+                latency=LOADTEST_LATENCY,
+                rows_per_page=LOADTEST_ROWS,
+                burst_every=LOADTEST_BURST_EVERY,
+                rate_limit=True,
+                seed=BENCHMARK_SEED,
+            )
+        ).start()
+        super().setUpClass()
+
+    @classmethod
+    def setUpTestData(cls):
+        dataset = DatasetBuilder(
+            seed=BENCHMARK_SEED,
+            size=DatasetSize(
+                alliances=max(LOADTEST_OWNERS // 50, 1),
+                corporations=max(LOADTEST_OWNERS // 5, 1),
+                characters=LOADTEST_OWNERS,
+                character_journal=1,
+                corporation_journal=1,
+                mining=0,
+                planets_per_character=0,
+            ),
+        ).build()
+        cls.recorder.dataset = dataset.counts
+        _create_tokens(
+            CharacterOwner.objects.values_list("eve_character__character_id", flat=True)
+        )
+
+        # Serve IDs known to the SDE
+        for names, (model, model_factory) in SDE_CHOICES.items():
+            ids = list(model.objects.values_list("id", flat=True)[:1_000])
+            if not ids:
+                ids = [obj.pk for obj in model_factory.create_batch(10)]
+            for name in names:
+                cls.server.fake.config.choices[name] = ids
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.stop()
+        path = cls.recorder.write(BENCHMARK_OUTPUT / "load")
+        sys.stderr.write(f"\nLoad test results written to {path}\n")
+        for (operation_id, status), count in sorted(cls.server.fake.stats.items()):
+            sys.stderr.write(f"{operation_id:<55} {status} {count}\n")
+        super().tearDownClass()
+
+    def setUp(self):
+        stack = ExitStack()
+        self.addCleanup(stack.close)
+        # The tokens are not refreshed during the sweep
+        stack.enter_context(
+            patch("esi.app_settings.ESI_TOKEN_VALID_DURATION", 24 * 60 * 60)
+        )
+        # The fake ESI enforces the rate limits, the ESI Budget would requeue the tasks
+        stack.enter_context(patch.dict(LEDGER_ESI_BUDGET, clear=True))
+        stack.enter_context(self.server.patch_client())
+
+    def _sweep(self, name: str, task, status_model, eve_ids: list[int], cold: bool):
+        """Run the batch task for all owners and record the throughput."""
+
+        def setup():
+            if cold:
+                cache.clear()
+            # Every section is due, also if the ESI data is still cached
+            status_model.objects.update(
+                is_success=None, next_due_at=timezone.now() - dt.timedelta(seconds=1)
+            )
+
+        def run():
+            results = [
+                task.apply(
+                    kwargs={
+                        "eve_ids": eve_ids[start : start + LEDGER_UPDATE_BATCH_SIZE]
+                    }
+                )
+                for start in range(0, len(eve_ids), LEDGER_UPDATE_BATCH_SIZE)
+            ]
+            return sum(result.failed() for result in results)
+
+        requests = self.server.fake.requests
+        failed_batches = self.recorder.measure(name, run, repeat=1, setup=setup)
+        result = self.recorder.results[name]
+        seconds = result["median_ms"] / 1000
+        result["owners"] = len(eve_ids)
+        result["owners_per_second"] = round(len(eve_ids) / seconds, 2)
+        result["esi_requests"] = self.server.fake.requests - requests
+        result["esi_requests_per_second"] = round(result["esi_requests"] / seconds, 2)
+        result["failed_batches"] = failed_batches
+        result["failed_sections"] = status_model.objects.filter(
+            is_success=False
+        ).count()
+
+    def test_character_sweep(self):
+        eve_ids = list(
+            CharacterOwner.objects.values_list("eve_character__character_id", flat=True)
+        )
+
+        for cold in (True, False):
+            self._sweep(
+                f"update_sweep_characters_{'cold' if cold else 'warm'}",
+                update_characters_batch,
+                CharacterUpdateStatus,
+                eve_ids,
+                cold=cold,
+            )
+
+    def test_corporation_sweep(self):
+        eve_ids = list(
+            CorporationOwner.objects.values_list(
+                "eve_corporation__corporation_id", flat=True
+            )
+        )
+
+        for cold in (True, False):
+            self._sweep(
+                f"update_sweep_corporations_{'cold' if cold else 'warm'}",
+                update_corporations_batch,
+                CorporationUpdateStatus,
+                eve_ids,
+                cold=cold,
+            )
@@ -0,0 +1,214 @@
+# Standard Library
+from unittest.mock import MagicMock, patch
+
+# Third Party
+from asgiref.sync import async_to_sync
+
+# Django
+from django.test import RequestFactory, TestCase
+
+# AA Ledger
+from ledger.api import API_VIEWS, api, setup
+from ledger.api.alliance import AllianceApiEndpoints, AllianceAsyncApiEndpoints
+from ledger.api.character import CharacterApiEndpoints, CharacterAsyncApiEndpoints
+from ledger.api.corporation import (
+    CorporationApiEndpoints,
+    CorporationAsyncApiEndpoints,
+)
+from ledger.auth_hooks import register_urls
+from ledger.models.ledger import (
+    CharacterBillboardEntry,
+    CharacterLedgerEntry,
+    CorporationLedgerEntry,
+)
+from ledger.tests import NoSocketsTestCase
+from ledger.tests.benchmarks.dataset import BENCHMARK_YEAR, DatasetBuilder, DatasetSize
+
+MODULE_PATH = "ledger.api"
+
+
+# The event loop of `async_to_sync` opens a socket pair, so these tests can't block sockets
+class TestAsyncLedgerEndpoints(TestCase):
+    """Test the async ledger endpoints against their sync variants."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.dataset = DatasetBuilder(
+            size=DatasetSize(
+                alliances=1,
+                corporations=2,
+                characters=4,
+                characters_per_user=2,
+                character_journal=40,
+                corporation_journal=40,
+                mining=0,
+                planets_per_character=0,
+            )
+        ).build()
+
+    def get_request(self, user=None):
+        request = RequestFactory().get("/")
+        request.user = user or self.dataset.user
+        return request
+
+    def assertSameResponse(self, sync_endpoints, async_endpoints, **kwargs):
+        """Assert the async endpoint responds like the sync endpoint."""
+        # The async endpoint runs first to create the ledger entries & billboard
+        async_response = async_to_sync(async_endpoints._aledger_api_response)(
+            request=self.get_request(), **kwargs
+        )
+        sync_response = sync_endpoints._ledger_api_response(
+            request=self.get_request(), **kwargs
+        )
+
+        self.assertEqual(async_response.dict(), sync_response.dict())
+        return async_response
+
+    def test_character_ledger(self):
+        """
+        Test the async character ledger.
+
+        ### Expected Result
+        - The response equals the response of the sync endpoint.
+        - The ledger entries and the billboard entry are stored.
+        """
+        for kwargs in [{}, {"month": 1}, {"data_only": True}]:
+            with self.subTest(**kwargs):
+                response = self.assertSameResponse(
+                    CharacterApiEndpoints(MagicMock()),
+                    CharacterAsyncApiEndpoints(MagicMock()),
+                    character_id=self.dataset.character_id,
+                    year=BENCHMARK_YEAR,
+                    **kwargs,
+                )
+                self.assertTrue(response.characters)
+
+        self.assertTrue(CharacterLedgerEntry.objects.exists())
+        self.assertTrue(CharacterBillboardEntry.objects.exists())
+
+    def test_corporation_ledger(self):
+        """
+        Test the async corporation ledger.
+
+        ### Expected Result
+        - The response equals the response of the sync endpoint.
+        - The ledger entries are stored.
+        """
+        for kwargs in [{}, {"month": 1}, {"data_only": True}]:
+            with self.subTest(**kwargs):
+                response = self.assertSameResponse(
+                    CorporationApiEndpoints(MagicMock()),
+                    CorporationAsyncApiEndpoints(MagicMock()),
+                    corporation_id=self.dataset.corporation_id,
+                    year=BENCHMARK_YEAR,
+                    **kwargs,
+                )
+                self.assertTrue(response.entities)
+
+        self.assertTrue(CorporationLedgerEntry.objects.exists())
+
+    def test_alliance_ledger(self):
+        """
+        Test the async alliance ledger.
+
+        ### Expected Result
+        - The response equals the response of the sync endpoint.
+        """
+        for kwargs in [{}, {"month": 1}, {"data_only": True}]:
+            with self.subTest(**kwargs):
+                response = self.assertSameResponse(
+                    AllianceApiEndpoints(MagicMock()),
+                    AllianceAsyncApiEndpoints(MagicMock()),
+                    alliance_id=self.dataset.alliance_id,
+                    year=BENCHMARK_YEAR,
+                    **kwargs,
+                )
+                self.assertTrue(response.corporations)
+
+    def test_not_found(self):
+        """
+        Test the async ledger endpoints with unknown owners.
+
+        ### Expected Result
+        - The endpoints return 404.
+        """
+        for endpoints, kwargs in [
+            (CharacterAsyncApiEndpoints, {"character_id": 9999}),
+            (CorporationAsyncApiEndpoints, {"corporation_id": 9999}),
+            (AllianceAsyncApiEndpoints, {"alliance_id": 9999}),
+        ]:
+            with self.subTest(endpoints=endpoints.__name__):
+                status, __ = async_to_sync(
+                    endpoints(MagicMock())._aledger_api_response
+                )(request=self.get_request(), year=BENCHMARK_YEAR, **kwargs)
+
+                self.assertEqual(status, 404)
+
+    def test_no_permission(self):
+        """
+        Test the async ledger endpoints without permission.
+
+        ### Expected Result
+        - The endpoints return 403.
+        """
+        # pylint: disable=import-outside-toplevel
+        # AA Ledger
+        from ledger.tests.testdata.factory import UserMainFactory
+
+        user = UserMainFactory()
+
+        for endpoints, kwargs in [
+            (CharacterAsyncApiEndpoints, {"character_id": self.dataset.character_id}),
+            (
+                CorporationAsyncApiEndpoints,
+                {"corporation_id": self.dataset.corporation_id},
+            ),
+            (AllianceAsyncApiEndpoints, {"alliance_id": self.dataset.alliance_id}),
+        ]:
+            with self.subTest(endpoints=endpoints.__name__):
+                status, __ = async_to_sync(
+                    endpoints(MagicMock())._aledger_api_response
+                )(request=self.get_request(user), year=BENCHMARK_YEAR, **kwargs)
+
+                self.assertEqual(status, 403)
+
+
+class TestAsyncSetup(NoSocketsTestCase):
+    @patch(MODULE_PATH + ".LEDGER_API_ASYNC", True)
+    @patch(MODULE_PATH + ".alliance")
+    @patch(MODULE_PATH + ".corporation")
+    @patch(MODULE_PATH + ".character")
+    def test_setup_async(self, mock_character, mock_corporation, mock_alliance):
+        """
+        Test the setup with the async endpoints enabled.
+
+        ### Expected Result
+        - The async ledger endpoints are registered instead of the sync endpoints.
+        """
+        setup(MagicMock())
+
+        mock_character.CharacterAsyncApiEndpoints.assert_called_once()
+        mock_character.CharacterApiEndpoints.assert_not_called()
+        mock_corporation.CorporationAsyncApiEndpoints.assert_called_once()
+        mock_corporation.CorporationApiEndpoints.assert_not_called()
+        mock_alliance.AllianceAsyncApiEndpoints.assert_called_once()
+        mock_alliance.AllianceApiEndpoints.assert_not_called()
+
+    def test_api_views_excluded(self):
+        """
+        Test the API views are excluded from the `main_character_required` decorator.
+
+        ### Expected Result
+        - The lookup strings of all API operation views are in `API_VIEWS`.
+        - The url hook excludes the API views.
+        """
+        patterns, __, __ = api.urls
+        lookup_strs = {
+            pattern.lookup_str
+            for pattern in patterns
+            if not pattern.lookup_str.startswith("ninja.openapi")
+        }
+
+        self.assertTrue(lookup_strs)
+        self.assertTrue(lookup_strs.issubset(API_VIEWS))
+        self.assertCountEqual(register_urls().excluded_views, API_VIEWS)
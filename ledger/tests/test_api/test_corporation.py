@@ -0,0 +1,101 @@
+# Standard Library
+from unittest.mock import MagicMock, patch
+
+# AA Ledger
+from ledger.api.corporation import (
+    CorporationApiEndpoints,
+    CorporationDetailsApiEndpoints,
+)
+from ledger.api.schema import CorporationLedgerRequestInfo
+from ledger.tests import LedgerTestCase
+from ledger.tests.testdata.factory import CorporationOwnerFactory, EveCharacterFactory
+from ledger.tests.testdata.utils import add_character_to_user
+
+MODULE_PATH = "ledger.api.corporation"
+
+
+class TestCorporationMemberLedgerData(LedgerTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.endpoints = CorporationApiEndpoints(MagicMock())
+        cls.owner = CorporationOwnerFactory(user=cls.user)
+        cls.alt_character = EveCharacterFactory()
+        add_character_to_user(cls.user, cls.alt_character)
+
+    @patch(MODULE_PATH + ".CorporationApiEndpoints._process_entity_entries")
+    def test_process_member_ledger_data(self, mock_process_entity_entries):
+        mock_process_entity_entries.return_value = None
+        entity_ids = {
+            self.user_character.character_id,
+            self.alt_character.character_id,
+            self.user2_character.character_id,
+            # Entity not registered in Auth
+            9999,
+        }
+
+        with self.assertNumQueries(1):
+            auth_entity_ids = self.endpoints.process_member_ledger_data(
+                owner=self.owner,
+                entity_ids=entity_ids,
+                request_info=CorporationLedgerRequestInfo(
+                    owner_id=self.owner.eve_corporation.corporation_id,
+                    year=2025,
+                    data_only=True,
+                ),
+                entries_by_entity={},
+                ledger_entries={},
+                changed_entries=[],
+                processed_entry_ids=set(),
+                entity_ledger_list=[],
+            )
+
+        self.assertCountEqual(
+            auth_entity_ids,
+            [
+                self.user_character.character_id,
+                self.alt_character.character_id,
+                self.user2_character.character_id,
+            ],
+        )
+        entities = {
+            call.kwargs["entity"].entity_id: call.kwargs["entity"]
+            for call in mock_process_entity_entries.call_args_list
+        }
+        self.assertCountEqual(
+            entities[self.user_character.character_id].alt_ids,
+            [self.user_character.character_id, self.alt_character.character_id],
+        )
+        self.assertEqual(
+            entities[self.user2_character.character_id].alt_ids,
+            [self.user2_character.character_id],
+        )
+
+
+class TestCorporationEntityDetails(LedgerTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.endpoints = CorporationDetailsApiEndpoints(MagicMock())
+        cls.owner = CorporationOwnerFactory(user=cls.user)
+        cls.alt_character = EveCharacterFactory()
+        add_character_to_user(cls.user, cls.alt_character)
+
+    def test_check_auth_account(self):
+        with self.assertNumQueries(1):
+            alt_ids = self.endpoints._check_auth_account(
+                owner=self.owner, entity_id=self.alt_character.character_id
+            )
+
+        self.assertCountEqual(
+            alt_ids,
+            self.user.character_ownerships.values_list(
+                "character__character_id", flat=True
+            ),
+        )
+        self.assertIn(self.user_character.character_id, alt_ids)
+
+    def test_check_auth_account_no_member(self):
+        self.assertIsNone(
+            self.endpoints._check_auth_account(owner=self.owner, entity_id=9999)
+        )
@@ -0,0 +1,73 @@
+# Django
+from django.urls import reverse
+
+# AA Ledger
+from ledger.tests import NoSocketsTestCase
+from ledger.tests.benchmarks.dataset import BENCHMARK_YEAR, DatasetBuilder, DatasetSize
+
+
+class TestDataFormat(NoSocketsTestCase):
+    """Test the `?format=data` mode of the ledger endpoints."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.dataset = DatasetBuilder(
+            size=DatasetSize(
+                alliances=1,
+                corporations=2,
+                characters=4,
+                characters_per_user=2,
+                character_journal=40,
+                corporation_journal=40,
+                mining=0,
+                planets_per_character=0,
+            )
+        ).build()
+
+    def test_ledger_without_html(self):
+        """
+        Test the ledger endpoints with `?format=data`.
+
+        ### Expected Result
+        - The payload contains no HTML.
+        - The icons of the owner and the rows are None.
+        """
+        self.client.force_login(self.dataset.user)
+
+        for viewname, kwargs, rows, entity in [
+            (
+                "get_character_ledger",
+                {"character_id": self.dataset.character_id},
+                "characters",
+                "character",
+            ),
+            (
+                "get_corporation_ledger",
+                {"corporation_id": self.dataset.corporation_id},
+                "entities",
+                "entity",
+            ),
+            (
+                "get_alliance_ledger",
+                {"alliance_id": self.dataset.alliance_id},
+                "corporations",
+                "corporation",
+            ),
+        ]:
+            with self.subTest(viewname=viewname):
+                response = self.client.get(
+                    reverse(
+                        f"ledger:api:{viewname}",
+                        kwargs=kwargs | {"year": BENCHMARK_YEAR},
+                    ),
+                    {"format": "data"},
+                )
+
+                self.assertEqual(response.status_code, 200)
+                self.assertNotIn(b"<", response.content)
+                data = response.json()
+                self.assertIsNone(data["owner"]["icon"])
+                self.assertTrue(data[rows])
+                for row in data[rows]:
+                    self.assertIsNone(row[entity]["icon"])
+                    self.assertIsNone(row[entity].get("popover"))
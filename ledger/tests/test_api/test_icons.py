@@ -0,0 +1,28 @@
+# AA Ledger
+from ledger.api.helpers.icons import get_character_details_info_button
+from ledger.api.schema import OwnerLedgerRequestInfo
+from ledger.tests import LedgerTestCase
+
+MODULE_PATH = "ledger.api.helpers.icons"
+
+
+class TestIcons(LedgerTestCase):
+    def test_get_character_details_info_button(self):
+        request_info = OwnerLedgerRequestInfo(owner_id=1001, year=2025, month=1)
+
+        button = get_character_details_info_button(
+            character_id=1001, request_info=request_info
+        )
+
+        self.assertIn("/ledger/api/character/1001/date/2025/1/", button)
+
+    def test_get_character_details_info_button_data_only(self):
+        request_info = OwnerLedgerRequestInfo(
+            owner_id=1001, year=2025, month=1, data_only=True
+        )
+
+        button = get_character_details_info_button(
+            character_id=1001, request_info=request_info
+        )
+
+        self.assertEqual(button, "")
@@ -0,0 +1,62 @@
+# Standard Library
+from datetime import date
+
+# Django
+from django.utils import timezone
+
+# AA Ledger
+from ledger.api.helpers.periods import (
+    MAX_SUMMARY_PERIODS,
+    get_ledger_periods,
+    get_next_period_key,
+    get_periods_date_query,
+)
+from ledger.tests import LedgerTestCase
+
+MODULE_PATH = "ledger.api.helpers.periods"
+
+
+class TestLedgerPeriods(LedgerTestCase):
+    def test_get_next_period_key(self):
+        self.assertEqual(
+            get_next_period_key((2025, None, None), "year"), (2026, None, None)
+        )
+        self.assertEqual(
+            get_next_period_key((2025, 12, None), "month"), (2026, 1, None)
+        )
+        self.assertEqual(get_next_period_key((2024, 2, 28), "day"), (2024, 2, 29))
+
+    def test_get_ledger_periods_month(self):
+        periods = get_ledger_periods(date(2024, 11, 5), date(2025, 2, 1), "month")
+
+        self.assertEqual(
+            periods,
+            [(2024, 11, None), (2024, 12, None), (2025, 1, None), (2025, 2, None)],
+        )
+
+    def test_get_ledger_periods_single(self):
+        periods = get_ledger_periods(date(2025, 3, 14), None, "day")
+
+        self.assertEqual(periods, [(2025, 3, 14)])
+
+    def test_get_ledger_periods_invalid(self):
+        with self.assertRaises(ValueError):
+            get_ledger_periods(date(2025, 1, 1), date(2024, 1, 1), "month")
+        with self.assertRaises(ValueError):
+            get_ledger_periods(date(2025, 1, 1), None, "week")
+        with self.assertRaises(ValueError):
+            get_ledger_periods(
+                date(2020, 1, 1),
+                date(2020, 1, 1) + timezone.timedelta(days=MAX_SUMMARY_PERIODS),
+                "day",
+            )
+
+    def test_get_periods_date_query(self):
+        query = get_periods_date_query([(2024, 12, None), (2025, 1, None)], "month")
+
+        self.assertEqual(
+            query["date__gte"], timezone.make_aware(timezone.datetime(2024, 12, 1))
+        )
+        self.assertEqual(
+            query["date__lt"], timezone.make_aware(timezone.datetime(2025, 2, 1))
+        )
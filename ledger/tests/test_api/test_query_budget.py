@@ -0,0 +1,221 @@
+# Django
+from django.urls import reverse
+
+# AA Ledger
+from ledger.tests import NoSocketsTestCase
+from ledger.tests.benchmarks.dataset import BENCHMARK_YEAR, DatasetBuilder, DatasetSize
+from ledger.tests.testdata.query_budget import QueryBudgetMixin
+
+# Journal entries created per item, so each alt, member and corporation has entries
+ENTRIES_PER_ITEM = 5
+
+# A `per_item` budget above 0 records the queries per alt, member or corporation
+# of the current implementation, lower it when an endpoint is optimized.
+
+# The ledger endpoints save their ledger entries with one bulk create and one bulk update,
+# SQLite splits the 100 entries of the largest size into two batches each
+LEDGER_ENTRY_BATCHES = 2
+
+
+def build_dataset(**size):
+    """Build a dataset without the SDE based mining and planetary data."""
+    return DatasetBuilder(
+        size=DatasetSize(mining=0, planets_per_character=0, **size)
+    ).build()
+
+
+class TestQueryBudgetMixin(QueryBudgetMixin, NoSocketsTestCase):
+    def request(self, dataset, viewname: str, query: dict | None = None, **kwargs):
+        """Return a request of the dataset user to an API endpoint."""
+
+        def run():
+            self.client.force_login(dataset.user)
+            return self.client.get(
+                reverse(f"ledger:api:{viewname}", kwargs=kwargs), query
+            )
+
+        return run
+
+
+class TestCharacterQueryBudget(TestQueryBudgetMixin):
+    """Query budget of the character endpoints with 1, 10 & 100 alts."""
+
+    def build(
+        self, viewname: str, query: dict | None = None, owner: bool = True, **kwargs
+    ):
+        def build(size: int):
+            dataset = build_dataset(
+                alliances=1,
+                corporations=1,
+                characters=size,
+                characters_per_user=size,
+                character_journal=size * ENTRIES_PER_ITEM,
+                corporation_journal=1,
+            )
+            return self.request(
+                dataset,
+                viewname,
+                query,
+                **({"character_id": dataset.character_id} if owner else {}),
+                **kwargs,
+            )
+
+        return build
+
+    def test_character_ledger(self):
+        self.assertQueryBudget(
+            self.build("get_character_ledger", year=BENCHMARK_YEAR),
+            per_item=0,
+            batches=LEDGER_ENTRY_BATCHES,
+        )
+
+    def test_character_ledger_details(self):
+        self.assertQueryBudget(
+            self.build(
+                "get_character_ledger_details", year=BENCHMARK_YEAR, section="summary"
+            ),
+            per_item=0,
+        )
+
+    def test_character_ledger_summary(self):
+        self.assertQueryBudget(
+            self.build(
+                "get_character_ledger_summary",
+                {"start": f"{BENCHMARK_YEAR}-01-01", "end": f"{BENCHMARK_YEAR}-03-31"},
+            ),
+            per_item=0,
+        )
+
+    def test_character_dashboard(self):
+        self.assertQueryBudget(self.build("get_character_dashboard"), per_item=0)
+
+    def test_character_overview(self):
+        self.assertQueryBudget(
+            self.build("get_character_overview", owner=False), per_item=0
+        )
+
+
+class TestCorporationQueryBudget(TestQueryBudgetMixin):
+    """Query budget of the corporation endpoints with 1, 10 & 100 members."""
+
+    def build(
+        self, viewname: str, query: dict | None = None, owner: bool = True, **kwargs
+    ):
+        def build(size: int):
+            dataset = build_dataset(
+                alliances=1,
+                corporations=1,
+                characters=size,
+                characters_per_user=1,
+                character_journal=1,
+                corporation_journal=size * ENTRIES_PER_ITEM,
+            )
+            if "entity_id" in kwargs:
+                kwargs["entity_id"] = dataset.character_id
+            return self.request(
+                dataset,
+                viewname,
+                query,
+                **({"corporation_id": dataset.corporation_id} if owner else {}),
+                **kwargs,
+            )
+
+        return build
+
+    def test_corporation_ledger(self):
+        self.assertQueryBudget(
+            self.build("get_corporation_ledger", year=BENCHMARK_YEAR),
+            per_item=0,
+            batches=LEDGER_ENTRY_BATCHES,
+        )
+
+    def test_corporation_ledger_details(self):
+        self.assertQueryBudget(
+            self.build(
+                "get_corporation_ledger_details",
+                year=BENCHMARK_YEAR,
+                section="summary",
+                entity_id=None,
+            ),
+            per_item=0,
+        )
+
+    def test_corporation_ledger_summary(self):
+        self.assertQueryBudget(
+            self.build(
+                "get_corporation_ledger_summary",
+                {"start": f"{BENCHMARK_YEAR}-01-01", "end": f"{BENCHMARK_YEAR}-03-31"},
+            ),
+            per_item=0,
+        )
+
+    def test_corporation_dashboard(self):
+        self.assertQueryBudget(self.build("get_corporation_dashboard"), per_item=0)
+
+
+class TestAllianceQueryBudget(TestQueryBudgetMixin):
+    """Query budget of the alliance endpoints with 1, 10 & 100 corporations."""
+
+    def build(
+        self, viewname: str, query: dict | None = None, owner: bool = True, **kwargs
+    ):
+        def build(size: int):
+            dataset = build_dataset(
+                alliances=1,
+                corporations=size,
+                characters=size,
+                characters_per_user=1,
+                character_journal=1,
+                corporation_journal=size * ENTRIES_PER_ITEM,
+            )
+            if "entity_id" in kwargs:
+                kwargs["entity_id"] = dataset.corporation_id
+            return self.request(
+                dataset,
+                viewname,
+                query,
+                **({"alliance_id": dataset.alliance_id} if owner else {}),
+                **kwargs,
+            )
+
+        return build
+
+    def test_alliance_ledger(self):
+        self.assertQueryBudget(
+            self.build("get_alliance_ledger", year=BENCHMARK_YEAR),
+            per_item=0,
+            batches=LEDGER_ENTRY_BATCHES,
+        )
+
+    def test_alliance_ledger_details(self):
+        self.assertQueryBudget(
+            self.build(
+                "get_alliance_ledger_details",
+                year=BENCHMARK_YEAR,
+                section="summary",
+                entity_id=None,
+            ),
+            per_item=0,
+        )
+
+    def test_alliance_ledger_summary(self):
+        self.assertQueryBudget(
+            self.build(
+                "get_alliance_ledger_summary",
+                {"start": f"{BENCHMARK_YEAR}-01-01", "end": f"{BENCHMARK_YEAR}-03-31"},
+            ),
+            per_item=0,
+        )
+
+    def test_alliance_dashboard(self):
+        self.assertQueryBudget(self.build("get_alliance_dashboard"), per_item=0)
+
+    def test_corporation_overview(self):
+        self.assertQueryBudget(
+            self.build("get_corporation_overview", owner=False), per_item=1
+        )
+
+    def test_alliance_overview(self):
+        self.assertQueryBudget(
+            self.build("get_alliance_overview", owner=False), per_item=2
+        )
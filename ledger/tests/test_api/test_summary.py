@@ -0,0 +1,205 @@
+# Standard Library
+from decimal import Decimal
+
+# Django
+from django.urls import reverse
+from django.utils import timezone
+
+# AA Ledger
+from ledger.tests import LedgerTestCase
+from ledger.tests.testdata.factory import (
+    CharacterJournalFactory,
+    CharacterOwnerFactory,
+    CorporationJournalFactory,
+    CorporationOwnerFactory,
+    DivisionFactory,
+)
+
+
+def aware(*args) -> timezone.datetime:
+    return timezone.make_aware(timezone.datetime(*args))
+
+
+class TestLedgerSummaryEndpoints(LedgerTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.owner = CharacterOwnerFactory(user=cls.user)
+        cls.corporation_owner = CorporationOwnerFactory(
+            user=cls.superuser,
+            eve_corporation=cls.superuser_character.corporation,
+        )
+        cls.division = DivisionFactory(corporation=cls.corporation_owner)
+
+    def get_summary(self, viewname: str, query: dict, **kwargs):
+        return self.client.get(reverse(f"ledger:api:{viewname}", kwargs=kwargs), query)
+
+    def add_bounty(self, date: timezone.datetime, amount: int):
+        CharacterJournalFactory(
+            character=self.owner, date=date, amount=amount, ref_type="bounty_prizes"
+        )
+
+    def test_character_summary_period_boundaries(self):
+        """
+        Test the character summary at the boundaries of the periods.
+
+        ### Expected Result
+        - Entries are summed up in the period of their date.
+        - Entries after the end date are excluded.
+        """
+        # Test Data
+        self.add_bounty(aware(2024, 12, 31, 23, 59, 59), 1000)
+        self.add_bounty(aware(2025, 1, 1), 100)
+        self.add_bounty(aware(2025, 1, 31, 23, 59, 59), 200)
+        self.add_bounty(aware(2025, 2, 1), 300)
+        self.add_bounty(aware(2025, 3, 1), 5000)
+        self.client.force_login(self.user)
+
+        # Test Action
+        response = self.get_summary(
+            "get_character_ledger_summary",
+            {"start": "2025-01-15", "end": "2025-02-28"},
+            character_id=self.user_character.character_id,
+        )
+
+        # Expected Result
+        self.assertEqual(response.status_code, 200)
+        periods = response.json()["periods"]
+        self.assertEqual(
+            [period["period"] for period in periods],
+            [
+                {"year": 2025, "month": 1, "day": None},
+                {"year": 2025, "month": 2, "day": None},
+            ],
+        )
+        self.assertEqual(
+            [Decimal(str(period["ledger"]["bounty"])) for period in periods],
+            [Decimal(300), Decimal(300)],
+        )
+
+    def test_character_summary_empty_periods(self):
+        """
+        Test the character summary with days without entries.
+
+        ### Expected Result
+        - Every day of the range is returned, days without entries are zero.
+        """
+        # Test Data
+        self.add_bounty(aware(2025, 3, 2, 12), 100)
+        self.client.force_login(self.user)
+
+        # Test Action
+        response = self.get_summary(
+            "get_character_ledger_summary",
+            {"start": "2025-03-01", "end": "2025-03-03", "granularity": "day"},
+            character_id=self.user_character.character_id,
+        )
+
+        # Expected Result
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [period["ledger"]["bounty"] for period in response.json()["periods"]],
+            [0, 100, 0],
+        )
+
+    def test_summary_start_after_end(self):
+        """
+        Test the summary endpoints with a start date after the end date.
+
+        ### Expected Result
+        - The endpoints return 400 with an error message.
+        """
+        self.client.force_login(self.superuser)
+        query = {"start": "2025-03-01", "end": "2025-02-01"}
+
+        for viewname, kwargs in [
+            (
+                "get_character_ledger_summary",
+                {"character_id": self.user_character.character_id},
+            ),
+            (
+                "get_corporation_ledger_summary",
+                {"corporation_id": self.superuser_character.corporation_id},
+            ),
+            (
+                "get_alliance_ledger_summary",
+                {"alliance_id": self.superuser_character.alliance_id},
+            ),
+        ]:
+            with self.subTest(viewname=viewname):
+                response = self.get_summary(viewname, query, **kwargs)
+
+                self.assertEqual(response.status_code, 400)
+                self.assertIn("error", response.json())
+
+    def test_summary_invalid_granularity(self):
+        """
+        Test the summary endpoint with an unknown granularity.
+
+        ### Expected Result
+        - The endpoint returns 400.
+        """
+        self.client.force_login(self.user)
+
+        response = self.get_summary(
+            "get_character_ledger_summary",
+            {"start": "2025-03-01", "granularity": "week"},
+            character_id=self.user_character.character_id,
+        )
+
+        self.assertEqual(response.status_code, 400)
+
+    def test_corporation_summary_year_boundaries(self):
+        """
+        Test the corporation summary at the boundaries of the years.
+
+        ### Expected Result
+        - Entries are summed up in the year of their date.
+        """
+        # Test Data
+        for date, amount in [
+            (aware(2024, 1, 1), 100),
+            (aware(2024, 12, 31, 23, 59, 59), 200),
+            (aware(2025, 1, 1), 400),
+        ]:
+            CorporationJournalFactory(
+                division=self.division,
+                date=date,
+                amount=amount,
+                ref_type="bounty_prizes",
+            )
+        self.client.force_login(self.superuser)
+
+        # Test Action
+        response = self.get_summary(
+            "get_corporation_ledger_summary",
+            {"start": "2024-06-01", "end": "2025-06-01", "granularity": "year"},
+            corporation_id=self.superuser_character.corporation_id,
+        )
+
+        # Expected Result
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [
+                (period["period"]["year"], period["ledger"]["bounty"])
+                for period in response.json()["periods"]
+            ],
+            [(2024, 300), (2025, 400)],
+        )
+
+    def test_character_summary_not_found(self):
+        """
+        Test the character summary of a character not in the Ledger.
+
+        ### Expected Result
+        - The endpoint returns 404.
+        """
+        self.client.force_login(self.user)
+
+        response = self.get_summary(
+            "get_character_ledger_summary",
+            {"start": "2025-03-01"},
+            character_id=self.user2_character.character_id,
+        )
+
+        self.assertEqual(response.status_code, 404)
@@ -0,0 +1,169 @@
+# Standard Library
+from unittest.mock import MagicMock, patch
+
+# Third Party
+from celery.exceptions import MaxRetriesExceededError
+
+# Django
+from django.test import override_settings
+
+# AA Ledger
+from ledger.helpers.esi_budget import (
+    ESIBudget,
+    acquire_current_esi_budget,
+    acquire_esi_budget,
+    charge_current_esi_pages,
+    esi_budget,
+)
+from ledger.tests import LedgerTestCase
+
+MODULE_PATH = "ledger.helpers.esi_budget"
+
+LOCMEM_CACHE = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "ledger-esi-budget",
+    }
+}
+
+
+@override_settings(CACHES=LOCMEM_CACHE)
+class TestESIBudget(LedgerTestCase):
+    def test_acquire_until_exhausted(self):
+        """
+        Test that tokens are acquired until the budget is exhausted.
+
+        ### Expected Result
+        - Tokens within the budget are acquired.
+        - Exhausted budget returns the seconds until the window is refilled.
+        """
+        budget = ESIBudget("test-acquire", tokens=2, window=60)
+
+        self.assertEqual(budget.acquire(), 0)
+        self.assertEqual(budget.acquire(), 0)
+        self.assertEqual(budget.remaining(), 0)
+        wait = budget.acquire()
+
+        self.assertGreater(wait, 0)
+        self.assertLessEqual(wait, 60)
+
+    def test_budget_shared_between_instances(self):
+        """
+        Test that the budget is shared between instances of the same group.
+
+        ### Expected Result
+        - Tokens acquired by one instance are not available to another one.
+        - Other groups have their own budget.
+        """
+        ESIBudget("test-shared", tokens=1, window=60).acquire()
+
+        self.assertGreater(ESIBudget("test-shared", tokens=1, window=60).acquire(), 0)
+        self.assertEqual(ESIBudget("test-other", tokens=1, window=60).acquire(), 0)
+
+    def test_group_without_budget_is_not_limited(self):
+        """
+        Test that groups without a budget are not limited.
+
+        ### Expected Result
+        - Tokens are always acquired.
+        """
+        budget = ESIBudget("test-unlimited", tokens=0)
+
+        self.assertEqual(budget.acquire(), 0)
+        self.assertIsNone(budget.remaining())
+
+    @patch(MODULE_PATH + ".time.sleep")
+    @patch(MODULE_PATH + ".ESIBudget.acquire")
+    def test_acquire_esi_budget_sleeps(self, mock_acquire, mock_sleep):
+        """
+        Test that the task waits if the budget is refilled soon.
+
+        ### Expected Result
+        - The task sleeps and acquires the budget again.
+        """
+        mock_acquire.side_effect = [1.5, 0]
+        task = MagicMock()
+
+        acquire_esi_budget(task, "char-wallet")
+
+        mock_sleep.assert_called_once_with(1.5)
+        task.retry.assert_not_called()
+
+    @patch(MODULE_PATH + ".ESIBudget.acquire")
+    def test_acquire_esi_budget_requeues(self, mock_acquire):
+        """
+        Test that the task is requeued if the budget is exhausted.
+
+        ### Expected Result
+        - The task is retried after the window is refilled.
+        """
+        mock_acquire.return_value = 30
+        task = MagicMock(max_retries=3)
+        task.request.retries = 0
+        task.retry.return_value = Exception("Retry")
+
+        with self.assertRaises(Exception):
+            acquire_esi_budget(task, "char-wallet")
+
+        task.retry.assert_called_once()
+        self.assertGreaterEqual(task.retry.call_args.kwargs["countdown"], 30)
+        self.assertNotIn("max_retries", task.retry.call_args.kwargs)
+
+    @patch(MODULE_PATH + ".logger")
+    @patch(MODULE_PATH + ".ESIBudget.acquire")
+    def test_acquire_esi_budget_gives_up(self, mock_acquire, mock_logger):
+        """
+        Test that the task gives up after its max retries.
+
+        ### Expected Result
+        - The task logs a warning and Celery raises MaxRetriesExceededError.
+        """
+        mock_acquire.return_value = 30
+        task = MagicMock(max_retries=3)
+        task.request.retries = 3
+        task.retry.side_effect = MaxRetriesExceededError()
+
+        with self.assertRaises(MaxRetriesExceededError):
+            acquire_esi_budget(task, "char-wallet")
+
+        mock_logger.warning.assert_called_once()
+
+    @patch(MODULE_PATH + ".acquire_esi_budget")
+    def test_acquire_current_esi_budget(self, mock_acquire_esi_budget):
+        """
+        Test that ESI operations acquire the budget of the current context.
+
+        ### Expected Result
+        - Each ESI operation within the context acquires the budget of its group.
+        - ESI operations outside of a context are not limited.
+        """
+        task = MagicMock()
+
+        with esi_budget(task, "char-planets"):
+            acquire_current_esi_budget()
+            acquire_current_esi_budget()
+        acquire_current_esi_budget()
+
+        self.assertEqual(mock_acquire_esi_budget.call_count, 2)
+        mock_acquire_esi_budget.assert_called_with(task, "char-planets")
+
+    @patch(MODULE_PATH + ".LEDGER_ESI_BUDGET", {"test-pages": 10})
+    def test_charge_current_esi_pages(self):
+        """
+        Test that the additional pages of an ESI operation are charged to the budget.
+
+        ### Expected Result
+        - Pages after the first one are charged to the budget of the current context.
+        - Pages outside of a context are not charged.
+        """
+        budget = ESIBudget("test-pages")
+
+        charge_current_esi_pages({"X-Pages": "3"})
+        self.assertEqual(budget.remaining(), 10)
+
+        with esi_budget(MagicMock(), "test-pages"):
+            charge_current_esi_pages({"X-Pages": "1"})
+            self.assertEqual(budget.remaining(), 10)
+            charge_current_esi_pages({"X-Pages": "4"})
+
+        self.assertEqual(budget.remaining(), 7)
@@ -1,3 +1,6 @@
+# Django
+from django.utils import timezone
+
 # AA Ledger
 from ledger.tests import LedgerTestCase
 
@@ -17,3 +20,20 @@ class TestCharacterWalletJournalModel(LedgerTestCase):
         self.assertEqual(get_footer_text_class(-10), "text-danger")
         self.assertEqual(get_footer_text_class(0), "")
         self.assertEqual(get_footer_text_class(10, mining=True), "text-info")
+
+    def test_get_period_key(self):
+        # AA Ledger
+        from ledger.helpers.ledger_data import get_period_key
+
+        date = timezone.datetime(2025, 3, 14)
+
+        self.assertEqual(get_period_key(date, "year"), (2025, None, None))
+        self.assertEqual(get_period_key(date, "month"), (2025, 3, None))
+        self.assertEqual(get_period_key(date, "day"), (2025, 3, 14))
+
+    def test_get_period_trunc_invalid(self):
+        # AA Ledger
+        from ledger.helpers.ledger_data import get_period_trunc
+
+        with self.assertRaises(ValueError):
+            get_period_trunc("week")
@@ -0,0 +1,173 @@
+# Standard Library
+from unittest.mock import patch
+
+# Django
+from django.core.cache import cache
+
+# AA Ledger
+from ledger.helpers import metrics
+from ledger.tests import LedgerTestCase
+
+MODULE_PATH = "ledger.helpers.metrics"
+
+
+class TestMetrics(LedgerTestCase):
+    def setUp(self):
+        super().setUp()
+        metrics.registry.reset()
+        metrics.registry._slot_key = None
+        cache.delete(metrics.METRICS_SLOTS_KEY)
+
+    def test_render_histogram_cumulative_buckets(self):
+        """
+        Test that histograms are rendered with cumulative buckets.
+
+        ### Expected Result
+        - Buckets count all values lower or equal to the bound.
+        - Sum and count are rendered.
+        """
+        registry = metrics.MetricsRegistry()
+        registry.observe("ledger_section_duration_seconds", {"section": "a"}, 0.2)
+        registry.observe("ledger_section_duration_seconds", {"section": "a"}, 3)
+
+        output = metrics.render_prometheus([registry.snapshot()])
+
+        self.assertIn("# TYPE ledger_section_duration_seconds histogram", output)
+        self.assertIn(
+            'ledger_section_duration_seconds_bucket{section="a",le="0.1"} 0', output
+        )
+        self.assertIn(
+            'ledger_section_duration_seconds_bucket{section="a",le="0.25"} 1', output
+        )
+        self.assertIn(
+            'ledger_section_duration_seconds_bucket{section="a",le="+Inf"} 2', output
+        )
+        self.assertIn('ledger_section_duration_seconds_sum{section="a"} 3.2', output)
+        self.assertIn('ledger_section_duration_seconds_count{section="a"} 2', output)
+
+    def test_section_update_records_phases(self):
+        """
+        Test that a section update records its duration, phases, rows and result.
+
+        ### Expected Result
+        - ESI requests are added to the fetch phase of the section.
+        - Rows of the write phase are counted.
+        - The result of the section update is counted.
+        """
+        with metrics.section_update("character", "wallet_journal") as state:
+            metrics.record_esi_request("GetWalletJournal", 304, 0.5)
+            metrics.add_phase("write", 0.1, rows=25)
+            state["result"] = "not_modified"
+
+        output = metrics.render_prometheus([metrics.registry.snapshot()])
+        labels = 'owner_type="character",section="wallet_journal"'
+
+        self.assertIn(
+            f'ledger_esi_requests_total{{operation="GetWalletJournal",{labels},'
+            'status_code="304"} 1',
+            output,
+        )
+        self.assertIn(
+            'ledger_section_phase_duration_seconds_sum{owner_type="character",'
+            'phase="fetch",section="wallet_journal"} 0.5',
+            output,
+        )
+        self.assertIn(f"ledger_section_rows_total{{{labels}}} 25", output)
+        self.assertIn(
+            'ledger_section_updates_total{owner_type="character",'
+            'result="not_modified",section="wallet_journal"} 1',
+            output,
+        )
+        self.assertIn(f"ledger_section_duration_seconds_count{{{labels}}} 1", output)
+
+    def test_section_update_error(self):
+        """
+        Test that a failed section update is counted as error.
+
+        ### Expected Result
+        - The exception is raised and the result is error.
+        """
+        with self.assertRaises(ValueError):
+            with metrics.section_update("corporation", "wallet_journal"):
+                raise ValueError("Failed")
+
+        output = metrics.render_prometheus([metrics.registry.snapshot()])
+
+        self.assertIn(
+            'ledger_section_updates_total{owner_type="corporation",'
+            'result="error",section="wallet_journal"} 1',
+            output,
+        )
+
+    def test_collect_metrics_merges_processes(self):
+        """
+        Test that the metrics of all processes are merged.
+
+        ### Expected Result
+        - Counters of other processes flushed to the cache are summed up.
+        """
+        worker = metrics.MetricsRegistry()
+        worker.inc("ledger_task_retries_total", {"issue": "ESIBudget"}, 2)
+        worker.flush(force=True)
+        metrics.record_retry("ESIBudget")
+
+        output = metrics.collect_metrics()
+
+        self.assertIn('ledger_task_retries_total{issue="ESIBudget"} 3', output)
+
+    def test_flush_uses_own_slot_per_process(self):
+        """
+        Test that every process flushes its metrics to its own slot.
+
+        ### Expected Result
+        - Each registry has its own slot.
+        - Flushing one registry does not remove the metrics of another.
+        """
+        first = metrics.MetricsRegistry()
+        second = metrics.MetricsRegistry()
+        first.inc("ledger_task_retries_total", {"issue": "first"})
+        second.inc("ledger_task_retries_total", {"issue": "second"})
+
+        first.flush(force=True)
+        second.flush(force=True)
+        first.flush(force=True)
+
+        self.assertNotEqual(first._slot_key, second._slot_key)
+        self.assertCountEqual(
+            cache.get(metrics.METRICS_SLOTS_KEY), [first._slot_key, second._slot_key]
+        )
+        output = metrics.collect_metrics()
+        self.assertIn('ledger_task_retries_total{issue="first"} 1', output)
+        self.assertIn('ledger_task_retries_total{issue="second"} 1', output)
+
+    @patch(MODULE_PATH + ".time.time")
+    def test_expired_slots_are_forgotten(self, mock_time):
+        """
+        Test that the slots of stopped processes are forgotten once they expire.
+
+        ### Expected Result
+        - Only live slots are registered and collected.
+        """
+        mock_time.return_value = 1000
+        stopped = metrics.MetricsRegistry()
+        stopped.inc("ledger_task_retries_total", {"issue": "stopped"})
+        stopped.flush(force=True)
+
+        mock_time.return_value = 1000 + metrics.METRICS_TIMEOUT + 1
+        live = metrics.MetricsRegistry()
+        live.flush(force=True)
+
+        self.assertEqual(list(cache.get(metrics.METRICS_SLOTS_KEY)), [live._slot_key])
+        self.assertNotIn('issue="stopped"', metrics.collect_metrics())
+
+    def test_esi_request_outside_section_update(self):
+        """
+        Test that ESI requests outside of a section update are ignored.
+
+        ### Expected Result
+        - Requests of Alliance Auth or other apps are not recorded.
+        """
+        metrics.record_esi_request("GetCharactersCharacterId", 200, 0.5)
+
+        self.assertEqual(metrics.registry.snapshot()["counters"], {})
+        self.assertEqual(metrics.registry.snapshot()["histograms"], {})
@@ -0,0 +1,127 @@
+# Standard Library
+from unittest.mock import patch
+
+# Alliance Auth
+from allianceauth.eveonline.models import EveCharacter
+
+# AA Ledger
+from ledger.helpers.permissions import (
+    PermissionResolver,
+    get_permission_generation,
+    invalidate_permission_cache,
+)
+from ledger.tests import LedgerTestCase
+from ledger.tests.testdata.factory import (
+    CorporationOwnerFactory,
+    EveCharacterFactory,
+)
+from ledger.tests.testdata.utils import add_character_to_user
+
+MODULE_PATH = "ledger.helpers.permissions"
+
+
+class TestPermissionResolver(LedgerTestCase):
+    def setUp(self):
+        super().setUp()
+        # Cached ID sets outlive the rolled back test transaction
+        invalidate_permission_cache()
+
+    def test_superuser_can_view_everything(self):
+        resolver = PermissionResolver(self.superuser)
+
+        self.assertIsNone(resolver.visible_character_ids())
+        self.assertIsNone(resolver.visible_corporation_ids())
+        self.assertTrue(resolver.can_view_character(9999))
+
+    def test_user_can_view_own_characters(self):
+        resolver = PermissionResolver(self.user)
+        character_ids = set(
+            self.user.character_ownerships.values_list(
+                "character__character_id", flat=True
+            )
+        )
+
+        self.assertEqual(resolver.visible_character_ids(), character_ids)
+        self.assertTrue(resolver.can_view_character(self.user_character.character_id))
+        self.assertFalse(resolver.can_view_character(self.user2_character.character_id))
+
+    def test_for_request_memoizes_resolver(self):
+        request = self.factory.get("/")
+        request.user = self.user
+
+        resolver = PermissionResolver.for_request(request)
+
+        self.assertIs(PermissionResolver.for_request(request), resolver)
+
+    @patch(MODULE_PATH + ".cache")
+    def test_visible_ids_are_memoized(self, mock_cache):
+        mock_cache.get.return_value = None
+        mock_cache.get_or_set.return_value = "generation"
+        resolver = PermissionResolver(self.user)
+
+        resolver.visible_character_ids()
+        resolver.visible_character_ids()
+
+        mock_cache.get.assert_called_once_with(
+            f"ledger-visible-characters-{self.user.pk}-generation"
+        )
+        mock_cache.set.assert_called_once()
+
+    def test_invalidate_permission_cache(self):
+        generation = get_permission_generation()
+
+        invalidate_permission_cache()
+
+        self.assertNotEqual(get_permission_generation(), generation)
+
+    def test_ownership_change_invalidates_visible_ids(self):
+        character_ids = PermissionResolver(self.user).visible_character_ids()
+
+        character = EveCharacterFactory()
+        add_character_to_user(self.user, character)
+
+        self.assertEqual(
+            PermissionResolver(self.user).visible_character_ids(),
+            character_ids | {character.character_id},
+        )
+
+
+class TestPermissionCacheSignals(LedgerTestCase):
+    @patch("ledger.signals.invalidate_permission_cache")
+    def test_unchanged_affiliation_keeps_cache(self, mock_invalidate):
+        character = EveCharacter.objects.get(pk=self.user_character.pk)
+
+        # Alliance Auth saves the affiliation fields on every refresh
+        character.save(update_fields=["corporation_id", "alliance_id", "faction_id"])
+        character.character_name = "Renamed"
+        character.save()
+
+        mock_invalidate.assert_not_called()
+
+    @patch("ledger.signals.invalidate_permission_cache")
+    def test_changed_affiliation_invalidates_cache(self, mock_invalidate):
+        character = EveCharacter.objects.get(pk=self.user_character.pk)
+
+        character.corporation_id = self.user2_character.corporation_id
+        character.save(update_fields=["corporation_id"])
+
+        mock_invalidate.assert_called_once()
+
+    @patch("ledger.signals.invalidate_permission_cache")
+    def test_unrelated_update_fields_keep_cache(self, mock_invalidate):
+        character = EveCharacter.objects.get(pk=self.user_character.pk)
+
+        character.corporation_id = self.user2_character.corporation_id
+        character.save(update_fields=["character_name"])
+
+        mock_invalidate.assert_not_called()
+
+    @patch("ledger.signals.invalidate_permission_cache")
+    def test_corporation_owner_saves(self, mock_invalidate):
+        corporation_owner = CorporationOwnerFactory()
+        mock_invalidate.assert_called()
+        mock_invalidate.reset_mock()
+
+        corporation_owner.save()
+
+        mock_invalidate.assert_not_called()
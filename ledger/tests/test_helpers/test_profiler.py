@@ -0,0 +1,143 @@
+# Standard Library
+from unittest.mock import patch
+
+# Django
+from django.contrib.auth.models import User
+from django.http import HttpResponse
+from django.urls import reverse
+
+# AA Ledger
+from ledger.helpers.profiler import (
+    OTHER_PHASE,
+    RequestProfiler,
+    profile_api_request,
+    profile_phase,
+)
+from ledger.tests import LedgerTestCase
+
+MODULE_PATH = "ledger.helpers.profiler"
+
+
+@profile_api_request
+def profiled_view(request):
+    with profile_phase("permission"):
+        User.objects.exists()
+    return HttpResponse("OK")
+
+
+class TestRequestProfiler(LedgerTestCase):
+    def test_phases(self):
+        """
+        Test that queries and time are counted per phase.
+
+        ### Expected Result
+        - Queries are counted for the innermost phase.
+        - Nested phases are not counted twice.
+        - Time outside of a phase is counted as other.
+        """
+        profiler = RequestProfiler()
+
+        with profiler.profile():
+            with profile_phase("aggregation"):
+                User.objects.exists()
+                with profile_phase("billboard"):
+                    User.objects.count()
+                    User.objects.exists()
+            User.objects.count()
+
+        self.assertEqual(profiler.phases["aggregation"]["queries"], 1)
+        self.assertEqual(profiler.phases["billboard"]["queries"], 2)
+        self.assertEqual(profiler.phases[OTHER_PHASE]["queries"], 1)
+        self.assertAlmostEqual(
+            sum(values["duration"] for values in profiler.phases.values()),
+            profiler.duration,
+        )
+        server_timing = profiler.server_timing()
+        self.assertIn("aggregation;dur=", server_timing)
+        self.assertIn("billboard;dur=", server_timing)
+        self.assertIn("db;dur=", server_timing)
+        self.assertIn('desc="4 queries"', server_timing)
+
+    def test_profile_phase_without_profiler(self):
+        """
+        Test that phases are ignored if the request is not profiled.
+
+        ### Expected Result
+        - The phase runs without profiling.
+        """
+        with self.assertNumQueries(1):
+            with profile_phase("aggregation"):
+                User.objects.exists()
+
+    def test_superuser_header(self):
+        """
+        Test that superusers can profile a request with the profile header.
+
+        ### Expected Result
+        - The response contains the Server-Timing header.
+        """
+        request = self.factory.get("/", HTTP_X_LEDGER_PROFILE="1")
+        request.user = self.superuser
+
+        response = profiled_view(request)
+
+        self.assertIn("permission;dur=", response["Server-Timing"])
+        self.assertIn('desc="1 queries', response["Server-Timing"])
+
+    def test_header_without_superuser(self):
+        """
+        Test that other users can't profile a request.
+
+        ### Expected Result
+        - The response contains no Server-Timing header.
+        """
+        request = self.factory.get("/", HTTP_X_LEDGER_PROFILE="1")
+        request.user = self.user
+
+        response = profiled_view(request)
+
+        self.assertFalse(response.has_header("Server-Timing"))
+
+    @patch(MODULE_PATH + ".logger")
+    @patch(MODULE_PATH + ".LEDGER_API_PROFILING_SLOW_QUERIES", 1)
+    @patch(MODULE_PATH + ".LEDGER_API_PROFILING", True)
+    def test_profiling_setting_logs_slow_queries(self, mock_logger):
+        """
+        Test that all requests are profiled if enabled by setting.
+
+        ### Expected Result
+        - The response contains the Server-Timing header.
+        - The slowest query is logged with its EXPLAIN output.
+        """
+        request = self.factory.get("/")
+        request.user = self.user
+
+        response = profiled_view(request)
+
+        self.assertTrue(response.has_header("Server-Timing"))
+        mock_logger.info.assert_called_once()
+        self.assertEqual(mock_logger.info.call_args.args[1], "permission")
+        self.assertTrue(mock_logger.info.call_args.args[4])
+
+    def test_api_endpoint(self):
+        """
+        Test that the Ledger API endpoints are profiled.
+
+        ### Expected Result
+        - The response contains the Server-Timing header with the permission phase.
+        """
+        self.client.force_login(self.superuser)
+
+        response = self.client.get(
+            reverse(
+                "ledger:api:get_character_ledger",
+                kwargs={
+                    "character_id": self.superuser_character.character_id,
+                    "year": 2025,
+                },
+            ),
+            HTTP_X_LEDGER_PROFILE="1",
+        )
+
+        self.assertIn("permission;dur=", response["Server-Timing"])
+        self.assertIn("serialization;dur=", response["Server-Timing"])
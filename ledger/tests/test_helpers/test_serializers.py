@@ -0,0 +1,49 @@
+# Standard Library
+import datetime as dt
+from decimal import Decimal
+from unittest import skipUnless
+from unittest.mock import patch
+
+# Django
+from django.utils.translation import gettext_lazy as _
+
+# AA Ledger
+from ledger.helpers.serializers import json_compatible, json_dumps, orjson_installed
+from ledger.tests import LedgerTestCase
+
+MODULE_PATH = "ledger.helpers.serializers"
+
+
+class TestSerializers(LedgerTestCase):
+    def test_json_compatible(self):
+        data = {"amount": Decimal("10.50"), "name": _("Bounty"), "values": [Decimal(1)]}
+
+        result = json_compatible(data)
+
+        self.assertEqual(result, {"amount": 10.5, "name": "Bounty", "values": [1.0]})
+        self.assertIsInstance(result["name"], str)
+
+    @patch(MODULE_PATH + ".LedgerJSONEncoder.default")
+    def test_json_dumps_compatible_data_without_default(self, mock_default):
+        """Converted data is serialized without the encoder fallback."""
+        data = {"amount": Decimal("10.50"), "values": [Decimal(1)]}
+
+        self.assertEqual(
+            json_dumps(json_compatible(data)).replace(b" ", b""),
+            b'{"amount":10.5,"values":[1.0]}',
+        )
+        mock_default.assert_not_called()
+
+    @skipUnless(orjson_installed(), "orjson is not installed")
+    def test_json_dumps_datetime(self):
+        date = dt.datetime(2025, 1, 1, 12, 0, tzinfo=dt.timezone.utc)
+
+        self.assertEqual(json_dumps({"date": date}), b'{"date":"2025-01-01T12:00:00Z"}')
+
+    @patch(MODULE_PATH + ".orjson", None)
+    def test_json_dumps_datetime_without_orjson(self):
+        date = dt.datetime(2025, 1, 1, 12, 0, tzinfo=dt.timezone.utc)
+
+        self.assertEqual(
+            json_dumps({"date": date}), b'{"date": "2025-01-01T12:00:00Z"}'
+        )
@@ -0,0 +1,58 @@
+# AA Ledger
+from ledger.tests import NoSocketsTestCase
+from ledger.tests.benchmarks.importtime import imported_by, measure_imports
+
+# Modules only needed to serve requests or to call ESI
+DEFERRED_MODULES = {
+    "celery",
+    "esi.openapi_clients",
+    "ledger.api",
+    "ledger.helpers.billboard",
+    "ledger.views",
+}
+
+
+def is_deferred(module: str) -> bool:
+    return any(
+        module == deferred or module.startswith(f"{deferred}.")
+        for deferred in DEFERRED_MODULES
+    )
+
+
+class TestImportGraph(NoSocketsTestCase):
+    """Test the modules imported on the app startup."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.imports = measure_imports()
+
+    def test_startup_does_not_import_api(self):
+        """
+        Test should not import the API & views on `django.setup()`.
+
+        ### Expected Result
+        - No API, view or billboard module is imported.
+        """
+        # Test Action
+        modules = {entry.module for entry in self.imports}
+
+        # Expected Result
+        self.assertIn("ledger.models.characteraudit", modules)
+        for module in ("ledger.api", "ledger.views", "ledger.helpers.billboard"):
+            self.assertNotIn(module, modules)
+
+    def test_models_do_not_import_esi_client(self):
+        """
+        Test should not import the ESI client or the API from the models.
+
+        ### Expected Result
+        - No deferred module is first imported by `ledger.models` or the managers.
+        """
+        # Test Action
+        modules = imported_by(self.imports, "ledger.models") | imported_by(
+            self.imports, "ledger.managers"
+        )
+
+        # Expected Result
+        self.assertEqual(sorted(filter(is_deferred, modules)), [])
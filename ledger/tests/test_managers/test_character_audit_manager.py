@@ -153,6 +153,8 @@ class TestCharacterAnnotateTotalUpdateStatus(LedgerTestCase):
             last_update_at=timezone.now(),
             last_update_finished_at=timezone.now(),
         )
+        # Bulk updates bypass the signals storing the total update status
+        CharacterOwner.objects.update_total_update_status()
 
         # Test Action
         update_status = CharacterOwner.objects.annotate_total_update_status()
@@ -226,3 +228,108 @@ class TestCharacterAnnotateTotalUpdateStatus(LedgerTestCase):
 
         # Expected Result
         self.assertEqual(obj.total_update_status, UpdateStatus.ERROR)
+
+
+class TestCharacterDueForUpdate(LedgerTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.fresh_character = CharacterOwnerFactory(user=cls.user)
+        cls.due_character = CharacterOwnerFactory(user=cls.user2)
+        cls.new_character = CharacterOwnerFactory(user=cls.superuser)
+        for section in CharacterUpdateSection.get_sections():
+            CharacterUpdateStatusFactory(
+                owner=cls.fresh_character,
+                section=section,
+                last_update_finished_at=timezone.now(),
+            )
+            CharacterUpdateStatusFactory(
+                owner=cls.due_character,
+                section=section,
+                last_update_finished_at=timezone.now() - timezone.timedelta(days=1),
+            )
+
+    def test_next_due_at(self):
+        """
+        Test that next_due_at is calculated from the stale time of the section.
+
+        ### Results:
+        - Fresh sections are due after the stale time.
+        - Sections with token errors are never due.
+        """
+        status = self.fresh_character.ledger_update_status.get(
+            section=CharacterUpdateSection.WALLET_JOURNAL
+        )
+        self.assertEqual(
+            status.next_due_at,
+            status.last_update_finished_at + timezone.timedelta(minutes=30),
+        )
+
+        status.has_token_error = True
+        status.save()
+        status.refresh_from_db()
+        self.assertIsNone(status.next_due_at)
+
+    def test_due_for_update(self):
+        """
+        Test that only the due sections of the characters are returned.
+
+        ### Results:
+        - Characters without update status are not due.
+        - Added characters are due with all sections, then overdue characters.
+        - Characters with fresh sections are not returned.
+        """
+        sections = CharacterUpdateSection.get_sections()
+        self.assertEqual(
+            CharacterOwner.objects.due_for_update(10),
+            {self.due_character.eve_id: sections},
+        )
+
+        created = self.new_character.update_manager.create_update_status()
+
+        self.assertEqual(created, len(sections))
+        due_sections = CharacterOwner.objects.due_for_update(10)
+        self.assertEqual(
+            list(due_sections), [self.due_character.eve_id, self.new_character.eve_id]
+        )
+        self.assertCountEqual(due_sections[self.new_character.eve_id], sections)
+        self.assertEqual(
+            list(CharacterOwner.objects.due_for_update(1)), [self.due_character.eve_id]
+        )
+
+    def test_due_for_update_section(self):
+        """
+        Test that only the due sections of a character are returned.
+
+        ### Results:
+        - The fresh sections of an overdue character are not returned.
+        """
+        self.due_character.ledger_update_status.filter(
+            section=CharacterUpdateSection.WALLET_JOURNAL
+        ).update(next_due_at=timezone.now() + timezone.timedelta(hours=1))
+
+        self.assertNotIn(
+            CharacterUpdateSection.WALLET_JOURNAL,
+            CharacterOwner.objects.due_for_update(10)[self.due_character.eve_id],
+        )
+
+    def test_create_missing_update_status(self):
+        """
+        Test that the missing update status of each section is created.
+
+        ### Results:
+        - Only the missing sections are created and due now.
+        """
+        self.due_character.ledger_update_status.filter(
+            section=CharacterUpdateSection.PLANETS
+        ).delete()
+
+        created = CharacterOwner.objects.filter(
+            pk__in=[self.due_character.pk, self.fresh_character.pk]
+        ).create_missing_update_status()
+
+        self.assertEqual(created, 1)
+        status = self.due_character.ledger_update_status.get(
+            section=CharacterUpdateSection.PLANETS
+        )
+        self.assertLessEqual(status.next_due_at, timezone.now())
@@ -201,3 +201,35 @@ class TestCharacterJournalManagerAggregate(LedgerTestCase):
             ref_type=["player_donation"], income=True
         )
         self.assertEqual(result, 1000.00)
+
+    def test_aggregate_by_period(self):
+        """Test aggregating amounts grouped by period."""
+        character = self.journal_entry.character
+        CharacterJournalFactory(
+            character=character,
+            amount=500,
+            ref_type="bounty_prizes",
+            date=timezone.make_aware(timezone.datetime(2025, 1, 10)),
+        )
+        CharacterJournalFactory(
+            character=character,
+            amount=-200,
+            ref_type="player_donation",
+            date=timezone.make_aware(timezone.datetime(2025, 1, 20)),
+        )
+        CharacterJournalFactory(
+            character=character,
+            amount=300,
+            ref_type="bounty_prizes",
+            date=timezone.make_aware(timezone.datetime(2025, 2, 5)),
+        )
+
+        result = character.ledger_character_journal.filter(
+            date__year=2025
+        ).aggregate_by_period("month")
+
+        self.assertEqual(set(result), {(2025, 1, None), (2025, 2, None)})
+        self.assertEqual(result[(2025, 1, None)]["bounty"], 500)
+        self.assertEqual(result[(2025, 1, None)]["costs"], -200)
+        self.assertEqual(result[(2025, 1, None)]["miscellaneous"], 0)
+        self.assertEqual(result[(2025, 2, None)]["bounty"], 300)
@@ -5,9 +5,14 @@ from unittest.mock import MagicMock, patch
 # Third Party
 import pook
 
+# Django
+from django.utils import timezone
+
 # AA Ledger
+from ledger.models.characteraudit import CharacterMiningLedger
 from ledger.tests import LedgerTestCase
 from ledger.tests.testdata.factory import (
+    CharacterMiningLedgerFactory,
     CharacterOwnerFactory,
     ItemTypeFactory,
     SolarSystemFactory,
@@ -65,3 +70,34 @@ class TestCharacterMiningManager(LedgerTestCase):
         self.assertEqual(obj.quantity, 5000)
         self.assertEqual(obj.system_id, 30004783)
         self.assertEqual(obj.type_id, 17425)
+
+    def test_update_mining_price_constant_queries(self, _):
+        """
+        Test the missing prices are set with a constant number of queries.
+
+        ### Expected Result
+        - Query count does not depend on the number of entries & types.
+        - Every entry without a price gets the price of its type.
+        """
+        for number_of_types in (2, 20):
+            with self.subTest(number_of_types=number_of_types):
+                CharacterMiningLedger.objects.all().delete()
+                entries = [
+                    CharacterMiningLedgerFactory(
+                        character=self.audit,
+                        date=timezone.now() - timezone.timedelta(days=1),
+                        price_per_unit=None,
+                    )
+                    for _ in range(number_of_types)
+                ]
+
+                # Entries, type names, prices, bulk update
+                with self.assertNumQueries(4):
+                    CharacterMiningLedger.objects._update_mining_price(owner=self.audit)
+
+                for entry in entries:
+                    entry.refresh_from_db()
+                    self.assertIsNotNone(entry.price_per_unit)
+                    self.assertAlmostEqual(
+                        float(entry.price_per_unit), entry.get_npc_price(), places=2
+                    )
@@ -1,13 +1,22 @@
 # Standard Library
 from http import HTTPStatus
 from types import SimpleNamespace
+from unittest.mock import patch
 
 # Third Party
 import pook
 
+# Django
+from django.core.cache import cache
+
+# Alliance Auth
+from esi.exceptions import HTTPNotModified
+
 # AA Ledger
+from ledger.managers.general_manager import MARKET_PRICES_HASH_KEY
 from ledger.models.general import EveEntity, EveMarketPrice
 from ledger.tests import LedgerTestCase
+from ledger.tests.testdata.factory import ItemTypeFactory
 
 MODULE_PATH = "ledger.managers.general_manager"
 
@@ -188,3 +197,132 @@ class TestGeneralManager(LedgerTestCase):
         self.assertEqual(result, 1)
         self.assertEqual(updated_obj.average_price, 42.0)
         self.assertEqual(updated_obj.adjusted_price, 84.0)
+
+
+class TestEveMarketPriceManager(LedgerTestCase):
+    def setUp(self):
+        super().setUp()
+        # The stored hash outlives the rolled back test transaction
+        cache.delete(MARKET_PRICES_HASH_KEY)
+
+    def test_update_objs_from_esi_skips_unchanged_market_price(self):
+        """Test unchanged EveMarketPrice entries are not written."""
+        EveMarketPrice.objects.create(
+            eve_type=ItemTypeFactory(id=17425, name="Tritanium"),
+            average_price=42.0,
+            adjusted_price=84.0,
+        )
+
+        with patch(MODULE_PATH + ".EveMarketPriceManager.bulk_update") as mock_update:
+            result = EveMarketPrice.objects.update_objs_from_esi(
+                [
+                    SimpleNamespace(
+                        type_id=17425,
+                        average_price=42.0,
+                        adjusted_price=84.0,
+                    )
+                ]
+            )
+
+        self.assertEqual(result, 0)
+        mock_update.assert_not_called()
+
+    @patch(MODULE_PATH + ".EveMarketPriceManager.update_objs_from_esi")
+    @patch(MODULE_PATH + ".EveMarketPriceManager.fetch_data_from_esi")
+    def test_update_from_esi_not_modified(self, mock_fetch, mock_update_objs):
+        """Test market prices are not written if ESI returns Not Modified."""
+        mock_fetch.side_effect = HTTPNotModified(304, {})
+
+        result = EveMarketPrice.objects.update_from_esi()
+
+        self.assertEqual(result, 0)
+        mock_update_objs.assert_not_called()
+
+    @patch(MODULE_PATH + ".EveMarketPriceManager.update_objs_from_esi")
+    @patch(MODULE_PATH + ".EveMarketPriceManager.fetch_data_from_esi")
+    def test_update_from_esi_unchanged_hash(self, mock_fetch, mock_update_objs):
+        """Test market prices are only written if the hash of the prices changed."""
+        prices = [SimpleNamespace(type_id=17425, average_price=1.0, adjusted_price=2.0)]
+        mock_fetch.return_value = prices
+        mock_update_objs.return_value = 1
+
+        self.assertEqual(EveMarketPrice.objects.update_from_esi(), 1)
+        self.assertEqual(EveMarketPrice.objects.update_from_esi(), 0)
+        self.assertEqual(EveMarketPrice.objects.update_from_esi(force_refresh=True), 1)
+        self.assertEqual(mock_update_objs.call_count, 2)
+
+    def test_update_objs_from_esi_constant_queries(self):
+        """
+        Test new EveMarketPrice entries are created with a constant number of queries.
+
+        ### Expected Result
+        - Query count does not depend on the number of new types.
+        - Types unknown to the SDE are skipped.
+        """
+        for number_of_types in (2, 20):
+            with self.subTest(number_of_types=number_of_types):
+                EveMarketPrice.objects.all().delete()
+                type_ids = [100000 + i for i in range(number_of_types)]
+                for type_id in type_ids:
+                    ItemTypeFactory(id=type_id)
+                prices = [
+                    SimpleNamespace(
+                        type_id=type_id, average_price=1.0, adjusted_price=2.0
+                    )
+                    for type_id in [*type_ids, 99999999]
+                ]
+
+                # Current prices, known types, bulk create
+                with self.assertNumQueries(3):
+                    result = EveMarketPrice.objects.update_objs_from_esi(prices)
+
+                self.assertEqual(result, number_of_types)
+                self.assertFalse(
+                    EveMarketPrice.objects.filter(eve_type_id=99999999).exists()
+                )
+
+    def test_get_npc_prices(self):
+        """
+        Test the NPC prices are resolved for all types with two queries.
+
+        ### Expected Result
+        - The price of the compressed variant is used if there is one.
+        - The price of the type is used if the compressed variant has no price.
+        - Types without any price are missing.
+        """
+        veldspar = ItemTypeFactory(id=1230, name="Veldspar")
+        compressed_veldspar = ItemTypeFactory(id=62516, name="Compressed Veldspar")
+        scordite = ItemTypeFactory(id=1228, name="Scordite")
+        pyroxeres = ItemTypeFactory(id=1224, name="Pyroxeres")
+        EveMarketPrice.objects.create(eve_type=veldspar, average_price=10.0)
+        EveMarketPrice.objects.create(
+            eve_type=compressed_veldspar, average_price=1000.0
+        )
+        EveMarketPrice.objects.create(eve_type=scordite, average_price=20.0)
+
+        with self.assertNumQueries(2):
+            prices = EveMarketPrice.objects.get_npc_prices(
+                [veldspar.id, scordite.id, pyroxeres.id]
+            )
+
+        self.assertEqual(prices, {veldspar.id: 1000.0, scordite.id: 20.0})
+
+    @patch(MODULE_PATH + ".LEDGER_USE_COMPRESSED", False)
+    def test_get_npc_prices_without_compressed(self):
+        """
+        Test the NPC prices of the types are used if compressed prices are disabled.
+
+        ### Expected Result
+        - The price of the type is used with a single query.
+        """
+        veldspar = ItemTypeFactory(id=1230, name="Veldspar")
+        compressed_veldspar = ItemTypeFactory(id=62516, name="Compressed Veldspar")
+        EveMarketPrice.objects.create(eve_type=veldspar, average_price=10.0)
+        EveMarketPrice.objects.create(
+            eve_type=compressed_veldspar, average_price=1000.0
+        )
+
+        with self.assertNumQueries(1):
+            prices = EveMarketPrice.objects.get_npc_prices([veldspar.id])
+
+        self.assertEqual(prices, {veldspar.id: 10.0})
@@ -9,6 +9,7 @@ from ledger.api.corporation import LedgerEntitySchema
 from ledger.api.schema import CorporationLedgerRequestInfo, EntitySchema, LedgerSchema
 from ledger.models import (
     CorporationBillboardEntry,
+    CorporationLedgerEntry,
     CorporationWalletJournalEntry,
     EveEntity,
 )
@@ -110,3 +111,53 @@ class TestBillboardEntryManager(LedgerTestCase):
         self.assertEqual(billboard_entry.day, 30)
         self.assertIsNotNone(billboard_entry.xy_billboard)
         self.assertIsNotNone(billboard_entry.chord_billboard)
+
+
+class TestLedgerEntryManager(LedgerTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.audit = CorporationOwnerFactory(user=cls.user)
+
+    def test_bulk_update_or_create(self):
+        """
+        Test the bulk_update_or_create method of the LedgerEntryManager.
+
+        ### Expected Result
+        - New ledger entries are created and changed ledger entries are updated.
+        - The updated ledger entries are marked as updated.
+        - Ledger entries of other periods are not returned for the requested period.
+        """
+        # Test Data
+        request_info = CorporationLedgerRequestInfo(
+            owner_id=self.audit.eve_id, year=2024, month=6
+        )
+        existing = CorporationLedgerEntry.objects.create(
+            owner=self.audit, entity_id=1, year=2024, month=6, bounty=100
+        )
+        CorporationLedgerEntry.objects.create(
+            owner=self.audit, entity_id=1, year=2024, month=5, bounty=50
+        )
+        last_updated = existing.last_updated
+        existing.bounty = 200
+        new = CorporationLedgerEntry(
+            owner=self.audit, entity_id=2, year=2024, month=6, bounty=300
+        )
+
+        # Test Action
+        with self.assertNumQueries(2):
+            CorporationLedgerEntry.objects.bulk_update_or_create(
+                [existing, new], fields=["bounty"]
+            )
+
+        # Expected Result
+        entries = {
+            entry.entity_id: entry
+            for entry in CorporationLedgerEntry.objects.filter_request_period(
+                request_info
+            )
+        }
+        self.assertEqual(entries[1].bounty, 200)
+        self.assertGreater(entries[1].last_updated, last_updated)
+        self.assertEqual(entries[2].bounty, 300)
+        self.assertEqual(len(entries), 2)
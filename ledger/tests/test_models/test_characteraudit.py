@@ -1,18 +1,32 @@
+# Standard Library
+from email.utils import format_datetime
+
 # Django
+from django.core.cache import cache
 from django.test import TestCase
 from django.utils import timezone
 
+# Alliance Auth
+from esi.errors import TokenError
+from esi.exceptions import HTTPNotModified
+
 # AA Ledger
+from ledger.errors import TokenDoesNotExist
 from ledger.models.characteraudit import (
     CharacterOwner,
     CharacterUpdateSection,
     CharacterUpdateStatus,
 )
-from ledger.models.helpers.update_manager import UpdateStatus
+from ledger.models.general import UpdateSectionResult
+from ledger.models.helpers.update_manager import (
+    UpdateStatus,
+    get_earliest_esi_headers,
+)
 from ledger.tests import LedgerTestCase
 from ledger.tests.testdata.factory import (
     CharacterOwnerFactory,
     CharacterUpdateStatusFactory,
+    UserMainFactory,
 )
 
 MODULE_PATH = "ledger.models.characteraudit"
@@ -81,6 +95,7 @@ class TestCharacterWalletJournalModel(LedgerTestCase):
         # Test Data - OK
         update_status = self.update_status_wallet
         audit = self.owner
+        self.owner.refresh_from_db()
 
         # Expected Result
         self.assertEqual(
@@ -104,6 +119,7 @@ class TestCharacterWalletJournalModel(LedgerTestCase):
         update_status.is_success = False
         update_status.has_token_error = True
         update_status.save()
+        self.owner.refresh_from_db()
 
         # Expected Result
         self.assertEqual(
@@ -117,6 +133,7 @@ class TestCharacterWalletJournalModel(LedgerTestCase):
         update_status.is_success = False
         update_status.has_token_error = False
         update_status.save()
+        self.owner.refresh_from_db()
 
         # Expected Result
         self.assertEqual(
@@ -124,9 +141,271 @@ class TestCharacterWalletJournalModel(LedgerTestCase):
             UpdateStatus.ERROR,
         )
         update_status.delete()
+        self.owner.refresh_from_db()
 
         # Test Data - INCOMPLETE
         self.assertEqual(
             self.owner.get_status,
             UpdateStatus.INCOMPLETE,
         )
+
+    def test_get_status_stored(self):
+        """
+        Test get_status property with the stored total update status.
+
+        ### Expected Result
+        - Stored status is returned without an additional query.
+        """
+        owner = CharacterOwner.objects.get(pk=self.owner.pk)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(owner.get_status, UpdateStatus.OK)
+
+    def test_update_section_log_stores_total_update_status(self):
+        """
+        Test that update_section_log stores the total update status.
+
+        ### Expected Result
+        - Total update status is TOKEN_ERROR after a section failed with a token error.
+        """
+        self.owner.update_manager.update_section_log(
+            section=CharacterUpdateSection.WALLET_JOURNAL,
+            result=UpdateSectionResult(
+                is_changed=False, is_updated=False, has_token_error=True
+            ),
+        )
+
+        self.assertEqual(
+            CharacterOwner.objects.get(pk=self.owner.pk).total_update_status,
+            UpdateStatus.TOKEN_ERROR,
+        )
+
+    def test_reset_has_token_error_stores_total_update_status(self):
+        """
+        Test that reset_has_token_error stores the total update status.
+
+        ### Expected Result
+        - Total update status is OK after the token error has been reset.
+        """
+        CharacterUpdateStatus.objects.filter(pk=self.update_status_wallet.pk).update(
+            has_token_error=True
+        )
+        CharacterOwner.objects.update_total_update_status()
+
+        self.owner.update_manager.reset_has_token_error()
+
+        self.assertEqual(
+            CharacterOwner.objects.get(pk=self.owner.pk).total_update_status,
+            UpdateStatus.OK,
+        )
+
+    def test_update_section_if_changed_not_modified(self):
+        """
+        Test that update_section_if_changed returns the ESI expiry of a 304.
+
+        ### Expected Result
+        - Result is not changed and has the expiry of the Expires header.
+        """
+        expires = timezone.now().replace(microsecond=0) + timezone.timedelta(hours=1)
+
+        def fetch_func(owner, force_refresh):
+            raise HTTPNotModified(
+                status_code=304, headers={"Expires": format_datetime(expires, True)}
+            )
+
+        result = self.owner.update_manager.update_section_if_changed(
+            section=CharacterUpdateSection.WALLET_JOURNAL, fetch_func=fetch_func
+        )
+
+        self.assertFalse(result.is_changed)
+        self.assertEqual(result.expires_at, expires)
+
+    def test_update_section_if_changed_stores_expiry(self):
+        """
+        Test that update_section_if_changed returns the ESI expiry of changed data.
+
+        ### Expected Result
+        - Result is changed and has the expiry of the Expires header.
+        - The expiry is stored on the update status.
+        """
+        expires = timezone.now().replace(microsecond=0) + timezone.timedelta(days=1)
+        section = CharacterUpdateSection.WALLET_JOURNAL
+
+        def fetch_func(owner, force_refresh):
+            return {"Expires": format_datetime(expires, True)}
+
+        result = self.owner.update_manager.update_section_if_changed(
+            section=section, fetch_func=fetch_func
+        )
+        self.owner.update_manager.update_section_log(section, result)
+
+        self.assertTrue(result.is_changed)
+        self.assertEqual(result.expires_at, expires)
+        status = CharacterUpdateStatus.objects.get(owner=self.owner, section=section)
+        self.assertEqual(status.esi_expires_at, expires)
+        self.assertEqual(status.next_due_at, expires)
+
+    def test_get_earliest_esi_headers(self):
+        """
+        Test that get_earliest_esi_headers picks the headers expiring first.
+
+        ### Expected Result
+        - The headers with the earliest Expires header are returned.
+        - None is returned without any Expires header.
+        """
+        now = timezone.now().replace(microsecond=0)
+        earliest = {
+            "Expires": format_datetime(now + timezone.timedelta(minutes=5), True)
+        }
+        latest = {"Expires": format_datetime(now + timezone.timedelta(hours=1), True)}
+
+        self.assertEqual(get_earliest_esi_headers([latest, {}, earliest]), earliest)
+        self.assertIsNone(get_earliest_esi_headers([{}, {"msg": "Not Modified"}]))
+
+    def test_update_section_log_backs_off_not_modified(self):
+        """
+        Test that update_section_log backs off sections without changed ESI data.
+
+        ### Expected Result
+        - Not modified runs are counted and double the interval to the next update.
+        - ESI expiry after the interval delays the next update.
+        - Changed data resets the back off.
+        """
+        section = CharacterUpdateSection.WALLET_JOURNAL
+        not_modified = UpdateSectionResult(is_changed=False, is_updated=False)
+
+        self.owner.update_manager.update_section_log(section, not_modified)
+        self.owner.update_manager.update_section_log(section, not_modified)
+
+        status = CharacterUpdateStatus.objects.get(owner=self.owner, section=section)
+        self.assertEqual(status.not_modified_count, 2)
+        self.assertEqual(
+            status.next_due_at,
+            status.last_run_finished_at + timezone.timedelta(minutes=30 * 4),
+        )
+        self.assertFalse(status.need_update())
+
+        expires = timezone.now() + timezone.timedelta(days=1)
+        self.owner.update_manager.update_section_log(
+            section, not_modified._replace(expires_at=expires)
+        )
+        status.refresh_from_db()
+        self.assertEqual(status.next_due_at, expires)
+
+        self.owner.update_manager.update_section_log(
+            section, UpdateSectionResult(is_changed=True, is_updated=True)
+        )
+        status.refresh_from_db()
+        self.assertEqual(status.not_modified_count, 0)
+        self.assertEqual(
+            status.next_due_at,
+            status.last_update_finished_at + timezone.timedelta(minutes=30),
+        )
+
+
+class TestCharacterOwnerGetToken(LedgerTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        user = UserMainFactory()
+        cls.owner = CharacterOwnerFactory(user=user)
+        cls.token = user.token_set.get()
+        cls.scopes = ["esi-wallet.read_character_wallet.v1"]
+
+    def setUp(self):
+        super().setUp()
+        # Cached tokens outlive the rolled back test transaction
+        self.owner.invalidate_token_cache()
+
+    def test_get_token_memoized(self):
+        """
+        Test that resolved tokens are memoized on the owner and cached across owners.
+
+        ### Expected Result
+        - Same owner resolves the token without queries.
+        - Another instance of the owner resolves the cached token.
+        """
+        token = self.owner.get_token(self.scopes)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(self.owner.get_token(self.scopes), token)
+
+        owner = CharacterOwner.objects.select_related(
+            "eve_character__character_ownership"
+        ).get(pk=self.owner.pk)
+        self.assertEqual(owner.get_token(self.scopes), self.token)
+
+    def test_get_token_cached_without_scopes(self):
+        """
+        Test that a cached token is not used once it lost the required scopes.
+
+        ### Expected Result
+        - The cached token without the scopes is skipped.
+        - The token is resolved again and the new token is cached.
+        """
+        other_token = self.token.user.token_set.create(
+            character_id=self.token.character_id,
+            character_name=self.token.character_name,
+            character_owner_hash=self.token.character_owner_hash,
+            access_token="other-access-token",
+            refresh_token="other-refresh-token",
+        )
+        cache.set(self.owner._token_cache_key, {" ".join(self.scopes): other_token.pk})
+
+        token = self.owner.get_token(self.scopes)
+
+        self.assertEqual(token, self.token)
+        self.assertEqual(
+            cache.get(self.owner._token_cache_key), {" ".join(self.scopes): token.pk}
+        )
+
+    def test_get_token_cached_deleted(self):
+        """
+        Test that a cached token is not used once it is deleted.
+
+        ### Expected Result
+        - The token is resolved again.
+        - Without any token TokenDoesNotExist is raised.
+        """
+        self.owner.get_token(self.scopes)
+        owner = CharacterOwner.objects.select_related(
+            "eve_character__character_ownership"
+        ).get(pk=self.owner.pk)
+        self.token.user.token_set.all().delete()
+
+        with self.assertRaises(TokenDoesNotExist):
+            owner.get_token(self.scopes)
+
+    def test_invalidate_token_cache(self):
+        """
+        Test that invalidating the token cache forgets the resolved tokens.
+
+        ### Expected Result
+        - Memoized and cached tokens are removed.
+        """
+        self.owner.get_token(self.scopes)
+
+        self.owner.invalidate_token_cache()
+
+        self.assertEqual(self.owner._resolved_tokens, {})
+        self.assertIsNone(cache.get(self.owner._token_cache_key))
+
+    def test_perform_update_status_invalidates_token_on_token_error(self):
+        """
+        Test that a token error during an update invalidates the token cache.
+
+        ### Expected Result
+        - Token cache is invalidated and the error is raised.
+        """
+        self.owner.get_token(self.scopes)
+
+        def method():
+            raise TokenError("Token expired")
+
+        with self.assertRaises(TokenError):
+            self.owner.update_manager.perform_update_status(
+                CharacterUpdateSection.WALLET_JOURNAL, method
+            )
+
+        self.assertIsNone(cache.get(self.owner._token_cache_key))
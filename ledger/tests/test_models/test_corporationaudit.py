@@ -1,7 +1,16 @@
+# Standard Library
+from types import SimpleNamespace
+from unittest.mock import patch
+
+# Django
+from django.core.cache import cache
+from django.utils import timezone
+
 # AA Ledger
 from ledger.models.corporationaudit import CorporationOwner
+from ledger.models.helpers.update_manager import UpdateStatus
 from ledger.tests import LedgerTestCase
-from ledger.tests.testdata.factory import CorporationOwnerFactory
+from ledger.tests.testdata.factory import CorporationOwnerFactory, UserMainFactory
 from ledger.tests.testdata.utils import (
     add_new_permission_to_user,
 )
@@ -46,6 +55,18 @@ class TestCorporationAuditModel(LedgerTestCase):
             ],
         )
 
+    def test_get_status_stored(self):
+        """
+        Test get_status property with the stored total update status.
+
+        ### Expected Result
+        - Stored status is returned without an additional query.
+        """
+        owner = CorporationOwner.objects.get(pk=self.owner.pk)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(owner.get_status, UpdateStatus.INCOMPLETE)
+
     def test_visible_to_should_not_include_any_corporations(self):
         """
         Test access permissions for CorporationOwner without permissions.
@@ -72,3 +93,78 @@ class TestCorporationAuditModel(LedgerTestCase):
         corporation = CorporationOwner.objects.visible_to(self.user)
         self.assertIn(self.owner, corporation)
         self.assertNotIn(self.owner2, corporation)
+
+
+class TestCorporationOwnerGetToken(LedgerTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+
+        user = UserMainFactory(main_character__scopes=CorporationOwner.get_esi_scopes())
+        cls.owner = CorporationOwnerFactory(user=user)
+        cls.token = user.token_set.get()
+        cls.token_key = (
+            f"ledger-corporation-token-{cls.owner.eve_corporation.corporation_id}"
+        )
+
+    def setUp(self):
+        super().setUp()
+        # Cached roles & tokens outlive the rolled back test transaction
+        cache.delete_many(
+            [
+                self.token_key,
+                f"ledger-character-roles-{self.token.character_id}",
+            ]
+        )
+
+    @staticmethod
+    def _mock_roles(mock_esi, roles: list[str]):
+        expires = timezone.now() + timezone.timedelta(hours=1)
+        operation = mock_esi.client.Character.GetCharactersCharacterIdRoles
+        operation.return_value.result.return_value = (
+            SimpleNamespace(roles=roles),
+            SimpleNamespace(
+                headers={"Expires": expires.strftime("%a, %d %b %Y %H:%M:%S GMT")}
+            ),
+        )
+        return operation
+
+    @patch(MODULE_PATH + ".esi")
+    def test_get_token_caches_roles_and_token(self, mock_esi):
+        """
+        Test that the token with the required roles is cached.
+
+        ### Expected Result
+        - Token with the required roles is returned.
+        - Roles are fetched from ESI only once.
+        - The known-good token is cached.
+        """
+        operation = self._mock_roles(mock_esi, ["Accountant"])
+        scopes = CorporationOwner.get_esi_scopes()
+
+        token = self.owner.get_token(scopes, ["Director", "Accountant"])
+        call_count = operation.call_count
+        cached_token = self.owner.get_token(scopes, ["Director", "Accountant"])
+
+        self.assertEqual(token, self.token)
+        self.assertEqual(cached_token, token)
+        self.assertEqual(operation.call_count, call_count)
+        self.assertEqual(cache.get(self.token_key), {"Accountant-Director": token.pk})
+
+    @patch(MODULE_PATH + ".esi")
+    def test_get_token_without_roles(self, mock_esi):
+        """
+        Test that no token is returned if no character has the required roles.
+
+        ### Expected Result
+        - False is returned and no token is cached.
+        """
+        self._mock_roles(mock_esi, ["Station_Manager"])
+        cache.set(self.token_key, {"Accountant-Director": 9999})
+
+        token = self.owner.get_token(
+            CorporationOwner.get_esi_scopes(), ["Director", "Accountant"]
+        )
+
+        self.assertFalse(token)
+        self.assertIsNone(cache.get(self.token_key))
@@ -1,6 +1,9 @@
 """Tests for the providers module."""
 
 # Standard Library
+import json
+import tempfile
+from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 # Third Party
@@ -19,7 +22,16 @@ from esi.exceptions import (
 )
 
 # AA Ledger
-from ledger.providers import DownTimeError, retry_task_on_esi_error
+from ledger import __operations__
+from ledger.providers import (
+    DownTimeError,
+    LedgerESIClientProvider,
+    _find_refs,
+    get_trimmed_spec_file,
+    retry_task_on_esi_error,
+    spec_file,
+    trim_spec,
+)
 from ledger.tests import NoSocketsTestCase
 
 MODULE_PATH = "ledger.providers"
@@ -313,3 +325,187 @@ class TestRetryTaskOnESIError(NoSocketsTestCase):
                 str(call_kwargs["exc"]), str(DownTimeError("ESI is in daily downtime"))
             )
             self.assertEqual(call_kwargs["countdown"], 603)
+
+
+class TestTrimmedSpec(NoSocketsTestCase):
+    """Tests for the trimmed ESI spec."""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.spec = json.loads(spec_file.read_bytes())
+
+    def setUp(self):
+        super().setUp()
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.cache_dir = Path(directory.name)
+        patcher = patch(MODULE_PATH + ".LEDGER_ESI_SPEC_CACHE_DIR", self.cache_dir)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_trim_spec(self):
+        """
+        Test should keep only the Ledger operations and their components.
+
+        ### Expected Result
+        - Only the Ledger operations are kept.
+        - Every reference of the trimmed spec resolves.
+        """
+        # Test Action
+        trimmed = trim_spec(self.spec, __operations__)
+
+        # Expected Result
+        operation_ids = {
+            method["operationId"]
+            for path_item in trimmed["paths"].values()
+            for key, method in path_item.items()
+            if key != "parameters"
+        }
+        self.assertEqual(operation_ids, set(__operations__))
+        refs = set()
+        _find_refs(trimmed, refs)
+        for ref in refs:
+            section, _, name = ref.removeprefix("#/components/").partition("/")
+            self.assertIn(name, trimmed["components"][section], ref)
+        self.assertLess(
+            len(trimmed["components"]["schemas"]),
+            len(self.spec["components"]["schemas"]),
+        )
+
+    def test_get_trimmed_spec_file(self):
+        """
+        Test should write the trimmed spec once and reuse the cached file.
+
+        ### Expected Result
+        - The trimmed spec is written to the cache directory.
+        - The cached file is returned without trimming the full spec again.
+        """
+        # Test Action
+        trimmed_file = get_trimmed_spec_file(spec_file, __operations__)
+        with patch(MODULE_PATH + ".trim_spec") as mock_trim_spec:
+            cached_file = get_trimmed_spec_file(spec_file, __operations__)
+
+        # Expected Result
+        self.assertEqual(trimmed_file.parent, self.cache_dir)
+        self.assertEqual(cached_file, trimmed_file)
+        mock_trim_spec.assert_not_called()
+        self.assertEqual(
+            json.loads(trimmed_file.read_bytes()), trim_spec(self.spec, __operations__)
+        )
+
+    def test_get_trimmed_spec_file_not_verified(self):
+        """
+        Test should not load a cached spec with an invalid signature.
+
+        ### Expected Result
+        - The tampered spec is trimmed again.
+        """
+        # Test Data
+        trimmed_file = get_trimmed_spec_file(spec_file, __operations__)
+        trimmed_file.write_text("{}", encoding="utf-8")
+
+        # Test Action
+        with patch(MODULE_PATH + ".logger") as mock_logger:
+            result = get_trimmed_spec_file(spec_file, __operations__)
+
+        # Expected Result
+        self.assertEqual(result, trimmed_file)
+        mock_logger.warning.assert_called_once()
+        self.assertEqual(
+            json.loads(trimmed_file.read_bytes()), trim_spec(self.spec, __operations__)
+        )
+
+    def test_get_trimmed_spec_file_changed_spec(self):
+        """
+        Test should replace the cached files of an older spec.
+
+        ### Expected Result
+        - Only the trimmed spec & signature of the current spec are kept.
+        """
+        # Test Data
+        old_file = get_trimmed_spec_file(spec_file, __operations__[:1])
+
+        # Test Action
+        trimmed_file = get_trimmed_spec_file(spec_file, __operations__)
+
+        # Expected Result
+        self.assertNotEqual(old_file, trimmed_file)
+        self.assertCountEqual(
+            self.cache_dir.iterdir(),
+            [trimmed_file, trimmed_file.with_suffix(".sig")],
+        )
+
+    def test_get_trimmed_spec_file_private_directory(self):
+        """
+        Test should make the cache directory private to the current user.
+
+        ### Expected Result
+        - A new cache directory is created with mode 0700.
+        - An existing cache directory accessible by other users is made private.
+        """
+        # Test Data
+        new_dir = self.cache_dir / "new"
+        shared_dir = self.cache_dir / "shared"
+        shared_dir.mkdir(mode=0o777)
+        shared_dir.chmod(0o777)
+
+        for cache_dir in [new_dir, shared_dir]:
+            with self.subTest(cache_dir=cache_dir.name):
+                # Test Action
+                with patch(MODULE_PATH + ".LEDGER_ESI_SPEC_CACHE_DIR", cache_dir):
+                    result = get_trimmed_spec_file(spec_file, __operations__)
+
+                # Expected Result
+                self.assertEqual(result.parent, cache_dir)
+                self.assertEqual(cache_dir.stat().st_mode & 0o777, 0o700)
+
+    def test_get_trimmed_spec_file_not_writable(self):
+        """
+        Test should fall back to the full spec if the cache is not writable.
+
+        ### Expected Result
+        - The full spec file is returned.
+        """
+        # Test Data
+        not_a_directory = self.cache_dir / "file"
+        not_a_directory.touch()
+
+        # Test Action
+        with patch(MODULE_PATH + ".LEDGER_ESI_SPEC_CACHE_DIR", not_a_directory):
+            result = get_trimmed_spec_file(spec_file, __operations__)
+
+        # Expected Result
+        self.assertEqual(result, spec_file)
+
+    @patch("esi.openapi_clients.ESIClient")
+    @patch("esi.openapi_clients.esi_client_factory_sync")
+    def test_client_is_lazy(self, mock_factory, mock_client):
+        """
+        Test should create the ESI client with the trimmed spec on first use.
+
+        ### Expected Result
+        - No client is created by the provider.
+        - The client is created once with the trimmed spec.
+        """
+        # Test Data
+        provider = LedgerESIClientProvider(
+            compatibility_date="2026-07-21",
+            ua_appname="Test",
+            ua_version="1.0",
+            operations=__operations__,
+            spec_file=spec_file,
+        )
+        mock_factory.assert_not_called()
+
+        # Test Action
+        client = provider.client
+
+        # Expected Result
+        self.assertIs(provider.client, client)
+        mock_factory.assert_called_once()
+        self.assertEqual(
+            mock_factory.call_args.kwargs["spec_file"],
+            get_trimmed_spec_file(spec_file, __operations__),
+        )
+        mock_client.assert_called_once()
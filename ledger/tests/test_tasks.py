@@ -3,7 +3,11 @@
 # Standard Library
 from unittest.mock import MagicMock, PropertyMock, patch
 
+# Third Party
+from celery.exceptions import MaxRetriesExceededError, Retry
+
 # Django
+from django.db import DatabaseError
 from django.test import override_settings
 from django.utils import timezone
 
@@ -11,13 +15,21 @@ from django.utils import timezone
 from ledger.models.characteraudit import CharacterUpdateStatus
 from ledger.models.corporationaudit import CorporationUpdateStatus
 from ledger.models.general import UpdateSectionResult
+from ledger.models.helpers.update_manager import (
+    CharacterUpdateSection,
+    CorporationUpdateSection,
+)
 from ledger.tasks import (
     _update_character_section,
     _update_corporation_section,
     update_all_characters,
     update_all_corporations,
     update_character,
+    update_characters_batch,
     update_corporation,
+    update_corporations_batch,
+    update_evemarket_prices,
+    update_subset_characters,
 )
 from ledger.tests import LedgerTestCase
 from ledger.tests.testdata.factory import (
@@ -38,12 +50,10 @@ class TestTasks(LedgerTestCase):
     Tests for ledger tasks.
     """
 
-    @patch(TASKS_PATH + ".update_corporation", spec=True)
-    @patch(TASKS_PATH + ".update_character", spec=True)
-    @patch(TASKS_PATH + ".CharacterMiningLedger.update_evemarket_price", spec=True)
+    @patch(TASKS_PATH + ".update_corporations_batch", spec=True)
+    @patch(TASKS_PATH + ".update_characters_batch", spec=True)
     def test_update_all_ledger(
         self,
-        mock_update_evemarket_price: MagicMock,
         mock_update_character: MagicMock,
         mock_update_corporation: MagicMock,
     ):
@@ -51,7 +61,7 @@ class TestTasks(LedgerTestCase):
         Test 'update_all_ledger' task.
 
         # Test Scenarios:
-            1. Task queues update tasks for all active corporation and character owners.
+            1. Task queues batch update tasks for all active corporation and character owners.
         """
         # Test Data
         CharacterOwnerFactory(user=self.user)
@@ -65,6 +75,216 @@ class TestTasks(LedgerTestCase):
         self.assertTrue(mock_update_character.apply_async.called)
         self.assertTrue(mock_update_corporation.apply_async.called)
 
+    @patch(TASKS_PATH + ".update_characters_batch", spec=True)
+    def test_update_subset_characters(
+        self,
+        mock_update_character: MagicMock,
+    ):
+        """
+        Test 'update_subset_characters' task.
+
+        # Test Scenarios:
+            1. Task queues update tasks only for characters with due sections.
+            2. Characters with missing sections are due once their update status is created.
+            3. Only the due sections of each character are queued.
+        """
+        # Test Data
+        due_owner = CharacterOwnerFactory(user=self.user)
+        fresh_owner = CharacterOwnerFactory(user=self.user2)
+        incomplete_owner = CharacterOwnerFactory(user=self.superuser)
+        for section in CharacterUpdateSection.get_sections():
+            CharacterUpdateStatusFactory(
+                owner=due_owner,
+                section=section,
+                last_update_finished_at=timezone.now() - timezone.timedelta(days=1),
+            )
+            CharacterUpdateStatusFactory(
+                owner=fresh_owner,
+                section=section,
+                last_update_finished_at=timezone.now(),
+            )
+        CharacterUpdateStatusFactory(
+            owner=incomplete_owner,
+            section="wallet_journal",
+            last_update_finished_at=timezone.now(),
+        )
+        incomplete_owner.update_manager.create_update_status()
+
+        # Test Action
+        update_subset_characters()
+
+        # Expected Result
+        queued_sections = {
+            eve_id: sections
+            for call in mock_update_character.apply_async.call_args_list
+            for eve_id, sections in zip(
+                call.kwargs["args"][0], call.kwargs["kwargs"]["sections"]
+            )
+        }
+        self.assertCountEqual(
+            queued_sections[due_owner.eve_id], CharacterUpdateSection.get_sections()
+        )
+        self.assertNotIn("wallet_journal", queued_sections[incomplete_owner.eve_id])
+        self.assertNotIn(fresh_owner.eve_id, queued_sections)
+
+    @patch(TASKS_PATH + ".CharacterMiningLedger.update_evemarket_price", spec=True)
+    def test_update_evemarket_prices(self, mock_update_evemarket_price: MagicMock):
+        """
+        Test 'update_evemarket_prices' task.
+
+        # Test Scenarios:
+            1. Task updates the market prices independent of the character updates.
+        """
+        # Test Action
+        update_evemarket_prices(force_refresh=True)
+
+        # Expected Result
+        mock_update_evemarket_price.assert_called_once_with(force_refresh=True)
+
+    @patch(TASKS_PATH + "._update_owner_section")
+    def test_update_characters_batch(self, mock_update_owner_section: MagicMock):
+        """
+        Test 'update_characters_batch' task.
+
+        # Test Scenarios:
+            1. Task updates the due sections of all owners in-process.
+            2. Owners without due sections are skipped.
+        """
+        # Test Data
+        due_owner = CharacterOwnerFactory(user=self.user)
+        fresh_owner = CharacterOwnerFactory(user=self.user2)
+        for section in CharacterUpdateSection.get_sections():
+            CharacterUpdateStatusFactory(
+                owner=fresh_owner,
+                section=section,
+                is_success=True,
+                last_run_finished_at=timezone.now(),
+                last_update_finished_at=timezone.now(),
+            )
+
+        # Test Action
+        updated = update_characters_batch(
+            eve_ids=[due_owner.eve_id, fresh_owner.eve_id]
+        )
+
+        # Expected Result
+        self.assertEqual(updated, 1)
+        updated_owners = {
+            call.kwargs["owner"] for call in mock_update_owner_section.call_args_list
+        }
+        self.assertEqual(updated_owners, {due_owner})
+        self.assertEqual(
+            mock_update_owner_section.call_count,
+            len(CharacterUpdateSection.get_sections()),
+        )
+
+    @patch(TASKS_PATH + "._update_owner_section")
+    def test_update_characters_batch_sections(
+        self, mock_update_owner_section: MagicMock
+    ):
+        """
+        Test 'update_characters_batch' task with the due sections of each owner.
+
+        # Test Scenarios:
+            1. Task updates only the queued sections of the owner.
+        """
+        # Test Data
+        owner = CharacterOwnerFactory(user=self.user)
+
+        # Test Action
+        updated = update_characters_batch(
+            eve_ids=[owner.eve_id], sections=[["wallet_journal"]]
+        )
+
+        # Expected Result
+        self.assertEqual(updated, 1)
+        mock_update_owner_section.assert_called_once()
+        self.assertEqual(
+            mock_update_owner_section.call_args.kwargs["section"],
+            CharacterUpdateSection.WALLET_JOURNAL,
+        )
+
+    @patch(TASKS_PATH + "._update_owner_section")
+    def test_update_corporations_batch(self, mock_update_owner_section: MagicMock):
+        """
+        Test 'update_corporations_batch' task.
+
+        # Test Scenarios:
+            1. Task updates all sections of all owners when forced.
+        """
+        # Test Data
+        owner = CorporationOwnerFactory(user=self.user)
+
+        # Test Action
+        updated = update_corporations_batch(eve_ids=[owner.eve_id], force_refresh=True)
+
+        # Expected Result
+        self.assertEqual(updated, 1)
+        self.assertEqual(
+            mock_update_owner_section.call_count,
+            len(CorporationUpdateSection.get_sections()),
+        )
+        self.assertTrue(mock_update_owner_section.call_args.kwargs["force_refresh"])
+
+    @patch(TASKS_PATH + ".logger")
+    @patch(TASKS_PATH + "._update_owner_section")
+    def test_update_characters_batch_owner_error(
+        self, mock_update_owner_section: MagicMock, mock_logger: MagicMock
+    ):
+        """
+        Test 'update_characters_batch' task with a failing owner.
+
+        # Test Scenarios:
+            1. An error of the first owner is logged.
+            2. The second owner is still updated.
+        """
+        # Test Data
+        failing_owner = CharacterOwnerFactory(user=self.user)
+        owner = CharacterOwnerFactory(user=self.user2)
+
+        def update_owner_section(owner, **kwargs):
+            if owner == failing_owner:
+                raise DatabaseError("Database Error")
+
+        mock_update_owner_section.side_effect = update_owner_section
+
+        # Test Action
+        updated = update_characters_batch(
+            eve_ids=[failing_owner.eve_id, owner.eve_id], force_refresh=True
+        )
+
+        # Expected Result
+        self.assertEqual(updated, 1)
+        updated_owners = {
+            call.kwargs["owner"] for call in mock_update_owner_section.call_args_list
+        }
+        self.assertEqual(updated_owners, {failing_owner, owner})
+        mock_logger.exception.assert_called_once()
+
+    @patch(TASKS_PATH + "._update_owner_section")
+    def test_update_corporations_batch_retry(
+        self, mock_update_owner_section: MagicMock
+    ):
+        """
+        Test 'update_corporations_batch' task when a section is retried.
+
+        # Test Scenarios:
+            1. Celery's Retry is not caught by the batch.
+            2. Celery's MaxRetriesExceededError is not caught by the batch.
+        """
+        # Test Data
+        owner = CorporationOwnerFactory(user=self.user)
+
+        for exc in [Retry(), MaxRetriesExceededError()]:
+            with self.subTest(exc=type(exc).__name__):
+                mock_update_owner_section.side_effect = exc
+
+                # Test Action & Expected Result
+                with self.assertRaises(type(exc)):
+                    update_corporations_batch(
+                        eve_ids=[owner.eve_id], force_refresh=True
+                    )
+
     @patch(TASKS_PATH + ".logger")
     @patch(TASKS_PATH + ".update_corp_wallet_journal")
     @patch(
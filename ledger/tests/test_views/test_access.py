@@ -51,6 +51,39 @@ class TestViewIndexAccess(LedgerTestCase):
         self.assertEqual(response.status_code, HTTPStatus.OK)
         self.assertContains(response, "Administration")
 
+    def test_metrics(self, mock_messages):
+        """
+        Test metrics access.
+
+        This test verifies that a superuser gets the metrics in the Prometheus text format.
+        """
+        # Test Data
+        request = self.factory.get(reverse("ledger:metrics"))
+        request.user = self.superuser
+
+        # Test Action
+        response = index.metrics(request)
+
+        # Expected Result
+        self.assertEqual(response.status_code, HTTPStatus.OK)
+        self.assertTrue(response["Content-Type"].startswith("text/plain"))
+
+    def test_metrics_no_access(self, mock_messages):
+        """
+        Test metrics access.
+
+        This test verifies that a user without admin access can't access the metrics.
+        """
+        # Test Data
+        request = self.factory.get(reverse("ledger:metrics"))
+        request.user = self.user
+
+        # Test Action
+        response = index.metrics(request)
+
+        # Expected Result
+        self.assertEqual(response.status_code, HTTPStatus.FORBIDDEN)
+
     def test_admin_no_access(self, mock_messages):
         """
         Test admin access.
@@ -89,15 +122,18 @@ class TestViewIndexAccess(LedgerTestCase):
         # Expected Result
         self.assertEqual(response.status_code, HTTPStatus.OK)
 
+    @patch(TASKS_PATH + ".update_evemarket_prices")
     @patch(TASKS_PATH + ".update_all_characters")
-    def test_run_character_updates(self, mock_update_characters, mock_messages):
+    def test_run_character_updates(
+        self, mock_update_characters, mock_update_evemarket_prices, mock_messages
+    ):
         """
         Test run character updates.
 
         This test posts to the admin view to trigger the run character updates action.
 
         # Expected Results
-            - Update all characters task is queued
+            - Update all characters & market prices tasks are queued
         """
         # Test Data
         request = self.factory.post(
@@ -115,6 +151,7 @@ class TestViewIndexAccess(LedgerTestCase):
             request, "Queued Update All Characters"
         )
         mock_update_characters.apply_async.assert_called_once()
+        mock_update_evemarket_prices.apply_async.assert_called_once()
 
     @patch(TASKS_PATH + ".update_character")
     def test_run_character_updates_character_1001(
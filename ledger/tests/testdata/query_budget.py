@@ -0,0 +1,131 @@
+# Standard Library
+import traceback
+from collections import Counter
+from collections.abc import Callable
+from pathlib import Path
+
+# Django
+from django.contrib.contenttypes.models import ContentType
+from django.core.cache import cache
+from django.db import connection, transaction
+
+# Fixture sizes, e.g. number of alts, corporations or entities
+QUERY_BUDGET_SIZES = (1, 10, 100)
+
+LEDGER_PATH = Path(__file__).resolve().parents[2]
+TESTS_PATH = LEDGER_PATH / "tests"
+
+
+def _call_site() -> str:
+    """Return the innermost Ledger code line outside the tests executing the query."""
+    for frame in reversed(traceback.extract_stack()):
+        path = Path(frame.filename).resolve()
+        if path.is_relative_to(LEDGER_PATH) and not path.is_relative_to(TESTS_PATH):
+            return (
+                f"{path.relative_to(LEDGER_PATH.parent)}:{frame.lineno} in {frame.name}"
+            )
+    return "<outside ledger>"
+
+
+class QueryCallSiteRecorder:
+    """Database execute wrapper recording the call site of each query."""
+
+    def __init__(self):
+        self.queries: list[tuple[str, str]] = []
+
+    # pylint: disable=too-many-arguments, too-many-positional-arguments
+    def __call__(self, execute, sql, params, many, context):
+        self.queries.append((_call_site(), sql))
+        return execute(sql, params, many, context)
+
+    @property
+    def call_sites(self) -> Counter:
+        return Counter(call_site for call_site, _ in self.queries)
+
+    def sample(self, call_site: str) -> str:
+        return next(sql for site, sql in self.queries if site == call_site)
+
+
+class QueryBudgetMixin:
+    """
+    Assert that the query count of a request stays bounded with the fixture size.
+
+    Example:
+        .. code-block:: python
+
+            class TestMyEndpoint(QueryBudgetMixin, NoSocketsTestCase):
+                def test_query_budget(self):
+                    def build(size):
+                        owner = create_owner_with_alts(size)
+                        return lambda: self.client.get(url(owner))
+
+                    self.assertQueryBudget(build, per_item=0)
+    """
+
+    def _record_queries(
+        self, build: Callable[[int], Callable], size: int
+    ) -> QueryCallSiteRecorder:
+        """Build the fixtures of `size` and record the queries of the request."""
+        recorder = QueryCallSiteRecorder()
+        with transaction.atomic():
+            request = build(size)
+            # Start each request with cold caches, otherwise the first size pays for all
+            cache.clear()
+            ContentType.objects.clear_cache()
+            with connection.execute_wrapper(recorder):
+                response = request()
+            transaction.set_rollback(True)
+        self.assertLess(
+            response.status_code, 400, f"Request failed for size {size}: {response}"
+        )
+        return recorder
+
+    def assertQueryBudget(
+        self,
+        build: Callable[[int], Callable],
+        per_item: int = 0,
+        sizes: tuple[int, ...] = QUERY_BUDGET_SIZES,
+        batches: int = 0,
+    ):
+        """
+        Assert that the queries grow by at most `per_item` for each additional item.
+
+        Args:
+            build (Callable): Creates the fixtures of a size and returns the request to run.
+            per_item (int, optional): Allowed additional queries per item. Defaults to 0.
+            sizes (tuple[int, ...], optional): The fixture sizes, smallest first.
+            batches (int, optional): Allowed additional queries of bulk writes, which
+                the database backend splits into batches, e.g. SQLite by its parameter limit. Defaults to 0.
+        Raises:
+            AssertionError: With the call sites that grew, if the budget is exceeded.
+        """
+        # pylint: disable=invalid-name
+        # Warm up the module level caches, e.g. of the API and the URL resolver
+        self._record_queries(build, sizes[0])
+        recorders = {size: self._record_queries(build, size) for size in sizes}
+        smallest = recorders[sizes[0]]
+        base = len(smallest.queries)
+
+        for size, recorder in recorders.items():
+            budget = base + per_item * (size - sizes[0])
+            if size > sizes[0]:
+                budget += batches
+            if len(recorder.queries) <= budget:
+                continue
+
+            grown = [
+                (call_site, count, smallest.call_sites.get(call_site, 0))
+                for call_site, count in recorder.call_sites.most_common()
+                if count > smallest.call_sites.get(call_site, 0)
+            ]
+            details = "\n".join(
+                f"  {call_site}: {before} -> {count} queries\n"
+                f"    {recorder.sample(call_site)[:200]}"
+                for call_site, count, before in grown
+            )
+            self.fail(
+                f"Query budget exceeded for size {size}: {len(recorder.queries)} queries, "
+                f"budget {budget} ({base} at size {sizes[0]} + {per_item} per item"
+                f" + {batches} batches).\n"
+                f"Call sites with growing queries:\n{details}"
+            )
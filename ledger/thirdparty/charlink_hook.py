@@ -28,6 +28,8 @@ def _add_character_charaudit(request, token):
             "character_name": token.character_name,
         },
     )[0]
+    # Sections without an update status are never due
+    character.update_manager.create_update_status()
     update_character.apply_async(
         args=[character.pk], kwargs={"force_refresh": True}, priority=6
     )
@@ -50,6 +52,8 @@ def _add_character_corp(request, token):
             "corporation_name": eve_corp.corporation_name,
         },
     )[0]
+    # Sections without an update status are never due
+    corp.update_manager.create_update_status()
     update_corporation.apply_async(
         args=[corp.pk], kwargs={"force_refresh": True}, priority=6
     )
@@ -13,13 +13,14 @@ from ledger.views.corporation import corporation_ledger
 from ledger.views.corporation.add_corp import add_corp
 
 # AA Example App
-from ledger.views.index import admin, index
+from ledger.views.index import admin, index, metrics
 
 app_name: str = "ledger"  # pylint: disable=invalid-name
 
 urlpatterns = [
     path("", index, name="index"),
     path("admin/", admin, name="admin"),
+    path("admin/metrics/", metrics, name="metrics"),
     # -- Character Audit
     path("character/add/", add_char, name="add_char"),
     path(
@@ -32,6 +32,8 @@ def add_char(request, token):
             "character_name": token.character_name,
         },
     )[0]
+    # Sections without an update status are never due
+    char.update_manager.create_update_status()
     tasks.update_character.apply_async(
         kwargs={"eve_id": char.eve_character.character_id, "force_refresh": True},
         priority=6,
@@ -42,6 +42,8 @@ def add_corp(request, token) -> HttpResponse:
             "corporation_name": eve_corp.corporation_name,
         },
     )[0]
+    # Sections without an update status are never due
+    corp.update_manager.create_update_status()
 
     tasks.update_corporation.apply_async(
         kwargs={"eve_id": corp.eve_corporation.corporation_id, "force_refresh": True},
@@ -4,6 +4,7 @@
 from django.contrib import messages
 from django.contrib.auth.decorators import login_required, permission_required
 from django.core.handlers.wsgi import WSGIRequest
+from django.http import HttpResponse, HttpResponseForbidden
 from django.shortcuts import redirect, render
 from django.utils import timezone
 from django.utils.text import format_lazy
@@ -14,6 +15,7 @@ from allianceauth.services.hooks import get_extension_logger
 
 # AA Ledger
 from ledger import __title__, tasks
+from ledger.helpers.metrics import collect_metrics
 
 # Ledger
 from ledger.models.characteraudit import CharacterOwner
@@ -71,6 +73,9 @@ def admin(request: WSGIRequest):
                 messages.error(request, msg)
             return
 
+        tasks.update_evemarket_prices.apply_async(
+            kwargs={"force_refresh": force_refresh}, priority=7
+        )
         tasks.update_all_characters.apply_async(
             kwargs={"force_refresh": force_refresh}, priority=7
         )
@@ -121,3 +126,13 @@ def admin(request: WSGIRequest):
         if request.POST.get("run_corporation_updates"):
             _handle_corporation_updates(force_refresh)
     return render(request, "ledger/view-administration.html")
+
+
+@login_required
+def metrics(request: WSGIRequest):
+    """Update metrics of all processes in the Prometheus text format"""
+    if not request.user.is_superuser:
+        return HttpResponseForbidden()
+    return HttpResponse(
+        collect_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )